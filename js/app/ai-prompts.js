@@ -178,16 +178,11 @@ const AppAIPrompts = {
             return this._promptsCache[phaseId];
         }
 
-        // Fetch prompts.json for this phase
-        const version = DataLoader.CACHE_VERSION || '2.5.0';
-        const response = await fetch(`data/${phaseId}/prompts.json?v=${version}`);
-
-        if (!response.ok) {
-            throw new Error(`Failed to load prompts: ${response.status}`);
-        }
-
-        const data = await response.json();
-        const prompts = data.prompts || {};
+        // Prompts come from the phase bundle (already loaded if the phase was opened)
+        const phase = DataLoader.getPhases().find(p => p.id === phaseId);
+        const dataPath = phase?.data_path || `${DataLoader.PHASE_DATA_ROOT}/${phaseId}`;
+        const bundle = await DataLoader.loadBundle(dataPath);
+        const prompts = bundle.prompts?.prompts || {};
 
         // Cache for future use
         this._promptsCache[phaseId] = prompts;
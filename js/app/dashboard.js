@@ -402,29 +402,20 @@ const AppDashboard = {
      */
     async getPhaseMetadata(phase) {
         try {
-            // Fetch manifest.json and questions.json for this phase
-            const v = DataLoader.CACHE_VERSION || '2.5.0';
-            const [manifestRes, questionsRes] = await Promise.all([
-                fetch(`${phase.data_path}/manifest.json?v=${v}`),
-                fetch(`${phase.data_path}/questions.json?v=${v}`)
-            ]);
-
-            if (!manifestRes.ok || !questionsRes.ok) throw new Error('Failed to load');
-
-            const manifest = await manifestRes.json();
-            const data = await questionsRes.json();
-
-            // Count questions by mode
-            let liteCount = 0;
-            let fullCount = 0;
-
-            if (data.questions) {
-                Object.values(data.questions).forEach(q => {
-                    const tags = q.tags?.included_in_manifests || [];
-                    if (tags.includes('lite')) liteCount++;
-                    if (tags.includes('full')) fullCount++;
-                });
-            }
+            // One bundle per phase (shared with DataLoader.load() when the phase is opened)
+            const bundle = await DataLoader.loadBundle(phase.data_path);
+            const manifest = bundle.manifest;
+            const data = bundle.questions;
+
+            if (!manifest || !data) throw new Error('Failed to load');
+
+            // Count questions by mode (from the manifests, as the questionnaire does)
+            const countMode = (mode) => {
+                const ids = data.manifests?.[mode]?.question_ids || [];
+                return new Set(ids.filter(id => data.questions?.[id])).size;
+            };
+            const liteCount = countMode('lite');
+            const fullCount = countMode('full');
 
             return {
                 artifact: manifest.artifact || {},
@@ -6,6 +6,9 @@
  * and structured access to questions, sections, and manifests.
  * Supports multi-phase architecture with dynamic data paths.
  * 
+ * Each phase's manifest, questions and prompts arrive together in one
+ * {data_path}.bundle.json (built by scripts/build_dist.py), fetched once per page.
+ * 
  * Usage: Import and call DataLoader.loadPhases() then DataLoader.load() to initialize.
  */
 
@@ -17,9 +20,15 @@ const DataLoader = {
   phases: null,
   currentPhase: null,
 
+  // Bundle promises keyed by phase data_path (one request per phase per page load)
+  _bundles: {},
+
   // Cache version for cache busting
   CACHE_VERSION: '2.5.0',
 
+  // Phase files are served from the minified build (scripts/build_dist.py)
+  PHASE_DATA_ROOT: 'dist/data',
+
   /**
    * Load site-wide configuration.
    * @returns {Promise<Object>} The site configuration.
@@ -72,7 +81,8 @@ const DataLoader = {
   /**
    * Load phases from the phase registry file.
    * Reads phase-registry.json which lists available phase folder names.
-   * Then loads manifest.json from each registered phase folder.
+   * Then takes each registered phase's manifest from its bundle under PHASE_DATA_ROOT
+   * (one request per phase; load() and the dashboard reuse the cached bundle).
    * @returns {Promise<Object>} The phases data with all display metadata.
    */
   async loadPhases() {
@@ -87,15 +97,14 @@ const DataLoader = {
       const phaseFolders = registry.phases || [];
       console.log('DataLoader: Phase registry loaded:', phaseFolders);
 
-      // Load manifests for all registered phases in parallel
+      // Load bundles for all registered phases in parallel
       const manifestPromises = phaseFolders.map(async (folder) => {
         try {
-          const manifestRes = await fetch(`./data/${folder}/manifest.json?v=${this.CACHE_VERSION}`);
-          if (!manifestRes.ok) {
+          const { manifest } = await this.loadBundle(`${this.PHASE_DATA_ROOT}/${folder}`);
+          if (!manifest) {
             console.warn(`Manifest not found for registered phase: ${folder}`);
             return null;
           }
-          const manifest = await manifestRes.json();
           // Only include if it has a valid display section
           if (manifest.display && manifest.display.id) {
             return { folder, manifest };
@@ -115,7 +124,8 @@ const DataLoader = {
         .filter(item => item !== null)
         .map(({ folder, manifest }) => ({
           ...manifest.display,
-          data_path: `data/${folder}`
+          artifact_id: manifest.artifact?.id || null,
+          data_path: `${this.PHASE_DATA_ROOT}/${folder}`
         }))
         .sort((a, b) => (a.order || 0) - (b.order || 0));
 
@@ -176,7 +186,7 @@ const DataLoader = {
 
   /**
    * Find phase ID by artifact ID from an exported JSON file.
-   * Loads each phase's manifest and compares artifact IDs.
+   * Compares against the artifact IDs recorded by loadPhases() (no extra requests).
    * @param {string} artifactId - Artifact ID from exported JSON (e.g., 'phase1_5_intentional_early_dating').
    * @returns {Promise<string|null>} Phase ID (e.g., 'phase_1.5') or null if not found.
    */
@@ -185,44 +195,49 @@ const DataLoader = {
       return null;
     }
 
-    // Try to find the phase by loading each manifest and comparing artifact.id
-    for (const phase of this.phases.phases) {
-      try {
-        const manifestRes = await fetch(`./${phase.data_path}/manifest.json?v=${this.CACHE_VERSION}`);
-        if (manifestRes.ok) {
-          const manifest = await manifestRes.json();
-          if (manifest.artifact?.id === artifactId) {
-            return phase.id;
+    const phase = this.phases.phases.find(p => p.artifact_id === artifactId);
+    return phase ? phase.id : null;
+  },
+
+  /**
+   * Load a phase bundle ({ manifest, questions, prompts }).
+   * Concurrent and repeat callers share one request; a failed request is retried next time.
+   * @param {string} dataPath - Phase data_path (e.g., 'dist/data/phase_0').
+   * @returns {Promise<Object>} The parsed bundle.
+   */
+  loadBundle(dataPath) {
+    if (!this._bundles[dataPath]) {
+      this._bundles[dataPath] = fetch(`./${dataPath}.bundle.json?v=${this.CACHE_VERSION}`)
+        .then(res => {
+          if (!res.ok) {
+            throw new Error(`Failed to load phase bundle: ${dataPath}`);
           }
-        }
-      } catch (error) {
-        console.warn(`Error loading manifest for phase ${phase.id}:`, error);
-      }
+          return res.json();
+        })
+        .catch(error => {
+          delete this._bundles[dataPath];
+          throw error;
+        });
     }
-
-    return null;
+    return this._bundles[dataPath];
   },
 
   /**
-   * Load all questionnaire data from JSON files for current phase.
+   * Load all questionnaire data for current phase (one bundle request).
    * @returns {Promise<Object>} The loaded questionnaire data.
    */
   async load() {
     try {
-      const basePath = this.currentPhase?.data_path || 'data';
-      const [manifestRes, questionsRes, promptsRes] = await Promise.all([
-        fetch(`./${basePath}/manifest.json?v=${this.CACHE_VERSION}`),
-        fetch(`./${basePath}/questions.json?v=${this.CACHE_VERSION}`),
-        fetch(`./${basePath}/prompts.json?v=${this.CACHE_VERSION}`)
-      ]);
-
-      if (!manifestRes.ok || !questionsRes.ok || !promptsRes.ok) {
+      const basePath = this.currentPhase?.data_path || this.getPhases()[0]?.data_path;
+      const bundle = await this.loadBundle(basePath);
+
+      if (!bundle.manifest || !bundle.questions || !bundle.prompts) {
         throw new Error('Failed to load questionnaire data');
       }
 
-      this.manifest = await manifestRes.json();
-      this.data = await questionsRes.json();
-      this.prompts = await promptsRes.json();
+      this.manifest = bundle.manifest;
+      this.data = bundle.questions;
+      this.prompts = bundle.prompts;
 
       return this.data;
     } catch (error) {
@@ -56,13 +56,11 @@ const ImportManager = {
                     if (phaseId) {
                         const phase = DataLoader.getPhases().find(p => p.id === phaseId);
                         if (phase) {
-                            const res = await fetch(`./${phase.data_path}/questions.json?v=${DataLoader.CACHE_VERSION || '1'}`);
-                            if (res.ok) {
-                                const qData = await res.json();
-                                // Store as array for easy searching in formatJSONResponses
-                                if (qData.questions) {
-                                    externalQuestions = Object.values(qData.questions);
-                                }
+                            const bundle = await DataLoader.loadBundle(phase.data_path);
+                            const qData = bundle.questions;
+                            // Store as array for easy searching in formatJSONResponses
+                            if (qData?.questions) {
+                                externalQuestions = Object.values(qData.questions);
                             }
                         }
                     }
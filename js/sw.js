@@ -76,17 +76,11 @@ const STATIC_ASSETS = [
     '../html/views/about.html?v=2.5.0',
     '../html/modals/import.html?v=2.5.0',
     '../html/modals/save.html?v=2.5.0',
-    // Data files - phase manifests are discovered dynamically
+    // Data files - one bundle per phase from the minified dist/ build; others are discovered dynamically
     '../data/config.json?v=2.5.0',
-    '../data/phase_0/manifest.json?v=2.5.0',
-    '../data/phase_0/questions.json?v=2.5.0',
-    '../data/phase_0/prompts.json?v=2.5.0',
-    '../data/phase_1/manifest.json?v=2.5.0',
-    '../data/phase_1/questions.json?v=2.5.0',
-    '../data/phase_1/prompts.json?v=2.5.0',
-    '../data/phase_1.5/manifest.json?v=2.5.0',
-    '../data/phase_1.5/questions.json?v=2.5.0',
-    '../data/phase_1.5/prompts.json?v=2.5.0',
+    '../dist/data/phase_0.bundle.json?v=2.5.0',
+    '../dist/data/phase_1.bundle.json?v=2.5.0',
+    '../dist/data/phase_1.5.bundle.json?v=2.5.0',
     // Icons
     '../assets/icons/icon-192.png?v=2.5.0',
     '../assets/icons/icon-512.png?v=2.5.0',
@@ -1,6 +1,8 @@
 import json
 import os
 
+from phase_corpus import load_json
+
 # Define the phases to checks
 PHASES = ['phase_0', 'phase_1', 'phase_1.5', 'phase_2', 'phase_2.5']
 DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
@@ -30,12 +32,11 @@ def analyze_file(phase):
         print(f"Skipping {phase}: File not found")
         return
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        try:
-            data = json.load(f)
-        except json.JSONDecodeError:
-            print(f"Skipping {phase}: Invalid JSON")
-            return
+    try:
+        data = load_json(file_path)
+    except json.JSONDecodeError:
+        print(f"Skipping {phase}: Invalid JSON")
+        return
 
     questions = data.get('questions', {})
     
@@ -117,12 +118,11 @@ def analyze_file_to_log(phase, outfile):
         outfile.write(f"Skipping {phase}: File not found\n")
         return 0, 0
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        try:
-            data = json.load(f)
-        except json.JSONDecodeError:
-            outfile.write(f"Skipping {phase}: Invalid JSON\n")
-            return 0, 0
+    try:
+        data = load_json(file_path)
+    except json.JSONDecodeError:
+        outfile.write(f"Skipping {phase}: Invalid JSON\n")
+        return 0, 0
 
     questions = data.get('questions', {})
     
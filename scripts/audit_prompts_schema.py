@@ -22,12 +22,12 @@ Operational Notes:
     - Checks for required prompt types and internal structure (inputs, context, output_format).
 """
 
-import json
-import glob
 import os
 import sys
 from typing import Dict, List, Any, Optional
 
+from phase_corpus import PhaseCorpus, load_json as load_cached_json
+
 # ANSI Colors for output
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -55,8 +55,7 @@ REQUIRED_PROMPT_FIELDS = [
 
 def load_json(path: str) -> Optional[Dict[str, Any]]:
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_cached_json(path)
     except Exception as e:
         print(f"{RED}Error loading {path}: {e}{RESET}")
         return None
@@ -158,8 +157,8 @@ def main():
         sys.exit(1)
 
     # Find prompt files
-    pattern = os.path.join(base_dir, "phase_*", "prompts.json")
-    files = glob.glob(pattern)
+    corpus = PhaseCorpus(base_dir)
+    files = [str(corpus.path(p, "prompts.json")) for p in corpus.phases() if corpus.has(p, "prompts.json")]
     
     if not files:
         print(f"{YELLOW}No phase_*/prompts.json files found.{RESET}")
@@ -10,6 +10,7 @@ Usage:
     python scripts/audit_questions.py [--phase PHASE] [--format FORMAT] [--output FILE]
     python scripts/audit_questions.py --phase phase_1 --format json
     python scripts/audit_questions.py --check missing_examples,validation
+    python scripts/audit_questions.py --jobs 8
 
 CLI Arguments:
     --phase: Optional. Specific phase to audit (e.g., phase_0, phase_1). Default: all phases
@@ -17,6 +18,7 @@ CLI Arguments:
     --output: Optional. File path to save audit report. Default: stdout
     --check: Optional. Comma-separated list of specific checks to run. Default: all
     --verbose: Optional. Enable detailed logging
+    --jobs: Optional. Worker processes for multi-phase runs (0 = all CPUs). Default: 1
 
 Available Checks:
     - missing_examples: Questions without examples
@@ -34,12 +36,14 @@ Inputs:
 Outputs:
     - Audit report to stdout or specified file
     - Statistics: question counts, type distribution, manifest distribution
-    - Issue reports: missing examples, validation gaps, etc.
+    - Issue reports: missing examples, validation gaps, etc., each with the
+      question's file:line:column (json: file, pointer, line, column keys)
 
 Operational Notes:
     - Auto-discovers all data/phase_* directories
     - Safe read-only operation with no side effects
     - Can filter by specific checks to reduce output
+    - --jobs output is identical to a sequential run (results merge in phase order)
     
 Author: Roy Dawson IV
 GitHub: https://github.com/imyourboyroy
@@ -52,6 +56,9 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from collections import defaultdict
 
+from phase_corpus import PhaseCorpus, map_phases
+from json_positions import display_path, pointer, source_map
+
 
 class QuestionAuditor:
     """Audits questionnaire questions for quality and completeness."""
@@ -71,6 +78,7 @@ class QuestionAuditor:
         self.enabled_checks = set(enabled_checks) if enabled_checks else set(self.ALL_CHECKS)
         self.verbose = verbose
         self.results = []
+        self.corpus = PhaseCorpus(data_dir)
     
     def log(self, message: str) -> None:
         """Log message if verbose enabled."""
@@ -79,20 +87,11 @@ class QuestionAuditor:
     
     def discover_phases(self) -> List[str]:
         """Auto-discover all phase directories."""
-        phases = []
-        for item in self.data_dir.iterdir():
-            if item.is_dir() and item.name.startswith("phase"):
-                phases.append(item.name)
-        phases.sort()
-        return phases
+        return sorted(self.corpus.phases())
     
     def audit_phase(self, phase_name: str) -> Dict:
         """Audit a single phase and return results."""
-        phase_dir = self.data_dir / phase_name
-        questions_path = phase_dir / "questions.json"
-        manifest_path = phase_dir / "manifest.json"
-        
-        if not questions_path.exists():
+        if not self.corpus.has(phase_name, "questions.json"):
             return {
                 'phase': phase_name,
                 'error': 'questions.json not found',
@@ -101,15 +100,10 @@ class QuestionAuditor:
             }
         
         # Load phase data
-        with open(questions_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = self.corpus.questions(phase_name)
         
         # Get phase title from manifest if available
-        phase_title = phase_name
-        if manifest_path.exists():
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-                phase_title = manifest.get("artifact", {}).get("title", phase_name)
+        phase_title = self.corpus.phase_title(phase_name)
         
         self.log(f"Auditing {phase_name} ({phase_title})")
         
@@ -164,6 +158,8 @@ class QuestionAuditor:
             if 'compound_fields' in self.enabled_checks:
                 self._check_compound_fields(qid, q, q_type, issues)
         
+        self._locate(phase_name, issues)
+        
         return {
             'phase': phase_name,
             'phase_title': phase_title,
@@ -171,6 +167,19 @@ class QuestionAuditor:
             'issues': dict(issues)
         }
     
+    def _locate(self, phase_name: str, issues: Dict) -> None:
+        """Add file, JSON Pointer, line and column to every issue item."""
+        if not any(issues.values()):
+            return
+        path = self.corpus.path(phase_name, "questions.json")
+        positions = source_map(path)
+        file = display_path(path)
+        for issue_list in issues.values():
+            for item in issue_list:
+                item['file'] = file
+                item['pointer'] = pointer('questions', item['qid'])
+                item['line'], item['column'] = positions.locate(item['pointer'])
+    
     def _check_examples(self, qid: str, q: Dict, issues: Dict, stats: Dict) -> None:
         """Check for missing or empty examples."""
         examples = q.get('examples', [])
@@ -309,12 +318,13 @@ class QuestionAuditor:
                 lines.append(f"\n  {title} ({len(issue_list)}):")
                 
                 for item in issue_list[:10]:  # Limit to 10 items
+                    where = f"{item['file']}:{item['line']}:{item['column']}: " if item.get('line') else ''
                     if 'length' in item:
-                        lines.append(f"    {item['qid']}: {item['title']} ({item['length']} chars)")
+                        lines.append(f"    {where}{item['qid']}: {item['title']} ({item['length']} chars)")
                     elif 'type' in item:
-                        lines.append(f"    {item['qid']} [{item['type']}]: {item['title']}")
+                        lines.append(f"    {where}{item['qid']} [{item['type']}]: {item['title']}")
                     else:
-                        lines.append(f"    {item['qid']}: {item['title']}")
+                        lines.append(f"    {where}{item['qid']}: {item['title']}")
                 
                 if len(issue_list) > 10:
                     lines.append(f"    ... and {len(issue_list) - 10} more")
@@ -375,12 +385,13 @@ class QuestionAuditor:
                 lines.append(f"#### {title} ({len(issue_list)})\n")
                 
                 for item in issue_list[:10]:
+                    where = f"`{item['file']}:{item['line']}:{item['column']}` " if item.get('line') else ''
                     if 'length' in item:
-                        lines.append(f"- `{item['qid']}`: {item['title']} ({item['length']} chars)")
+                        lines.append(f"- {where}`{item['qid']}`: {item['title']} ({item['length']} chars)")
                     elif 'type' in item:
-                        lines.append(f"- `{item['qid']}` [{item['type']}]: {item['title']}")
+                        lines.append(f"- {where}`{item['qid']}` [{item['type']}]: {item['title']}")
                     else:
-                        lines.append(f"- `{item['qid']}`: {item['title']}")
+                        lines.append(f"- {where}`{item['qid']}`: {item['title']}")
                 
                 if len(issue_list) > 10:
                     lines.append(f"\n*... and {len(issue_list) - 10} more*\n")
@@ -449,6 +460,13 @@ Examples:
         help='Enable verbose logging'
     )
     
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Audit phases in N worker processes (0 = all CPUs). Default: 1'
+    )
+    
     args = parser.parse_args()
     
     # Parse checks
@@ -486,10 +504,7 @@ Examples:
             sys.exit(1)
     
     # Run audit
-    results = []
-    for phase in phases:
-        result = auditor.audit_phase(phase)
-        results.append(result)
+    results = map_phases(auditor.audit_phase, phases, args.jobs)
     
     # Format output
     if args.format == 'json':
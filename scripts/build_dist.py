@@ -0,0 +1,388 @@
+# ./scripts/build_dist.py
+"""
+Build Dist - Minified Runtime Copies of the Phase Files
+=======================================================
+
+Writes dist/data/{phase}.bundle.json holding the phase's questions.json,
+manifest.json and prompts.json, which is what the PWA fetches (one request
+per phase). Bundles are minified, and author-only keys the runtime never
+reads are stripped (see AUTHOR_ONLY_KEYS). Every bundle is re-parsed and
+each part checked against its source before it is kept: same content apart
+from the stripped keys, and stripped keys not referenced by js/ or html/.
+
+Usage:
+    python scripts/build_dist.py
+    python scripts/build_dist.py --phase phase_0
+    python scripts/build_dist.py --check
+    python scripts/build_dist.py --format json
+
+CLI Arguments:
+    --phase: Optional. Only build one phase. Default: all phases
+    --check: Optional. Write nothing; exit 1 if dist/ is stale or fails verification
+    --format: Optional. Report format: text or json. Default: text
+
+Inputs:
+    - data/{phase}/questions.json, manifest.json, prompts.json
+    - js/**/*.js, html/**/*.html, index.html (scanned for stripped key names)
+
+Outputs:
+    - dist/data/{phase}.bundle.json: {"format", "phase", "manifest", "questions",
+      "prompts"} (a missing phase file is null; only rewritten when the text changes)
+    - Bytes per phase: source, dist and saved, raw and gzip
+    - Warnings where tags.included_in_manifests disagrees with the manifests
+    - Exit code: 0 (success), 1 (verification failed or, with --check, stale)
+
+Operational Notes:
+    - tags.included_in_manifests repeats manifests.*.question_ids. The
+      questionnaire and the dashboard counts read the manifests, so the tags
+      are never shipped. Where they disagree the tags are wrong, and a
+      warning names the questions (validate_schema.py reports them too)
+    - A tags object left empty by stripping is dropped with it
+    - build_exports.py runs this as its 'bundles' rule via render()
+    - DataLoader.loadBundle() is the only reader of phase data in js/;
+      DataLoader.loadPhases() takes each manifest from its bundle, so no
+      per-file copies are shipped
+    - Re-run after editing phase files; `--check` is the CI gate
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import os
+import re
+import sys
+import json
+import gzip
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from phase_corpus import PROJECT_ROOT, PhaseCorpus, load_json
+
+
+DIST_DIR = PROJECT_ROOT / "dist" / "data"
+BUNDLE_FORMAT = 1
+# phase file -> key in {phase}.bundle.json
+BUNDLE_KEYS = {'manifest.json': 'manifest', 'questions.json': 'questions', 'prompts.json': 'prompts'}
+RUNTIME_SOURCES = ['js/**/*.js', 'html/**/*.html', 'index.html']
+
+# Key paths ('*' = every key at that level) the PWA never reads
+AUTHOR_ONLY_KEYS: Dict[str, List[Tuple[str, ...]]] = {
+    'questions.json': [
+        ('schema_version',),
+        ('primary_manifest_id',),
+        ('questions', '*', 'tags', 'included_in_manifests'),
+    ],
+    'manifest.json': [
+        ('schema_version',),
+    ],
+    'prompts.json': [],
+}
+
+
+def _strip(node: Any, path: Tuple[str, ...]) -> Tuple[Any, int]:
+    """Copy of node without path (copies only along the path). Returns (node, keys removed)."""
+    if not path or not isinstance(node, dict):
+        return node, 0
+    head, rest = path[0], path[1:]
+    keys = list(node) if head == '*' else [head] if head in node else []
+    out, removed = None, 0
+    for key in keys:
+        if rest:
+            child, count = _strip(node[key], rest)
+            if not count:
+                continue
+        else:
+            child, count = None, 1
+        if out is None:
+            out = dict(node)
+        removed += count
+        if child is None or child == {}:
+            del out[key]
+        else:
+            out[key] = child
+    return (node if out is None else out), removed
+
+
+def runtime_view(filename: str, data: Any) -> Tuple[Any, Dict[str, int]]:
+    """The document the PWA gets, plus how many keys each author-only path removed."""
+    stripped = {}
+    for path in AUTHOR_ONLY_KEYS.get(filename, []):
+        data, count = _strip(data, path)
+        if count:
+            stripped['.'.join(path)] = count
+    return data, stripped
+
+
+def tag_disagreements(filename: str, data: Any) -> List[str]:
+    """Questions whose stripped tags.included_in_manifests disagree with the manifests."""
+    problems = []
+    if filename == 'questions.json' and isinstance(data.get('questions'), dict):
+        manifests = data.get('manifests') or {}
+        for qid, question in data['questions'].items():
+            tags = question.get('tags') if isinstance(question, dict) else None
+            if not isinstance(tags, dict) or 'included_in_manifests' not in tags:
+                continue
+            listed = sorted(name for name, entry in manifests.items()
+                            if isinstance(entry, dict) and qid in entry.get('question_ids', []))
+            tagged = sorted(tags['included_in_manifests'] or [])
+            if tagged != listed:
+                problems.append(f"{qid}: tags.included_in_manifests {tagged} disagrees with manifests {listed}")
+    return problems
+
+
+def render_bundle(phase: str, phase_dir: str) -> str:
+    """Exact text of dist/data/{phase}.bundle.json: the runtime view of every phase file."""
+    bundle: Dict[str, Any] = {'format': BUNDLE_FORMAT, 'phase': phase}
+    for filename, key in BUNDLE_KEYS.items():
+        path = Path(phase_dir) / filename
+        bundle[key] = runtime_view(filename, load_json(path))[0] if path.exists() else None
+    return json.dumps(bundle, ensure_ascii=False, separators=(',', ':'))
+
+
+def render(phase: str, phase_dir: str) -> str:
+    """Exact text of dist/data/{phase}.bundle.json (used by build_exports.py)."""
+    return render_bundle(phase, phase_dir)
+
+
+def runtime_references(key_names: List[str], root: Path = PROJECT_ROOT) -> Dict[str, List[str]]:
+    """Runtime source files that mention each key name."""
+    pattern = re.compile(r"\b(" + "|".join(map(re.escape, key_names)) + r")\b") if key_names else None
+    found: Dict[str, List[str]] = {name: [] for name in key_names}
+    if pattern is None:
+        return found
+    for glob in RUNTIME_SOURCES:
+        for source in sorted(root.glob(glob)):
+            text = source.read_text(encoding='utf-8', errors='replace')
+            for name in sorted(set(pattern.findall(text))):
+                found[name].append(source.relative_to(root).as_posix())
+    return found
+
+
+def _author_only(filename: str, path: Tuple[str, ...]) -> bool:
+    for pattern in AUTHOR_ONLY_KEYS.get(filename, []):
+        if len(pattern) == len(path) and all(p in ('*', key) for p, key in zip(pattern, path)):
+            return True
+    return False
+
+
+def _unexplained(filename: str, source: Any, shipped: Any, path: Tuple[str, ...] = ()) -> List[str]:
+    """Differences between source and shipped that stripping author-only keys does not explain."""
+    if isinstance(source, dict) and isinstance(shipped, dict):
+        problems = []
+        for key, value in source.items():
+            if key in shipped:
+                problems.extend(_unexplained(filename, value, shipped[key], path + (key,)))
+            elif not _author_only(filename, path + (key,)) and (
+                    not isinstance(value, dict) or not value
+                    or _unexplained(filename, value, {}, path + (key,))):
+                problems.append(f"{'.'.join(path + (key,))} missing from dist")
+        problems.extend(f"{'.'.join(path + (key,))} not in source" for key in shipped if key not in source)
+        return problems
+    if isinstance(source, list) and isinstance(shipped, list) and len(source) == len(shipped):
+        return [problem for i, (a, b) in enumerate(zip(source, shipped))
+                for problem in _unexplained(filename, a, b, path + (str(i),))]
+    if source != shipped or type(source) is not type(shipped):
+        return [f"{'.'.join(path) or '(root)'} differs"]
+    return []
+
+
+def verify(phase: str, filename: str, source: Any, text: str) -> List[str]:
+    """
+    Problems with one bundle part. It is walked against its source on its own
+    (not through runtime_view), so a stripping bug cannot hide itself.
+    """
+    problems = []
+    try:
+        shipped = json.loads(text)
+    except ValueError as e:
+        return problems + [f"{phase}/{filename}: dist output does not parse: {e}"]
+    unexplained = _unexplained(filename, source, shipped)
+    problems.extend(f"{phase}/{filename}: {problem}" for problem in unexplained[:10])
+    if len(unexplained) > 10:
+        problems.append(f"{phase}/{filename}: ... {len(unexplained) - 10} more differences")
+    return problems
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_file.write_text(text, encoding='utf-8')
+    os.replace(tmp_file, path)
+    return True
+
+
+def _sizes(raw: bytes) -> Tuple[int, int]:
+    return len(raw), len(gzip.compress(raw, 9, mtime=0))
+
+
+def _update(target: Path, text: str, check: bool) -> str:
+    """'unchanged', 'stale' (check mode) or 'written'."""
+    try:
+        current = target.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        current = None
+    if current == text:
+        return 'unchanged'
+    if check:
+        return 'stale'
+    _write_if_changed(target, text)
+    return 'written'
+
+
+def verify_bundle(phase: str, sources: Dict[str, Any], text: str) -> List[str]:
+    """Problems with a bundle: each part must be the runtime view of its phase file."""
+    try:
+        bundle = json.loads(text)
+    except ValueError as e:
+        return [f"{phase}.bundle.json: does not parse: {e}"]
+    problems = []
+    if bundle.get('format') != BUNDLE_FORMAT or bundle.get('phase') != phase:
+        problems.append(f"{phase}.bundle.json: wrong format or phase")
+    for filename, key in BUNDLE_KEYS.items():
+        if filename not in sources:
+            if bundle.get(key) is not None:
+                problems.append(f"{phase}.bundle.json: has {key} but {filename} does not exist")
+            continue
+        part = json.dumps(bundle.get(key), ensure_ascii=False)
+        problems.extend(f"{phase}.bundle.json: {problem}"
+                        for problem in verify(phase, filename, sources[filename], part))
+    return problems
+
+
+def build_phase(corpus: PhaseCorpus, phase: str, check: bool = False,
+                dist_dir: Path = DIST_DIR) -> Dict[str, Any]:
+    """Render, verify and (unless check) write one phase's bundle."""
+    report = {'phase': phase, 'files': [], 'bundle': None, 'problems': [], 'warnings': [], 'stripped': {}}
+    sources = {}
+    for filename in BUNDLE_KEYS:
+        if not corpus.has(phase, filename):
+            continue
+        source_path = corpus.path(phase, filename)
+        source = sources[filename] = load_json(source_path)
+        view, stripped = runtime_view(filename, source)
+        text = json.dumps(view, ensure_ascii=False, separators=(',', ':'))
+        disagreements = tag_disagreements(filename, source)
+        if disagreements:
+            report['warnings'].append(f"{phase}/{filename}: {len(disagreements)} questions have tags that "
+                                      f"disagree with the manifests (stripped; the manifests win): "
+                                      + ", ".join(d.split(':', 1)[0] for d in disagreements))
+        for key, count in stripped.items():
+            report['stripped'][f"{filename}:{key}"] = count
+
+        source_raw, source_gzip = _sizes(source_path.read_bytes())
+        dist_raw, dist_gzip = _sizes(text.encode('utf-8'))
+        report['files'].append({
+            'file': filename,
+            'source_bytes': source_raw, 'dist_bytes': dist_raw,
+            'source_gzip': source_gzip, 'dist_gzip': dist_gzip,
+        })
+
+    if (dist_dir / phase).is_dir():
+        report['warnings'].append(f"dist/data/{phase}/ holds per-file copies that are no longer built or "
+                                  f"fetched; delete it")
+    if sources:
+        text = render_bundle(phase, str(corpus.phase_dir(phase)))
+        problems = verify_bundle(phase, sources, text)
+        report['problems'].extend(problems)
+        dist_raw, dist_gzip = _sizes(text.encode('utf-8'))
+        report['bundle'] = {
+            'file': f"{phase}.bundle.json",
+            'status': 'failed' if problems else _update(dist_dir / f"{phase}.bundle.json", text, check),
+            'dist_bytes': dist_raw, 'dist_gzip': dist_gzip, 'replaces_requests': len(sources),
+        }
+    return report
+
+
+def _pct(saved: int, total: int) -> str:
+    return f"{saved / total * 100:.1f}%" if total else "0.0%"
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Build Dist - Minified, author-key-free phase files for the PWA",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  Build dist/data/ for every phase:
+    python scripts/build_dist.py
+
+  CI: fail if dist/data/ is out of date or not equivalent to data/:
+    python scripts/build_dist.py --check
+        """
+    )
+    parser.add_argument('--phase', help='Only build this phase (default: all)')
+    parser.add_argument('--check', action='store_true', help='Write nothing; exit 1 if dist/ is stale or invalid')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='Report format (default: text)')
+    args = parser.parse_args()
+
+    corpus = PhaseCorpus.for_project()
+    if args.phase and args.phase not in corpus.phases():
+        print(f"ERROR: Unknown phase: {args.phase}")
+        sys.exit(1)
+    phases = [args.phase] if args.phase else sorted(corpus.phases())
+
+    reports = [build_phase(corpus, phase, args.check) for phase in phases]
+    stripped_keys = sorted({key.split(':', 1)[1].rsplit('.', 1)[-1] for r in reports for key in r['stripped']})
+    references = {name: files for name, files in runtime_references(stripped_keys).items() if files}
+    problems = [problem for r in reports for problem in r['problems']]
+    problems += [f"stripped key '{name}' is read by {', '.join(files)}" for name, files in references.items()]
+    stale = [r['bundle']['file'] for r in reports if r['bundle'] and r['bundle']['status'] == 'stale']
+
+    if args.format == 'json':
+        print(json.dumps({'phases': reports, 'problems': problems, 'stale': stale}, indent=2))
+    else:
+        totals = {'source_bytes': 0, 'dist_bytes': 0, 'source_gzip': 0, 'dist_gzip': 0}
+        print(f"{'Phase':<16}{'Source':>10}{'Dist':>10}{'Saved':>10}{'':>8}{'Gzip saved':>12}")
+        for r in reports:
+            sums = {key: sum(f[key] for f in r['files']) for key in totals}
+            for key in totals:
+                totals[key] += sums[key]
+            saved = sums['source_bytes'] - sums['dist_bytes']
+            gzip_saved = sums['source_gzip'] - sums['dist_gzip']
+            print(f"{r['phase']:<16}{sums['source_bytes']:>10,}{sums['dist_bytes']:>10,}{saved:>10,}"
+                  f"{_pct(saved, sums['source_bytes']):>8}{gzip_saved:>12,} ({_pct(gzip_saved, sums['source_gzip'])})")
+        saved = totals['source_bytes'] - totals['dist_bytes']
+        gzip_saved = totals['source_gzip'] - totals['dist_gzip']
+        print(f"{'Total':<16}{totals['source_bytes']:>10,}{totals['dist_bytes']:>10,}{saved:>10,}"
+              f"{_pct(saved, totals['source_bytes']):>8}{gzip_saved:>12,} ({_pct(gzip_saved, totals['source_gzip'])})")
+
+        bundles = [r['bundle'] for r in reports if r['bundle']]
+        if bundles:
+            print(f"\nBundles (one request per phase instead of {max(b['replaces_requests'] for b in bundles)}):")
+            for bundle in bundles:
+                print(f"  {bundle['file']:<28}{bundle['dist_bytes']:>10,} bytes ({bundle['dist_gzip']:,} gzip)")
+
+        counts: Dict[str, int] = {}
+        for bundle in bundles:
+            counts[bundle['status']] = counts.get(bundle['status'], 0) + 1
+        print("\nBundles: " + ", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+        stripped: Dict[str, int] = {}
+        for r in reports:
+            for key, count in r['stripped'].items():
+                stripped[key] = stripped.get(key, 0) + count
+        for key, count in sorted(stripped.items()):
+            print(f"  stripped {key} x{count}")
+        for name in stale:
+            print(f"  stale: dist/data/{name}")
+        for r in reports:
+            for warning in r['warnings']:
+                print(f"WARNING: {warning}")
+        for problem in problems:
+            print(f"ERROR: {problem}")
+
+    if problems or stale:
+        sys.exit(1)
+    if args.format == 'text':
+        print("[SUCCESS] dist/data matches data/ at runtime" if args.check else "[SUCCESS] dist/data built and verified")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
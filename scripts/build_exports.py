@@ -0,0 +1,344 @@
+# ./scripts/build_exports.py
+"""
+Build Exports - Incremental Runner for Every Generated File
+===========================================================
+
+One make-style build for the outputs of export_questions.py,
+export_prompts.py, export_manifests.py, export_schemas.py,
+generate_schema_snapshots.py and build_dist.py. Each output file is a node. A node depends on
+one phase input file and on the source of the generator that renders it.
+Inputs and generators are fingerprinted by content, and only stale nodes
+run, across a process pool. A file is only written when its content changes.
+
+Usage:
+    python scripts/build_exports.py
+    python scripts/build_exports.py --dry-run
+    python scripts/build_exports.py --rule schemas --phase phase_0 --force
+    python scripts/build_exports.py --jobs 4 --verbose
+
+CLI Arguments:
+    --rule: Optional. Only build one rule's outputs (see Rules). Default: all
+    --phase: Optional. Only build one phase's outputs. Default: all phases
+    --force: Optional. Treat every selected node as stale
+    --dry-run: Optional. List stale nodes and why, without building
+    --jobs: Optional. Worker processes for stale nodes (0 = all CPUs). Default: 0
+    --verbose: Optional. Also list up-to-date nodes
+
+Rules:
+    questions-text: data/{phase}/questions.json -> exports/questions/{phase}_questions.txt
+    prompts-text: data/{phase}/prompts.json -> exports/prompts/{phase}_prompts.txt
+    manifests: data/{phase}/manifest.json -> exports/manifests/{phase}_manifest.json
+    schemas: data/{phase}/{file}.json -> exports/schemas/{phase}_{file}_schema.json
+    schema-snapshots: data/{phase}/{file}.json -> data/{phase}/{phase}_{file}_schema.json
+    bundles: data/{phase}/ -> dist/data/{phase}.bundle.json (all three files, one request)
+
+Inputs:
+    - data/{phase}/questions.json, manifest.json, prompts.json
+    - scripts/{generator}.py (its source is part of every node's fingerprint)
+    - scripts/schema_inference.py (part of the schemas/schema-snapshots fingerprint)
+    - .cache/build/state.json (fingerprints of the last build)
+
+Outputs:
+    - The stale files above (unchanged content is never rewritten)
+    - Summary line plus one line per stale node (written, unchanged, failed)
+    - Exit code: 0 (success), 1 (a node failed)
+
+Operational Notes:
+    - Up to date = same input and generator hashes as the last build, and the
+      output still has the (mtime, size) that build left. Editing an output by
+      hand therefore makes it stale again.
+    - Files whose (mtime, size) did not change are not re-hashed, so a no-op
+      build only stats files and finishes in a few milliseconds. Touching a file
+      without changing it re-hashes it but rebuilds nothing.
+    - Renders go through each generator's render() function, so outputs are
+      byte-identical to running the generator scripts directly
+    - Writes are atomic (temp file + rename)
+    - PHASE_RULES make one node per phase whose input is the phase
+      directory; its fingerprint covers all of the rule's input files
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import importlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from phase_corpus import PROJECT_ROOT, PhaseCorpus, map_phases
+
+
+BUILD_FORMAT = 1
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_STATE_FILE = PROJECT_ROOT / ".cache" / "build" / "state.json"
+SCHEMA_INPUTS = ['questions.json', 'manifest.json', 'prompts.json']
+
+# rule -> (generator module with render(phase, path), phase input files, output template)
+RULES: Dict[str, Tuple[str, List[str], str]] = {
+    'questions-text': ('export_questions', ['questions.json'], 'exports/questions/{phase}_questions.txt'),
+    'prompts-text': ('export_prompts', ['prompts.json'], 'exports/prompts/{phase}_prompts.txt'),
+    'manifests': ('export_manifests', ['manifest.json'], 'exports/manifests/{phase}_manifest.json'),
+    'schemas': ('export_schemas', SCHEMA_INPUTS, 'exports/schemas/{phase}_{name}_schema.json'),
+    'schema-snapshots': ('generate_schema_snapshots', SCHEMA_INPUTS, 'data/{phase}/{phase}_{name}_schema.json'),
+    'bundles': ('build_dist', SCHEMA_INPUTS, 'dist/data/{phase}.bundle.json'),
+}
+
+# Rules with one node per phase (input: the phase directory, fingerprinted over all inputs)
+PHASE_RULES = {'bundles'}
+
+# Shared modules a generator renders through (their source is fingerprinted with it)
+GENERATOR_DEPS: Dict[str, List[str]] = {
+    'export_schemas': ['schema_inference'],
+    'generate_schema_snapshots': ['schema_inference'],
+}
+
+# (rule, generator module, phase, input path, output path), paths project-relative;
+# the input is the phase directory for per-phase rules
+Node = Tuple[str, str, str, str, str]
+
+
+def _stamp(path: Path) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def build_graph(corpus: PhaseCorpus, rule: Optional[str] = None, phase: Optional[str] = None) -> List[Node]:
+    """Every output node, in rule then phase order."""
+    data_prefix = Path(corpus.data_dir).resolve().relative_to(PROJECT_ROOT).as_posix()
+    phases = [phase] if phase else sorted(corpus.phases())
+    nodes = []
+    for name, (module, inputs, template) in RULES.items():
+        if rule and name != rule:
+            continue
+        for phase_name in phases:
+            if name in PHASE_RULES:
+                if any(corpus.has(phase_name, filename) for filename in inputs):
+                    nodes.append((name, module, phase_name, f"{data_prefix}/{phase_name}",
+                                  template.format(phase=phase_name)))
+                continue
+            for filename in inputs:
+                if corpus.has(phase_name, filename):
+                    output = template.format(phase=phase_name, name=filename.replace('.json', ''))
+                    nodes.append((name, module, phase_name, f"{data_prefix}/{phase_name}/{filename}", output))
+    return nodes
+
+
+class Fingerprints:
+    """Content hashes of inputs and generator sources, re-hashed only when (mtime, size) moved."""
+
+    def __init__(self, known: Dict[str, List[Any]]):
+        self.known = known
+        self.files: Dict[str, List[Any]] = {}
+        self.hashed = 0
+
+    def hash(self, path: str) -> Optional[str]:
+        if path in self.files:
+            return self.files[path][2]
+        stamp = _stamp(PROJECT_ROOT / path)
+        if stamp is None:
+            return None
+        entry = self.known.get(path)
+        if entry is None or entry[:2] != stamp:
+            with open(PROJECT_ROOT / path, 'rb') as f:
+                entry = stamp + [hashlib.blake2b(f.read(), digest_size=16).hexdigest()]
+            self.hashed += 1
+        self.files[path] = entry
+        return entry[2]
+
+
+def _generator_path(module: str) -> str:
+    return (SCRIPTS_DIR / f"{module}.py").relative_to(PROJECT_ROOT).as_posix()
+
+
+def code_hash(module: str, fingerprints: Fingerprints) -> Optional[str]:
+    """Fingerprint of a generator's source plus the shared modules it renders through."""
+    modules = [module] + GENERATOR_DEPS.get(module, [])
+    hashes = [fingerprints.hash(_generator_path(name)) for name in modules]
+    if None in hashes:
+        return None
+    return hashes[0] if len(hashes) == 1 else hashlib.blake2b('|'.join(hashes).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def input_hash(node: Node, fingerprints: Fingerprints) -> Optional[str]:
+    """Fingerprint of a node's input file, or of every rule input in its phase directory."""
+    rule, _, _, input_path, _ = node
+    if input_path.endswith('.json'):
+        return fingerprints.hash(input_path)
+    hashes = [str(fingerprints.hash(f"{input_path}/{filename}")) for filename in RULES[rule][1]]
+    return hashlib.blake2b('|'.join(hashes).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def stale_reason(node: Node, fingerprints: Fingerprints, previous: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Why a node must run, or None when its output is up to date."""
+    _, module, _, input_path, output = node
+    if previous is None:
+        return "new"
+    if previous.get('code') != code_hash(module, fingerprints):
+        return "generator changed"
+    if previous.get('input') != input_hash(node, fingerprints):
+        return "input changed"
+    stamp = _stamp(PROJECT_ROOT / output)
+    if stamp is None:
+        return "output missing"
+    if previous.get('stamp') != stamp:
+        return "output modified"
+    return None
+
+
+def run_node(node: Node) -> Dict[str, Any]:
+    """Render one node and write it if its content changed (runs in a worker process)."""
+    _, module, phase, input_path, output = node
+    target = PROJECT_ROOT / output
+    try:
+        text = importlib.import_module(module).render(phase, str(PROJECT_ROOT / input_path))
+        try:
+            with open(target, 'r', encoding='utf-8') as f:
+                current = f.read()
+        except (OSError, UnicodeDecodeError):
+            current = None
+        if current == text:
+            status = 'unchanged'
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_file, target)
+            status = 'written'
+    except Exception as e:
+        return {'output': output, 'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+    return {'output': output, 'status': status, 'stamp': _stamp(target)}
+
+
+def load_state(state_file: Path) -> Dict[str, Any]:
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('format') == BUILD_FORMAT:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'format': BUILD_FORMAT, 'files': {}, 'outputs': {}}
+
+
+def save_state(state_file: Path, state: Dict[str, Any]) -> None:
+    try:
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = state_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(state, sort_keys=True), encoding='utf-8')
+        os.replace(tmp_file, state_file)
+    except OSError:
+        pass
+
+
+def build(corpus: PhaseCorpus, rule: Optional[str] = None, phase: Optional[str] = None, force: bool = False,
+          dry_run: bool = False, jobs: int = 0, state_file: Path = DEFAULT_STATE_FILE) -> Dict[str, Any]:
+    """Run every stale node; returns {'nodes', 'stale': [(node, reason)], 'results', 'hashed'}."""
+    state = load_state(state_file)
+    fingerprints = Fingerprints(state['files'])
+    nodes = build_graph(corpus, rule, phase)
+
+    stale = []
+    for node in nodes:
+        reason = "forced" if force else stale_reason(node, fingerprints, state['outputs'].get(node[4]))
+        if reason:
+            stale.append((node, reason))
+
+    results = []
+    if stale and not dry_run:
+        results = map_phases(run_node, [node for node, _ in stale], jobs)
+        for (node, _), result in zip(stale, results):
+            if result['status'] == 'failed':
+                state['outputs'].pop(node[4], None)
+            else:
+                state['outputs'][node[4]] = {
+                    'code': code_hash(node[1], fingerprints),
+                    'input': input_hash(node, fingerprints),
+                    'stamp': result['stamp'],
+                }
+    if fingerprints.hashed or results:
+        state['files'].update(fingerprints.files)
+        if not dry_run:
+            save_state(state_file, state)
+
+    return {'nodes': nodes, 'stale': stale, 'results': results, 'hashed': fingerprints.hashed}
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Build Exports - Rebuild only the stale exports and schema snapshots",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  Build everything that is out of date:
+    python scripts/build_exports.py
+
+  Show what would run and why:
+    python scripts/build_exports.py --dry-run
+
+  Rebuild one rule for one phase regardless of fingerprints:
+    python scripts/build_exports.py --rule schemas --phase phase_0 --force
+        """
+    )
+    parser.add_argument('--rule', choices=list(RULES), help='Only build this rule (default: all)')
+    parser.add_argument('--phase', help='Only build this phase (default: all)')
+    parser.add_argument('--force', action='store_true', help='Treat every selected node as stale')
+    parser.add_argument('--dry-run', action='store_true', help='List stale nodes without building')
+    parser.add_argument('--jobs', type=int, default=0, help='Worker processes for stale nodes (0 = all CPUs)')
+    parser.add_argument('--verbose', action='store_true', help='Also list up-to-date nodes')
+    args = parser.parse_args()
+
+    corpus = PhaseCorpus.for_project()
+    if args.phase and args.phase not in corpus.phases():
+        print(f"ERROR: Unknown phase: {args.phase}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    report = build(corpus, args.rule, args.phase, args.force, args.dry_run, args.jobs)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    results = {result['output']: result for result in report['results']}
+    counts = {'written': 0, 'unchanged': 0, 'failed': 0}
+    for result in report['results']:
+        counts[result['status']] += 1
+
+    stale_count = len(report['stale'])
+    fresh_count = len(report['nodes']) - stale_count
+    if args.dry_run:
+        print(f"Build (dry run): {len(report['nodes'])} nodes, {stale_count} stale, {fresh_count} up to date")
+    else:
+        print(f"Build: {len(report['nodes'])} nodes, {stale_count} stale ({counts['written']} written, "
+              f"{counts['unchanged']} unchanged, {counts['failed']} failed), {fresh_count} up to date "
+              f"in {elapsed_ms:.1f} ms")
+
+    for node, reason in report['stale']:
+        result = results.get(node[4])
+        status = result['status'] if result else 'stale'
+        line = f"  {status:<10} {node[4]} ({reason})"
+        if result and result['status'] == 'failed':
+            line += f"\n  ERROR: {result['error']}"
+        print(line)
+    if args.verbose:
+        stale_outputs = {node[4] for node, _ in report['stale']}
+        for node in report['nodes']:
+            if node[4] not in stale_outputs:
+                print(f"  {'up to date':<10} {node[4]}")
+
+    if counts['failed']:
+        sys.exit(1)
+    if not args.dry_run:
+        print("[SUCCESS] Exports up to date")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
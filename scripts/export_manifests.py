@@ -16,9 +16,9 @@ Key Outputs:
 """
 
 import json
-import glob
 import os
-import shutil
+
+from phase_corpus import PhaseCorpus, load_json
 
 # ANSI Colors
 GREEN = "\033[92m"
@@ -26,6 +26,10 @@ RED = "\033[91m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+def render(phase_name, file_path):
+    """Exact text of exports/manifests/{phase}_manifest.json (also used by build_exports.py)."""
+    return json.dumps(load_json(file_path), indent=4)
+
 def main():
     print(f"{BOLD}Starting Manifest Export...{RESET}\n")
     
@@ -35,10 +39,9 @@ def main():
     
     os.makedirs(export_dir, exist_ok=True)
     
-    # Dynamic pattern to catch all phases
-    pattern = os.path.join(data_dir, "phase_*", "manifest.json")
-    files = glob.glob(pattern)
-    files.sort()
+    # Registry-driven discovery catches all phases
+    corpus = PhaseCorpus(data_dir)
+    files = [str(corpus.path(p, "manifest.json")) for p in sorted(corpus.phases()) if corpus.has(p, "manifest.json")]
     
     if not files:
         print(f"{RED}No manifest.json files found.{RESET}")
@@ -51,13 +54,10 @@ def main():
         target_path = os.path.join(export_dir, target_name)
         
         try:
-            # We copy valid JSON to ensure it is formatted nicely? 
-            # Or just copy the file. Let's load and dump to ensure pretty print.
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            # Load and dump (rather than copy) so every export is pretty-printed the same way
+            text = render(phase_dir_name, file_path)
             with open(target_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+                f.write(text)
                 
             print(f"Exported {BOLD}{phase_dir_name}{RESET} -> {target_name}")
             count += 1
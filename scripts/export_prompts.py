@@ -16,11 +16,11 @@ Key Outputs:
     - exports/prompts/phase_[id]_prompts.txt: formatted text file.
 """
 
-import json
-import glob
 import os
 import sys
 
+from phase_corpus import PhaseCorpus, load_json as load_cached_json
+
 # ANSI Colors
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -29,8 +29,7 @@ BOLD = "\033[1m"
 
 def load_json(path):
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_cached_json(path)
     except Exception as e:
         print(f"{RED}Error loading {path}: {e}{RESET}")
         return None
@@ -101,6 +100,10 @@ def convert_to_text(data, phase_name):
 
     return "\n".join(lines)
 
+def render(phase_name, file_path):
+    """Exact text of exports/prompts/{phase}_prompts.txt (also used by build_exports.py)."""
+    return convert_to_text(load_cached_json(file_path), phase_name)
+
 def main():
     print(f"{BOLD}Starting Formatted Prompts Export...{RESET}\n")
     
@@ -110,9 +113,8 @@ def main():
     
     os.makedirs(export_dir, exist_ok=True)
     
-    pattern = os.path.join(data_dir, "phase_*", "prompts.json")
-    files = glob.glob(pattern)
-    files.sort()
+    corpus = PhaseCorpus(data_dir)
+    files = [str(corpus.path(p, "prompts.json")) for p in sorted(corpus.phases()) if corpus.has(p, "prompts.json")]
     
     if not files:
         print(f"{RED}No prompts.json files found.{RESET}")
@@ -8,18 +8,25 @@ text format in `exports/questions/`.
 
 Usage:
     python scripts/export_questions.py
+    python scripts/export_questions.py --watch [--poll-ms 50]
 
 Key Inputs:
     - data/phase_*/questions.json
 
 Key Outputs:
     - exports/questions/phase_[id]_questions.txt: formatted text file.
+
+Watch Mode:
+    --watch re-exports only the phase whose questions.json was saved and
+    prints the save-to-export latency (see phase_watch.py).
 """
 
-import json
-import glob
 import os
 import sys
+import argparse
+from datetime import datetime
+
+from phase_corpus import PhaseCorpus, load_json as load_cached_json
 
 # ANSI Colors
 GREEN = "\033[92m"
@@ -29,8 +36,7 @@ BOLD = "\033[1m"
 
 def load_json(path):
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_cached_json(path)
     except Exception as e:
         print(f"{RED}Error loading {path}: {e}{RESET}")
         return None
@@ -104,7 +110,50 @@ def convert_to_text(data, phase_name):
 
     return "\n".join(lines)
 
+def render(phase_name, file_path):
+    """Exact text of exports/questions/{phase}_questions.txt (also used by build_exports.py)."""
+    return convert_to_text(load_cached_json(file_path), phase_name)
+
+def export_phase(file_path, export_dir):
+    """Export one questions.json; returns the target file name, or None on failure."""
+    phase_dir = os.path.basename(os.path.dirname(file_path))
+    target_name = f"{phase_dir}_questions.txt"
+    target_path = os.path.join(export_dir, target_name)
+    
+    data = load_json(file_path)
+    if not data:
+        return None
+    try:
+        formatted_text = convert_to_text(data, phase_dir)
+        with open(target_path, 'w', encoding='utf-8') as f:
+            f.write(formatted_text)
+    except Exception as e:
+        print(f"{RED}Failed to write {target_name}: {e}{RESET}")
+        return None
+    return target_name
+
+def watch(corpus, export_dir, poll_ms):
+    from phase_watch import PhaseWatcher
+    
+    watcher = PhaseWatcher(corpus, ["questions.json"], poll_ms=poll_ms)
+    
+    def on_change(phase, filenames):
+        stamp = datetime.now().strftime('%H:%M:%S')
+        target_name = export_phase(str(corpus.path(phase, "questions.json")), export_dir)
+        latency = watcher.latency_ms(phase, filenames)
+        if target_name:
+            print(f"[{stamp}] Exported {BOLD}{phase}{RESET} -> {target_name} ({latency:.0f} ms after save)")
+        else:
+            print(f"[{stamp}] {RED}Skipped {phase}: questions.json could not be exported{RESET}")
+    
+    watcher.run(on_change)
+
 def main():
+    parser = argparse.ArgumentParser(description="Export questions.json files to formatted text")
+    parser.add_argument('--watch', action='store_true', help='Re-export a phase whenever its questions.json is saved')
+    parser.add_argument('--poll-ms', type=float, default=50, help='--watch polling interval in ms (default: 50)')
+    args = parser.parse_args()
+    
     print(f"{BOLD}Starting Formatted Questions Export...{RESET}\n")
     
     base_dir = os.path.join(os.path.dirname(__file__), "..")
@@ -113,9 +162,8 @@ def main():
     
     os.makedirs(export_dir, exist_ok=True)
     
-    pattern = os.path.join(data_dir, "phase_*", "questions.json")
-    files = glob.glob(pattern)
-    files.sort()
+    corpus = PhaseCorpus(data_dir)
+    files = [str(corpus.path(p, "questions.json")) for p in sorted(corpus.phases()) if corpus.has(p, "questions.json")]
     
     if not files:
         print(f"{RED}No questions.json files found.{RESET}")
@@ -123,23 +171,16 @@ def main():
 
     count = 0
     for file_path in files:
-        phase_dir = os.path.basename(os.path.dirname(file_path))
-        target_name = f"{phase_dir}_questions.txt"
-        target_path = os.path.join(export_dir, target_name)
-        
-        data = load_json(file_path)
-        if data:
-            try:
-                formatted_text = convert_to_text(data, phase_dir)
-                with open(target_path, 'w', encoding='utf-8') as f:
-                    f.write(formatted_text)
-                
-                print(f"Exported {BOLD}{phase_dir}{RESET} -> {target_name}")
-                count += 1
-            except Exception as e:
-                print(f"{RED}Failed to write {target_name}: {e}{RESET}")
+        target_name = export_phase(file_path, export_dir)
+        if target_name:
+            print(f"Exported {BOLD}{os.path.basename(os.path.dirname(file_path))}{RESET} -> {target_name}")
+            count += 1
                 
     print(f"\n{GREEN}Success! Exported {count} formatted files to {export_dir}{RESET}")
+    
+    if args.watch:
+        print()
+        watch(corpus, export_dir, args.poll_ms)
 
 if __name__ == "__main__":
     main()
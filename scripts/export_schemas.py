@@ -16,12 +16,14 @@ Key Inputs:
 
 Key Outputs:
     - exports/schemas/{phase}_{type}_schema.json
+
+Inference lives in schema_inference.py (shared with generate_schema_snapshots.py).
 """
 
-import json
-import glob
 import os
-from collections import defaultdict
+
+from phase_corpus import PhaseCorpus
+from schema_inference import render_snapshot
 
 # ANSI Colors
 GREEN = "\033[92m"
@@ -29,58 +31,9 @@ RED = "\033[91m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
-def get_structure(data):
-    """
-    Recursively extracts the structure (keys and types) of a dictionary or list.
-    """
-    if isinstance(data, dict):
-        structure = {}
-        for k, v in data.items():
-            if isinstance(v, (dict, list)):
-                structure[k] = get_structure(v)
-            else:
-                structure[k] = type(v).__name__
-        return structure
-    elif isinstance(data, list):
-        if not data:
-            return "list(empty)"
-        
-        # If list of dicts, merge structures
-        if all(isinstance(i, dict) for i in data):
-            merged_structure = {}
-            for item in data:
-                item_structure = get_structure(item)
-                for k, v in item_structure.items():
-                    if k not in merged_structure:
-                        merged_structure[k] = v
-            return ["list(dict)", merged_structure]
-        else:
-            return f"list({type(data[0]).__name__})"
-    else:
-        return type(data).__name__
-
-def analyze_questions_schema(questions_data):
-    """
-    Specifically analyzes the questions.json structure.
-    """
-    schema_summary = {
-        "root_keys": list(questions_data.keys()),
-        "answer_schemas_by_type": defaultdict(dict)
-    }
-    
-    questions = questions_data.get("questions", {})
-    if isinstance(questions, dict):
-        for q_id, q_data in questions.items():
-            q_type = q_data.get("type", "unknown")
-            a_schema = q_data.get("answer_schema", {})
-            
-            if q_type not in schema_summary["answer_schemas_by_type"]:
-                 schema_summary["answer_schemas_by_type"][q_type] = {}
-            
-            for k in a_schema.keys():
-                schema_summary["answer_schemas_by_type"][q_type][k] = type(a_schema[k]).__name__
-
-    return schema_summary
+def render(phase_name, file_path):
+    """Exact text of exports/schemas/{phase}_{type}_schema.json (also used by build_exports.py)."""
+    return render_snapshot(file_path)
 
 def main():
     print(f"{BOLD}Starting Schema Export...{RESET}\n")
@@ -92,8 +45,8 @@ def main():
     os.makedirs(export_dir, exist_ok=True)
     
     # Dynamic: find all phase directories
-    phase_dirs = glob.glob(os.path.join(data_dir, "phase_*"))
-    phase_dirs.sort()
+    corpus = PhaseCorpus(data_dir)
+    phase_dirs = [str(corpus.phase_dir(p)) for p in sorted(corpus.phases())]
     
     if not phase_dirs:
         print(f"{RED}No phase directories found.{RESET}")
@@ -109,23 +62,14 @@ def main():
                 continue
                 
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Generate schema logic
-                if filename == "questions.json":
-                    schema_snapshot = analyze_questions_schema(data)
-                    schema_snapshot["full_structure_sample"] = get_structure(data)
-                else:
-                    schema_snapshot = get_structure(data)
-                
                 # Output file name: phase_0_questions_schema.json
                 base_name = filename.replace('.json', '')
                 target_name = f"{phase_name}_{base_name}_schema.json"
                 target_path = os.path.join(export_dir, target_name)
                 
+                text = render(phase_name, file_path)
                 with open(target_path, 'w', encoding='utf-8') as f:
-                    json.dump(schema_snapshot, f, indent=4)
+                    f.write(text)
                 
                 print(f"Exported {BOLD}{target_name}{RESET}")
                 count += 1
@@ -31,29 +31,25 @@ GitHub: https://github.com/imyourboyroy
 """
 
 
-import json
 import sys
-from pathlib import Path
+
+from phase_corpus import PhaseCorpus
+
+
+CORPUS = PhaseCorpus.for_project()
 
 def extract_questions(phase_name: str) -> None:
     """Extract and print questions from a phase's questions.json file."""
-    data_dir = Path(__file__).parent.parent / "data" / phase_name
-    questions_file = data_dir / "questions.json"
-    manifest_file = data_dir / "manifest.json"
+    questions_file = CORPUS.path(phase_name, "questions.json")
     
     if not questions_file.exists():
         print(f"ERROR: {questions_file} not found")
         return
     
-    with open(questions_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = CORPUS.questions(phase_name)
     
     # Load manifest for phase title
-    phase_title = phase_name
-    if manifest_file.exists():
-        with open(manifest_file, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
-            phase_title = manifest.get("artifact", {}).get("title", phase_name)
+    phase_title = CORPUS.phase_title(phase_name)
     
     sections = {s["id"]: s["title"] for s in data.get("sections", [])}
     questions = data.get("questions", {})
@@ -135,12 +131,9 @@ def main():
     else:
         phase_arg = "all"
     
-    data_dir = Path(__file__).parent.parent / "data"
-    
     if phase_arg == "all":
         # Find all phase directories
-        phases = [d.name for d in data_dir.iterdir() if d.is_dir() and d.name.startswith("phase")]
-        phases.sort()
+        phases = sorted(CORPUS.phases())
     else:
         phases = [phase_arg]
     
@@ -5,16 +5,20 @@ Find Schema Mismatches (Generic)
 
 Checks for discrepancies between 'answer_schema' keys and 'fields' keys 
 in compound questions for a specific phase.
+Checks are the 'mismatches' rule set of validation_engine.py.
+Each mismatch lists the file:line:column of the question.
 
 Usage:
     python scripts/find_schema_mismatches_generic.py --phase phase_0
 """
 
-import json
 import argparse
 from pathlib import Path
 import sys
 
+from phase_corpus import load_json
+from validation_engine import ValidationEngine, finding_location, locate_findings
+
 def check_phase(phase_dir):
     questions_file = phase_dir / "questions.json"
     if not questions_file.exists():
@@ -25,48 +29,24 @@ def check_phase(phase_dir):
         return
 
     try:
-        with open(questions_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(questions_file)
     except Exception as e:
         print(f"Error reading {questions_file}: {e}")
         return
 
-    questions = data.get('questions', {})
     print(f"Checking {phase_dir.name}...")
 
-    issues_found = 0
-    for qid, q in questions.items():
-        q_type = q.get('type')
-        schema_keys = set(q.get('answer_schema', {}).keys())
-        expected_keys = set()
-        
-        if q_type == 'compound':
-            for field in q.get('fields', []):
-                expected_keys.add(field.get('key'))
-        elif q_type == 'single_select':
-            expected_keys.add('selected_value')
-            # Check if 'other' is an option
-            if any(opt.get('value') == 'other' for opt in q.get('options', [])):
-                expected_keys.add('other_text')
-        elif q_type == 'multi_select':
-            expected_keys.add('selected_values')
-            # Check if 'other' is an option
-            if any(opt.get('value') == 'other' for opt in q.get('options', [])):
-                expected_keys.add('other_text')
-        else:
-            # Skip unknown types for now
-            continue
-
-        missing_in_schema = expected_keys - schema_keys
-        extra_in_schema = schema_keys - expected_keys
-        
-        if missing_in_schema or extra_in_schema:
-            issues_found += 1
-            print(f"\n[MISMATCH] {qid}: {q.get('title')} ({q_type})")
-            if missing_in_schema:
-                print(f"  Missing from Schema: {missing_in_schema}")
-            if extra_in_schema:
-                print(f"  Extra in Schema (should remove?): {extra_in_schema}")
+    engine = ValidationEngine(rule_sets=['mismatches'])
+    findings = locate_findings(phase_dir, engine.run(phase_dir.name, data))
+    for finding in findings:
+        details = finding['data']
+        print(f"\n[MISMATCH] {details['qid']}: {details['title']} ({details['type']})")
+        print(f"  At: {finding_location(finding)}")
+        if details['missing']:
+            print(f"  Missing from Schema: {details['missing']}")
+        if details['extra']:
+            print(f"  Extra in Schema (should remove?): {details['extra']}")
+    issues_found = len(findings)
 
     if issues_found == 0:
         print(f"  No mismatches found in {phase_dir.name}.")
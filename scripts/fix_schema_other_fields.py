@@ -10,6 +10,8 @@ import json
 import shutil
 from pathlib import Path
 
+from phase_corpus import PhaseCorpus, load_json
+
 def fix_file(filepath):
     print(f"Processing: {filepath}")
     
@@ -18,8 +20,7 @@ def fix_file(filepath):
     shutil.copy2(filepath, backup_path)
     print(f"  [Backup] Created {backup_path.name}")
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(filepath, use_cache=False)
 
     questions = data.get("questions", {})
     if not questions:
@@ -106,7 +107,8 @@ def main():
         print("Data directory not found.")
         return
 
-    files = list(root_dir.rglob("questions.json"))
+    corpus = PhaseCorpus(root_dir)
+    files = [corpus.path(p, "questions.json") for p in corpus.phases() if corpus.has(p, "questions.json")]
     print(f"Found {len(files)} files to check.")
     
     total_fixed = 0
@@ -3,14 +3,14 @@
 Comprehensive question audit script for Ready for Us.
 Analyzes all questions for structure optimization, examples, and AI-readability.
 """
-import json
 import os
 
+from phase_corpus import load_json
+
 def audit_phase(phase_path, phase_name):
     questions_path = os.path.join(phase_path, 'questions.json')
     
-    with open(questions_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(questions_path)
     
     print(f"\n{'='*70}")
     print(f" {phase_name}")
@@ -0,0 +1,368 @@
+# ./scripts/json_positions.py
+"""
+JSON Positions - Position-Tracking JSON Loader
+==============================================
+
+Parses JSON while recording where each object starts, and maps RFC 6901
+JSON Pointers (the 'path' of every validation finding) back to that line
+and column, so reports can say "questions.json:412:9" instead of making
+editors search a 130 KB file.
+
+Usage:
+    from json_positions import load_with_positions, source_map
+
+    data, positions = load_with_positions(path)
+    line, column = positions.locate('/questions/q12/options/3')
+
+    python scripts/json_positions.py --benchmark [--repeat 20] [--phase phase_0]
+    python scripts/json_positions.py data/phase_0/questions.json /questions/q12/options/3
+
+CLI Arguments:
+    file, pointer: Optional. Print file:line:column for one pointer
+    --benchmark: Optional. Time json.loads against the position-tracking parse
+        (and against also locating every question, option and field);
+        fails if the parse costs more than 2x json.loads
+    --phase: Optional. Benchmark one phase only. Default: all phases
+    --repeat: Optional. Runs per benchmark case (best is reported). Default: 20
+
+Inputs:
+    - Any JSON file (the benchmark reads data/{phase}/questions.json)
+
+Outputs:
+    - (line, column), both 1-based, column counted in characters
+    - Benchmark table and exit code: 0 (within budget), 1 (over budget)
+
+Operational Notes:
+    - The parse records every top-level key and every question, section and
+      manifest (EAGER_DEPTH); values below that go through the C scanner, so
+      each byte is still decoded once (~1.3x json.loads). Deeper containers
+      (options, fields, answer_schema) are indexed the first time a pointer
+      passes through them
+    - Validators keep using phase_corpus.load_json for data and only build
+      a map (source_map) for files that have findings
+    - A pointer into a missing key resolves to its nearest existing
+      ancestor ("Missing 'options'" points at the question that lacks it)
+    - source_map() keeps one map per file, keyed like phase_corpus.load_json
+      (path, mtime, size), so watch loops and repeated reports reuse it
+    - duplicate_keys() lists keys that repeat within one object, which
+      json.loads silently collapses to the last value. Only the eagerly
+      parsed levels are checked (top-level keys, question IDs, manifest
+      names), so the answer never depends on which pointers were located
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+from bisect import bisect_left
+from itertools import accumulate
+from pathlib import Path
+from json.decoder import scanstring
+from typing import Any, Dict, List, Optional, Tuple
+
+from phase_corpus import PROJECT_ROOT, PhaseCorpus
+
+
+# The position-tracking parse may cost at most this many times json.loads
+OVERHEAD_BUDGET = 2.0
+
+Location = Tuple[int, int]
+
+# load_with_positions records offsets this many container levels deep while
+# parsing (the document's keys, then each question/section/manifest);
+# anything deeper is indexed on first lookup. A third level costs ~2.5x
+EAGER_DEPTH = 2
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_MEMBER = re.compile(r'[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*:[ \t\n\r]*')
+_COLON = re.compile(r'[ \t\n\r]*:[ \t\n\r]*')
+_SEPARATOR = re.compile(r'[ \t\n\r]*([,\]}])[ \t\n\r]*')
+_EMPTY = {'{': re.compile(r'[ \t\n\r]*}'), '[': re.compile(r'[ \t\n\r]*]')}
+_SCAN_ONCE = json.JSONDecoder().scan_once
+
+# path -> ((mtime_ns, size), SourceMap)
+_MAP_CACHE: Dict[str, Tuple[Tuple[int, int], 'SourceMap']] = {}
+
+
+def pointer(*parts: Any) -> str:
+    """RFC 6901 JSON Pointer for a node path."""
+    return ''.join('/' + str(p).replace('~', '~0').replace('/', '~1') for p in parts)
+
+
+def split_pointer(path: str) -> List[str]:
+    """Reference tokens of an RFC 6901 pointer ('' is the whole document)."""
+    if not path:
+        return []
+    return [token.replace('~1', '/').replace('~0', '~') for token in path[1:].split('/')]
+
+
+class SourceMap:
+    """Resolves JSON Pointers to (line, column) in one document's source text."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._root = _WHITESPACE.match(text, 0).end()
+        # container offset -> {key or index: value offset}
+        self._children: Dict[int, Dict[str, int]] = {}
+        # (object offset, key) for every key that repeats within its object
+        self._duplicates: List[Tuple[int, str]] = []
+        self._newlines: Optional[List[int]] = None
+
+    def parse(self, depth: int = EAGER_DEPTH) -> Any:
+        """
+        Parse the document, recording offsets `depth` container levels deep.
+
+        Raises json.JSONDecodeError exactly like json.loads (malformed input
+        is handed to json.loads for the error message).
+        """
+        try:
+            if self.text[self._root] in '{[':
+                data, end = self._container(self._root, depth)
+            else:
+                data, end = _SCAN_ONCE(self.text, self._root)
+            if _WHITESPACE.match(self.text, end).end() == len(self.text):
+                return data
+        except (IndexError, ValueError, AttributeError, StopIteration):
+            pass
+        self._children.clear()
+        self._duplicates.clear()
+        return json.loads(self.text)
+
+    def offset(self, path: str) -> int:
+        """Character offset of the node at path, or of its nearest existing ancestor."""
+        offset = self._root
+        for token in split_pointer(path):
+            children = self._children.get(offset)
+            if children is None:
+                try:
+                    self._container(offset, 1)
+                except (IndexError, ValueError, AttributeError, StopIteration):
+                    pass  # malformed tail: keep what was indexed
+                children = self._children.setdefault(offset, {})
+            child = children.get(token)
+            if child is None:
+                break
+            offset = child
+        return offset
+
+    def duplicate_keys(self) -> List[str]:
+        """Pointers of object keys that repeat in the EAGER_DEPTH levels (json.loads keeps the last value)."""
+        if not self._duplicates:
+            return []
+        paths = {self._root: ''}
+        level = [self._root]
+        for _ in range(EAGER_DEPTH - 1):
+            deeper = []
+            for start in level:
+                for key, child in self._children.get(start, {}).items():
+                    if child in self._children:
+                        paths[child] = paths[start] + pointer(key)
+                        deeper.append(child)
+            level = deeper
+        return [paths[start] + pointer(key) for start, key in self._duplicates if start in paths]
+
+    def locate(self, path: str) -> Location:
+        """(line, column), both 1-based, where the node at path starts."""
+        offset = self.offset(path)
+        if self._newlines is None:
+            ends = accumulate(map(len, self.text.split('\n')))
+            self._newlines = [end + line for line, end in enumerate(ends)]
+        line = bisect_left(self._newlines, offset)
+        line_start = self._newlines[line - 1] + 1 if line else 0
+        return line + 1, offset - line_start + 1
+
+    def _container(self, start: int, depth: int) -> Tuple[Any, int]:
+        """
+        Parse the object/array at start into (value, end offset), recording
+        each child's offset; children that are containers are recursed into
+        while depth > 1, everything else goes through the C scanner.
+        """
+        text = self.text
+        children = self._children.setdefault(start, {})
+        is_object = text[start] == '{'
+        value: Any = {} if is_object else []
+        empty = _EMPTY[text[start]].match(text, start + 1)
+        if empty:
+            return value, empty.end()
+        index = start + 1
+        if not is_object:
+            index = _WHITESPACE.match(text, index).end()
+        while True:
+            if is_object:
+                member = _MEMBER.match(text, index)
+                if member:
+                    key, index = member.group(1), member.end()
+                else:
+                    # Escaped or malformed key: let scanstring decode or reject it
+                    index = _WHITESPACE.match(text, index).end()
+                    if text[index] != '"':
+                        raise ValueError(index)
+                    key, index = scanstring(text, index + 1)
+                    index = _COLON.match(text, index).end()
+            else:
+                key = str(len(value))
+            if key in children:
+                self._duplicates.append((start, key))
+            children[key] = index
+            if depth > 1 and text[index] in '{[':
+                item, index = self._container(index, depth - 1)
+            else:
+                item, index = _SCAN_ONCE(text, index)
+            if is_object:
+                value[key] = item
+            else:
+                value.append(item)
+            separator = _SEPARATOR.match(text, index)
+            index = separator.end()
+            if separator.group(1) != ',':
+                if separator.group(1) != ('}' if is_object else ']'):
+                    raise ValueError(index)
+                return value, index
+
+
+def load_with_positions(path: Path) -> Tuple[Any, SourceMap]:
+    """Parse a JSON file and return (data, SourceMap). Raises like json.load."""
+    positions = SourceMap(Path(path).read_text(encoding='utf-8'))
+    return positions.parse(), positions
+
+
+def source_map(path: Path) -> SourceMap:
+    """
+    Cached SourceMap for a file, recorded with one position-tracking parse.
+
+    Raises OSError/UnicodeDecodeError if the file cannot be read; invalid
+    JSON still gets a (lazily indexed) map so findings can point into it.
+    """
+    path = Path(path)
+    key = str(path.resolve())
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _MAP_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    positions = SourceMap(path.read_text(encoding='utf-8'))
+    try:
+        positions.parse()
+    except json.JSONDecodeError:
+        pass
+    _MAP_CACHE[key] = (stamp, positions)
+    return positions
+
+
+def display_path(path: Path) -> str:
+    """Project-relative path ('data/phase_0/questions.json') for files inside the repo."""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(PROJECT_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def format_location(filename: str, location: Optional[Location]) -> str:
+    """'file:line:column', the form editors and terminals turn into links."""
+    if not location:
+        return filename
+    return f"{filename}:{location[0]}:{location[1]}"
+
+
+def _question_pointers(data: Dict) -> List[str]:
+    """Every question, option and field pointer in a questions.json document."""
+    pointers = []
+    for qid, q in data.get('questions', {}).items():
+        base = pointer('questions', qid)
+        pointers.append(base)
+        for index in range(len(q.get('options') or [])):
+            pointers.append(f"{base}/options/{index}")
+        for index in range(len(q.get('fields') or [])):
+            pointers.append(f"{base}/fields/{index}")
+    return pointers
+
+
+def benchmark(phase_dirs: List[Path], repeat: int) -> int:
+    """Time json.loads against the position-recording parse (and locating every node)."""
+
+    def best(func) -> float:
+        timings = []
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings) * 1000
+
+    def locate_every(text: str, pointers: List[str]) -> None:
+        positions = SourceMap(text)
+        positions.parse()
+        for p in pointers:
+            positions.locate(p)
+
+    print(f"{'Phase':<15} {'KB':>5} {'json.loads':>11} {'positions':>10} {'overhead':>9} "
+          f"{'+ locate all':>13} {'pointers':>9}")
+    total_plain = total_positions = 0.0
+    for phase_dir in phase_dirs:
+        path = phase_dir / "questions.json"
+        if not path.exists():
+            continue
+        text = path.read_text(encoding='utf-8')
+        data = json.loads(text)
+        if SourceMap(text).parse() != data:
+            print(f"ERROR: {phase_dir.name}: position-recording parse differs from json.loads")
+            return 1
+        pointers = _question_pointers(data)
+        plain = best(lambda: json.loads(text))
+        positioned = best(lambda: SourceMap(text).parse())
+        located = best(lambda: locate_every(text, pointers))
+        total_plain += plain
+        total_positions += positioned
+        print(f"{phase_dir.name:<15} {len(text) / 1024:>5.0f} {plain:>9.2f}ms {positioned:>8.2f}ms "
+              f"{positioned / plain:>8.2f}x {located:>11.2f}ms {len(pointers):>9}")
+    if not total_plain:
+        print("ERROR: No questions.json files found")
+        return 1
+    ratio = total_positions / total_plain
+    print(f"{'TOTAL':<15} {'':>5} {total_plain:>9.2f}ms {total_positions:>8.2f}ms {ratio:>8.2f}x")
+    print(f"(best of {repeat}; '+ locate all' also resolves every question, option and field to line:column)")
+    if ratio > OVERHEAD_BUDGET:
+        print(f"ERROR: Position overhead {ratio:.2f}x exceeds the {OVERHEAD_BUDGET:.1f}x budget")
+        return 1
+    print(f"[SUCCESS] Position overhead {ratio:.2f}x is within the {OVERHEAD_BUDGET:.1f}x budget")
+    return 0
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Locate JSON Pointers in a file, or benchmark position tracking",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('file', nargs='?', help='JSON file to look in')
+    parser.add_argument('pointer', nargs='?', default='', help="JSON Pointer (default: '' = document)")
+    parser.add_argument('--benchmark', action='store_true', help='Time position tracking against json.load')
+    parser.add_argument('--phase', help='Benchmark one phase only (default: all)')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per benchmark case (default: 20)')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        corpus = PhaseCorpus(PROJECT_ROOT / "data")
+        if args.phase and not corpus.phase_dir(args.phase).exists():
+            print(f"ERROR: Phase directory not found: {args.phase}")
+            sys.exit(1)
+        phases = [args.phase] if args.phase else sorted(corpus.phases())
+        sys.exit(benchmark([corpus.phase_dir(p) for p in phases], args.repeat))
+
+    if not args.file:
+        parser.print_help()
+        sys.exit(1)
+    try:
+        _, positions = load_with_positions(Path(args.file))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    print(format_location(args.file, positions.locate(args.pointer)))
+
+
+if __name__ == "__main__":
+    main()
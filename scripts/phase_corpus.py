@@ -0,0 +1,448 @@
+# ./scripts/phase_corpus.py
+"""
+Phase Corpus - Shared Phase Data Loader
+=======================================
+
+Single entry point for reading phase data (questions.json, manifest.json,
+prompts.json) from every script in scripts/. Phases are discovered through
+data/phase-registry.json and every file is parsed at most once per process.
+
+Usage:
+    from phase_corpus import PhaseCorpus
+
+    corpus = PhaseCorpus.for_project()
+    for phase in corpus.phases():
+        questions = corpus.questions(phase)
+        manifest = corpus.manifest(phase)
+
+    python scripts/phase_corpus.py              # list discovered phases and files
+    python scripts/phase_corpus.py --stats      # show parse/cache counters after a full load
+    python scripts/phase_corpus.py --benchmark  # cold (JSON) vs warm (disk cache) load times
+    python scripts/phase_corpus.py --clear-cache
+
+    PHASE_CORPUS_CACHE=1 python scripts/question_search.py --text pace   # opt into disk cache
+
+Inputs:
+    - data/phase-registry.json (phase discovery order)
+    - data/{phase}/questions.json
+    - data/{phase}/manifest.json
+    - data/{phase}/prompts.json
+
+Outputs:
+    - Parsed JSON documents (shared, read-only by convention)
+    - .cache/phase_corpus/{phase}-{dirhash}.marshal (only with PHASE_CORPUS_CACHE set)
+
+Operational Notes:
+    - Parse cache is process-wide and keyed on (path, mtime, size)
+    - Files edited on disk are re-parsed automatically on next access
+    - Cached documents are shared between callers: treat them as read-only.
+      Writers must call load_json(path, use_cache=False) to get a private copy
+    - Phase directories missing from the registry are still discovered
+      (appended in sorted order) so freshly scaffolded phases are not skipped
+    - Disk cache is opt-in: PHASE_CORPUS_CACHE=1 uses .cache/phase_corpus/,
+      any other non-empty value is used as the cache directory
+    - Disk cache entries hold all three files of a phase and are keyed by a
+      content hash of questions/manifest/prompts (plus the Python version,
+      since marshal output is version-specific); any edit invalidates them
+    - map_phases() fans per-phase work out over a process pool (--jobs in
+      the validators/auditors) and returns results in input order
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import json
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+PHASE_FILES = ['questions.json', 'manifest.json', 'prompts.json']
+QUESTION_TYPES = ['free_text', 'single_select', 'multi_select', 'ranked_select', 'compound']
+MANIFEST_NAMES = ['lite', 'full']
+REGISTRY_FILE = 'phase-registry.json'
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DISK_CACHE_ENV = 'PHASE_CORPUS_CACHE'
+DEFAULT_DISK_CACHE_DIR = PROJECT_ROOT / ".cache" / "phase_corpus"
+DISK_CACHE_FORMAT = 1
+
+# path -> ((mtime_ns, size), parsed document)
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_STATS = {'parsed': 0, 'cache_hits': 0, 'disk_hits': 0, 'disk_writes': 0}
+
+
+def _disk_cache_from_env() -> Optional[Path]:
+    """Resolve the opt-in disk cache directory from PHASE_CORPUS_CACHE."""
+    value = os.environ.get(DISK_CACHE_ENV, '').strip()
+    if not value or value == '0':
+        return None
+    if value == '1':
+        return DEFAULT_DISK_CACHE_DIR
+    return Path(value)
+
+
+_DISK_CACHE_DIR: Optional[Path] = _disk_cache_from_env()
+
+
+def enable_disk_cache(cache_dir: Optional[Path] = None) -> None:
+    """Turn on the persistent phase cache for this process."""
+    global _DISK_CACHE_DIR
+    _DISK_CACHE_DIR = Path(cache_dir) if cache_dir else DEFAULT_DISK_CACHE_DIR
+
+
+def disable_disk_cache() -> None:
+    """Turn off the persistent phase cache for this process."""
+    global _DISK_CACHE_DIR
+    _DISK_CACHE_DIR = None
+
+
+def _stamp(path: Path) -> Tuple[int, int]:
+    """Return the (mtime_ns, size) freshness stamp for a file."""
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_json(path: Path, use_cache: bool = True) -> Any:
+    """
+    Parse a JSON file, reusing the cached result when the file is unchanged.
+
+    Raises FileNotFoundError / json.JSONDecodeError exactly like json.load.
+    """
+    path = Path(path)
+    key = str(path.resolve())
+    stamp = _stamp(path)
+
+    if use_cache:
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            _STATS['cache_hits'] += 1
+            return cached[1]
+
+        if _DISK_CACHE_DIR is not None and path.name in PHASE_FILES:
+            _load_phase_from_disk_cache(path.parent)
+            cached = _PARSE_CACHE.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _STATS['parsed'] += 1
+
+    if use_cache:
+        _PARSE_CACHE[key] = (stamp, data)
+    else:
+        # A private copy is about to be mutated and written back; drop the
+        # shared entry so nobody keeps reading the pre-write document.
+        _PARSE_CACHE.pop(key, None)
+
+    return data
+
+
+def _disk_cache_file(phase_dir: Path) -> Path:
+    """Cache file for one phase directory (dir hash keeps data roots apart)."""
+    import hashlib
+
+    dir_hash = hashlib.blake2b(str(phase_dir).encode('utf-8'), digest_size=4).hexdigest()
+    return _DISK_CACHE_DIR / f"{phase_dir.name}-{dir_hash}.marshal"
+
+
+def _load_phase_from_disk_cache(phase_dir: Path) -> None:
+    """
+    Seed the parse cache with all three files of a phase.
+
+    Reads the raw bytes, hashes them, and loads the marshalled bundle when
+    the hash matches; otherwise parses the JSON and rewrites the bundle.
+    Cache I/O problems are never fatal: the JSON is simply parsed.
+    """
+    # Only needed when the disk cache is on; keeps plain imports cheap
+    import hashlib
+    import marshal
+
+    phase_dir = phase_dir.resolve()
+    stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+    raw: Dict[str, Optional[bytes]] = {}
+    hasher = hashlib.sha256()
+    hasher.update(f"{DISK_CACHE_FORMAT}:{sys.version_info[0]}.{sys.version_info[1]}".encode('ascii'))
+
+    for filename in PHASE_FILES:
+        file_path = phase_dir / filename
+        try:
+            stamps[filename] = _stamp(file_path)
+            with open(file_path, 'rb') as f:
+                raw[filename] = f.read()
+        except OSError:
+            stamps[filename] = None
+            raw[filename] = None
+        hasher.update(filename.encode('utf-8'))
+        hasher.update(b'\0' if raw[filename] is None else b'\1' + raw[filename])
+
+    digest = hasher.hexdigest().encode('ascii')
+    cache_file = _disk_cache_file(phase_dir)
+
+    bundle = None
+    try:
+        with open(cache_file, 'rb') as f:
+            if f.read(len(digest)) == digest:
+                bundle = marshal.loads(f.read())
+                _STATS['disk_hits'] += 1
+    except (OSError, EOFError, ValueError, TypeError):
+        bundle = None
+
+    if bundle is None:
+        bundle = {}
+        for filename in PHASE_FILES:
+            if raw[filename] is None:
+                continue
+            try:
+                bundle[filename] = json.loads(raw[filename].decode('utf-8'))
+            except ValueError:
+                # Let load_json surface the syntax error itself
+                continue
+            _STATS['parsed'] += 1
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(digest)
+                f.write(marshal.dumps(bundle))
+            os.replace(tmp_file, cache_file)
+            _STATS['disk_writes'] += 1
+        except (OSError, ValueError):
+            pass
+
+    for filename, data in bundle.items():
+        if stamps.get(filename) is not None:
+            _PARSE_CACHE[str(phase_dir / filename)] = (stamps[filename], data)
+
+
+def clear_disk_cache(cache_dir: Optional[Path] = None) -> int:
+    """Delete persisted phase bundles. Returns number of files removed."""
+    cache_dir = Path(cache_dir) if cache_dir else (_DISK_CACHE_DIR or DEFAULT_DISK_CACHE_DIR)
+    removed = 0
+    if cache_dir.exists():
+        for cache_file in cache_dir.glob("*.marshal"):
+            cache_file.unlink()
+            removed += 1
+    return removed
+
+
+def invalidate(path: Optional[Path] = None) -> None:
+    """Drop one cached file (or everything when path is None)."""
+    if path is None:
+        _PARSE_CACHE.clear()
+    else:
+        _PARSE_CACHE.pop(str(Path(path).resolve()), None)
+
+
+def cache_stats() -> Dict[str, int]:
+    """Return parse/cache-hit counters for this process."""
+    return dict(_STATS, cached_files=len(_PARSE_CACHE))
+
+
+def map_phases(func: Callable[[Any], Any], items: List[Any], jobs: int = 1) -> List[Any]:
+    """
+    Apply func to each phase item, optionally across a process pool.
+
+    Results come back in input order whichever worker finishes first, so a
+    report built from them is identical to a sequential run. jobs <= 0 uses
+    every CPU; func and its results must be picklable (module-level
+    functions or bound methods of plain objects, dict/list/str results).
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(items))
+    if jobs <= 1:
+        return [func(item) for item in items]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(func, items))
+
+
+class PhaseCorpus:
+    """Registry-driven access to every phase's JSON documents."""
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+        self.registry_file = self.data_dir / REGISTRY_FILE
+
+    @classmethod
+    def for_project(cls, project_root: Optional[Path] = None) -> 'PhaseCorpus':
+        """Build a corpus for the repository containing this script."""
+        return cls(Path(project_root or PROJECT_ROOT) / "data")
+
+    def phases(self) -> List[str]:
+        """
+        Discover phases in registry order.
+
+        Phase directories that exist on disk but are not registered yet are
+        appended in sorted order.
+        """
+        if not self.data_dir.exists():
+            return []
+
+        registered: List[str] = []
+        if self.registry_file.exists():
+            registry = load_json(self.registry_file)
+            registered = [p for p in registry.get('phases', []) if (self.data_dir / p).is_dir()]
+
+        extra = sorted(
+            p.name for p in self.data_dir.iterdir()
+            if p.is_dir() and p.name.startswith('phase') and p.name not in registered
+        )
+        return registered + extra
+
+    def phase_dir(self, phase: str) -> Path:
+        """Return the directory for a phase."""
+        return self.data_dir / phase
+
+    def path(self, phase: str, filename: str) -> Path:
+        """Return the path of one phase file (e.g. questions.json)."""
+        return self.data_dir / phase / filename
+
+    def has(self, phase: str, filename: str) -> bool:
+        """Check whether a phase file exists."""
+        return self.path(phase, filename).exists()
+
+    def load(self, phase: str, filename: str) -> Any:
+        """Load (cached) one phase file."""
+        return load_json(self.path(phase, filename))
+
+    def warm(self) -> int:
+        """
+        Parse every phase file that is missing from (or stale in) the cache.
+
+        Returns the number of files actually parsed; unchanged files cost one
+        stat() each. Invalid JSON is skipped here and surfaces when a tool
+        reads the file.
+        """
+        parsed_before = _STATS['parsed']
+        for phase in self.phases():
+            for filename in PHASE_FILES:
+                if self.has(phase, filename):
+                    try:
+                        self.load(phase, filename)
+                    except ValueError:
+                        pass
+        return _STATS['parsed'] - parsed_before
+
+    def questions(self, phase: str) -> Dict:
+        """Load (cached) data/{phase}/questions.json."""
+        return self.load(phase, 'questions.json')
+
+    def manifest(self, phase: str) -> Dict:
+        """Load (cached) data/{phase}/manifest.json."""
+        return self.load(phase, 'manifest.json')
+
+    def prompts(self, phase: str) -> Dict:
+        """Load (cached) data/{phase}/prompts.json."""
+        return self.load(phase, 'prompts.json')
+
+    def phase_title(self, phase: str) -> str:
+        """Return artifact.title from the manifest, falling back to the phase ID."""
+        if not self.has(phase, 'manifest.json'):
+            return phase
+        return self.manifest(phase).get('artifact', {}).get('title', phase)
+
+
+def benchmark(corpus: PhaseCorpus, phases: List[str], repeat: int) -> str:
+    """
+    Time cold (JSON parse) vs warm (disk cache) loads of each phase.
+
+    Both paths start from an empty in-process cache, so each iteration
+    measures what a fresh interpreter would pay.
+    """
+    global _DISK_CACHE_DIR
+    saved_dir = _DISK_CACHE_DIR
+    bench_dir = saved_dir or DEFAULT_DISK_CACHE_DIR
+
+    def load_all(phase: str) -> None:
+        for filename in PHASE_FILES:
+            if corpus.has(phase, filename):
+                corpus.load(phase, filename)
+
+    def best_of(phase: str) -> float:
+        best = float('inf')
+        for _ in range(repeat):
+            invalidate()
+            start = time.perf_counter()
+            load_all(phase)
+            best = min(best, time.perf_counter() - start)
+        return best * 1000
+
+    lines = []
+    lines.append(f"{'Phase':<16}{'Cold JSON (ms)':>16}{'Warm cache (ms)':>18}{'Speedup':>10}")
+    lines.append("-" * 60)
+    total_cold = total_warm = 0.0
+    try:
+        for phase in phases:
+            _DISK_CACHE_DIR = None
+            cold = best_of(phase)
+
+            _DISK_CACHE_DIR = bench_dir
+            invalidate()
+            load_all(phase)  # prime the bundle
+            warm = best_of(phase)
+
+            total_cold += cold
+            total_warm += warm
+            lines.append(f"{phase:<16}{cold:>16.2f}{warm:>18.2f}{cold / warm:>9.1f}x")
+    finally:
+        _DISK_CACHE_DIR = saved_dir
+        invalidate()
+
+    lines.append("-" * 60)
+    lines.append(f"{'TOTAL':<16}{total_cold:>16.2f}{total_warm:>18.2f}{total_cold / total_warm:>9.1f}x")
+    lines.append(f"(best of {repeat}, cache dir: {bench_dir})")
+    return "\n".join(lines)
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Phase Corpus - Inspect registry-driven phase discovery"
+    )
+    parser.add_argument('--stats', action='store_true', help='Load every file twice and print cache counters')
+    parser.add_argument('--benchmark', action='store_true', help='Compare cold JSON vs warm disk-cache loads')
+    parser.add_argument('--repeat', type=int, default=20, help='Benchmark iterations per phase (default: 20)')
+    parser.add_argument('--clear-cache', action='store_true', help='Delete persisted phase bundles')
+    args = parser.parse_args()
+
+    if args.clear_cache:
+        print(f"[SUCCESS] Removed {clear_disk_cache()} cached phase bundle(s)")
+        sys.exit(0)
+
+    corpus = PhaseCorpus.for_project()
+    phases = corpus.phases()
+    if not phases:
+        print(f"ERROR: No phases found in {corpus.data_dir}")
+        sys.exit(1)
+
+    if args.benchmark:
+        print(benchmark(corpus, phases, max(1, args.repeat)))
+        sys.exit(0)
+
+    for phase in phases:
+        present = [f for f in PHASE_FILES if corpus.has(phase, f)]
+        print(f"{phase}: {', '.join(present) if present else '(no data files)'}")
+
+    if args.stats:
+        for _ in range(2):
+            for phase in phases:
+                for filename in PHASE_FILES:
+                    if corpus.has(phase, filename):
+                        corpus.load(phase, filename)
+        stats = cache_stats()
+        print(f"\nParsed: {stats['parsed']}, cache hits: {stats['cache_hits']}, "
+              f"disk hits: {stats['disk_hits']}, cached files: {stats['cached_files']}")
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -50,6 +50,8 @@ import shutil
 from pathlib import Path
 from typing import Dict, Optional
 
+from phase_corpus import load_json
+
 
 class PhaseScaffold:
     """Generates new phase directory structures."""
@@ -113,8 +115,7 @@ class PhaseScaffold:
         # Copy and modify manifest
         manifest_src = template_dir / "manifest.json"
         if manifest_src.exists():
-            with open(manifest_src, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
+            manifest = load_json(manifest_src, use_cache=False)
             
             # Update IDs and titles
             manifest['artifact']['id'] = args.id
@@ -128,8 +129,7 @@ class PhaseScaffold:
         # Copy empty questions structure
         questions_src = template_dir / "questions.json"
         if questions_src.exists():
-            with open(questions_src, 'r', encoding='utf-8') as f:
-                questions = json.load(f)
+            questions = load_json(questions_src, use_cache=False)
             
             # Clear questions but keep structure
             questions['sections'] = []
@@ -0,0 +1,204 @@
+# ./scripts/phase_watch.py
+"""
+Phase Watch - Shared --watch Loop for Validators and Exporters
+==============================================================
+
+Polls data/{phase}/*.json for saves and reruns one tool's work for just
+the phase that changed. Used by the --watch flag of validate_schema.py,
+validate_prompts.py and export_questions.py.
+
+Usage:
+    from phase_watch import PhaseWatcher, watch_findings
+
+    watcher = PhaseWatcher(corpus, ['questions.json'])
+    watch_findings(watcher, check)   # check(phase) -> (status, [finding, ...][, [location, ...]])
+
+    python scripts/validate_schema.py --watch
+    python scripts/validate_prompts.py --watch
+    python scripts/export_questions.py --watch
+
+Inputs:
+    - data/{phase}/{watched files}
+
+Outputs:
+    - One line per save: phase, file(s), new/resolved finding counts and
+      the save-to-feedback latency, then the new (+) and resolved (-) findings
+
+Operational Notes:
+    - Stdlib polling (one stat() per watched file per tick) rather than
+      inotify, so it behaves the same on Linux, macOS and Windows; the
+      default 50 ms tick keeps feedback well under 100 ms
+    - State stays warm between runs: phase_corpus keeps parsed files and
+      only re-parses what changed; the validation engine re-checks only
+      the questions whose content changed
+    - A save is reported once the file has stopped changing for 15 ms, so
+      chunked writes are seen whole
+    - Invalid JSON is printed (!) without replacing the last good findings,
+      so the next valid save still shows only what really changed
+    - Phases added to the registry while watching are picked up
+    - Ctrl+C stops the loop (exit code 0)
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from phase_corpus import PhaseCorpus
+
+
+DEFAULT_POLL_MS = 50
+
+# A save is only reported once the file stops changing for this long
+# (editors and json.dump write large files in several chunks)
+SETTLE_MS = 15
+MAX_SETTLE_MS = 1000
+
+Signature = Optional[Tuple[int, int]]
+
+
+def file_signature(path) -> Signature:
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class PhaseWatcher:
+    """Detects saved phase files by polling their (mtime, size)."""
+
+    def __init__(self, corpus: PhaseCorpus, filenames: List[str], phases: Optional[List[str]] = None,
+                 poll_ms: float = DEFAULT_POLL_MS):
+        self.corpus = corpus
+        self.filenames = list(filenames)
+        self.fixed_phases = list(phases) if phases else None
+        self.poll_s = max(poll_ms, 1) / 1000
+        self._signatures = self._scan()
+
+    def phases(self) -> List[str]:
+        return self.fixed_phases or sorted(self.corpus.phases())
+
+    def _scan(self) -> Dict[Tuple[str, str], Signature]:
+        return {
+            (phase, name): file_signature(self.corpus.path(phase, name))
+            for phase in self.phases()
+            for name in self.filenames
+        }
+
+    def poll(self) -> Dict[str, List[str]]:
+        """Return {phase: [changed filenames]} since the previous poll."""
+        current = self._scan()
+        changed = {key for key, signature in current.items() if self._signatures.get(key) != signature}
+        waited = 0
+        while changed and waited < MAX_SETTLE_MS:
+            time.sleep(SETTLE_MS / 1000)
+            waited += SETTLE_MS
+            settled = self._scan()
+            if settled == current:
+                break
+            changed |= {key for key, signature in settled.items() if current.get(key) != signature}
+            current = settled
+        self._signatures = current
+
+        by_phase: Dict[str, List[str]] = {}
+        for phase, name in sorted(changed, key=lambda key: self.filenames.index(key[1])):
+            by_phase.setdefault(phase, []).append(name)
+        return by_phase
+
+    def latency_ms(self, phase: str, filenames: List[str]) -> float:
+        """Milliseconds since the newest of these files was written."""
+        stamps = [self._signatures.get((phase, name)) for name in filenames]
+        newest = max((s[0] for s in stamps if s), default=None)
+        if newest is None:
+            return 0.0
+        return max(0.0, (time.time_ns() - newest) / 1e6)
+
+    def run(self, on_change: Callable[[str, List[str]], None]) -> None:
+        """Call on_change(phase, filenames) for every save until Ctrl+C."""
+        print(f"Watching {', '.join(self.filenames)} in {len(self.phases())} phase(s) "
+              f"every {self.poll_s * 1000:.0f} ms (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(self.poll_s)
+                for phase, filenames in self.poll().items():
+                    on_change(phase, filenames)
+                    sys.stdout.flush()
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+
+
+def diff_findings(previous: List[Any], current: List[Any],
+                  key: Callable[[Any], Any] = lambda item: item) -> Tuple[List[Any], List[Any]]:
+    """(new, resolved) findings, treating both lists as multisets of key(item) and keeping report order."""
+    before, after = Counter(map(key, previous)), Counter(map(key, current))
+    return _take(current, after - before, key), _take(previous, before - after, key)
+
+
+def _take(items: List[Any], counts: Counter, key: Callable[[Any], Any]) -> List[Any]:
+    """The first counts[key(item)] occurrences of each item, in order."""
+    remaining = Counter(counts)
+    taken = []
+    for item in items:
+        if remaining[key(item)] > 0:
+            remaining[key(item)] -= 1
+            taken.append(item)
+    return taken
+
+
+def _shown(finding: Tuple[str, str]) -> str:
+    message, location = finding
+    return f"{location}: {message}" if location else message
+
+
+def watch_findings(watcher: PhaseWatcher, check: Callable[[str], Tuple]) -> None:
+    """
+    Run check(phase) -> (status, findings) on every phase, then again for
+    each saved phase, printing only the findings that appeared or cleared.
+
+    check may return (status, findings, locations) instead: locations[i]
+    ('file:line:column' or '') is printed in front of findings[i] but is not
+    compared, so a finding that only moved (a line inserted above it) is
+    not reported as resolved and new.
+
+    A status of 'ERROR' means the file could not be read (e.g. invalid
+    JSON): its findings are printed but the last readable run stays the
+    baseline, so fixing the syntax does not replay every finding as new.
+    """
+    def run(phase: str) -> Tuple[str, List[Tuple[str, str]]]:
+        status, findings, *rest = check(phase)
+        locations = rest[0] if rest else []
+        return status, [(finding, locations[i] if i < len(locations) else '') for i, finding in enumerate(findings)]
+
+    state: Dict[str, List[Tuple[str, str]]] = {}
+    for phase in watcher.phases():
+        status, findings = run(phase)
+        state[phase] = [] if status == 'ERROR' else findings
+        print(f"  {phase}: {status} ({len(findings)} finding{'s' if len(findings) != 1 else ''})")
+    sys.stdout.flush()
+
+    def on_change(phase: str, filenames: List[str]) -> None:
+        status, findings = run(phase)
+        stamp = datetime.now().strftime('%H:%M:%S')
+        if status == 'ERROR':
+            print(f"[{stamp}] {phase} ({', '.join(filenames)}): ERROR "
+                  f"({watcher.latency_ms(phase, filenames):.0f} ms after save)")
+            for finding in findings:
+                print(f"  ! {_shown(finding)}")
+            return
+        added, resolved = diff_findings(state.get(phase, []), findings, key=lambda finding: finding[0])
+        state[phase] = findings
+        print(f"[{stamp}] {phase} ({', '.join(filenames)}): {status}, {len(added)} new, "
+              f"{len(resolved)} resolved ({watcher.latency_ms(phase, filenames):.0f} ms after save)")
+        for finding in added:
+            print(f"  + {_shown(finding)}")
+        for finding in resolved:
+            print(f"  - {_shown(finding)}")
+
+    watcher.run(on_change)
@@ -0,0 +1,220 @@
+# ./scripts/question_batch.py
+"""
+Question Batch - Transactional JSONL Operations for questions.json
+===================================================================
+
+Applies a stream of question, section and property operations to one phase
+in memory, validates the result, and commits with a single atomic write.
+If any operation fails, nothing is written (the whole batch rolls back).
+
+Usage:
+    python scripts/question_tool.py batch --phase PHASE --file ops.jsonl [--dry-run]
+    python scripts/section_manager.py batch --phase PHASE --file ops.jsonl
+    python scripts/question_properties.py batch --phase PHASE --file ops.jsonl
+    cat ops.jsonl | python scripts/question_tool.py batch --phase PHASE
+
+Operation Format (one JSON object per line, keys mirror the CLI flags):
+    {"op": "add", "section": "s1", "title": "...", "prompt": "...", "type": "free_text"}
+    {"op": "update", "question": "q05", "field": "title", "value": "New title"}
+    {"op": "delete", "question": "q07", "confirm": true}
+    {"op": "add-option", "question": "q06", "value": "other", "label": "Other"}
+    {"op": "change-manifest", "question": "q06", "manifest": "lite,full"}
+    {"op": "section-add", "id": "s9", "title": "Wrap-up"}
+    {"op": "section-reorder", "id": "s9", "position": 2}
+    {"op": "set-max", "questions": "q06,q18", "value": 5}
+
+Supported Operations:
+    add, update, delete, add-option, change-manifest,
+    section-add, section-remove, section-rename, section-reorder,
+    set-max, remove-max, set-min
+
+Inputs:
+    - data/{phase}/questions.json
+    - JSONL operations (file path or stdin)
+
+Outputs:
+    - data/{phase}/questions.json (one write, only if every operation succeeds)
+    - data/{phase}/questions.json.bak (single backup of the pre-batch file)
+    - One result line per operation plus a summary
+
+Operational Notes:
+    - Each operation runs the same method (and validation) as its CLI command
+    - After all operations, section/manifest references are cross-checked
+    - Blank lines and lines starting with '#' are ignored
+    - The file is written by the invoking tool, so its formatting is kept
+      (section_manager writes indent=4, the others indent=2)
+    - --dry-run reports what would happen without touching the file
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import json
+import sys
+import argparse
+from typing import Any, Dict, List, Tuple
+
+
+# op -> (tool, method, required keys, defaults)
+OPERATIONS: Dict[str, Tuple[str, str, List[str], Dict[str, Any]]] = {
+    'add': ('question', 'add_question', ['section', 'title', 'prompt', 'type'],
+            {'id': None, 'options': None, 'manifest': 'full', 'examples': None, 'order': None}),
+    'update': ('question', 'update_question', ['question', 'field', 'value'], {}),
+    'delete': ('question', 'delete_question', ['question'], {'confirm': False}),
+    'add-option': ('question', 'add_option', ['question', 'value', 'label'], {}),
+    'change-manifest': ('question', 'change_manifest', ['question', 'manifest'], {}),
+    'section-add': ('section', 'add_section', ['id', 'title'], {'order': None}),
+    'section-remove': ('section', 'remove_section', ['id'], {'confirm': False}),
+    'section-rename': ('section', 'rename_section', ['id', 'title'], {}),
+    'section-reorder': ('section', 'reorder_section', ['id', 'position'], {}),
+    'set-max': ('properties', 'set_max', ['questions', 'value'], {}),
+    'remove-max': ('properties', 'remove_max', ['questions'], {}),
+    'set-min': ('properties', 'set_min', ['questions', 'value'], {}),
+}
+
+FAILURE_PREFIXES = ('ERROR', 'VALIDATION ERRORS')
+
+
+def read_operations(source: str) -> List[Dict]:
+    """Parse JSONL operations from a file path or '-' (stdin)."""
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+    operations = []
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            op = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {line_no}: invalid JSON ({e.msg})")
+        if not isinstance(op, dict) or 'op' not in op:
+            raise ValueError(f"line {line_no}: each operation must be an object with an 'op' key")
+        op['_line'] = line_no
+        operations.append(op)
+    return operations
+
+
+def _split_ids(value: Any) -> List[str]:
+    """Accept 'q01,q02' or ["q01", "q02"]."""
+    if isinstance(value, list):
+        return [str(v).strip() for v in value]
+    return [v.strip() for v in str(value).split(',') if v.strip()]
+
+
+def _apply(tools: Dict[str, Any], op: Dict) -> str:
+    """Run one operation against the shared in-memory document."""
+    name = op['op']
+    if name not in OPERATIONS:
+        return f"ERROR: Unknown operation '{name}' (supported: {', '.join(OPERATIONS)})"
+
+    tool_key, method_name, required, defaults = OPERATIONS[name]
+    missing = [key for key in required if key not in op]
+    if missing:
+        return f"ERROR: {name} requires: {', '.join(missing)}"
+
+    method = getattr(tools[tool_key], method_name)
+
+    if tool_key == 'properties':
+        qids = _split_ids(op['questions'])
+        if name == 'remove-max':
+            result = method(qids)
+        else:
+            result = method(qids, int(op['value']))
+        # Bulk property updates skip questions they cannot change; in a
+        # transaction any of them fails the batch
+        if tools[tool_key].last_errors:
+            return "ERROR: " + "; ".join(tools[tool_key].last_errors)
+        return result
+
+    params = dict(defaults)
+    params.update({k.replace('-', '_'): v for k, v in op.items() if k not in ('op', '_line')})
+    for key in ('order', 'position'):
+        if params.get(key) is not None:
+            params[key] = int(params[key])
+    if name in ('update', 'add-option') and not isinstance(params['value'], str):
+        params['value'] = str(params['value'])
+    for key in ('manifest', 'examples'):
+        if isinstance(params.get(key), list):
+            params[key] = ','.join(params[key])
+    return method(argparse.Namespace(**params))
+
+
+def check_references(data: Dict) -> List[str]:
+    """Cross-check that sections and manifests only reference existing questions."""
+    errors = []
+    questions = data.get('questions', {})
+    for section in data.get('sections', []):
+        for qid in section.get('question_ids', []):
+            if qid not in questions:
+                errors.append(f"Section {section.get('id')} references missing question {qid}")
+    for name, manifest in data.get('manifests', {}).items():
+        for qid in manifest.get('question_ids', []):
+            if qid not in questions:
+                errors.append(f"Manifest {name} references missing question {qid}")
+    return errors
+
+
+def run_batch(owner: Any, source: str, dry_run: bool = False) -> str:
+    """
+    Apply every operation in `source` to owner's phase, then write once.
+
+    `owner` is the invoking tool instance (QuestionTool, SectionManager or
+    QuestionPropertiesManager); its _save_questions performs the commit.
+    """
+    from question_tool import QuestionTool
+    from section_manager import SectionManager
+    from question_properties import QuestionPropertiesManager
+
+    try:
+        operations = read_operations(source)
+    except (OSError, ValueError) as e:
+        return f"ERROR: Could not read operations: {e}"
+
+    if not operations:
+        return "ERROR: No operations to apply"
+
+    project_root = owner.phase_dir.parent.parent
+    data = owner._load_questions()
+    tools = {
+        'question': QuestionTool(owner.phase, project_root),
+        'section': SectionManager(owner.phase, project_root),
+        'properties': QuestionPropertiesManager(owner.phase, project_root),
+    }
+    for tool in tools.values():
+        tool._batch_data = data
+
+    lines = []
+    for number, op in enumerate(operations, 1):
+        try:
+            result = _apply(tools, op)
+        except (KeyError, TypeError, ValueError) as e:
+            result = f"ERROR: {type(e).__name__}: {e}"
+
+        first_line = result.splitlines()[0] if result else ''
+        lines.append(f"  [{number}] {op['op']}: {first_line}")
+
+        if result.startswith(FAILURE_PREFIXES):
+            detail = result.replace('\\n', '\n')
+            return (
+                f"ERROR: Operation {number} ({op['op']}, line {op['_line']}) failed; "
+                f"rolled back, {owner.questions_file.name} unchanged\n"
+                + "\n".join(lines[:-1] + [f"  [{number}] {op['op']}: {detail}"])
+            )
+
+    errors = check_references(data)
+    if errors:
+        return (
+            f"ERROR: Batch leaves dangling references; rolled back, {owner.questions_file.name} unchanged\n"
+            + "\n".join(f"  - {e}" for e in errors)
+        )
+
+    if dry_run:
+        return f"[DRY RUN] {len(operations)} operation(s) valid for {owner.phase}\n" + "\n".join(lines)
+
+    owner._save_questions(data, backup=True)
+    return f"[SUCCESS] Applied {len(operations)} operation(s) to {owner.phase} in one write\n" + "\n".join(lines)
@@ -0,0 +1,317 @@
+# ./scripts/question_dupes.py
+"""
+Question Dupes - Cross-Phase Near-Duplicate Detection (MinHash/LSH)
+===================================================================
+
+Finds questions whose wording largely repeats another question, in the same
+phase or any other. Each question's title, prompt and option labels are cut
+into overlapping word shingles. A MinHash signature stands in for each
+shingle set, and locality-sensitive hashing buckets signatures by bands, so
+only questions that share a bucket are ever compared. The work grows with
+the number of questions, not the number of pairs.
+
+Usage:
+    python scripts/question_dupes.py
+    python scripts/question_dupes.py --threshold 0.5 --cross-phase
+    python scripts/question_dupes.py --format json --output dupes.json
+    python scripts/question_dupes.py --check-recall
+
+CLI Arguments:
+    --phase: Optional. Only compare questions inside this phase. Default: all phases
+    --threshold: Optional. Minimum Jaccard similarity of shingle sets to report. Default: 0.7
+    --shingle: Optional. Words per shingle. Default: 3
+    --perms: Optional. MinHash permutations per signature. Default: 128
+    --cross-phase: Optional. Only report pairs from different phases
+    --check-recall: Optional. Also compare every pair directly and report what LSH missed
+    --format: Optional. Output format (text, json). Default: text
+    --output: Optional. Save the report to a file
+
+Inputs:
+    - data/{phase}/questions.json
+
+Outputs:
+    - Near-duplicate pairs, most similar first, with each question's
+      file:line:column (json: file, pointer, line, column keys)
+    - Counts: questions, LSH candidate pairs, reported pairs, timing
+    - Exit code: 0 (report produced), 1 (error, or --check-recall found misses)
+
+Operational Notes:
+    - Read-only; uses the same title/prompt/option-label text as question_search.py
+    - Reported similarity is the exact Jaccard of the two shingle sets; LSH
+      only decides which pairs get checked
+    - Bands and rows are chosen so a pair at exactly --threshold becomes a
+      candidate with at least 95% probability; more similar pairs are
+      practically always found (--check-recall measures it on the real bank)
+    - Hash parameters come from a fixed seed, so reports are reproducible
+    - Questions shorter than one shingle use their whole text as one shingle
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import json
+import sys
+import time
+import zlib
+import random
+import argparse
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from phase_corpus import PhaseCorpus
+from search_index import field_texts, tokenize
+from json_positions import display_path, pointer, source_map
+
+
+DEFAULT_THRESHOLD = 0.7
+DEFAULT_SHINGLE = 3
+DEFAULT_PERMS = 128
+
+# Universal hashing (a * x + b) mod p over 32-bit shingle hashes
+MERSENNE_PRIME = (1 << 61) - 1
+SEED = 20240601
+
+# Minimum chance that a pair at exactly the threshold shares an LSH bucket
+MIN_RECALL = 0.95
+
+# Title, prompt and option labels (see search_index.FIELDS)
+SHINGLE_FIELDS = 3
+
+
+def shingles(q: Dict, size: int = DEFAULT_SHINGLE) -> Set[int]:
+    """Hashed `size`-word shingles of a question's title, prompt and option labels."""
+    tokens = [token for texts in field_texts(q)[:SHINGLE_FIELDS] for text in texts for token in tokenize(text)]
+    if not tokens:
+        return set()
+    if len(tokens) <= size:
+        return {zlib.crc32(" ".join(tokens).encode('utf-8'))}
+    return {zlib.crc32(" ".join(tokens[i:i + size]).encode('utf-8')) for i in range(len(tokens) - size + 1)}
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def choose_bands(perms: int, threshold: float) -> Tuple[int, int, float]:
+    """
+    (bands, rows, recall) for LSH: the most rows per band (fewest false
+    candidates) that still catch a pair at `threshold` with MIN_RECALL.
+    """
+    best = (perms, 1, 1.0)
+    for rows in range(1, perms + 1):
+        bands = perms // rows
+        recall = 1.0 - (1.0 - threshold ** rows) ** bands
+        if recall < MIN_RECALL:
+            break
+        best = (bands, rows, recall)
+    return best
+
+
+class MinHasher:
+    """MinHash signatures: one min-hash per random permutation of the shingle space."""
+
+    def __init__(self, perms: int = DEFAULT_PERMS, seed: int = SEED):
+        rng = random.Random(seed)
+        self.params = [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(MERSENNE_PRIME)) for _ in range(perms)]
+
+    def signature(self, shingle_set: Set[int]) -> Tuple[int, ...]:
+        values = list(shingle_set)
+        return tuple(min([(a * x + b) % MERSENNE_PRIME for x in values]) for a, b in self.params)
+
+
+class DuplicateFinder:
+    """Shingles, signs and LSH-buckets every question, then verifies candidate pairs."""
+
+    def __init__(self, corpus: PhaseCorpus, threshold: float = DEFAULT_THRESHOLD,
+                 shingle_size: int = DEFAULT_SHINGLE, perms: int = DEFAULT_PERMS):
+        self.corpus = corpus
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.perms = perms
+        self.bands, self.rows, self.recall = choose_bands(perms, threshold)
+        self.hasher = MinHasher(perms)
+        # Parallel lists, one entry per question with any text
+        self.keys: List[Tuple[str, str]] = []
+        self.titles: List[str] = []
+        self.sets: List[Set[int]] = []
+        self.candidates = 0
+
+    def load(self, phases: List[str]) -> None:
+        for phase in phases:
+            for qid, q in self.corpus.questions(phase).get('questions', {}).items():
+                shingle_set = shingles(q, self.shingle_size)
+                if shingle_set:
+                    self.keys.append((phase, qid))
+                    self.titles.append(q.get('title', ''))
+                    self.sets.append(shingle_set)
+
+    def candidate_pairs(self) -> Set[Tuple[int, int]]:
+        """Question pairs sharing at least one LSH band bucket."""
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        for i, shingle_set in enumerate(self.sets):
+            signature = self.hasher.signature(shingle_set)
+            for band in range(self.bands):
+                key = (band, signature[band * self.rows:(band + 1) * self.rows])
+                buckets.setdefault(key, []).append(i)
+
+        pairs: Set[Tuple[int, int]] = set()
+        for members in buckets.values():
+            if len(members) > 1:
+                pairs.update(combinations(members, 2))
+        self.candidates = len(pairs)
+        return pairs
+
+    def find(self, pairs: Optional[Set[Tuple[int, int]]] = None, cross_phase: bool = False) -> List[Tuple[float, int, int]]:
+        """(similarity, i, j) for candidate pairs at or above the threshold, most similar first."""
+        if pairs is None:
+            pairs = self.candidate_pairs()
+        found = []
+        for i, j in pairs:
+            if cross_phase and self.keys[i][0] == self.keys[j][0]:
+                continue
+            similarity = jaccard(self.sets[i], self.sets[j])
+            if similarity >= self.threshold:
+                found.append((similarity, i, j))
+        found.sort(key=lambda item: (-item[0], item[1], item[2]))
+        return found
+
+    def all_pairs(self) -> Set[Tuple[int, int]]:
+        """Every question pair (the quadratic comparison LSH avoids; for --check-recall)."""
+        return set(combinations(range(len(self.sets)), 2))
+
+    def report(self, found: List[Tuple[float, int, int]], seconds: float) -> Dict[str, Any]:
+        locations: Dict[str, Any] = {}
+
+        def describe(i: int) -> Dict[str, Any]:
+            phase, qid = self.keys[i]
+            path = self.corpus.path(phase, "questions.json")
+            if phase not in locations:
+                locations[phase] = source_map(path)
+            item = {'phase': phase, 'id': qid, 'title': self.titles[i],
+                    'file': display_path(path), 'pointer': pointer('questions', qid)}
+            item['line'], item['column'] = locations[phase].locate(item['pointer'])
+            return item
+
+        return {
+            'threshold': self.threshold,
+            'shingle_size': self.shingle_size,
+            'permutations': self.perms,
+            'bands': self.bands,
+            'rows': self.rows,
+            'questions': len(self.keys),
+            'phases': len({phase for phase, _ in self.keys}),
+            'candidates': self.candidates,
+            'seconds': round(seconds, 3),
+            'pairs': [
+                {'similarity': round(similarity, 3), 'questions': [describe(i), describe(j)]}
+                for similarity, i, j in found
+            ],
+        }
+
+
+def format_text(report: Dict[str, Any]) -> str:
+    lines = [
+        f"Near-duplicate questions (Jaccard >= {report['threshold']:.2f} over "
+        f"{report['shingle_size']}-word shingles of title/prompt/option labels)",
+        f"Scanned {report['questions']} questions in {report['phases']} phases: "
+        f"{report['candidates']} LSH candidates, {len(report['pairs'])} pairs "
+        f"({report['bands']} bands x {report['rows']} rows, {report['permutations']} permutations) "
+        f"in {report['seconds']:.2f} s",
+        "",
+    ]
+    if not report['pairs']:
+        lines.append("No near-duplicate questions found")
+    for pair in report['pairs']:
+        a, b = pair['questions']
+        lines.append(f"[{pair['similarity']:.2f}] {a['phase']}/{a['id']} <-> {b['phase']}/{b['id']}")
+        for item in (a, b):
+            lines.append(f"  {item['file']}:{item['line']}:{item['column']}  {item['title']}")
+        lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Question Dupes - Find near-duplicate questions across phases (MinHash/LSH)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  Near-copies anywhere in the bank:
+    python scripts/question_dupes.py
+
+  Looser match, only across phases:
+    python scripts/question_dupes.py --threshold 0.5 --cross-phase
+
+  Verify LSH found every pair an all-pairs scan finds:
+    python scripts/question_dupes.py --check-recall
+        """
+    )
+    parser.add_argument('--phase', help='Only compare questions inside this phase (default: all)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Minimum Jaccard similarity to report (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--shingle', type=int, default=DEFAULT_SHINGLE,
+                        help=f'Words per shingle (default: {DEFAULT_SHINGLE})')
+    parser.add_argument('--perms', type=int, default=DEFAULT_PERMS,
+                        help=f'MinHash permutations per signature (default: {DEFAULT_PERMS})')
+    parser.add_argument('--cross-phase', action='store_true', help='Only report pairs from different phases')
+    parser.add_argument('--check-recall', action='store_true',
+                        help='Also compare every pair directly and report pairs LSH missed')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='Output format')
+    parser.add_argument('--output', help='Save the report to a file')
+    args = parser.parse_args()
+
+    if not 0.0 < args.threshold <= 1.0:
+        print("ERROR: --threshold must be between 0 and 1")
+        sys.exit(1)
+    if args.shingle < 1 or args.perms < 1:
+        print("ERROR: --shingle and --perms must be positive")
+        sys.exit(1)
+
+    corpus = PhaseCorpus.for_project()
+    phases = [args.phase] if args.phase else sorted(corpus.phases())
+    phases = [phase for phase in phases if corpus.has(phase, "questions.json")]
+    if not phases:
+        print(f"ERROR: No questions.json found{' for ' + args.phase if args.phase else ''}")
+        sys.exit(1)
+
+    try:
+        finder = DuplicateFinder(corpus, args.threshold, args.shingle, args.perms)
+        start = time.perf_counter()
+        finder.load(phases)
+        found = finder.find(cross_phase=args.cross_phase)
+        report = finder.report(found, time.perf_counter() - start)
+    except Exception as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    missed = []
+    if args.check_recall:
+        start = time.perf_counter()
+        exact = finder.find(finder.all_pairs(), cross_phase=args.cross_phase)
+        report['all_pairs_seconds'] = round(time.perf_counter() - start, 3)
+        reported = {(i, j) for _, i, j in found}
+        missed = [(similarity, i, j) for similarity, i, j in exact if (i, j) not in reported]
+        report['missed'] = [
+            {'similarity': round(similarity, 3), 'ids': [f"{'/'.join(finder.keys[i])}", f"{'/'.join(finder.keys[j])}"]}
+            for similarity, i, j in missed
+        ]
+
+    output = json.dumps(report, indent=2, ensure_ascii=False) if args.format == 'json' else format_text(report)
+    if args.check_recall and args.format == 'text':
+        output += (f"\nAll-pairs check: {len(found)} of {len(found) + len(missed)} pairs found by LSH "
+                   f"(all-pairs scan {report['all_pairs_seconds']:.2f} s)\n")
+        output += "".join(f"  missed [{m['similarity']:.2f}] {m['ids'][0]} <-> {m['ids'][1]}\n" for m in report['missed'])
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"[SUCCESS] Report saved to: {args.output}")
+    else:
+        print(output, end='')
+
+    sys.exit(1 if missed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+# ./scripts/question_index.py
+"""
+Question Index - Byte-Offset Sidecar Index for questions.json
+==============================================================
+
+Maps every question ID (and every top-level key such as sections/manifests)
+to its byte span inside questions.json, so read-only tools can seek to one
+question and decode only that span instead of parsing the whole file.
+
+Usage:
+    from question_index import QuestionIndex
+
+    index = QuestionIndex(phase_dir / "questions.json")
+    question = index.read_question("q05")        # decodes only q05's bytes
+    index.patch_question("q05", question)         # re-serializes only q05
+    sections = index.read_top_level("sections")   # decodes only the sections array
+    index.refresh()                               # call after writing questions.json
+
+    python scripts/question_index.py build --phase phase_0
+    python scripts/question_index.py show --phase phase_0 [--question q05]
+
+Inputs:
+    - data/{phase}/questions.json
+
+Outputs:
+    - data/{phase}/questions.json.idx (binary sidecar, git-ignored)
+
+Operational Notes:
+    - Index records the (mtime_ns, size) of the file it describes; a stale
+      index is rebuilt transparently on the next lookup
+    - Writers (question_tool, section_manager, question_properties,
+      questions_manager) refresh the index right after saving
+    - Records are fixed-width and sorted by ID, so lookups are a binary search
+      over the sidecar regardless of how many questions a phase has
+    - Top-level keys are stored with an '@' prefix (e.g. '@manifests')
+    - Spans are verified on read (object whose 'id' matches); a mismatch
+      triggers a rebuild rather than returning the wrong question
+    - patch_question() re-serializes one question, splices it into the
+      file's bytes and swaps the result in through a temp file (os.replace),
+      so readers never see a partial file; the result matches a full
+      json.dump for files in the repo's indent style
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import json
+import re
+import os
+import sys
+import struct
+import argparse
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+INDEX_SUFFIX = '.idx'
+INDEX_MAGIC = b'RFUQIDX1'
+# magic, mtime_ns, size, record count, id width
+HEADER = struct.Struct('<8sqqIH')
+TOP_LEVEL_PREFIX = '@'
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+
+def scan_spans(raw: bytes) -> Dict[str, Tuple[int, int]]:
+    """
+    Return {question_id: (start, end)} plus {'@key': (start, end)} for every
+    top-level member of a questions.json document.
+
+    The bytes are viewed as latin-1 so string offsets equal byte offsets;
+    JSON structure is pure ASCII, so multi-byte UTF-8 text cannot confuse
+    the scan. Raises json.JSONDecodeError on malformed input.
+    """
+    text = raw.decode('latin-1')
+    spans: Dict[str, Tuple[int, int]] = {}
+
+    def skip(pos: int) -> int:
+        return _WHITESPACE.match(text, pos).end()
+
+    def expect(pos: int, char: str) -> int:
+        pos = skip(pos)
+        if text[pos:pos + 1] != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", text, pos)
+        return pos + 1
+
+    def members(pos: int, on_member) -> int:
+        """Walk an object starting at '{'; returns position after '}'."""
+        pos = expect(pos, '{')
+        pos = skip(pos)
+        if text[pos:pos + 1] == '}':
+            return pos + 1
+        while True:
+            key, pos = _DECODER.raw_decode(text, skip(pos))
+            pos = skip(expect(pos, ':'))
+            pos = on_member(key, pos)
+            pos = skip(pos)
+            if text[pos:pos + 1] == ',':
+                pos += 1
+                continue
+            return expect(pos, '}')
+
+    def question_member(qid: str, start: int) -> int:
+        _, end = _DECODER.raw_decode(text, start)
+        spans[qid] = (start, end)
+        return end
+
+    def top_member(key: str, start: int) -> int:
+        if key == 'questions':
+            end = members(start, question_member)
+        else:
+            _, end = _DECODER.raw_decode(text, start)
+        spans[TOP_LEVEL_PREFIX + key] = (start, end)
+        return end
+
+    members(0, top_member)
+    return spans
+
+
+class QuestionIndex:
+    """Sidecar byte-offset index for one questions.json file."""
+
+    def __init__(self, questions_file: Path):
+        self.questions_file = Path(questions_file)
+        self.index_file = self.questions_file.with_name(self.questions_file.name + INDEX_SUFFIX)
+        self._blob: Optional[bytes] = None
+
+    def _stamp(self) -> Tuple[int, int]:
+        st = self.questions_file.stat()
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh(self) -> Dict[str, Tuple[int, int]]:
+        """Rescan questions.json and rewrite the sidecar. Returns the spans."""
+        stamp = self._stamp()
+        with open(self.questions_file, 'rb') as f:
+            raw = f.read()
+        spans = scan_spans(raw)
+        self._write(spans, stamp)
+        return spans
+
+    def _write(self, spans: Dict[str, Tuple[int, int]], stamp: Tuple[int, int]) -> None:
+        """Serialize spans to the sidecar (kept in memory if not writable)."""
+        keys = sorted(spans)
+        encoded = [k.encode('utf-8') for k in keys]
+        width = max((len(k) for k in encoded), default=1)
+        record = struct.Struct(f'<{width}sQQ')
+
+        parts = [HEADER.pack(INDEX_MAGIC, stamp[0], stamp[1], len(keys), width)]
+        for key, key_bytes in zip(keys, encoded):
+            start, end = spans[key]
+            parts.append(record.pack(key_bytes, start, end))
+        blob = b''.join(parts)
+
+        tmp_file = self.index_file.with_suffix(f"{INDEX_SUFFIX}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(blob)
+            os.replace(tmp_file, self.index_file)
+        except OSError:
+            # Read-only checkout: keep the index in memory only
+            pass
+
+        self._blob = blob
+
+    def _load(self) -> bytes:
+        """Return a current index blob, rebuilding it when stale or missing."""
+        stamp = self._stamp()
+        blob = self._blob
+        if blob is None:
+            try:
+                with open(self.index_file, 'rb') as f:
+                    blob = f.read()
+            except OSError:
+                blob = None
+
+        if blob is not None and len(blob) >= HEADER.size:
+            magic, mtime_ns, size, _, _ = HEADER.unpack_from(blob)
+            if magic == INDEX_MAGIC and (mtime_ns, size) == stamp:
+                self._blob = blob
+                return blob
+
+        self.refresh()
+        return self._blob
+
+    def lookup(self, key: str) -> Optional[Tuple[int, int]]:
+        """Binary-search the sidecar for a question ID (or '@key')."""
+        blob = self._load()
+        _, _, _, count, width = HEADER.unpack_from(blob)
+        record = struct.Struct(f'<{width}sQQ')
+        target = key.encode('utf-8')
+        if len(target) > width:
+            return None
+        target = target.ljust(width, b'\0')
+
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = HEADER.size + mid * record.size
+            mid_key = blob[offset:offset + width]
+            if mid_key < target:
+                lo = mid + 1
+            elif mid_key > target:
+                hi = mid
+            else:
+                _, start, end = record.unpack_from(blob, offset)
+                return (start, end)
+        return None
+
+    def _read_span(self, span: Tuple[int, int]) -> Any:
+        start, end = span
+        with open(self.questions_file, 'rb') as f:
+            f.seek(start)
+            chunk = f.read(end - start)
+        return json.loads(chunk.decode('utf-8'))
+
+    def read_question(self, qid: str) -> Optional[Dict]:
+        """Decode only one question's bytes. Returns None if the ID is absent."""
+        if qid.startswith(TOP_LEVEL_PREFIX):
+            return None
+        span = self.lookup(qid)
+        if span is None:
+            return None
+        try:
+            question = self._read_span(span)
+        except ValueError:
+            question = None
+        if not isinstance(question, dict) or question.get('id', qid) != qid:
+            # File changed under us within the same mtime tick: rebuild once
+            span = self.refresh().get(qid)
+            return self._read_span(span) if span else None
+        return question
+
+    def read_top_level(self, key: str) -> Any:
+        """Decode one top-level member (sections, manifests, ...). None if absent."""
+        span = self.lookup(TOP_LEVEL_PREFIX + key)
+        if span is None:
+            return None
+        try:
+            return self._read_span(span)
+        except ValueError:
+            span = self.refresh().get(TOP_LEVEL_PREFIX + key)
+            return self._read_span(span) if span else None
+
+    def patch_question(self, qid: str, question: Dict) -> bool:
+        """
+        Replace one question, re-serializing only that object.
+
+        Indentation is taken from the existing span so the spliced text lines
+        up with its neighbours. Returns False (file untouched) when the span
+        cannot be patched safely; callers should then fall back to a full save.
+        """
+        if qid.startswith(TOP_LEVEL_PREFIX):
+            return False
+        before = self._spans()
+        if qid not in before:
+            return False
+        start, end = before[qid]
+
+        with open(self.questions_file, 'rb') as f:
+            raw = f.read()
+        old = raw[start:end]
+        try:
+            current = json.loads(old.decode('utf-8'))
+        except ValueError:
+            return False
+        if not isinstance(current, dict) or current.get('id', qid) != qid:
+            return False
+
+        # Leading whitespace of the `"qid": {` line, one level deeper, and EOL style
+        line_start = raw.rfind(b'\n', 0, start) + 1
+        line = raw[line_start:start]
+        base = line[:len(line) - len(line.lstrip(b' '))]
+        newline = old.find(b'\n')
+        if newline < 0:
+            return False
+        second = old[newline + 1:]
+        unit = len(second) - len(second.lstrip(b' ')) - len(base)
+        if unit <= 0:
+            return False
+
+        eol = '\r\n' if old[newline - 1:newline] == b'\r' else '\n'
+        text = json.dumps(question, indent=unit, ensure_ascii=False)
+        new = text.replace('\n', eol + base.decode('ascii')).encode('utf-8')
+
+        # Write beside the target and swap in, so readers never see a partial file
+        tmp_file = self.questions_file.with_name(f"{self.questions_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(raw[:start] + new + raw[end:])
+        os.replace(tmp_file, self.questions_file)
+
+        # Shift spans after the edit (and stretch the enclosing 'questions'
+        # object) instead of rescanning the file
+        delta = len(new) - len(old)
+        spans = {}
+        for key, (s, e) in before.items():
+            if s >= end:
+                s, e = s + delta, e + delta
+            elif e >= end:
+                e += delta
+            spans[key] = (s, e)
+        self._write(spans, self._stamp())
+        return True
+
+    def _spans(self) -> Dict[str, Tuple[int, int]]:
+        """Decode every record of the current index."""
+        blob = self._load()
+        _, _, _, count, width = HEADER.unpack_from(blob)
+        record = struct.Struct(f'<{width}sQQ')
+        spans = {}
+        for i in range(count):
+            key, start, end = record.unpack_from(blob, HEADER.size + i * record.size)
+            spans[key.rstrip(b'\0').decode('utf-8')] = (start, end)
+        return spans
+
+    def question_ids(self) -> list:
+        """All indexed question IDs (sorted)."""
+        return [k for k in self._spans() if not k.startswith(TOP_LEVEL_PREFIX)]
+
+
+def refresh_index(questions_file: Path) -> None:
+    """Rebuild the sidecar after a tool writes questions.json (never fatal)."""
+    try:
+        QuestionIndex(questions_file).refresh()
+    except (OSError, ValueError):
+        pass
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Question Index - Byte-offset sidecar for questions.json"
+    )
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+
+    build_parser = subparsers.add_parser('build', help='Build or refresh the index')
+    build_parser.add_argument('--phase', required=True, help='Phase directory')
+
+    show_parser = subparsers.add_parser('show', help='Show indexed spans')
+    show_parser.add_argument('--phase', required=True, help='Phase directory')
+    show_parser.add_argument('--question', help='Only show this question ID')
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    project_root = Path(__file__).parent.parent
+    questions_file = project_root / "data" / args.phase / "questions.json"
+    if not questions_file.exists():
+        print(f"ERROR: questions.json not found in data/{args.phase}")
+        sys.exit(1)
+
+    try:
+        index = QuestionIndex(questions_file)
+        if args.command == 'build':
+            spans = index.refresh()
+            count = sum(1 for k in spans if not k.startswith(TOP_LEVEL_PREFIX))
+            print(f"[SUCCESS] Indexed {count} questions in {args.phase} -> {index.index_file.name}")
+        else:
+            keys = [args.question] if args.question else index.question_ids()
+            for qid in keys:
+                span = index.lookup(qid)
+                if span is None:
+                    print(f"ERROR: Question {qid} not found in {args.phase}")
+                    sys.exit(1)
+                print(f"{qid}: bytes {span[0]}-{span[1]} ({span[1] - span[0]} bytes)")
+    except json.JSONDecodeError as e:
+        print(f"ERROR: Invalid JSON in {questions_file}: {e}")
+        sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,12 +11,14 @@ Usage:
     python scripts/question_properties.py set-max --phase PHASE --type multi_select --value 5
     python scripts/question_properties.py remove-max --phase PHASE --question q06
     python scripts/question_properties.py list-props --phase PHASE --type multi_select
+    python scripts/question_properties.py batch --phase PHASE --file ops.jsonl
 
 Commands:
     set-max: Set max limit on select-type questions
     remove-max: Remove max limit
     set-min: Set min limit on number/multi-select questions
     list-props: List current properties for questions matching criteria
+    batch: Apply JSONL operations in one atomic write (see question_batch.py)
 
 CLI Arguments:
     --phase: Required. Phase directory (e.g., phase_0)
@@ -46,9 +48,13 @@ GitHub: https://github.com/imyourboyroy
 import json
 import sys
 import argparse
+import os
 import shutil
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Optional
+
+from phase_corpus import load_json
+from question_index import refresh_index
 
 
 class QuestionPropertiesManager:
@@ -61,20 +67,34 @@ class QuestionPropertiesManager:
         
         if not self.questions_file.exists():
             raise FileNotFoundError(f"questions.json not found in {self.phase_dir}")
+        
+        # Set by question_batch: operations share one in-memory document
+        self._batch_data: Optional[Dict] = None
+        # Per-question errors of the last set_max/set_min/remove_max call
+        self.last_errors: List[str] = []
     
     def _load_questions(self) -> Dict:
-        """Load questions.json file."""
-        with open(self.questions_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """Load a private (mutable) copy of questions.json (or the batch document)."""
+        if self._batch_data is not None:
+            return self._batch_data
+        return load_json(self.questions_file, use_cache=False)
     
     def _save_questions(self, data: Dict, backup: bool = True) -> None:
-        """Save questions.json with optional backup."""
+        """Save questions.json with optional backup (no-op inside a batch)."""
+        if self._batch_data is not None:
+            return
+        
         if backup:
             backup_path = self.questions_file.with_suffix('.json.bak')
             shutil.copy2(self.questions_file, backup_path)
         
-        with open(self.questions_file, 'w', encoding='utf-8') as f:
+        # Write beside the target and swap in, so readers never see a partial file
+        tmp_path = self.questions_file.with_name(self.questions_file.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.questions_file)
+        
+        refresh_index(self.questions_file)
     
     def set_max(self, question_ids: List[str], max_value: int) -> str:
         """Set max limit on questions."""
@@ -97,6 +117,7 @@ class QuestionPropertiesManager:
             q['max'] = max_value
             updated.append(qid)
         
+        self.last_errors = errors
         if updated:
             self._save_questions(data, backup=True)
         
@@ -115,16 +136,26 @@ class QuestionPropertiesManager:
         """Remove max limit from questions."""
         data = self._load_questions()
         updated = []
+        errors = []
         
         for qid in question_ids:
-            if qid in data['questions'] and 'max' in data['questions'][qid]:
+            if qid not in data['questions']:
+                errors.append(f"{qid}: not found")
+            elif 'max' in data['questions'][qid]:
                 del data['questions'][qid]['max']
                 updated.append(qid)
         
+        self.last_errors = errors
         if updated:
             self._save_questions(data, backup=True)
         
-        return f"[SUCCESS] Removed max from {len(updated)} question(s): {', '.join(updated)}"
+        result = [f"[SUCCESS] Removed max from {len(updated)} question(s): {', '.join(updated)}"]
+        if errors:
+            result.append(f"  Errors: {len(errors)}")
+            for err in errors:
+                result.append(f"    - {err}")
+        
+        return '\n'.join(result)
     
     def set_min(self, question_ids: List[str], min_value: int) -> str:
         """Set min limit on questions."""
@@ -147,6 +178,7 @@ class QuestionPropertiesManager:
             q['min'] = min_value
             updated.append(qid)
         
+        self.last_errors = errors
         if updated:
             self._save_questions(data, backup=True)
         
@@ -222,6 +254,12 @@ def main():
     list_props_parser.add_argument('--phase', required=True, help='Phase ID')
     list_props_parser.add_argument('--type', help='Filter by question type')
     
+    # batch command
+    batch_parser = subparsers.add_parser('batch', help='Apply JSONL operations atomically (one write)')
+    batch_parser.add_argument('--phase', required=True, help='Phase ID')
+    batch_parser.add_argument('--file', default='-', help='JSONL operations file (default: stdin)')
+    batch_parser.add_argument('--dry-run', action='store_true', help='Validate operations without writing')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -276,6 +314,13 @@ def main():
         elif args.command == 'list-props':
             result = manager.list_properties(args.type)
             print(result)
+        
+        elif args.command == 'batch':
+            from question_batch import run_batch
+            result = run_batch(manager, args.file, dry_run=args.dry_run)
+            print(result)
+            if result.startswith('ERROR'):
+                sys.exit(1)
     
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
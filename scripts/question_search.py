@@ -8,12 +8,25 @@ entire questions.json files. Designed for rapid AI agent queries.
 
 Usage:
     python scripts/question_search.py --text SEARCH_TERM [OPTIONS]
+    python scripts/question_search.py --query 'pac* "hard topics"'
+    python scripts/question_search.py --rank "pacing hard conversations" --top 5
+    python scripts/question_search.py --where 'type:multi_select AND manifest:lite AND NOT missing:examples'
     python scripts/question_search.py --type single_select --phase phase_0
     python scripts/question_search.py --manifest lite --count
+    python scripts/question_search.py --id q01,q05 --phase phase_0
 
 CLI Arguments:
     --phase: Optional. Specific phase to search. Default: all phases
-    --text: Optional. Search in title/prompt/options
+    --id: Optional. Comma-separated question IDs (byte-offset lookup, see question_index.py)
+    --text: Optional. Substring search in title/prompt/options
+    --query: Optional. Full-text query over title/prompt/option and field labels/examples:
+             words must all match; word* = prefix; "two words" = exact phrase
+    --rank: Optional. Order matches by BM25 relevance to these words (any may match;
+            title > prompt > options > examples) and add a highlighted snippet
+    --top: Optional. Number of ranked results to return (use with --rank). Default: 10
+    --where: Optional. Filter expression: field:value conditions with AND/OR/NOT and
+             parentheses over type/section/manifest/missing/has/text/title/.../id/phase
+             (see search_query.py)
     --type: Optional. Filter by question type
     --section: Optional. Filter by section ID
     --manifest: Optional. Filter by manifest (lite/full)
@@ -24,7 +37,8 @@ CLI Arguments:
     --output: Optional. Save results to file
 
 Inputs:
-    - data/{phase}/questions.json (indexed search, not full load)
+    - data/{phase}/questions.json (only re-read when it changed)
+    - .cache/search/ (persistent full-text index, see search_index.py)
 
 Outputs:
     - Matching questions list or count
@@ -32,10 +46,16 @@ Outputs:
     - Optional JSON export
 
 Operational Notes:
-    - Uses indexed search (doesn't parse full JSON tree)
-    - Fast queries (<100ms typical)
-    - Supports complex filter combinations
-    - Count-only mode for minimal output
+    - Uses indexed search: answers come from the search_index.py files, and a
+      phase's questions.json is only parsed (and re-indexed) after it changes
+    - Fast queries (single-digit ms over thousands of questions once indexed)
+    - Supports complex filter combinations: --where and every filter flag
+      compile once into a search_query.py predicate answered with index set
+      operations (flags are ANDed with --where)
+    - Count-only mode for minimal output (text --count never decodes a
+      question record, only counts the matching posting set)
+    - --rank combines with every filter: filters decide which questions qualify,
+      BM25 decides their order; --count reports all ranked matches, not just --top
     - Token-efficient: ~30 tokens vs ~3,000 for manual search
 
 Author: Roy Dawson IV
@@ -46,148 +66,172 @@ import json
 import sys
 import argparse
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Optional, Tuple
+
+from phase_corpus import QUESTION_TYPES, MANIFEST_NAMES, PhaseCorpus
+
+
+DEFAULT_TOP = 10
 
 
 class QuestionSearch:
     """Efficient question search without full file loading."""
     
-    VALID_TYPES = ['free_text', 'single_select', 'multi_select', 'compound']
-    VALID_MANIFESTS = ['lite', 'full']
+    VALID_TYPES = QUESTION_TYPES
+    VALID_MANIFESTS = MANIFEST_NAMES
     
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
+        self.corpus = PhaseCorpus(data_dir)
+        self._index = None
+        self.total_matches: Optional[int] = None  # before --top is applied
+    
+    @property
+    def index(self):
+        """Persistent search index, imported and opened on first use (see search_index.py)."""
+        if self._index is None:
+            from search_index import SearchIndex
+            self._index = SearchIndex(self.corpus)
+        return self._index
     
     def search(self, args: argparse.Namespace) -> List[Dict]:
         """Search questions based on criteria."""
         # Get phases to search
         if args.phase:
-            phases = [self.data_dir / args.phase]
+            phases = [args.phase]
         else:
-            phases = [p for p in self.data_dir.iterdir() if p.is_dir() and p.name.startswith('phase')]
-            phases.sort()
+            phases = sorted(self.corpus.phases())
         
-        results = []
+        phases = [phase for phase in phases if self.corpus.has(phase, "questions.json")]
+        predicate = self.compile_filters(args)
+        # A text --count only needs how many match: no record is decoded
+        count_only = args.count and args.format == 'text' and not args.rank
+        matches = []
+        counted = 0
         
-        for phase_dir in phases:
-            questions_file = phase_dir / "questions.json"
-            if not questions_file.exists():
+        for phase in phases:
+            # ID lookups decode only the requested spans; everything else is
+            # answered from the search index with set operations
+            if args.id and not (args.query or args.rank or args.where):
+                records = [r for r in self._records_by_id(phase, args.id.split(','))
+                           if predicate.test(r, phase)]
+            elif count_only:
+                counted += len(self.index.select_docs(phase, predicate))
                 continue
-            
-            # Load questions
-            with open(questions_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Get manifest data for filtering
-            manifests_data = data.get('manifests', {})
-            lite_ids = set(manifests_data.get('lite', {}).get('question_ids', []))
-            full_ids = set(manifests_data.get('full', {}).get('question_ids', []))
-            
-            # Search through questions
-            for qid, q in data.get('questions', {}).items():
-                if self._matches_criteria(q, qid, lite_ids, full_ids, args):
-                    results.append({
-                        'phase': phase_dir.name,
-                        'id': qid,
-                        'title': q.get('title', ''),
-                        'type': q.get('type', ''),
-                        'section': q.get('section_id', ''),
-                        'prompt': q.get('prompt', ''),
-                        'manifests': self._get_manifests(qid, lite_ids, full_ids)
-                    })
+            else:
+                records = self.index.select(phase, predicate)
+            matches.extend((phase, r) for r in records)
         
-        return results
+        if count_only:
+            self.total_matches = counted + len(matches)
+            return []
+        if args.rank:
+            return self._ranked(phases, matches, args)
+        self.total_matches = len(matches)
+        return [self._result(phase, r) for phase, r in matches]
+    
+    def _result(self, phase: str, r: Dict) -> Dict:
+        """Output fields of one matching question record."""
+        return {
+            'phase': phase,
+            'id': r['id'],
+            'title': r['title'],
+            'type': r['type'],
+            'section': r['section'],
+            'prompt': r['prompt'],
+            'manifests': r['manifests']
+        }
     
-    def _matches_criteria(self, q: Dict, qid: str, lite_ids: Set, full_ids: Set, args: argparse.Namespace) -> bool:
-        """Check if question matches search criteria."""
-        # Type filter
-        if args.type and q.get('type') != args.type:
-            return False
+    def _ranked(self, phases: List[str], matches: List[Tuple[str, Dict]], args: argparse.Namespace) -> List[Dict]:
+        """Top --top matches containing a --rank word, by BM25 score, with snippets."""
+        scores = self.index.rank(phases, args.rank)
+        scored = [(scores[(phase, r['doc'])], phase, r) for phase, r in matches if (phase, r['doc']) in scores]
+        scored.sort(key=lambda item: -item[0])  # stable: ties keep phase/file order
+        self.total_matches = len(scored)
         
-        # Section filter
-        if args.section and q.get('section_id') != args.section:
-            return False
+        # Snippets need the full option/example text: decode only the top questions
+        from question_index import QuestionIndex
+        from search_index import query_terms, snippet
+        terms = query_terms(args.rank)
+        readers: Dict[str, QuestionIndex] = {}
+        results = []
+        for score, phase, r in scored[:args.top or DEFAULT_TOP]:
+            if phase not in readers:
+                readers[phase] = QuestionIndex(self.corpus.path(phase, "questions.json"))
+            q = readers[phase].read_question(r['id'])
+            result = self._result(phase, r)
+            result['score'] = round(score, 3)
+            result['snippet'] = snippet(q, terms) if q else ""
+            results.append(result)
+        return results
+    
+    def _records_by_id(self, phase: str, qids: List[str]) -> List[Dict]:
+        """Search records for specific IDs via byte-offset reads (see question_index.py)."""
+        from question_index import QuestionIndex
+        from search_index import question_record
+        index = QuestionIndex(self.corpus.path(phase, "questions.json"))
+        manifests_data = index.read_top_level('manifests') or {}
+        lite_ids = set(manifests_data.get('lite', {}).get('question_ids', []))
+        full_ids = set(manifests_data.get('full', {}).get('question_ids', []))
         
-        # Manifest filter
+        records = {}
+        for qid in qids:
+            q = index.read_question(qid.strip())
+            if q is not None:
+                records[qid.strip()] = question_record(qid.strip(), q, lite_ids, full_ids)
+        return list(records.values())
+    
+    def compile_filters(self, args: argparse.Namespace) -> Optional['Node']:
+        """Compile --where and the filter flags into one search_query predicate."""
+        if not any((args.where, args.query, args.type, args.section, args.manifest,
+                    args.text, args.missing, args.id)):
+            return None
+        # Only filtered searches pay for the query compiler
+        from search_query import And, Contains, Facet, FullText, Node, Not, Or, QuestionId, compile_query
+        conditions: List[Node] = []
+        if args.where:
+            conditions.append(compile_query(args.where))
+        if args.query:
+            conditions.append(FullText('text', args.query))
+        if args.type:
+            conditions.append(Facet('type', args.type))
+        if args.section:
+            conditions.append(Facet('section', args.section))
         if args.manifest:
-            if args.manifest == 'lite':
-                if args.exclude and args.exclude == 'full':
-                    # Lite-only (not in full)
-                    if qid not in lite_ids or qid in full_ids:
-                        return False
-                else:
-                    # In lite (may also be in full)
-                    if qid not in lite_ids:
-                        return False
-            elif args.manifest == 'full':
-                if args.exclude and args.exclude == 'lite':
-                    # Full-only (not in lite)
-                    if qid not in full_ids or qid in lite_ids:
-                        return False
-                else:
-                    # In full (may also be in lite)
-                    if qid not in full_ids:
-                        return False
-        
-        # Text search
+            conditions.append(Facet('manifest', args.manifest))
+            if args.exclude and args.exclude != args.manifest:
+                conditions.append(Not(Facet('manifest', args.exclude)))
         if args.text:
-            search_text = args.text.lower()
-            title = q.get('title', '').lower()
-            prompt = q.get('prompt', '').lower()
-            
-            # Search in options if present
-            options_text = ""
-            if 'options' in q:
-                options_text = " ".join([opt.get('label', '').lower() for opt in q['options']])
-            
-            combined = f"{title} {prompt} {options_text}"
-            if search_text not in combined:
-                return False
-        
-        # Missing field filter
+            conditions.append(Contains(args.text))
         if args.missing:
-            if args.missing == 'examples':
-                if q.get('examples') and len(q['examples']) > 0:
-                    return False
-            elif args.missing == 'validation':
-                if q.get('validation'):
-                    return False
-            elif args.missing == 'options':
-                if q.get('type') in ['single_select', 'multi_select']:
-                    if q.get('options') and len(q['options']) > 0:
-                        return False
+            conditions.append(Facet('missing', args.missing))
+        if args.id:
+            conditions.append(Or([QuestionId(qid.strip()) for qid in args.id.split(',')]))
         
-        return True
-    
-    def _get_manifests(self, qid: str, lite_ids: Set, full_ids: Set) -> str:
-        """Get manifest membership string."""
-        in_lite = qid in lite_ids
-        in_full = qid in full_ids
-        
-        if in_lite and in_full:
-            return "lite,full"
-        elif in_lite:
-            return "lite"
-        elif in_full:
-            return "full"
-        else:
-            return "none"
+        return conditions[0] if len(conditions) == 1 else And(conditions)
     
     def format_text(self, results: List[Dict], count_only: bool = False) -> str:
         """Format search results as text."""
+        total = len(results) if self.total_matches is None else self.total_matches
         if count_only:
-            return f"Found {len(results)} questions"
+            return f"Found {total} questions"
         
         if not results:
             return "No questions found matching criteria"
         
         lines = []
-        lines.append(f"Found {len(results)} questions:\n")
+        if total > len(results):
+            lines.append(f"Found {total} questions (top {len(results)} by relevance):\n")
+        else:
+            lines.append(f"Found {len(results)} questions:\n")
         
         for r in results:
-            lines.append(f"{r['id']} [{r['type']}] - {r['title']}")
+            score = f" (score {r['score']:.2f})" if 'score' in r else ""
+            lines.append(f"{r['id']} [{r['type']}] - {r['title']}{score}")
             lines.append(f"  Phase: {r['phase']}, Section: {r['section']}, Manifests: {r['manifests']}")
-            if len(r['prompt']) < 80:
+            if r.get('snippet'):
+                lines.append(f"  Match: {r['snippet']}")
+            elif len(r['prompt']) < 80:
                 lines.append(f"  Prompt: {r['prompt']}")
             lines.append("")
         
@@ -212,6 +256,15 @@ Examples:
   Search by text:
     python scripts/question_search.py --text "readiness"
   
+  Full-text query (all words, prefix*, "phrase"):
+    python scripts/question_search.py --query 'conflict repair*'
+  
+  Best 3 matches by relevance, with snippets:
+    python scripts/question_search.py --rank "money spending habits" --top 3
+  
+  Filter expression (AND/OR/NOT, parentheses, field:value*):
+    python scripts/question_search.py --where 'type:multi_select AND (manifest:lite OR has:validation.*)'
+  
   Find by type:
     python scripts/question_search.py --type compound --phase phase_0
   
@@ -227,7 +280,12 @@ Examples:
     )
     
     parser.add_argument('--phase', help='Specific phase to search (default: all)')
+    parser.add_argument('--id', help='Comma-separated question IDs to look up (reads only those spans)')
     parser.add_argument('--text', help='Search text in title/prompt/options')
+    parser.add_argument('--query', help='Full-text query: words (all must match), prefix*, "exact phrase"')
+    parser.add_argument('--rank', metavar='WORDS', help='Rank matches by BM25 relevance to these words (title > prompt > options)')
+    parser.add_argument('--top', type=int, help=f'Number of ranked results (use with --rank, default: {DEFAULT_TOP})')
+    parser.add_argument('--where', metavar='EXPR', help='Filter expression, e.g. \'type:compound AND NOT missing:examples\'')
     parser.add_argument('--type', choices=QuestionSearch.VALID_TYPES, help='Filter by question type')
     parser.add_argument('--section', help='Filter by section ID (e.g., s1)')
     parser.add_argument('--manifest', choices=QuestionSearch.VALID_MANIFESTS, help='Filter by manifest')
@@ -243,6 +301,9 @@ Examples:
     if args.exclude and not args.manifest:
         print("ERROR: --exclude requires --manifest")
         sys.exit(1)
+    if args.top is not None and (not args.rank or args.top < 1):
+        print("ERROR: --top requires --rank and a positive number")
+        sys.exit(1)
     
     # Find project root
     script_dir = Path(__file__).parent
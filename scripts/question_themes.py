@@ -0,0 +1,564 @@
+# ./scripts/question_themes.py
+"""
+Question Themes - TF-IDF Similarity, Topic Clusters and Coverage Reports
+========================================================================
+
+Maps what the question bank covers. Every question becomes a sparse TF-IDF
+vector over the text question_search.py indexes: title, prompt, option and
+field labels, and examples, weighted per field as in --rank. From these
+vectors the tool finds each question's nearest neighbours by cosine
+similarity and groups questions into topics with spherical k-means. It then
+reports which topics each phase covers, which topics are thin, and which
+sections overlap across phases.
+
+Usage:
+    python scripts/question_themes.py
+    python scripts/question_themes.py --clusters 20 --format json --output themes.json
+    python scripts/question_themes.py --similar phase_0/q05
+    python scripts/question_themes.py --backend python --no-cache
+
+CLI Arguments:
+    --clusters: Optional. Number of topics (k-means k). Default: about sqrt(questions / 2)
+    --neighbors: Optional. Nearest neighbours kept per question. Default: 5
+    --overlap: Optional. Minimum section-to-section cosine to report as overlap. Default: 0.35
+    --thin: Optional. Topics with at most this many questions are reported as thin. Default: 3
+    --similar: Optional. PHASE/QID; print that question's nearest neighbours only
+    --backend: Optional. auto, numpy or python. Default: auto (numpy when installed)
+    --no-cache: Optional. Recompute even when a cached report matches the corpus
+    --format: Optional. Output format (text, json). Default: text
+    --output: Optional. Save the report to a file
+
+Inputs:
+    - data/{phase}/questions.json
+
+Outputs:
+    - Topics with size, phases and top terms; thin topics
+    - Per-phase coverage (topics covered/missing) and per-section dominant
+      topics with their closest sections in other phases
+    - json: the same plus every question's topic and neighbours
+    - .cache/themes/{hash}.json (report cached by corpus hash, settings and
+      the source of this script and search_index.py)
+    - Exit code: 0 (report produced), 1 (error)
+
+Operational Notes:
+    - Read-only on data/; reruns on an unchanged corpus load the cached
+      report instead of recomputing
+    - NumPy is optional. With it, similarities are matrix products in row
+      blocks (dense while the matrix fits in 128 MB, gathered from the CSR
+      arrays beyond that). Without it, a pure-Python inverted index does the
+      same work. Both give the same report (scores rounded to 4 places).
+    - Terms are question_search tokens of 3+ letters minus common English
+      stop words and answer-form words (prefer, unsure, notes, ...); tf is
+      sublinear (1 + ln tf) and idf is smoothed
+    - k-means starts from evenly spaced questions, so results are
+      deterministic; ties go to the lower topic/question number
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import hashlib
+import argparse
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from phase_corpus import PROJECT_ROOT, PhaseCorpus
+from search_index import FIELD_WEIGHTS, field_texts, tokenize
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python backend below
+    np = None
+
+
+THEMES_FORMAT = 1
+# Scripts whose source shapes the report (tokenizer, field weights, clustering)
+THEMES_SOURCES = ('question_themes.py', 'search_index.py')
+DEFAULT_CACHE_DIR = PROJECT_ROOT / ".cache" / "themes"
+DEFAULT_NEIGHBORS = 5
+DEFAULT_OVERLAP = 0.35
+DEFAULT_THIN = 3
+KMEANS_ITERATIONS = 25
+TOPIC_TERMS = 5
+
+# Ties between backends are decided on scores rounded to this many places
+TIE_DIGITS = 9
+# numpy: keep X dense up to this many cells (128 MB); beyond it, similarity
+# blocks gather (rows x nonzeros) floats at a time
+DENSE_ELEMENTS = 1 << 24
+BLOCK_ELEMENTS = 1 << 22
+
+STOPWORDS = frozenset("""
+about above after again against all also and any are because been before being below between both but can
+could did does doing down during each few for from further had has have having her here hers him his how
+into its itself just more most not now off once only other our ours out over own same she should some such
+than that the their theirs them then there these they this those through too under until very was were
+what when where which while who whom why will with would you your yours yourself yourselves
+""".split()) | frozenset("""
+applicable describe drag none notes optional other prefer rank ranked say select sure unsure write yes
+""".split())  # answer-form boilerplate shared by most questions
+
+Vector = Dict[int, float]
+
+
+def question_terms(q: Dict) -> Dict[str, float]:
+    """Field-weighted term counts of a question (title 3, prompt 2, labels 1, examples 0.5)."""
+    counts: Dict[str, float] = {}
+    for weight, texts in zip(FIELD_WEIGHTS, field_texts(q)):
+        for text in texts:
+            for token in tokenize(text):
+                if len(token) >= 3 and not token.isdigit() and token not in STOPWORDS:
+                    counts[token] = counts.get(token, 0.0) + weight
+    return counts
+
+
+def _normalized(vector: Vector) -> Vector:
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    return {t: w / norm for t, w in vector.items()} if norm else {}
+
+
+def _dot(a: Vector, b: Vector) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(t, 0.0) for t, w in a.items())
+
+
+class TfidfMatrix:
+    """L2-normalized TF-IDF rows in CSR form (indptr/indices/data) over a sorted vocabulary."""
+
+    def __init__(self, documents: List[Dict[str, float]]):
+        df: Dict[str, int] = {}
+        for counts in documents:
+            for term in counts:
+                df[term] = df.get(term, 0) + 1
+        self.vocab = sorted(df)
+        column = {term: i for i, term in enumerate(self.vocab)}
+        n = len(documents)
+        idf = {term: math.log((1 + n) / (1 + count)) + 1.0 for term, count in df.items()}
+
+        self.indptr = array('l', [0])
+        self.indices = array('l')
+        self.data = array('d')
+        for counts in documents:
+            row = _normalized({column[t]: (1.0 + math.log(tf)) * idf[t] for t, tf in counts.items()})
+            for i in sorted(row):
+                self.indices.append(i)
+                self.data.append(row[i])
+            self.indptr.append(len(self.indices))
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def row(self, i: int) -> Vector:
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return dict(zip(self.indices[start:end], self.data[start:end]))
+
+
+class PythonBackend:
+    """Inverted-index cosine similarity and k-means over dict rows."""
+
+    name = "python"
+
+    def __init__(self, matrix: TfidfMatrix):
+        self.rows = [matrix.row(i) for i in range(len(matrix))]
+        self.postings: Dict[int, List[Tuple[int, float]]] = {}
+        for doc, row in enumerate(self.rows):
+            for term, weight in row.items():
+                self.postings.setdefault(term, []).append((doc, weight))
+
+    def neighbors(self, k: int) -> List[List[Tuple[int, float]]]:
+        result = []
+        for doc, row in enumerate(self.rows):
+            scores: Dict[int, float] = {}
+            for term, weight in row.items():
+                for other, other_weight in self.postings[term]:
+                    scores[other] = scores.get(other, 0.0) + weight * other_weight
+            scores.pop(doc, None)
+            ranked = sorted(scores.items(), key=lambda item: (-round(item[1], TIE_DIGITS), item[0]))
+            result.append(ranked[:k])
+        return result
+
+    def kmeans(self, seeds: List[int]) -> List[int]:
+        centroids = [self.rows[i] for i in seeds]
+        assignment: List[int] = []
+        for _ in range(KMEANS_ITERATIONS):
+            updated = []
+            for row in self.rows:
+                scores = [round(_dot(row, centroid), TIE_DIGITS) for centroid in centroids]
+                updated.append(scores.index(max(scores)))
+            if updated == assignment:
+                break
+            assignment = updated
+            sums: List[Vector] = [{} for _ in centroids]
+            for row, topic in zip(self.rows, assignment):
+                for term, weight in row.items():
+                    sums[topic][term] = sums[topic].get(term, 0.0) + weight
+            centroids = [_normalized(total) if total else centroid for total, centroid in zip(sums, centroids)]
+        return assignment
+
+
+class NumpyBackend:
+    """The same operations vectorized over the CSR arrays, one block of rows at a time."""
+
+    name = "numpy"
+
+    def __init__(self, matrix: TfidfMatrix):
+        self.n = len(matrix)
+        self.v = len(matrix.vocab)
+        self.indptr = np.frombuffer(matrix.indptr, dtype=np.int_ if matrix.indptr.itemsize == 8 else np.int32)
+        self.indices = np.frombuffer(matrix.indices, dtype=self.indptr.dtype)
+        self.data = np.frombuffer(matrix.data, dtype=np.float64)
+        # Row number of every stored value (for scatter-adds)
+        self.row_of = np.repeat(np.arange(self.n), np.diff(self.indptr))
+        # Small enough to hold densely: products become BLAS matrix multiplies
+        self.dense = None
+        if self.n * self.v <= DENSE_ELEMENTS:
+            self.dense = np.zeros((self.n, self.v))
+            self.dense[self.row_of, self.indices] = self.data
+
+    def _times(self, dense: Any) -> Any:
+        """dense (m x vocab) @ X.T -> (m x n)."""
+        if self.dense is not None:
+            return dense @ self.dense.T
+        # Sparse: gather each row's columns, sum per row
+        products = dense[:, self.indices] * self.data
+        return np.add.reduceat(products, self.indptr[:-1], axis=1)
+
+    def neighbors(self, k: int) -> List[List[Tuple[int, float]]]:
+        result = []
+        width = self.n if self.dense is not None else max(1, len(self.data))
+        block = max(1, BLOCK_ELEMENTS // width)
+        for start in range(0, self.n, block):
+            end = min(self.n, start + block)
+            if self.dense is not None:
+                dense = self.dense[start:end]
+            else:
+                dense = np.zeros((end - start, self.v))
+                lo, hi = self.indptr[start], self.indptr[end]
+                dense[self.row_of[lo:hi] - start, self.indices[lo:hi]] = self.data[lo:hi]
+            scores = self._times(dense)
+            for offset, row in enumerate(scores):
+                doc = start + offset
+                rounded = np.round(row, TIE_DIGITS)
+                rounded[doc] = -np.inf
+                order = np.argsort(-rounded, kind='stable')
+                result.append([(int(j), float(row[j])) for j in order[:k] if rounded[j] > 0])
+        return result
+
+    def kmeans(self, seeds: List[int]) -> List[int]:
+        centroids = np.zeros((len(seeds), self.v))
+        for topic, doc in enumerate(seeds):
+            lo, hi = self.indptr[doc], self.indptr[doc + 1]
+            centroids[topic, self.indices[lo:hi]] = self.data[lo:hi]
+        assignment = None
+        for _ in range(KMEANS_ITERATIONS):
+            updated = np.argmax(np.round(self._times(centroids), TIE_DIGITS), axis=0)
+            if assignment is not None and np.array_equal(updated, assignment):
+                break
+            assignment = updated
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, (assignment[self.row_of], self.indices), self.data)
+            norms = np.linalg.norm(sums, axis=1)
+            filled = norms > 0
+            centroids[filled] = sums[filled] / norms[filled, None]
+        return [int(topic) for topic in assignment]
+
+
+def make_backend(matrix: TfidfMatrix, name: str = 'auto') -> Any:
+    if name == 'numpy' and np is None:
+        raise ValueError("numpy is not installed (use --backend python)")
+    if name == 'numpy' or (name == 'auto' and np is not None):
+        return NumpyBackend(matrix)
+    return PythonBackend(matrix)
+
+
+def corpus_hash(corpus: PhaseCorpus, phases: List[str], settings: Dict[str, Any]) -> str:
+    """Content hash of every questions.json plus the settings and sources that shape the report."""
+    digest = hashlib.sha256(json.dumps([THEMES_FORMAT, settings], sort_keys=True).encode('utf-8'))
+    scripts_dir = Path(__file__).parent
+    for name in THEMES_SOURCES:
+        digest.update(hashlib.sha256((scripts_dir / name).read_bytes()).digest())
+    for phase in phases:
+        digest.update(phase.encode('utf-8') + b"\0")
+        digest.update(corpus.path(phase, "questions.json").read_bytes())
+    return digest.hexdigest()
+
+
+class ThemeMapper:
+    """Builds the TF-IDF matrix for a set of phases and derives the coverage report."""
+
+    def __init__(self, corpus: PhaseCorpus, phases: List[str]):
+        self.corpus = corpus
+        self.phases = phases
+        self.questions: List[Dict[str, Any]] = []
+        documents = []
+        for phase in phases:
+            for qid, q in corpus.questions(phase).get('questions', {}).items():
+                terms = question_terms(q)
+                if terms:
+                    self.questions.append({'phase': phase, 'id': qid, 'section': q.get('section_id', ''),
+                                           'title': q.get('title', '')})
+                    documents.append(terms)
+        self.matrix = TfidfMatrix(documents)
+
+    def report(self, clusters: Optional[int], neighbors: int, overlap: float, thin: int,
+               backend_name: str = 'auto') -> Dict[str, Any]:
+        n = len(self.questions)
+        if n < 2:
+            raise ValueError("Need at least two questions with text")
+        k = max(1, min(n, clusters or max(2, round(math.sqrt(n / 2)))))
+        backend = make_backend(self.matrix, backend_name)
+
+        near = backend.neighbors(neighbors)
+        assignment = backend.kmeans([i * n // k for i in range(k)])
+        topics = self._topics(assignment)
+        topic_of = {doc: topic['id'] for topic in topics for doc in topic.pop('members')}
+
+        questions = []
+        for doc, info in enumerate(self.questions):
+            questions.append(dict(info, topic=topic_of[doc], neighbors=[
+                {'phase': self.questions[j]['phase'], 'id': self.questions[j]['id'], 'similarity': round(score, 4)}
+                for j, score in near[doc]
+            ]))
+
+        return {
+            'format': THEMES_FORMAT,
+            'backend': backend.name,
+            'questions_total': n,
+            'vocabulary': len(self.matrix.vocab),
+            'phases': self._phase_coverage(topics, topic_of),
+            'topics': topics,
+            'thin_topics': [topic['id'] for topic in topics if topic['size'] <= thin],
+            'sections': self._sections(topic_of, overlap),
+            'questions': questions,
+        }
+
+    def _topics(self, assignment: List[int]) -> List[Dict[str, Any]]:
+        members: Dict[int, List[int]] = {}
+        for doc, topic in enumerate(assignment):
+            members.setdefault(topic, []).append(doc)
+        ordered = sorted(members.values(), key=lambda docs: (-len(docs), docs[0]))
+
+        topics = []
+        for number, docs in enumerate(ordered, 1):
+            centroid = self._centroid(docs)
+            terms = sorted(centroid.items(), key=lambda item: (-round(item[1], TIE_DIGITS), item[0]))
+            phases: Dict[str, int] = {}
+            for doc in docs:
+                phases[self.questions[doc]['phase']] = phases.get(self.questions[doc]['phase'], 0) + 1
+            topics.append({
+                'id': f"T{number:02d}",
+                'size': len(docs),
+                'terms': [self.matrix.vocab[t] for t, _ in terms[:TOPIC_TERMS]],
+                'phases': phases,
+                'members': docs,
+            })
+        return topics
+
+    def _centroid(self, docs: List[int]) -> Vector:
+        total: Vector = {}
+        for doc in docs:
+            for term, weight in self.matrix.row(doc).items():
+                total[term] = total.get(term, 0.0) + weight
+        return _normalized(total)
+
+    def _phase_coverage(self, topics: List[Dict[str, Any]], topic_of: Dict[int, str]) -> Dict[str, Any]:
+        coverage = {}
+        for phase in self.phases:
+            counts: Dict[str, int] = {}
+            for doc, info in enumerate(self.questions):
+                if info['phase'] == phase:
+                    counts[topic_of[doc]] = counts.get(topic_of[doc], 0) + 1
+            coverage[phase] = {
+                'questions': sum(counts.values()),
+                'topics': dict(sorted(counts.items(), key=lambda item: (-item[1], item[0]))),
+                'missing': [topic['id'] for topic in topics if topic['id'] not in counts],
+            }
+        return coverage
+
+    def _sections(self, topic_of: Dict[int, str], overlap: float) -> List[Dict[str, Any]]:
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        for doc, info in enumerate(self.questions):
+            groups.setdefault((info['phase'], info['section']), []).append(doc)
+        centroids = {key: self._centroid(docs) for key, docs in groups.items()}
+
+        sections = []
+        for (phase, section), docs in groups.items():
+            counts: Dict[str, int] = {}
+            for doc in docs:
+                counts[topic_of[doc]] = counts.get(topic_of[doc], 0) + 1
+            overlaps = []
+            for (other_phase, other_section), centroid in centroids.items():
+                if other_phase != phase:
+                    score = _dot(centroids[(phase, section)], centroid)
+                    if score >= overlap:
+                        overlaps.append({'phase': other_phase, 'section': other_section, 'similarity': round(score, 4)})
+            overlaps.sort(key=lambda item: (-item['similarity'], item['phase'], item['section']))
+            sections.append({
+                'phase': phase,
+                'section': section,
+                'questions': len(docs),
+                'topics': dict(sorted(counts.items(), key=lambda item: (-item[1], item[0]))),
+                'overlaps': overlaps,
+            })
+        return sections
+
+
+def load_cached(cache_dir: Path, key: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(cache_dir / f"{key[:32]}.json", 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        return report if report.get('corpus_hash') == key else None
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached(cache_dir: Path, key: str, report: Dict[str, Any]) -> None:
+    """Write the report as the only cache entry (older corpus hashes are dropped)."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for old in cache_dir.glob("*.json"):
+            old.unlink()
+        tmp_file = cache_dir / f"{key[:32]}.{os.getpid()}.tmp"
+        tmp_file.write_text(json.dumps(report, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_file, cache_dir / f"{key[:32]}.json")
+    except OSError:
+        pass
+
+
+def format_text(report: Dict[str, Any], thin: int) -> str:
+    topics = report['topics']
+    source = "cached" if report.get('cached') else f"{report['seconds']:.2f} s, {report['backend']} backend"
+    lines = [
+        f"Question themes: {report['questions_total']} questions, {len(report['phases'])} phases, "
+        f"{len(topics)} topics, {report['vocabulary']} terms ({source})",
+        "",
+        "Topics:",
+    ]
+    for topic in topics:
+        lines.append(f"  {topic['id']}  {topic['size']:>3} questions  {len(topic['phases'])} phases  "
+                     f"[{', '.join(topic['terms'])}]")
+    thin_topics = [topic for topic in topics if topic['id'] in report['thin_topics']]
+    if thin_topics:
+        lines.append(f"\nThin topics (<= {thin} questions):")
+        for topic in thin_topics:
+            where = ", ".join(f"{phase} ({count})" for phase, count in topic['phases'].items())
+            lines.append(f"  {topic['id']}  [{', '.join(topic['terms'])}]  in {where}")
+
+    lines.append("\nPhase coverage:")
+    for phase, coverage in report['phases'].items():
+        top = ", ".join(f"{topic} ({count})" for topic, count in list(coverage['topics'].items())[:4])
+        lines.append(f"  {phase}: {coverage['questions']} questions, "
+                     f"{len(coverage['topics'])}/{len(topics)} topics; top: {top}")
+        if coverage['missing']:
+            lines.append(f"    missing: {', '.join(coverage['missing'])}")
+
+    overlapping = [section for section in report['sections'] if section['overlaps']]
+    lines.append(f"\nSection overlap across phases ({len(overlapping)} of {len(report['sections'])} sections):")
+    for section in overlapping:
+        best = ", ".join(f"{o['phase']}/{o['section']} {o['similarity']:.2f}" for o in section['overlaps'][:3])
+        lines.append(f"  {section['phase']}/{section['section']} ({section['questions']} q): {best}")
+    if not overlapping:
+        lines.append("  None above the --overlap threshold")
+    return "\n".join(lines) + "\n"
+
+
+def format_similar(report: Dict[str, Any], target: str) -> str:
+    phase, _, qid = target.partition('/')
+    for question in report['questions']:
+        if question['phase'] == phase and question['id'] == qid:
+            titles = {(q['phase'], q['id']): q['title'] for q in report['questions']}
+            lines = [f"{phase}/{qid} [{question['topic']}] - {question['title']}", ""]
+            for near in question['neighbors']:
+                lines.append(f"  {near['similarity']:.2f}  {near['phase']}/{near['id']}  "
+                             f"{titles[(near['phase'], near['id'])]}")
+            return "\n".join(lines) + "\n"
+    raise ValueError(f"Question not found: {target} (use PHASE/QID, e.g. phase_0/q05)")
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Question Themes - TF-IDF similarity, topic clusters and coverage across phases",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  Coverage report (topics, thin topics, phase coverage, section overlap):
+    python scripts/question_themes.py
+
+  Nearest questions to one question, in any phase:
+    python scripts/question_themes.py --similar phase_1/q12
+
+  Full JSON (every question's topic and neighbours):
+    python scripts/question_themes.py --format json --output themes.json
+        """
+    )
+    parser.add_argument('--clusters', type=int, help='Number of topics (default: about sqrt(questions / 2))')
+    parser.add_argument('--neighbors', type=int, default=DEFAULT_NEIGHBORS,
+                        help=f'Nearest neighbours kept per question (default: {DEFAULT_NEIGHBORS})')
+    parser.add_argument('--overlap', type=float, default=DEFAULT_OVERLAP,
+                        help=f'Minimum section cosine reported as overlap (default: {DEFAULT_OVERLAP})')
+    parser.add_argument('--thin', type=int, default=DEFAULT_THIN,
+                        help=f'Topics with at most this many questions are thin (default: {DEFAULT_THIN})')
+    parser.add_argument('--similar', metavar='PHASE/QID', help="Print one question's nearest neighbours")
+    parser.add_argument('--backend', choices=['auto', 'numpy', 'python'], default='auto',
+                        help='Similarity backend (default: numpy when installed)')
+    parser.add_argument('--no-cache', action='store_true', help='Recompute even if a cached report matches')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='Output format')
+    parser.add_argument('--output', help='Save the report to a file')
+    args = parser.parse_args()
+
+    if (args.clusters is not None and args.clusters < 1) or args.neighbors < 1:
+        print("ERROR: --clusters and --neighbors must be positive")
+        sys.exit(1)
+
+    corpus = PhaseCorpus.for_project()
+    phases = [phase for phase in sorted(corpus.phases()) if corpus.has(phase, "questions.json")]
+    if not phases:
+        print("ERROR: No phases with questions.json found")
+        sys.exit(1)
+
+    try:
+        settings = {'clusters': args.clusters, 'neighbors': args.neighbors, 'overlap': args.overlap,
+                    'thin': args.thin}
+        key = corpus_hash(corpus, phases, settings)
+        report = None if args.no_cache else load_cached(DEFAULT_CACHE_DIR, key)
+        if report is not None and args.backend not in ('auto', report['backend']):
+            report = None
+        if report is None:
+            start = time.perf_counter()
+            report = ThemeMapper(corpus, phases).report(args.clusters, args.neighbors, args.overlap,
+                                                        args.thin, args.backend)
+            report['seconds'] = round(time.perf_counter() - start, 3)
+            report['corpus_hash'] = key
+            save_cached(DEFAULT_CACHE_DIR, key, report)
+        else:
+            report['cached'] = True
+
+        if args.similar:
+            output = format_similar(report, args.similar)
+        elif args.format == 'json':
+            output = json.dumps(report, indent=2, ensure_ascii=False) + "\n"
+        else:
+            output = format_text(report, args.thin)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"[SUCCESS] Report saved to: {args.output}")
+    else:
+        print(output, end='')
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ Usage:
     python scripts/question_tool.py update --phase PHASE --question QID --field FIELD --value VALUE
     python scripts/question_tool.py delete --phase PHASE --question QID --confirm
     python scripts/question_tool.py add-option --phase PHASE --question QID --value VALUE --label LABEL
+    python scripts/question_tool.py change-manifest --phase PHASE --question QID --manifest lite,full
+    python scripts/question_tool.py batch --phase PHASE --file ops.jsonl [--dry-run]
 
 Commands:
     add: Create new question with auto-ID assignment
@@ -21,6 +23,7 @@ Commands:
     update-examples: Update examples list
     change-manifest: Move question between lite/full manifests
     get: Retrieve single question details
+    batch: Apply JSONL operations in one atomic write (see question_batch.py)
 
 CLI Arguments (add):
     --phase: Required. Phase directory (e.g., phase_0)
@@ -39,6 +42,11 @@ CLI Arguments (update):
     --field: Required. Field to update (title, prompt, type, etc.)
     --value: Required. New value for field
 
+CLI Arguments (batch):
+    --phase: Required. Phase directory
+    --file: Optional. JSONL operations file. Default: stdin
+    --dry-run: Optional. Validate every operation without writing
+
 Inputs:
     - data/{phase}/questions.json (loads minimal required data)
     - Command-line arguments
@@ -50,6 +58,10 @@ Outputs:
 
 Operational Notes:
     - Loads only necessary JSON sections (not entire file)
+    - get decodes a single question via the byte-offset sidecar (questions.json.idx,
+      see question_index.py); writes refresh the sidecar automatically
+    - update re-serializes only the edited question and splices it into the
+      file, so every other byte of questions.json stays identical
     - Validates all changes against SCHEMA.md before committing
     - Creates automatic bac kup before any destructive operation
     - Auto-assigns question IDs and order numbers
@@ -64,16 +76,20 @@ GitHub: https://github.com/imyourboyroy
 import json
 import sys
 import argparse
+import os
 import shutil
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from phase_corpus import QUESTION_TYPES, MANIFEST_NAMES, load_json
+from question_index import QuestionIndex, refresh_index
+
 
 class QuestionTool:
     """Surgical question CRUD operations with minimal file I/O."""
     
-    VALID_TYPES = ['free_text', 'single_select', 'multi_select', 'ranked_select', 'compound']
-    VALID_MANIFESTS = ['lite', 'full']
+    VALID_TYPES = QUESTION_TYPES
+    VALID_MANIFESTS = MANIFEST_NAMES
     
     def __init__(self, phase: str, project_root: Path):
         self.phase = phase
@@ -83,20 +99,47 @@ class QuestionTool:
         
         if not self.questions_file.exists():
             raise FileNotFoundError(f"questions.json not found in {self.phase_dir}")
+        
+        # Set by question_batch: operations share one in-memory document
+        self._batch_data: Optional[Dict] = None
     
     def _load_questions(self) -> Dict:
-        """Load questions.json file."""
-        with open(self.questions_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """Load a private (mutable) copy of questions.json (or the batch document)."""
+        if self._batch_data is not None:
+            return self._batch_data
+        return load_json(self.questions_file, use_cache=False)
     
     def _save_questions(self, data: Dict, backup: bool = True) -> None:
-        """Save questions.json with optional backup."""
+        """Save questions.json with optional backup (no-op inside a batch)."""
+        if self._batch_data is not None:
+            return
+        
         if backup:
             backup_path = str(self.questions_file) + ".bak"
             shutil.copy2(self.questions_file, backup_path)
         
-        with open(self.questions_file, 'w', encoding='utf-8') as f:
+        # Write beside the target and swap in, so readers never see a partial file
+        tmp_path = self.questions_file.with_name(self.questions_file.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.questions_file)
+        
+        refresh_index(self.questions_file)
+    
+    def _patch_question(self, index: QuestionIndex, qid: str, question: Dict, backup: bool = True) -> None:
+        """Splice one question into questions.json, falling back to a full save."""
+        if self._batch_data is not None:
+            self._batch_data['questions'][qid] = question
+            return
+        
+        if backup:
+            backup_path = str(self.questions_file) + ".bak"
+            shutil.copy2(self.questions_file, backup_path)
+        
+        if not index.patch_question(qid, question):
+            data = self._load_questions()
+            data['questions'][qid] = question
+            self._save_questions(data, backup=False)
     
     def _get_next_question_id(self, data: Dict) -> str:
         """Auto-assign next question ID."""
@@ -246,14 +289,16 @@ class QuestionTool:
         return f"[SUCCESS] Added {question_id} to {self.phase}/{args.section} (manifests: {', '.join(manifests)})"
     
     def update_question(self, args: argparse.Namespace) -> str:
-        """Update specific field in question."""
-        data = self._load_questions()
+        """Update specific field in question (splices only that question back in)."""
+        index = QuestionIndex(self.questions_file)
+        if self._batch_data is not None:
+            question = self._batch_data['questions'].get(args.question)
+        else:
+            question = index.read_question(args.question)
         
-        if args.question not in data['questions']:
+        if question is None:
             return f"ERROR: Question {args.question} not found in {self.phase}"
         
-        question = data['questions'][args.question]
-        
         # Handle different field types
         if args.field in ['title', 'prompt', 'type', 'section_id']:
             question[args.field] = args.value
@@ -273,7 +318,7 @@ class QuestionTool:
             return f"VALIDATION ERRORS:\n" + "\n".join(f"  - {e}" for e in errors)
         
         # Save
-        self._save_questions(data, backup=True)
+        self._patch_question(index, args.question, question, backup=True)
         
         return f"[SUCCESS] Updated {args.question}.{args.field}"
     
@@ -305,14 +350,62 @@ class QuestionTool:
         
         return f"[SUCCESS] Deleted {args.question} from {self.phase}"
     
-    def get_question(self, args: argparse.Namespace) -> str:
-        """Retrieve single question details."""
+    def add_option(self, args: argparse.Namespace) -> str:
+        """Append an option to a select-type question."""
+        data = self._load_questions()
+        
+        if args.question not in data['questions']:
+            return f"ERROR: Question {args.question} not found in {self.phase}"
+        
+        question = data['questions'][args.question]
+        
+        if question.get('type') not in ['single_select', 'multi_select', 'ranked_select']:
+            return f"ERROR: Question {args.question} is {question.get('type')}, not a select type"
+        
+        options = question.setdefault('options', [])
+        if any(opt.get('value') == args.value for opt in options):
+            return f"ERROR: Option {args.value} already exists on {args.question}"
+        
+        options.append({"value": args.value, "label": args.label})
+        
+        # Save
+        self._save_questions(data, backup=True)
+        
+        return f"[SUCCESS] Added option {args.value} to {args.question}"
+    
+    def change_manifest(self, args: argparse.Namespace) -> str:
+        """Set which manifests include a question (tags and manifest lists)."""
         data = self._load_questions()
         
         if args.question not in data['questions']:
             return f"ERROR: Question {args.question} not found in {self.phase}"
         
+        manifests = [m.strip() for m in args.manifest.split(',') if m.strip()]
+        invalid = [m for m in manifests if m not in self.VALID_MANIFESTS]
+        if invalid:
+            return f"ERROR: Invalid manifest(s): {', '.join(invalid)}. Must be one of {self.VALID_MANIFESTS}"
+        
         question = data['questions'][args.question]
+        question.setdefault('tags', {})['included_in_manifests'] = manifests
+        
+        for manifest_name, manifest in data['manifests'].items():
+            ids = manifest['question_ids']
+            if manifest_name in manifests and args.question not in ids:
+                ids.append(args.question)
+            elif manifest_name not in manifests and args.question in ids:
+                ids.remove(args.question)
+        
+        # Save
+        self._save_questions(data, backup=True)
+        
+        return f"[SUCCESS] {args.question} manifests: {', '.join(manifests)}"
+    
+    def get_question(self, args: argparse.Namespace) -> str:
+        """Retrieve single question details (decodes only that question's bytes)."""
+        question = QuestionIndex(self.questions_file).read_question(args.question)
+        
+        if question is None:
+            return f"ERROR: Question {args.question} not found in {self.phase}"
         
         if args.format == 'json':
             return json.dumps(question, indent=2, ensure_ascii=False)
@@ -353,8 +446,7 @@ class QuestionTool:
         
         # Load question JSON
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                question = json.load(f)
+            question = load_json(file_path, use_cache=False)
         except json.JSONDecodeError as e:
             return f"ERROR: Invalid JSON in {file_path}: {e}"
         
@@ -449,6 +541,19 @@ def main():
     delete_parser.add_argument('--question', required=True, help='Question ID')
     delete_parser.add_argument('--confirm', action='store_true', help='Confirm deletion')
     
+    # ADD-OPTION command
+    option_parser = subparsers.add_parser('add-option', help='Add option to select-type question')
+    option_parser.add_argument('--phase', required=True, help='Phase directory')
+    option_parser.add_argument('--question', required=True, help='Question ID')
+    option_parser.add_argument('--value', required=True, help='Option value')
+    option_parser.add_argument('--label', required=True, help='Option label')
+    
+    # CHANGE-MANIFEST command
+    manifest_parser = subparsers.add_parser('change-manifest', help='Set manifests for a question')
+    manifest_parser.add_argument('--phase', required=True, help='Phase directory')
+    manifest_parser.add_argument('--question', required=True, help='Question ID')
+    manifest_parser.add_argument('--manifest', required=True, help='Manifests (lite,full)')
+    
     # GET command
     get_parser = subparsers.add_parser('get', help='Get question details')
     get_parser.add_argument('--phase', required=True, help='Phase directory')
@@ -464,6 +569,12 @@ def main():
     import_parser.add_argument('--auto-id', action='store_true', help='Auto-assign question ID')
     import_parser.add_argument('--overwrite', action='store_true', help='Overwrite existing question')
     
+    # BATCH command
+    batch_parser = subparsers.add_parser('batch', help='Apply JSONL operations atomically (one write)')
+    batch_parser.add_argument('--phase', required=True, help='Phase directory')
+    batch_parser.add_argument('--file', default='-', help='JSONL operations file (default: stdin)')
+    batch_parser.add_argument('--dry-run', action='store_true', help='Validate operations without writing')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -483,10 +594,17 @@ def main():
             result = tool.update_question(args)
         elif args.command == 'delete':
             result = tool.delete_question(args)
+        elif args.command == 'add-option':
+            result = tool.add_option(args)
+        elif args.command == 'change-manifest':
+            result = tool.change_manifest(args)
         elif args.command == 'get':
             result = tool.get_question(args)
         elif args.command == 'import':
             result = tool.import_question(args)
+        elif args.command == 'batch':
+            from question_batch import run_batch
+            result = run_batch(tool, args.file, dry_run=args.dry_run)
         else:
             result = f"ERROR: Unknown command: {args.command}"
         
@@ -8,53 +8,103 @@ Replaces phase-specific export/merge scripts with dynamic phase detection.
 
 Usage:
     python scripts/questions_manager.py --action export [--phase PHASE] [--verbose]
-    python scripts/questions_manager.py --action merge [--phase PHASE] [--verbose]
+    python scripts/questions_manager.py --action merge [--phase PHASE] [--verbose] [--jobs N]
 
 CLI Arguments:
     --action: Required. Either 'export' or 'merge'
     --phase: Optional. Specific phase (e.g., phase_0, phase_1, phase_1.5). Default: all phases
     --verbose: Optional. Enable detailed logging
     --format: Optional. Export format for text export: 'txt' or 'none'. Default: 'txt'
+    --jobs: Optional. Threads for reading question files during merge (0 = default). Default: 0
 
 Inputs:
     Export: data/{phase}/questions.json
     Merge: data/{phase}/questions/*.json (individual question files)
+           data/{phase}/questions/.base.json (hashes recorded by the last export)
 
 Outputs:
     Export: 
         - data/{phase}/questions/{qid}.json (individual JSON files)
         - data/{phase}/questions.txt (human-readable text export)
+        - data/{phase}/questions/.base.json (hash of each exported question)
+        - Per phase: counts of files written, unchanged, removed and kept
     Merge:
         - data/{phase}/questions.json (updated master file)
         - data/{phase}/questions.json.bak (automatic backup)
+        - Per phase: counts of added, updated, unchanged, stale, conflict and invalid files
 
 Operational Notes:
     - Auto-discovers all data/phase_* directories
     - Creates backups before merge operations
     - Validates JSON structure before writing
     - Idempotent: safe to run multiple times
+    - Export only writes files whose content changed (mtimes of unchanged
+      questions stay put for watchers and merge) and deletes q*.json files
+      of questions no longer in questions.json, but only while they still
+      hash to what .base.json recorded; new or edited files are kept with a
+      WARNING, and without .base.json nothing is deleted (dry run)
+    - Export never overwrites a file edited since the last export (its hash
+      matches neither .base.json nor the master): it is kept with "edited
+      since export; merge first" so the edit is not lost
+    - Merge only applies files edited since export. A file the master moved
+      past is stale and skipped; a file edited on both sides is a conflict.
+      Files without a base hash (older exports) are applied as before.
+    - Merged questions are validated with validation_engine; new errors, a
+      conflict or an unreadable file abort that phase without writing
+    - When no file differs from the master, merge writes nothing (no backup,
+      no rewrite). The master is written atomically and only if it did not
+      change while the merge was running.
     
 Author: Roy Dawson IV
 GitHub: https://github.com/imyourboyroy
 """
 
-import json
 import os
+import json
 import sys
 import argparse
-import glob
+import hashlib
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
+
+from phase_corpus import PhaseCorpus, load_json
+from question_index import refresh_index
+from validation_engine import ERROR, ValidationEngine
+
+
+BASE_FORMAT = 1
+BASE_FILE = ".base.json"
+
+# Merge verdicts per shard, in report order
+MERGE_STATUSES = ['added', 'updated', 'unchanged', 'stale', 'conflict', 'invalid']
+
+
+def question_hash(question: Any) -> str:
+    """Content hash of one question, independent of key order and indentation."""
+    canonical = json.dumps(question, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
 class QuestionsManager:
     """Manages export and merge operations for questionnaire phases."""
     
-    def __init__(self, base_dir: str, verbose: bool = False):
+    def __init__(self, base_dir: str, verbose: bool = False, jobs: int = 0):
         self.base_dir = Path(base_dir)
         self.data_dir = self.base_dir / "data"
         self.verbose = verbose
+        self.jobs = jobs
+        self.corpus = PhaseCorpus(self.data_dir)
+        self._engine: Optional[ValidationEngine] = None
     
     def log(self, message: str, level: str = "INFO") -> None:
         """Log message if verbose mode enabled."""
@@ -68,12 +118,7 @@ class QuestionsManager:
             self.log(f"Data directory not found: {self.data_dir}", "ERROR")
             return []
         
-        phases = []
-        for item in self.data_dir.iterdir():
-            if item.is_dir() and item.name.startswith("phase"):
-                phases.append(item.name)
-        
-        phases.sort()
+        phases = sorted(self.corpus.phases())
         self.log(f"Discovered phases: {', '.join(phases)}")
         return phases
     
@@ -90,8 +135,7 @@ class QuestionsManager:
         self.log(f"Exporting {phase_name}...")
         
         try:
-            with open(questions_json, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(questions_json)
         except Exception as e:
             self.log(f"Error reading {questions_json}: {e}", "ERROR")
             return False
@@ -99,27 +143,110 @@ class QuestionsManager:
         # Create output directory
         output_dir.mkdir(exist_ok=True)
         self.log(f"Created directory: {output_dir}")
+        base = self._load_base(output_dir)
         
-        # Export individual JSON files
+        # Export individual JSON files (only those whose content changed)
         questions = data.get('questions', {})
         self.log(f"Found {len(questions)} questions to export")
         
+        counts = {'written': 0, 'unchanged': 0, 'removed': 0, 'kept': 0}
+        hashes = {q_id: question_hash(q_data) for q_id, q_data in questions.items()}
         for q_id, q_data in questions.items():
             file_path = output_dir / f"{q_id}.json"
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(q_data, f, indent=2, ensure_ascii=False)
-                self.log(f"  Exported: {q_id}.json")
+                # A file edited since the last export is unmerged work: leave it
+                # (and its base hash) for merge rather than overwrite it
+                if base is not None and file_path.exists():
+                    file_hash = self._file_hash(file_path)
+                    if file_hash is None or file_hash not in (base.get(q_id), hashes[q_id]):
+                        counts['kept'] += 1
+                        if q_id in base:
+                            hashes[q_id] = base[q_id]
+                        else:
+                            del hashes[q_id]
+                        self.log(f"{phase_name}/questions/{file_path.name}: edited since export; "
+                                 f"merge first (not overwritten)", "WARNING")
+                        continue
+                if self._write_if_changed(file_path, json.dumps(q_data, indent=2, ensure_ascii=False)):
+                    counts['written'] += 1
+                    self.log(f"  Exported: {q_id}.json")
+                else:
+                    counts['unchanged'] += 1
             except Exception as e:
                 self.log(f"Error writing {file_path}: {e}", "ERROR")
         
+        # Drop files of questions that no longer exist (merge would re-add them),
+        # but only files that are still exactly what the last export wrote: a
+        # new or edited file is unmerged work
+        for file_path in sorted(output_dir.glob("q*.json")):
+            q_id = file_path.stem
+            if q_id in questions:
+                continue
+            if base is None:
+                counts['kept'] += 1
+                self.log(f"{phase_name}/questions/{file_path.name}: not in questions.json; would remove, "
+                         f"but without {BASE_FILE} it may be unmerged work (merge it or delete it by hand)", "WARNING")
+            elif q_id in base and self._file_hash(file_path) == base[q_id]:
+                try:
+                    file_path.unlink()
+                    counts['removed'] += 1
+                    self.log(f"  Removed: {file_path.name}")
+                except OSError as e:
+                    self.log(f"Error removing {file_path}: {e}", "ERROR")
+            else:
+                counts['kept'] += 1
+                if q_id in base:
+                    # Merge then sees it as edited here and deleted in questions.json (a conflict)
+                    hashes[q_id] = base[q_id]
+                self.log(f"{phase_name}/questions/{file_path.name}: not in questions.json and new or edited "
+                         f"since export; kept (merge it, or delete it by hand)", "WARNING")
+        
+        # Record what each file was exported from, so merge can tell edits from stale files
+        self._save_base(output_dir, hashes)
+        
         # Export text file for human review
         if export_txt:
             self._export_text_file(phase_name, phase_dir, data)
         
-        print(f"[SUCCESS] Exported {len(questions)} questions from {phase_name}")
+        print(f"[SUCCESS] Exported {len(questions)} questions from {phase_name}: "
+              f"{counts['written']} written, {counts['unchanged']} unchanged, {counts['removed']} removed, "
+              f"{counts['kept']} kept")
+        return True
+    
+    def _write_if_changed(self, path: Path, text: str) -> bool:
+        """Write text unless the file already holds exactly that. Returns True if written."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if f.read() == text:
+                    return False
+        except (OSError, UnicodeDecodeError):
+            pass
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
         return True
     
+    def _load_base(self, questions_dir: Path) -> Optional[Dict[str, str]]:
+        """Hashes of the master questions the q*.json files were exported from (None if unknown)."""
+        try:
+            base = load_json(questions_dir / BASE_FILE, use_cache=False)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(base, dict) or base.get('format') != BASE_FORMAT:
+            return None
+        return base.get('questions', {})
+    
+    @staticmethod
+    def _file_hash(path: Path) -> Optional[str]:
+        """question_hash of a q*.json file's content (None if missing or unreadable)."""
+        try:
+            return question_hash(load_json(path, use_cache=False))
+        except (OSError, ValueError):
+            return None
+    
+    def _save_base(self, questions_dir: Path, hashes: Dict[str, str]) -> None:
+        text = json.dumps({'format': BASE_FORMAT, 'questions': dict(sorted(hashes.items()))}, indent=2)
+        self._write_if_changed(questions_dir / BASE_FILE, text)
+    
     def _export_text_file(self, phase_name: str, phase_dir: Path, data: Dict) -> None:
         """Export questions to human-readable text file."""
         txt_path = phase_dir / "questions.txt"
@@ -163,13 +290,24 @@ class QuestionsManager:
                     for field in q_data['fields']:
                         output_lines.append(f"  - {field.get('label', '')}")
         
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(output_lines))
-        
-        self.log(f"  Created text export: questions.txt")
+        if self._write_if_changed(txt_path, "\n".join(output_lines)):
+            self.log(f"  Created text export: questions.txt")
+        else:
+            self.log(f"  Text export unchanged: questions.txt")
     
     def merge_phase(self, phase_name: str) -> bool:
-        """Merge individual question JSON files back into master questions.json."""
+        """
+        Merge individual question JSON files back into master questions.json.
+        
+        Each q*.json is compared with the master question and with the base
+        hash recorded at export time:
+            - same as master: unchanged
+            - only the file changed since export: updated (or added if new)
+            - only the master changed since export: stale, skipped
+            - both changed: conflict
+        Merged questions must not add validation errors. Any conflict, invalid
+        or unreadable file aborts the phase and leaves the master untouched.
+        """
         phase_dir = self.data_dir / phase_name
         main_file = phase_dir / "questions.json"
         questions_dir = phase_dir / "questions"
@@ -185,51 +323,152 @@ class QuestionsManager:
         self.log(f"Merging {phase_name}...")
         
         # Read main file
+        main_stamp = _stamp(main_file)
         try:
-            with open(main_file, 'r', encoding='utf-8') as f:
-                main_data = json.load(f)
+            main_data = load_json(main_file, use_cache=False)
         except Exception as e:
             self.log(f"Error reading {main_file}: {e}", "ERROR")
             return False
         
-        if 'questions' not in main_data:
+        if not isinstance(main_data.get('questions'), dict):
             self.log(f"Error: 'questions' key not found in {main_file}", "ERROR")
             return False
         
-        # Find all individual question files
-        files = list(questions_dir.glob("q*.json"))
+        # Find and read all individual question files
+        files = sorted(questions_dir.glob("q*.json"))
         self.log(f"Found {len(files)} individual question files to merge")
+        shards = self._read_shards(files)
+        
+        base = self._load_base(questions_dir)
+        if files and base is None:
+            self.log(f"{phase_name}: no {BASE_FILE} (exported before base hashes); "
+                     f"every changed file counts as an edit", "WARNING")
+        base = base or {}
+        
+        questions = main_data['questions']
+        merged = dict(questions)
+        verdicts: Dict[str, List[str]] = {status: [] for status in MERGE_STATUSES}
+        synced: Dict[str, str] = {}
+        for file_path, shard, error in shards:
+            qid = file_path.stem
+            if error:
+                verdicts['invalid'].append(qid)
+                self.log(f"{phase_name}/questions/{file_path.name}: {error}", "ERROR")
+                continue
+            status = self._classify(qid, question_hash(shard), questions, base)
+            verdicts[status].append(qid)
+            if status in ('added', 'updated'):
+                merged[qid] = shard
+                synced[qid] = question_hash(shard)
+                self.log(f"  {status.capitalize()}: {qid}")
+            elif status == 'unchanged':
+                synced[qid] = question_hash(shard)
+            elif status == 'stale':
+                self.log(f"{phase_name}/questions/{file_path.name}: questions.json changed since export "
+                         f"and this file did not; skipped (re-export to refresh it)", "WARNING")
+            else:
+                self.log(f"{phase_name}/questions/{file_path.name}: edited here and in questions.json "
+                         f"since export; resolve by hand, then re-export", "ERROR")
+        
+        changed = verdicts['added'] + verdicts['updated']
+        phase_errors = 0
+        if changed and not verdicts['conflict'] and not verdicts['invalid']:
+            for qid, message in self._new_errors(phase_name, main_data, dict(main_data, questions=merged), changed):
+                if qid is None:
+                    phase_errors += 1
+                    self.log(f"{phase_name}: merged questions cause {message}", "ERROR")
+                    continue
+                if qid not in verdicts['invalid']:
+                    verdicts['added' if qid in verdicts['added'] else 'updated'].remove(qid)
+                    verdicts['invalid'].append(qid)
+                self.log(f"{phase_name}/questions/{qid}.json: {message}", "ERROR")
+        
+        summary = ", ".join(f"{len(verdicts[status])} {status}" for status in MERGE_STATUSES)
+        if verdicts['conflict'] or verdicts['invalid'] or phase_errors:
+            self.log(f"Not merging {phase_name} ({summary}); questions.json left untouched", "ERROR")
+            return False
         
-        updates_count = 0
-        for file_path in files:
-            qid = file_path.stem  # filename without extension
+        if changed:
+            if _stamp(main_file) != main_stamp:
+                self.log(f"{main_file} changed during merge; questions.json left untouched, run merge again", "ERROR")
+                return False
+            
+            # Create backup
+            backup_path = str(main_file) + ".bak"
+            shutil.copy2(main_file, backup_path)
+            self.log(f"Backup created: {Path(backup_path).name}")
             
+            # Write updated data back to main file (atomically, so readers never see half a file)
+            main_data['questions'] = merged
+            tmp_file = main_file.with_name(f".{main_file.name}.{os.getpid()}.tmp")
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    individual_data = json.load(f)
-                
-                # Update the question in main data
-                main_data['questions'][qid] = individual_data
-                updates_count += 1
-                self.log(f"  Merged: {qid}")
-                
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(main_data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_file, main_file)
+                refresh_index(main_file)
             except Exception as e:
-                self.log(f"Error processing {file_path.name}: {e}", "ERROR")
+                tmp_file.unlink(missing_ok=True)
+                self.log(f"Error writing to {main_file}: {e}", "ERROR")
+                return False
         
-        # Create backup
-        backup_path = str(main_file) + ".bak"
-        shutil.copy2(main_file, backup_path)
-        self.log(f"Backup created: {Path(backup_path).name}")
+        # Files now matching the master are fresh exports again
+        if synced:
+            self._save_base(questions_dir, {**base, **synced})
         
-        # Write updated data back to main file
-        try:
-            with open(main_file, 'w', encoding='utf-8') as f:
-                json.dump(main_data, f, indent=2, ensure_ascii=False)
-            print(f"[SUCCESS] Merged {updates_count} questions into {phase_name}/questions.json")
-            return True
-        except Exception as e:
-            self.log(f"Error writing to {main_file}: {e}", "ERROR")
-            return False
+        if changed:
+            print(f"[SUCCESS] Merged {len(changed)} questions into {phase_name}/questions.json ({summary})")
+        else:
+            print(f"[SUCCESS] Nothing to merge into {phase_name}/questions.json ({summary})")
+        return True
+    
+    def _read_shards(self, files: List[Path]) -> List[Tuple[Path, Any, Optional[str]]]:
+        """Parse question files on a thread pool; (path, data, error) in file order."""
+        def read(file_path: Path) -> Tuple[Path, Any, Optional[str]]:
+            try:
+                data = load_json(file_path, use_cache=False)
+            except Exception as e:
+                return file_path, None, f"unreadable: {e}"
+            if not isinstance(data, dict):
+                return file_path, None, f"must be a JSON object, got {type(data).__name__}"
+            return file_path, data, None
+        
+        if len(files) < 2:
+            return [read(file_path) for file_path in files]
+        with ThreadPoolExecutor(max_workers=self.jobs or None) as pool:
+            return list(pool.map(read, files))
+    
+    @staticmethod
+    def _classify(qid: str, shard_hash: str, questions: Dict[str, Any], base: Dict[str, str]) -> str:
+        """Merge verdict for one question file (see merge_phase)."""
+        master_hash = question_hash(questions[qid]) if qid in questions else None
+        base_hash = base.get(qid)
+        if shard_hash == master_hash:
+            return 'unchanged'
+        if base_hash is None:
+            # New file, or exported before base hashes existed: trust the file
+            return 'updated' if master_hash else 'added'
+        if shard_hash == base_hash:
+            return 'stale'
+        if master_hash == base_hash:
+            return 'updated'
+        return 'conflict'
+    
+    def _new_errors(self, phase_name: str, before: Dict, after: Dict,
+                    changed: List[str]) -> List[Tuple[Optional[str], str]]:
+        """Validation errors the merged questions introduce, as (qid or None for phase-level, message)."""
+        if self._engine is None:
+            self._engine = ValidationEngine()
+        known = {(f['rule'], f['path'], f['message'])
+                 for f in self._engine.run(phase_name, before) if f['severity'] == ERROR}
+        changed_ids = set(changed)
+        errors = []
+        for finding in self._engine.run(phase_name, after):
+            if finding['severity'] != ERROR or (finding['rule'], finding['path'], finding['message']) in known:
+                continue
+            parts = finding['path'].split('/')
+            qid = parts[2] if len(parts) > 2 and parts[1] == 'questions' and parts[2] in changed_ids else None
+            errors.append((qid, f"{finding['rule']}: {finding['message']}"))
+        return errors
 
 
 def main():
@@ -273,6 +512,13 @@ Examples:
         help='Enable verbose logging'
     )
     
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=0,
+        help='Threads for reading question files (merge only, 0 = default pool size). Default: 0'
+    )
+    
     parser.add_argument(
         '--format',
         type=str,
@@ -288,7 +534,7 @@ Examples:
     project_root = script_dir.parent
     
     # Initialize manager
-    manager = QuestionsManager(project_root, verbose=args.verbose)
+    manager = QuestionsManager(project_root, verbose=args.verbose, jobs=args.jobs)
     
     # Get phases to process
     if args.phase:
@@ -0,0 +1,219 @@
+# ./scripts/rfu.py
+"""
+RFU - Single Entry Point for the Ready for Us Tooling
+======================================================
+
+One dispatcher for every script in scripts/. Only the module behind the
+requested subcommand is imported, so a quick query never pays for the
+validators, exporters or audit tools it does not use.
+
+Usage:
+    python -m scripts.rfu <subcommand> [ARGS...]
+    python -m scripts.rfu search --text "readiness" --count
+    python -m scripts.rfu question get --phase phase_0 --question q05
+    python -m scripts.rfu validate --phase phase_0
+    python -m scripts.rfu help
+    python -m scripts.rfu importtime [--budget-ms 75] [SUBCOMMAND ARGS...]
+
+CLI Arguments:
+    subcommand: Required. See `help` for the full list
+    ARGS: Passed through unchanged to the underlying script's main()
+
+Inputs:
+    - Same as the underlying script
+
+Outputs:
+    - Same as the underlying script (argparse usage shows `rfu <subcommand>`)
+
+Operational Notes:
+    - This module imports nothing beyond sys/os at startup; argparse and the
+      subcommand module load only after dispatch
+    - importtime runs the dispatch under `python -X importtime`, subtracts a
+      bare-interpreter baseline, and exits 1 when the cumulative import time
+      exceeds the budget or another subcommand's module was imported eagerly
+    - New tools: add one line to COMMANDS; no other wiring needed
+    - rfu_client.py/rfu_daemon.py use the same COMMANDS table
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import os
+import sys
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPTS_DIR)
+
+# subcommand -> (module in scripts/, one-line help)
+SUBCOMMANDS = {
+    'search': ('question_search', 'Search/filter questions'),
+    'dupes': ('question_dupes', 'Find near-duplicate questions (MinHash/LSH)'),
+    'themes': ('question_themes', 'TF-IDF topics, coverage and similar questions'),
+    'question': ('question_tool', 'Question CRUD, import and batch'),
+    'section': ('section_manager', 'Section CRUD'),
+    'props': ('question_properties', 'Bulk max/min properties'),
+    'index': ('question_index', 'Byte-offset index for questions.json'),
+    'validate': ('validate_schema', 'Validate questions.json'),
+    'validate-all': ('validation_engine', 'Single-pass unified validation report'),
+    'compile-schemas': ('schema_compiler', 'Compile data/schema/*.schema.json to validators'),
+    'validate-manifest': ('validate_manifest', 'Validate manifest.json'),
+    'validate-prompts': ('validate_prompts', 'Validate prompts.json'),
+    'validate-manifest-ids': ('validate_manifest_ids', 'Check manifest question IDs exist'),
+    'review': ('review_compliance', 'Read-only compliance review'),
+    'audit': ('audit_questions', 'Question quality audit'),
+    'audit-full': ('full_question_audit', 'Structure/examples audit across phases'),
+    'audit-other-fields': ('audit_questions_other_fields', "Audit 'Other' write-in fields"),
+    'audit-questions-schema': ('audit_questions_schema', 'Questions structural schema audit'),
+    'audit-prompts-schema': ('audit_prompts_schema', 'Prompts structural schema audit'),
+    'schema-mismatches': ('find_schema_mismatches_generic', 'Find cross-phase schema mismatches'),
+    'fix-other-fields': ('fix_schema_other_fields', "Repair 'Other' write-in fields"),
+    'questions': ('questions_manager', 'Export/merge per-question files'),
+    'build': ('build_exports', 'Rebuild only stale exports and schema snapshots'),
+    'dist': ('build_dist', 'Minified runtime phase bundles in dist/data with a size report'),
+    'export-questions': ('export_questions', 'Export questions'),
+    'export-prompts': ('export_prompts', 'Export prompts'),
+    'export-manifests': ('export_manifests', 'Export manifests'),
+    'export-schemas': ('export_schemas', 'Export inferred schemas'),
+    'schema-snapshots': ('generate_schema_snapshots', 'Write schema snapshots'),
+    'schema-diff': ('schema_inference', 'Structural drift check for schema snapshots'),
+    'scaffold': ('phase_scaffold', 'Create a new phase skeleton'),
+    'extract': ('extract_questions', 'Extract questions to text'),
+    'convert-md': ('convert_questions_md', 'Convert questions markdown to JSON'),
+    'notes-savings': ('analyze_notes_savings', 'Estimate notes-field savings'),
+    'corpus': ('phase_corpus', 'Phase discovery and parse cache'),
+    'daemon': ('rfu_daemon', 'Optional tooling daemon'),
+}
+
+# subcommand -> module (used by rfu_client / rfu_daemon)
+COMMANDS = {name: module for name, (module, _) in SUBCOMMANDS.items()}
+
+# Library modules other tools import on purpose (not "eager" imports)
+SHARED_MODULES = {'phase_corpus', 'question_index', 'validation_engine'}
+
+# Measured ~40-55 ms for `search --count` (scripts/ byte-compiled) on a slow
+# CI-class box; headroom catches a new eager import without flapping on noise.
+# Enforced by tests/test_import_budget.py
+DEFAULT_BUDGET_MS = 75.0
+
+
+def print_help() -> None:
+    print("usage: python -m scripts.rfu <subcommand> [ARGS...]\n")
+    print("Subcommands:")
+    width = max(len(name) for name in SUBCOMMANDS)
+    for name, (module, summary) in SUBCOMMANDS.items():
+        print(f"  {name:<{width}}  {summary} ({module}.py)")
+    print(f"  {'importtime':<{width}}  Check dispatcher import time against a budget")
+
+
+def dispatch(name: str, argv: list) -> int:
+    """Import one subcommand module and run its main() with argv."""
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    # __import__ (not importlib) so -X importtime attributes the cost to the module
+    module = __import__(SUBCOMMANDS[name][0])
+    sys.argv = [f"rfu {name}"] + list(argv)
+    try:
+        module.main()
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def _import_times(args: list) -> tuple:
+    """
+    Run `python -X importtime args`.
+
+    Returns ({top_level_module: cumulative_us}, {every_module_imported}).
+    """
+    import subprocess
+
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + args,
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+        env=dict(os.environ, RFU_NO_DAEMON='1'),
+    )
+    times, names = {}, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split(':', 1)[1].split('|', 2)
+        names.add(name.strip())
+        if not name.startswith('  '):
+            # Nested imports are already counted in their parent's cumulative
+            times[name.strip()] = int(cumulative_us)
+    return times, names
+
+
+def check_importtime(argv: list) -> int:
+    """Measure dispatcher import cost for one command line and enforce a budget."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='rfu importtime', description='Check dispatcher import time')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'Max import time above a bare interpreter (default: {DEFAULT_BUDGET_MS})')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs to take the best of (default: 5)')
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='Subcommand and args (default: search --count)')
+    args = parser.parse_args(argv)
+
+    command = args.command or ['search', '--count']
+    if command[0] not in SUBCOMMANDS:
+        print(f"ERROR: Unknown subcommand: {command[0]}")
+        return 1
+
+    baseline, _ = _import_times(['-c', 'pass'])
+    best_total, best_times, imported = None, {}, set()
+    for _ in range(max(1, args.repeat)):
+        times, names = _import_times(['-m', 'scripts.rfu'] + command)
+        extra = {name: us for name, us in times.items() if name not in baseline}
+        total = sum(extra.values())
+        imported |= names
+        if best_total is None or total < best_total:
+            best_total, best_times = total, extra
+
+    target = SUBCOMMANDS[command[0]][0]
+    eager = sorted(
+        module for module, _ in SUBCOMMANDS.values()
+        if module != target and module not in SHARED_MODULES and module in imported
+    )
+
+    print(f"rfu {' '.join(command)}: {best_total / 1000:.1f} ms of imports "
+          f"(budget {args.budget_ms:.1f} ms, best of {args.repeat})")
+    for name, us in sorted(best_times.items(), key=lambda item: -item[1])[:8]:
+        print(f"  {us / 1000:7.2f} ms  {name}")
+
+    failures = []
+    if best_total / 1000 > args.budget_ms:
+        failures.append(f"import time {best_total / 1000:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+    if eager:
+        failures.append(f"unrelated subcommand modules imported: {', '.join(eager)}")
+
+    if failures:
+        for failure in failures:
+            print(f"ERROR: {failure}")
+        return 1
+    print("[SUCCESS] Import budget met")
+    return 0
+
+
+def main():
+    """Main CLI entry point."""
+    if len(sys.argv) < 2 or sys.argv[1] in ('-h', '--help', 'help'):
+        print_help()
+        sys.exit(0 if len(sys.argv) >= 2 else 1)
+
+    name, argv = sys.argv[1], sys.argv[2:]
+    if name == 'importtime':
+        sys.exit(check_importtime(argv))
+    if name not in SUBCOMMANDS:
+        print(f"ERROR: Unknown subcommand: {name}. Run `python -m scripts.rfu help`.")
+        sys.exit(1)
+
+    sys.exit(dispatch(name, argv))
+
+
+if __name__ == "__main__":
+    main()
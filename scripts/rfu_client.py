@@ -0,0 +1,134 @@
+# ./scripts/rfu_client.py
+"""
+RFU Client - Thin Forwarder to the Tooling Daemon
+==================================================
+
+Forwards a tool invocation to rfu_daemon.py over its Unix socket and prints
+the captured output. When no daemon is running, runs the script in-process
+instead, so the same command line always works.
+
+Usage:
+    python scripts/rfu_client.py search --text "readiness" --count
+    python scripts/rfu_client.py question get --phase phase_0 --question q05
+    python scripts/rfu_client.py validate --phase phase_0
+    python scripts/rfu_client.py audit --phase phase_1
+
+Commands:
+    Every `python -m scripts.rfu` subcommand except `daemon`
+    (search, question, section, props, validate, audit, index, ...)
+
+CLI Arguments:
+    COMMAND: Required. An rfu subcommand (python -m scripts.rfu help)
+    ARGS: Passed through unchanged to the underlying script
+
+Inputs:
+    - .cache/rfu_daemon.sock (or $RFU_DAEMON_SOCKET)
+    - stdin, forwarded when an argument is '-' or for batch without --file
+
+Outputs:
+    - The script's stdout/stderr and exit code
+
+Operational Notes:
+    - Imports only socket/json so the client itself starts quickly
+    - Relative paths work: the daemon runs the command in the client's cwd
+    - RFU_NO_DAEMON=1 forces local execution
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import os
+import sys
+import json
+import socket
+
+from rfu import COMMANDS as RFU_COMMANDS
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOCKET = os.path.join(os.path.dirname(SCRIPTS_DIR), '.cache', 'rfu_daemon.sock')
+SOCKET_ENV = 'RFU_DAEMON_SOCKET'
+
+# Same subcommand table as `python -m scripts.rfu` (the daemon can't serve itself)
+COMMANDS = {name: module for name, module in RFU_COMMANDS.items() if name != 'daemon'}
+
+
+def socket_path() -> str:
+    return os.environ.get(SOCKET_ENV) or DEFAULT_SOCKET
+
+
+def call(method: str, params: dict = None, path: str = None, timeout: float = 60.0) -> dict:
+    """Send one JSON-RPC request; returns the decoded response object."""
+    request = {'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params or {}}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path or socket_path())
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b''.join(chunks).decode('utf-8'))
+
+
+def _wants_stdin(argv: list) -> bool:
+    return '-' in argv or ('batch' in argv and '--file' not in argv)
+
+
+def run_local(module: str, argv: list) -> int:
+    """Fallback: run the script's main() in this process."""
+    import runpy
+    sys.argv = [os.path.join(SCRIPTS_DIR, module + '.py')] + argv
+    sys.path.insert(0, SCRIPTS_DIR)
+    try:
+        runpy.run_path(sys.argv[0], run_name='__main__')
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def main():
+    """Main CLI entry point."""
+    if len(sys.argv) < 2 or sys.argv[1] in ('-h', '--help'):
+        print(__doc__.split('CLI Arguments:')[0].strip())
+        sys.exit(0 if len(sys.argv) >= 2 else 1)
+
+    command, argv = sys.argv[1], sys.argv[2:]
+    if command not in COMMANDS:
+        print(f"ERROR: Unknown command: {command} (choose from {', '.join(COMMANDS)})")
+        sys.exit(1)
+
+    use_daemon = (os.environ.get('RFU_NO_DAEMON') != '1'
+                  and hasattr(socket, 'AF_UNIX')
+                  and os.path.exists(socket_path()))
+
+    if use_daemon:
+        params = {'command': command, 'argv': argv, 'cwd': os.getcwd()}
+        if _wants_stdin(argv):
+            params['stdin'] = sys.stdin.read()
+        try:
+            response = call('run', params)
+        except OSError:
+            response = None
+
+        if response is not None:
+            if 'error' in response:
+                print(f"ERROR: daemon: {response['error'].get('message')}", file=sys.stderr)
+                sys.exit(1)
+            result = response['result']
+            sys.stdout.write(result['stdout'])
+            sys.stderr.write(result['stderr'])
+            sys.exit(result['exit_code'])
+
+    sys.exit(run_local(COMMANDS[command], argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+# ./scripts/rfu_daemon.py
+"""
+RFU Daemon - Long-Lived Tooling Server over a Local Unix Socket
+================================================================
+
+Keeps the parsed phase corpus (and every imported tool module) in memory and
+serves the existing script commands over a local Unix socket, so repeated
+agent calls skip interpreter startup and JSON parsing entirely.
+
+Usage:
+    python scripts/rfu_daemon.py start [--poll 1.0] [--socket PATH]
+    python scripts/rfu_daemon.py start --foreground
+    python scripts/rfu_daemon.py status
+    python scripts/rfu_daemon.py bench [--repeat 50]
+    python scripts/rfu_daemon.py stop
+
+    python scripts/rfu_client.py search --text "readiness" --count
+
+CLI Arguments:
+    start: Launch the daemon (background unless --foreground)
+    stop: Ask a running daemon to exit
+    status: Show uptime, requests served and cache counters
+    bench: Time round trips through the socket vs a fresh process without the daemon
+    --socket: Optional. Socket path. Default: .cache/rfu_daemon.sock ($RFU_DAEMON_SOCKET)
+    --poll: Optional. Seconds between mtime sweeps. Default: 1.0 (0 disables)
+    --repeat: Optional. Queries per benchmark case. Default: 50
+
+Protocol (JSON-RPC 2.0, one newline-terminated request per connection):
+    {"jsonrpc": "2.0", "id": 1, "method": "run",
+     "params": {"command": "search", "argv": ["--count"], "cwd": "/path", "stdin": ""}}
+    -> {"jsonrpc": "2.0", "id": 1, "result": {"stdout": "...", "stderr": "", "exit_code": 0}}
+
+    Methods: run, ping, status, shutdown
+
+Inputs:
+    - data/phase-registry.json and data/{phase}/*.json (via phase_corpus)
+
+Outputs:
+    - .cache/rfu_daemon.sock (mode 0600)
+    - .cache/rfu_daemon.log (background mode)
+
+Operational Notes:
+    - Optional: every command still works without it (rfu_client falls back)
+    - Requests are handled one at a time, so writes never interleave
+    - A watcher thread re-stats phase files every --poll seconds and
+      re-parses anything edited out-of-band before the next query needs it;
+      every load also re-checks (mtime, size), so no stale data is served
+    - Commands run the script's own main() with argv/cwd/stdin swapped in and
+      stdout/stderr captured, so output is identical to a direct run
+    - Requires socket.AF_UNIX (Linux/macOS, not native Windows Python)
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import threading
+import importlib
+import traceback
+import subprocess
+import socketserver
+import contextlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from phase_corpus import PhaseCorpus, cache_stats
+from rfu_client import COMMANDS, call, socket_path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LOG_FILE = PROJECT_ROOT / ".cache" / "rfu_daemon.log"
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+
+class ToolRunner:
+    """Runs script main() functions in-process with captured I/O."""
+
+    def __init__(self):
+        self.corpus = PhaseCorpus.for_project()
+        self.started = time.time()
+        self.requests = 0
+
+    def run(self, command: str, argv: List[str], cwd: Optional[str] = None, stdin: str = '') -> Dict:
+        module = importlib.import_module(COMMANDS[command])
+        stdout, stderr = io.StringIO(), io.StringIO()
+        saved_argv, saved_stdin, saved_cwd = sys.argv, sys.stdin, os.getcwd()
+        exit_code = 0
+
+        sys.argv = [module.__file__] + list(argv)
+        sys.stdin = io.StringIO(stdin or '')
+        try:
+            if cwd:
+                os.chdir(cwd)
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    module.main()
+                except SystemExit as e:
+                    if e.code is None:
+                        exit_code = 0
+                    elif isinstance(e.code, int):
+                        exit_code = e.code
+                    else:
+                        print(e.code, file=sys.stderr)
+                        exit_code = 1
+                except Exception:
+                    traceback.print_exc()
+                    exit_code = 1
+        finally:
+            sys.argv, sys.stdin = saved_argv, saved_stdin
+            os.chdir(saved_cwd)
+
+        self.requests += 1
+        return {'stdout': stdout.getvalue(), 'stderr': stderr.getvalue(), 'exit_code': exit_code}
+
+    def status(self) -> Dict:
+        return {
+            'pid': os.getpid(),
+            'uptime_s': round(time.time() - self.started, 1),
+            'requests': self.requests,
+            'phases': self.corpus.phases(),
+            'cache': cache_stats(),
+        }
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """One JSON-RPC request per connection."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        request_id = None
+        try:
+            request = json.loads(line.decode('utf-8'))
+            request_id = request.get('id')
+            response = {'jsonrpc': '2.0', 'id': request_id,
+                        'result': self.server.dispatch(request.get('method'), request.get('params') or {})}
+        except json.JSONDecodeError as e:
+            response = self._error(request_id, PARSE_ERROR, f"Parse error: {e.msg}")
+        except LookupError as e:
+            response = self._error(request_id, METHOD_NOT_FOUND, str(e.args[0]))
+        except (TypeError, ValueError) as e:
+            response = self._error(request_id, INVALID_PARAMS, str(e))
+        except AttributeError:
+            response = self._error(request_id, INVALID_REQUEST, "Request must be a JSON object")
+
+        self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+
+    @staticmethod
+    def _error(request_id: Any, code: int, message: str) -> Dict:
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+class RfuDaemon(socketserver.UnixStreamServer):
+    """Single-threaded socket server plus a background mtime watcher."""
+
+    def __init__(self, path: str, poll: float):
+        self.runner = ToolRunner()
+        self.poll = poll
+        self._stop = threading.Event()
+        super().__init__(path, RequestHandler)
+        os.chmod(path, 0o600)
+
+    def dispatch(self, method: str, params: Dict) -> Any:
+        if method == 'ping':
+            return 'pong'
+        if method == 'status':
+            return self.runner.status()
+        if method == 'shutdown':
+            self._stop.set()
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return 'bye'
+        if method == 'run':
+            command = params.get('command')
+            if command not in COMMANDS:
+                raise ValueError(f"Unknown command: {command}")
+            argv = params.get('argv', [])
+            if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+                raise ValueError("argv must be a list of strings")
+            return self.runner.run(command, argv, params.get('cwd'), params.get('stdin', ''))
+        raise LookupError(f"Method not found: {method}")
+
+    def watch(self) -> None:
+        """Re-parse phase files edited out-of-band so queries stay warm."""
+        while not self._stop.wait(self.poll):
+            try:
+                self.runner.corpus.warm()
+            except OSError:
+                pass
+
+
+def serve(path: str, poll: float) -> None:
+    """Run the daemon in the foreground until shutdown."""
+    if os.path.exists(path):
+        try:
+            call('ping', path=path, timeout=1.0)
+            print(f"ERROR: Daemon already running on {path}")
+            sys.exit(1)
+        except OSError:
+            os.unlink(path)  # stale socket from a crashed daemon
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    server = RfuDaemon(path, poll)
+    parsed = server.runner.corpus.warm()
+    if poll > 0:
+        threading.Thread(target=server.watch, daemon=True).start()
+
+    print(f"[SUCCESS] rfu daemon listening on {path} (pid {os.getpid()}, {parsed} files parsed)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def start_background(path: str, poll: float) -> str:
+    """Spawn a detached foreground daemon and wait for it to answer ping."""
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(LOG_FILE, 'a', encoding='utf-8') as log:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), 'start', '--foreground',
+             '--socket', path, '--poll', str(poll)],
+            stdout=log, stderr=log, stdin=subprocess.DEVNULL, start_new_session=True,
+        )
+
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            call('ping', path=path, timeout=1.0)
+            return f"[SUCCESS] rfu daemon started on {path}"
+        except OSError:
+            time.sleep(0.05)
+    return f"ERROR: Daemon did not come up; see {LOG_FILE}"
+
+
+def benchmark(path: str, repeat: int) -> str:
+    """Median/p95 socket round trips, plus a fresh-process run for comparison."""
+    cases = [
+        ('search', ['--count']),
+        ('search', ['--text', 'readiness', '--format', 'ids']),
+        ('question', ['get', '--phase', 'phase_0', '--question', 'q05']),
+        ('validate', ['--phase', 'phase_0']),
+    ]
+
+    def stats(samples: List[float]) -> str:
+        samples = sorted(samples)
+        median = samples[len(samples) // 2] * 1000
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000
+        return f"{median:8.2f} {p95:8.2f}"
+
+    lines = [f"{'Command':<44} {'median':>8} {'p95':>8}  (ms, socket round trip)"]
+    for command, argv in cases:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            call('run', {'command': command, 'argv': argv, 'cwd': str(PROJECT_ROOT)}, path=path)
+            samples.append(time.perf_counter() - start)
+        lines.append(f"{(command + ' ' + ' '.join(argv))[:44]:<44} {stats(samples)}")
+
+    cold = [sys.executable, str(Path(__file__).parent / 'rfu_client.py'), 'search', '--count']
+    samples = []
+    for _ in range(max(3, repeat // 10)):
+        start = time.perf_counter()
+        subprocess.run(cold, capture_output=True, env=dict(os.environ, RFU_NO_DAEMON='1'))
+        samples.append(time.perf_counter() - start)
+    lines.append(f"{'search --count (new process, no daemon)':<44} {stats(samples)}")
+    return "\n".join(lines)
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(description="RFU Daemon - tooling server over a Unix socket")
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+
+    start_parser = subparsers.add_parser('start', help='Start the daemon')
+    start_parser.add_argument('--foreground', action='store_true', help='Run in this process')
+    start_parser.add_argument('--poll', type=float, default=1.0, help='Seconds between mtime sweeps (0 disables)')
+    subparsers.add_parser('stop', help='Stop the daemon')
+    subparsers.add_parser('status', help='Show daemon status')
+    bench_parser = subparsers.add_parser('bench', help='Benchmark socket round trips')
+    bench_parser.add_argument('--repeat', type=int, default=50, help='Queries per case')
+    for sub in subparsers.choices.values():
+        sub.add_argument('--socket', default=socket_path(), help='Socket path')
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("ERROR: Unix sockets are not available on this platform; run scripts directly")
+        sys.exit(1)
+
+    if args.command == 'start':
+        if args.foreground:
+            serve(args.socket, args.poll)
+            sys.exit(0)
+        result = start_background(args.socket, args.poll)
+        print(result)
+        sys.exit(0 if not result.startswith('ERROR') else 1)
+
+    try:
+        if args.command == 'stop':
+            call('shutdown', path=args.socket, timeout=5.0)
+            result = "[SUCCESS] rfu daemon stopped"
+        elif args.command == 'status':
+            result = json.dumps(call('status', path=args.socket)['result'], indent=2)
+        else:
+            result = benchmark(args.socket, args.repeat)
+    except (ConnectionError, FileNotFoundError, socket.timeout):
+        result = f"ERROR: No daemon listening on {args.socket}"
+
+    print(result)
+    sys.exit(0 if not result.startswith('ERROR') else 1)
+
+
+if __name__ == "__main__":
+    main()
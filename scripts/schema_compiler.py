@@ -0,0 +1,622 @@
+# ./scripts/schema_compiler.py
+"""
+Schema Compiler - JSON Schema to Specialized Python Validators
+===============================================================
+
+Compiles the formal JSON Schemas in data/schema/ (draft 2020-12) into plain
+Python functions, one per schema and per $defs entry, in the style of
+fastjsonschema code generation. Every keyword becomes inline checks
+(isinstance, `in`, len, precompiled regexes), so validating a document never
+interprets the schema at runtime.
+
+Usage:
+    python scripts/schema_compiler.py
+    python scripts/schema_compiler.py --check
+    python scripts/schema_compiler.py --stdout
+
+CLI Arguments:
+    --check: Optional. Exit 1 if scripts/schema_validators.py is missing or stale
+    --stdout: Optional. Print the generated module instead of writing it
+
+Supported Keywords:
+    Applicators: $ref (local only), allOf, anyOf, oneOf, not, if/then/else
+    Any type: type, enum, const
+    Objects: required, properties, patternProperties, additionalProperties,
+        propertyNames, minProperties, maxProperties
+    Arrays: items, prefixItems, contains, minItems, maxItems, uniqueItems
+    Strings: minLength, maxLength, pattern
+    Numbers: minimum, maximum, exclusiveMinimum, exclusiveMaximum, multipleOf
+    Annotations ($schema, $id, title, description, format, ...) are ignored
+
+Inputs:
+    - data/schema/questions.schema.json
+    - data/schema/manifest.schema.json
+    - data/schema/prompts.schema.json
+
+Outputs:
+    - scripts/schema_validators.py (generated; do not edit by hand)
+    - Exit code: 0 (success/up to date), 1 (stale, or unsupported keyword)
+
+Operational Notes:
+    - validate_schema.py --compiled uses the generated module. If a schema
+      changed since the last build it compiles in memory instead, so results
+      never come from a stale validator
+    - Each schema's hash covers this compiler's source, so a generator
+      change also marks the module stale
+    - Generated validators collect every error as (JSON Pointer, message)
+      rather than stopping at the first one
+    - An `if` made only of required/const/enum checks compiles to a single
+      boolean expression (the usual `type` discriminator)
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import re
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from phase_corpus import PROJECT_ROOT
+
+
+SCHEMA_DIR = PROJECT_ROOT / "data" / "schema"
+SCHEMA_FILES = {
+    'questions': 'questions.schema.json',
+    'manifest': 'manifest.schema.json',
+    'prompts': 'prompts.schema.json',
+}
+GENERATED_FILE = Path(__file__).resolve().parent / "schema_validators.py"
+
+ANNOTATIONS = {
+    '$schema', '$id', '$comment', '$defs', 'definitions', 'title', 'description',
+    'examples', 'default', 'deprecated', 'readOnly', 'writeOnly', 'format',
+}
+OBJECT_KEYWORDS = ['required', 'minProperties', 'maxProperties', 'properties',
+                   'patternProperties', 'additionalProperties', 'propertyNames']
+ARRAY_KEYWORDS = ['minItems', 'maxItems', 'uniqueItems', 'prefixItems', 'items', 'contains']
+STRING_KEYWORDS = ['minLength', 'maxLength', 'pattern']
+NUMBER_KEYWORDS = ['minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum', 'multipleOf']
+GENERIC_KEYWORDS = ['$ref', 'type', 'enum', 'const', 'allOf', 'anyOf', 'oneOf', 'not', 'if', 'then', 'else']
+SUPPORTED = set(OBJECT_KEYWORDS + ARRAY_KEYWORDS + STRING_KEYWORDS + NUMBER_KEYWORDS + GENERIC_KEYWORDS)
+
+TYPE_CHECKS = {
+    'object': 'isinstance({v}, dict)',
+    'array': 'isinstance({v}, list)',
+    'string': 'isinstance({v}, str)',
+    'integer': '(type({v}) is int or (type({v}) is float and {v}.is_integer()))',
+    'number': '(type({v}) is int or type({v}) is float)',
+    'boolean': '({v} is True or {v} is False)',
+    'null': '{v} is None',
+}
+# A single declared type that already implies a keyword group's guard
+NARROWS = {'integer': 'number'}
+GROUPS = [
+    ('object', OBJECT_KEYWORDS, 'isinstance({v}, dict)'),
+    ('array', ARRAY_KEYWORDS, 'isinstance({v}, list)'),
+    ('string', STRING_KEYWORDS, 'isinstance({v}, str)'),
+    ('number', NUMBER_KEYWORDS, '(type({v}) is int or type({v}) is float)'),
+]
+
+RUNTIME_HELPERS = '''
+def _type_name(value):
+    if value is None:
+        return 'null'
+    if value is True or value is False:
+        return 'boolean'
+    return _TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+_TYPE_NAMES = {dict: 'object', list: 'array', str: 'string', int: 'integer', float: 'number'}
+
+
+def _esc(key):
+    if '~' in key or '/' in key:
+        return key.replace('~', '~0').replace('/', '~1')
+    return key
+
+
+def _equal(a, b):
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    return a == b
+
+
+def _unique(items):
+    try:
+        return len(set(items)) == len(items)
+    except TypeError:
+        seen = [json.dumps(item, sort_keys=True) for item in items]
+        return len(set(seen)) == len(seen)
+'''
+
+
+class SchemaCompileError(ValueError):
+    """Raised for schema constructs the compiler does not support."""
+
+
+def _pointer_escape(key: str) -> str:
+    return key.replace('~', '~0').replace('/', '~1')
+
+
+def _render_path(path: Tuple[str, str]) -> str:
+    """Path is (runtime expression, constant suffix); join them once."""
+    expr, suffix = path
+    return f"{expr} + {suffix!r}" if suffix else expr
+
+
+class SchemaCompiler:
+    """Generates Python source for one or more JSON Schemas."""
+
+    def __init__(self):
+        self.blocks: List[str] = []
+        self.constants: Dict[str, str] = {}
+        self.entries: Dict[str, str] = {}
+        self._refs: Dict[Tuple[str, str], str] = {}
+        self._queue: List[Tuple[str, Any]] = []
+        self._inlining: List[str] = []
+        self._counter = 0
+
+    # -- bookkeeping ---------------------------------------------------------
+
+    def _name(self, stem: str) -> str:
+        self._counter += 1
+        return f"{stem}{self._counter}"
+
+    def _constant(self, prefix: str, value_source: str) -> str:
+        if value_source not in self.constants:
+            self.constants[value_source] = f"_{prefix}_{len(self.constants)}"
+        return self.constants[value_source]
+
+    def _regex(self, pattern: str) -> str:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise SchemaCompileError(f"invalid pattern {pattern!r}: {e}")
+        return self._constant('RE', f"re.compile({pattern!r})")
+
+    def _resolve(self, ref: str) -> Any:
+        if not ref.startswith('#'):
+            raise SchemaCompileError(f"only local $ref is supported, got {ref!r}")
+        node = self.root
+        for part in [p for p in ref[1:].split('/') if p]:
+            part = part.replace('~1', '/').replace('~0', '~')
+            try:
+                node = node[int(part)] if isinstance(node, list) else node[part]
+            except (KeyError, IndexError, ValueError):
+                raise SchemaCompileError(f"unresolvable $ref {ref!r}")
+        return node
+
+    def _ref_function(self, ref: str) -> str:
+        key = (self.prefix, ref)
+        if key not in self._refs:
+            slug = re.sub(r'[^0-9a-zA-Z]+', '_', ref.replace('$defs', '')).strip('_') or 'root'
+            self._refs[key] = f"_{self.prefix}_{slug}"
+            self._queue.append((self._refs[key], self._resolve(ref)))
+        return self._refs[key]
+
+    def _anonymous_function(self, schema: Any) -> str:
+        name = self._name(f"_{self.prefix}_branch")
+        self._queue.append((name, schema))
+        return name
+
+    # -- entry points --------------------------------------------------------
+
+    def add_schema(self, name: str, schema: Dict) -> None:
+        """Compile one root schema and every $ref it reaches."""
+        self.root, self.prefix = schema, name
+        root_function = self._ref_function('#')
+        while self._queue:
+            function_name, node = self._queue.pop(0)
+            self.blocks.append(self._function(function_name, node))
+        self.blocks.append(
+            f"def validate_{name}(data):\n"
+            f"    \"\"\"Validate a parsed {name} document; returns [(json_pointer, message), ...].\"\"\"\n"
+            f"    return {root_function}(data, '', [])\n"
+        )
+        self.entries[name] = f"validate_{name}"
+
+    def source(self, header: str, hashes: Dict[str, str]) -> str:
+        """Assemble the generated module."""
+        lines = [header, "import re", "import json", ""]
+        lines.append(f"SCHEMA_HASHES = {json.dumps(hashes, indent=4, sort_keys=True)}")
+        lines.append("")
+        for value_source, name in self.constants.items():
+            lines.append(f"{name} = {value_source}")
+        lines.append(RUNTIME_HELPERS)
+        for block in self.blocks:
+            lines.extend(["", block])
+        lines.append("")
+        entries = ''.join(f"    {name!r}: {function},\n" for name, function in self.entries.items())
+        lines.append(f"VALIDATORS = {{\n{entries}}}\n")
+        return "\n".join(lines)
+
+    # -- code generation -----------------------------------------------------
+
+    def _function(self, name: str, schema: Any) -> str:
+        out = [f"def {name}(data, path, errors):"]
+        self._emit(schema, 'data', ('path', ''), out, 1)
+        out.append("    return errors")
+        return "\n".join(out) + "\n"
+
+    def _emit(self, schema: Any, var: str, path: Tuple[str, str], out: List[str], depth: int) -> None:
+        pad = '    ' * depth
+        p = _render_path(path)
+        if schema is True or schema == {}:
+            return
+        if schema is False:
+            out.append(f"{pad}errors.append(({p}, 'no value is allowed here'))")
+            return
+        if not isinstance(schema, dict):
+            raise SchemaCompileError(f"schema must be an object or boolean, got {schema!r}")
+        unknown = set(schema) - SUPPORTED - ANNOTATIONS
+        if unknown:
+            raise SchemaCompileError(f"unsupported keyword(s): {', '.join(sorted(unknown))}")
+
+        if '$ref' in schema:
+            ref = schema['$ref']
+            if ref == '#' or ref in self._inlining:
+                # Recursive reference: the only case that needs a real call
+                out.append(f"{pad}{self._ref_function(ref)}({var}, {p}, errors)")
+            else:
+                self._inlining.append(ref)
+                self._emit(self._resolve(ref), var, path, out, depth)
+                self._inlining.pop()
+
+        types = schema.get('type')
+        types = [types] if isinstance(types, str) else types
+        groups = [(kind, guard) for kind, keywords, guard in GROUPS if any(k in schema for k in keywords)]
+        if types is not None:
+            unknown_types = set(types) - set(TYPE_CHECKS)
+            if unknown_types:
+                raise SchemaCompileError(f"unknown type(s): {', '.join(sorted(unknown_types))}")
+            allowed = set(types) | ({'number'} if 'integer' in types else set())
+            groups = [(kind, guard) for kind, guard in groups if kind in allowed]
+            checks = [TYPE_CHECKS[t].format(v=var) for t in types]
+            condition = checks[0] if len(checks) == 1 else f"({' or '.join(checks)})"
+            expected = ' or '.join(types)
+            out.append(f"{pad}if not {condition}:")
+            out.append(f"{pad}    errors.append(({p}, 'expected {expected}, got ' + _type_name({var})))")
+            if len(groups) == 1 and len(types) == 1 and groups[0][0] in (types[0], NARROWS.get(types[0])):
+                # The type check already narrowed it: no second isinstance
+                out.append(f"{pad}else:")
+                self._emit_group(groups[0][0], schema, var, path, out, depth + 1)
+                groups = []
+        for kind, guard in groups:
+            out.append(f"{pad}if {guard.format(v=var)}:")
+            self._emit_group(kind, schema, var, path, out, depth + 1)
+
+        if 'enum' in schema:
+            self._emit_enum(schema['enum'], var, p, out, pad)
+        if 'const' in schema:
+            value = schema['const']
+            if isinstance(value, str):
+                out.append(f"{pad}if {var} != {value!r}:")
+            else:
+                out.append(f"{pad}if not _equal({var}, {value!r}):")
+            out.append(f"{pad}    errors.append(({p}, {('must equal ' + json.dumps(value))!r}))")
+
+        for sub in schema.get('allOf', []):
+            self._emit(sub, var, path, out, depth)
+        if 'anyOf' in schema:
+            branches = [self._anonymous_function(sub) for sub in schema['anyOf']]
+            failing = ' and '.join(f"{b}({var}, {p}, [])" for b in branches)
+            out.append(f"{pad}if {failing}:")
+            out.append(f"{pad}    errors.append(({p}, 'does not match any anyOf alternative'))")
+        if 'oneOf' in schema:
+            branches = [self._anonymous_function(sub) for sub in schema['oneOf']]
+            passing = ' + '.join(f"(not {b}({var}, {p}, []))" for b in branches)
+            out.append(f"{pad}if ({passing}) != 1:")
+            out.append(f"{pad}    errors.append(({p}, 'must match exactly one oneOf alternative'))")
+        if 'not' in schema:
+            branch = self._anonymous_function(schema['not'])
+            out.append(f"{pad}if not {branch}({var}, {p}, []):")
+            out.append(f"{pad}    errors.append(({p}, 'must not match the \"not\" schema'))")
+        if 'if' in schema and ('then' in schema or 'else' in schema):
+            self._emit_conditional(schema, var, path, out, depth)
+
+    def _emit_enum(self, values: List, var: str, p: str, out: List[str], pad: str) -> None:
+        message = 'must be one of: ' + ', '.join(str(v) for v in values)
+        if all(isinstance(v, str) for v in values):
+            name = self._constant('ENUM', f"frozenset({sorted(values)!r})")
+            out.append(f"{pad}if not isinstance({var}, str) or {var} not in {name}:")
+        else:
+            name = self._constant('ENUM', repr(tuple(values)))
+            out.append(f"{pad}if not any(_equal({var}, e) for e in {name}):")
+        out.append(f"{pad}    errors.append(({p}, {message!r}))")
+
+    def _predicate(self, schema: Any, var: str) -> Optional[str]:
+        """Boolean expression for simple `if` schemas, or None."""
+        if not isinstance(schema, dict) or set(schema) - {'required', 'properties', 'type'} - ANNOTATIONS:
+            return None
+        if schema.get('type', 'object') != 'object':
+            return None
+        required = schema.get('required', [])
+        terms = [f"{k!r} in {var}" for k in required]
+        for key, sub in schema.get('properties', {}).items():
+            if not isinstance(sub, dict) or set(sub) - ANNOTATIONS not in ({'const'}, {'enum'}):
+                return None
+            values = [sub['const']] if 'const' in sub else sub['enum']
+            if not all(isinstance(v, str) for v in values):
+                return None
+            test = (f"{var}[{key!r}] == {values[0]!r}" if len(values) == 1
+                    else f"{var}[{key!r}] in {self._constant('ENUM', f'frozenset({sorted(values)!r})')}")
+            terms.append(test if key in required else f"({key!r} not in {var} or {test})")
+        # Non-objects pass an object-only `if` (JSON Schema semantics)
+        if schema.get('type') == 'object':
+            return ' and '.join([f"isinstance({var}, dict)"] + terms)
+        return f"(not isinstance({var}, dict) or ({' and '.join(terms) or 'True'}))"
+
+    def _emit_conditional(self, schema: Dict, var: str, path: Tuple[str, str], out: List[str], depth: int) -> None:
+        pad = '    ' * depth
+        condition = self._predicate(schema['if'], var)
+        if condition is None:
+            branch = self._anonymous_function(schema['if'])
+            condition = f"not {branch}({var}, {_render_path(path)}, [])"
+        out.append(f"{pad}if {condition}:")
+        mark = len(out)
+        self._emit(schema.get('then', True), var, path, out, depth + 1)
+        if len(out) == mark:
+            out.append(f"{pad}    pass")
+        if 'else' in schema:
+            out.append(f"{pad}else:")
+            mark = len(out)
+            self._emit(schema['else'], var, path, out, depth + 1)
+            if len(out) == mark:
+                out.append(f"{pad}    pass")
+
+    def _emit_child(self, schema: Any, value_expr: str, path: Tuple[str, str], out: List[str], depth: int) -> None:
+        """Bind a child value to a local and validate it (dropped if no checks apply)."""
+        pad = '    ' * depth
+        var = self._name('v')
+        mark = len(out)
+        out.append(f"{pad}{var} = {value_expr}")
+        self._emit(schema, var, path, out, depth)
+        if len(out) == mark + 1:
+            del out[mark:]
+
+    def _emit_group(self, kind: str, schema: Dict, var: str, path: Tuple[str, str], out: List[str], depth: int) -> None:
+        pad = '    ' * depth
+        mark = len(out)
+        p = _render_path(path)
+        getattr(self, f"_emit_{kind}")(schema, var, path, p, out, pad, depth)
+        if len(out) == mark:
+            out.append(f"{pad}pass")
+
+    def _emit_object(self, schema, var, path, p, out, pad, depth) -> None:
+        properties = schema.get('properties', {})
+        required = schema.get('required', [])
+        for key in required:
+            if key not in properties:
+                out.append(f"{pad}if {key!r} not in {var}:")
+                out.append(f"{pad}    errors.append(({p}, {f'missing required property {key!r}'!r}))")
+        if 'minProperties' in schema:
+            n = schema['minProperties']
+            out.append(f"{pad}if len({var}) < {n}:")
+            out.append(f"{pad}    errors.append(({p}, 'must have at least {n} properties'))")
+        if 'maxProperties' in schema:
+            n = schema['maxProperties']
+            out.append(f"{pad}if len({var}) > {n}:")
+            out.append(f"{pad}    errors.append(({p}, 'must have at most {n} properties'))")
+
+        for key, sub in properties.items():
+            # A required property's presence and value checks share one lookup
+            missing = f"{pad}    errors.append(({p}, {f'missing required property {key!r}'!r}))"
+            out.append(f"{pad}if {key!r} in {var}:")
+            mark = len(out)
+            if sub is not True and sub != {}:
+                child = (path[0], path[1] + '/' + _pointer_escape(key))
+                self._emit_child(sub, f"{var}[{key!r}]", child, out, depth + 1)
+            if len(out) > mark:
+                if key in required:
+                    out.extend([f"{pad}else:", missing])
+            elif key in required:
+                out[-1] = f"{pad}if {key!r} not in {var}:"
+                out.append(missing)
+            else:
+                out.pop()
+
+        patterns = schema.get('patternProperties', {})
+        additional = schema.get('additionalProperties', True)
+        names = schema.get('propertyNames', True)
+        if not patterns and additional is True and names is True:
+            return
+
+        key_var, value_var = self._name('k'), self._name('v')
+        child = (f"{_render_path((path[0], path[1] + '/'))} + _esc({key_var})", '')
+        out.append(f"{pad}for {key_var}, {value_var} in {var}.items():")
+        inner = pad + '    '
+        if names is not True:
+            self._emit(names, key_var, child, out, depth + 1)
+        matched = self._name('matched') if patterns and additional is not True else None
+        if matched:
+            out.append(f"{inner}{matched} = False")
+        for pattern, sub in patterns.items():
+            out.append(f"{inner}if {self._regex(pattern)}.search({key_var}):")
+            if matched:
+                out.append(f"{inner}    {matched} = True")
+            mark = len(out)
+            self._emit(sub, value_var, child, out, depth + 2)
+            if len(out) == mark and not matched:
+                out.append(f"{inner}    pass")
+        if additional is not True:
+            conditions = []
+            if properties:
+                known = self._constant('KEYS', f"frozenset({sorted(properties)!r})")
+                conditions.append(f"{key_var} not in {known}")
+            if matched:
+                conditions.append(f"not {matched}")
+            depth_extra = 0
+            if conditions:
+                out.append(f"{inner}if {' and '.join(conditions)}:")
+                depth_extra = 1
+            if additional is False:
+                out.append(f"{inner}{'    ' * depth_extra}errors.append(({p}, 'unexpected property ' + repr({key_var})))")
+            else:
+                self._emit(additional, value_var, child, out, depth + 1 + depth_extra)
+
+    def _emit_array(self, schema, var, path, p, out, pad, depth) -> None:
+        if 'minItems' in schema:
+            n = schema['minItems']
+            out.append(f"{pad}if len({var}) < {n}:")
+            out.append(f"{pad}    errors.append(({p}, 'must have at least {n} item{'s' if n != 1 else ''}'))")
+        if 'maxItems' in schema:
+            n = schema['maxItems']
+            out.append(f"{pad}if len({var}) > {n}:")
+            out.append(f"{pad}    errors.append(({p}, 'must have at most {n} item{'s' if n != 1 else ''}'))")
+        if schema.get('uniqueItems'):
+            out.append(f"{pad}if not _unique({var}):")
+            out.append(f"{pad}    errors.append(({p}, 'items must be unique'))")
+
+        prefix = schema.get('prefixItems', [])
+        for index, sub in enumerate(prefix):
+            out.append(f"{pad}if len({var}) > {index}:")
+            mark = len(out)
+            self._emit_child(sub, f"{var}[{index}]", (path[0], f"{path[1]}/{index}"), out, depth + 1)
+            if len(out) == mark:
+                out.pop()
+        items = schema.get('items', True)
+        if items is not True and items != {}:
+            index_var, value_var = self._name('i'), self._name('v')
+            child = (f"{_render_path((path[0], path[1] + '/'))} + str({index_var})", '')
+            if prefix:
+                out.append(f"{pad}for {index_var} in range({len(prefix)}, len({var})):")
+                out.append(f"{pad}    {value_var} = {var}[{index_var}]")
+            else:
+                out.append(f"{pad}for {index_var}, {value_var} in enumerate({var}):")
+            self._emit(items, value_var, child, out, depth + 1)
+        if 'contains' in schema:
+            branch = self._anonymous_function(schema['contains'])
+            item = self._name('item')
+            out.append(f"{pad}if all({branch}({item}, {p}, []) for {item} in {var}):")
+            out.append(f"{pad}    errors.append(({p}, 'must contain at least one matching item'))")
+
+    def _emit_string(self, schema, var, path, p, out, pad, depth) -> None:
+        if 'minLength' in schema:
+            n = schema['minLength']
+            message = 'must not be empty' if n == 1 else f'must be at least {n} characters'
+            out.append(f"{pad}if not {var}:" if n == 1 else f"{pad}if len({var}) < {n}:")
+            out.append(f"{pad}    errors.append(({p}, {message!r}))")
+        if 'maxLength' in schema:
+            n = schema['maxLength']
+            out.append(f"{pad}if len({var}) > {n}:")
+            out.append(f"{pad}    errors.append(({p}, 'must be at most {n} characters'))")
+        if 'pattern' in schema:
+            out.append(f"{pad}if {self._regex(schema['pattern'])}.search({var}) is None:")
+            out.append(f"{pad}    errors.append(({p}, {('does not match ' + schema['pattern'])!r}))")
+
+    def _emit_number(self, schema, var, path, p, out, pad, depth) -> None:
+        for keyword, operator, words in [('minimum', '<', 'at least'), ('maximum', '>', 'at most'),
+                                         ('exclusiveMinimum', '<=', 'greater than'),
+                                         ('exclusiveMaximum', '>=', 'less than')]:
+            if keyword in schema:
+                limit = schema[keyword]
+                out.append(f"{pad}if {var} {operator} {limit!r}:")
+                out.append(f"{pad}    errors.append(({p}, 'must be {words} {limit}'))")
+        if 'multipleOf' in schema:
+            step = schema['multipleOf']
+            out.append(f"{pad}if {var} % {step!r}:")
+            out.append(f"{pad}    errors.append(({p}, 'must be a multiple of {step}'))")
+
+
+# ============================================================================
+# Build / load
+# ============================================================================
+
+def _digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def load_schemas(schema_dir: Path = SCHEMA_DIR) -> Dict[str, Tuple[Dict, str]]:
+    """name -> (parsed schema, hash of compiler source + schema bytes)."""
+    compiler_source = Path(__file__).read_bytes()
+    schemas = {}
+    for name, filename in SCHEMA_FILES.items():
+        raw = (schema_dir / filename).read_bytes()
+        schemas[name] = (json.loads(raw), _digest(compiler_source + raw))
+    return schemas
+
+
+def build_source(schemas: Dict[str, Tuple[Dict, str]]) -> str:
+    """Generate the schema_validators.py source for the given schemas."""
+    compiler = SchemaCompiler()
+    for name, (schema, _) in schemas.items():
+        compiler.add_schema(name, schema)
+    header = f'''# ./scripts/{GENERATED_FILE.name}
+"""
+Compiled Schema Validators - GENERATED, DO NOT EDIT
+====================================================
+
+Generated by scripts/schema_compiler.py from data/schema/*.schema.json.
+Rebuild after editing a schema: python scripts/schema_compiler.py
+
+Each validate_<name>(data) returns a list of (JSON Pointer, message)
+tuples; an empty list means the document is valid.
+
+Validators: {', '.join(compiler.entries.values())}
+"""
+'''
+    return compiler.source(header, {name: digest for name, (_, digest) in schemas.items()})
+
+
+def load_validators(schema_dir: Path = SCHEMA_DIR) -> Dict[str, Callable]:
+    """
+    Return {'questions': fn, 'manifest': fn, 'prompts': fn}.
+
+    Uses the generated module when its hashes match the schemas on disk;
+    otherwise compiles in memory (no file is written).
+    """
+    schemas = load_schemas(schema_dir)
+    hashes = {name: digest for name, (_, digest) in schemas.items()}
+    try:
+        import schema_validators
+        if schema_validators.SCHEMA_HASHES == hashes:
+            return schema_validators.VALIDATORS
+    except ImportError:
+        pass
+    namespace: Dict[str, Any] = {}
+    exec(compile(build_source(schemas), str(GENERATED_FILE), 'exec'), namespace)
+    return namespace['VALIDATORS']
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Schema Compiler - Generate Python validators from data/schema/*.schema.json",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--check', action='store_true', help='Exit 1 if the generated module is stale')
+    parser.add_argument('--stdout', action='store_true', help='Print the generated module instead of writing it')
+    args = parser.parse_args()
+
+    try:
+        source = build_source(load_schemas())
+    except (OSError, json.JSONDecodeError, SchemaCompileError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    if args.stdout:
+        print(source, end='')
+        return
+
+    current = GENERATED_FILE.read_text(encoding='utf-8') if GENERATED_FILE.exists() else None
+    if args.check:
+        if current != source:
+            print(f"ERROR: {GENERATED_FILE.name} is stale; run python scripts/schema_compiler.py")
+            sys.exit(1)
+        print(f"[SUCCESS] {GENERATED_FILE.name} is up to date")
+        return
+
+    if current == source:
+        print(f"[SUCCESS] {GENERATED_FILE.name} already up to date")
+        return
+    GENERATED_FILE.write_text(source, encoding='utf-8')
+    print(f"[SUCCESS] Wrote {GENERATED_FILE.relative_to(PROJECT_ROOT)} "
+          f"({len(source.splitlines())} lines, {len(SCHEMA_FILES)} schemas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+# ./scripts/schema_inference.py
+"""
+Schema Inference - Memoized Structure Snapshots and Structural Diff
+===================================================================
+
+The one engine behind {phase}_{file}_schema.json. export_schemas.py and
+generate_schema_snapshots.py render through it. Each subtree is reduced to
+a structural signature (its keys and the signatures of its children) and
+signatures are interned, so a shape shared by hundreds of options, fields
+or answer schemas is inferred and merged once. The CLI diffs snapshots
+structurally and exits 1 on drift, for CI.
+
+Usage:
+    python scripts/schema_inference.py
+    python scripts/schema_inference.py --snapshots exports --phase phase_0
+    python scripts/schema_inference.py --against phase_1 --file manifest --file prompts
+    python scripts/schema_inference.py --diff OLD_schema.json NEW_schema.json
+
+CLI Arguments:
+    --snapshots: Optional. Committed snapshots to check against live data:
+                 'data' (data/{phase}/) or 'exports' (exports/schemas/). Default: data
+    --against: Optional. Compare every phase's inferred schema with this phase's
+               instead of with committed snapshots
+    --diff: Optional. Diff two snapshot files (OLD NEW) and nothing else
+    --phase: Optional. Only check this phase. Default: all phases
+    --file: Optional, repeatable. questions, manifest or prompts. Default: all three
+    --format: Optional. Output format: text or json. Default: text
+
+Inputs:
+    - data/phase_*/questions.json, manifest.json, prompts.json
+    - data/phase_*/{phase}_{file}_schema.json or exports/schemas/{phase}_{file}_schema.json
+
+Outputs:
+    - One line per compared snapshot (match, drift, missing) and one line per
+      structural difference: added, removed or changed, with its path
+    - Exit code: 0 (no drift), 1 (drift found or unreadable input)
+
+Operational Notes:
+    - Output of render_snapshot() is byte-identical to the get_structure walk
+      the snapshot scripts used before: for a list of dicts the first item
+      that has a key decides that key's shape, and any other list is typed by
+      its first element
+    - Shapes are shared between equal subtrees; treat them as read-only
+    - The diff only descends into subtrees that differ, so equal snapshots
+      cost one comparison
+    - Missing committed snapshots are listed but are not drift (phase_closure
+      has none under data/)
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import os
+import sys
+import json
+import argparse
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from phase_corpus import PROJECT_ROOT, PhaseCorpus, load_json
+
+
+SNAPSHOT_FILES = ['questions', 'manifest', 'prompts']
+SNAPSHOT_DIRS = {
+    'data': 'data/{phase}/{phase}_{name}_schema.json',
+    'exports': 'exports/schemas/{phase}_{name}_schema.json',
+}
+
+# Primitive signatures are their type name (which is also their shape);
+# container signatures are ints interned by SchemaInferrer
+Signature = Union[str, int]
+
+
+class SchemaInferrer:
+    """Infers structure shapes, once per distinct structural signature."""
+
+    def __init__(self):
+        self._ids: Dict[Tuple, int] = {}
+        self._shapes: List[Any] = []
+
+    @property
+    def shape_count(self) -> int:
+        return len(self._shapes)
+
+    def infer(self, data: Any) -> Any:
+        """Structure of data: keys and type names, lists of dicts merged into one shape."""
+        signature = self._signature(data)
+        return signature if isinstance(signature, str) else self._shapes[signature]
+
+    def _signature(self, node: Any) -> Signature:
+        if isinstance(node, dict):
+            parts = ['dict']
+            for k, v in node.items():
+                parts.append(k)
+                parts.append(self._signature(v) if isinstance(v, (dict, list)) else type(v).__name__)
+            key = tuple(parts)
+        elif isinstance(node, list):
+            if not node:
+                return "list(empty)"
+            if not all(isinstance(item, dict) for item in node):
+                return f"list({type(node[0]).__name__})"
+            # Only the first occurrence of each item shape affects the merge
+            key = ('list',) + tuple(dict.fromkeys(map(self._signature, node)))
+        else:
+            return type(node).__name__
+
+        signature = self._ids.get(key)
+        if signature is None:
+            signature = len(self._shapes)
+            self._shapes.append(self._build(key))
+            self._ids[key] = signature
+        return signature
+
+    def _shape(self, signature: Signature) -> Any:
+        return signature if isinstance(signature, str) else self._shapes[signature]
+
+    def _build(self, key: Tuple) -> Any:
+        if key[0] == 'dict':
+            return {key[i]: self._shape(key[i + 1]) for i in range(1, len(key), 2)}
+        merged = {}
+        for item in key[1:]:
+            for k, v in self._shapes[item].items():
+                if k not in merged:
+                    merged[k] = v
+        return ["list(dict)", merged]
+
+
+_INFERRER = SchemaInferrer()
+
+
+def get_structure(data: Any) -> Any:
+    """Structure of data using the process-wide memo (see SchemaInferrer.infer)."""
+    return _INFERRER.infer(data)
+
+
+def analyze_questions_schema(questions_data: Dict) -> Dict:
+    """Root keys of questions.json plus answer_schema keys seen per question type."""
+    schema_summary = {
+        "root_keys": list(questions_data.keys()),
+        "answer_schemas_by_type": defaultdict(dict)
+    }
+
+    questions = questions_data.get("questions", {})
+    if isinstance(questions, dict):
+        for q_data in questions.values():
+            q_type = q_data.get("type", "unknown")
+            a_schema = q_data.get("answer_schema", {})
+            by_type = schema_summary["answer_schemas_by_type"][q_type]
+            for k in a_schema.keys():
+                by_type[k] = type(a_schema[k]).__name__
+
+    return schema_summary
+
+
+def infer_snapshot(file_name: str, data: Any) -> Any:
+    """Snapshot object for one phase file (questions.json gets the answer_schema summary too)."""
+    if file_name == "questions.json":
+        snapshot = analyze_questions_schema(data)
+        snapshot["full_structure_sample"] = get_structure(data)
+        return snapshot
+    return get_structure(data)
+
+
+def render_snapshot(file_path: str) -> str:
+    """Exact text of {phase}_{file}_schema.json for one phase file."""
+    return json.dumps(infer_snapshot(os.path.basename(file_path), load_json(file_path)), indent=4)
+
+
+# ============================================================================
+# Structural diff
+# ============================================================================
+
+def _join(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
+
+
+def diff_snapshots(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Differences between two snapshots as {'change', 'path', 'old', 'new'}, in key order."""
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for key in old:
+            if key not in new:
+                changes.append({'change': 'removed', 'path': _join(path, key), 'old': old[key], 'new': None})
+            else:
+                changes.extend(diff_snapshots(old[key], new[key], _join(path, key)))
+        for key in new:
+            if key not in old:
+                changes.append({'change': 'added', 'path': _join(path, key), 'old': None, 'new': new[key]})
+        return changes
+    if (isinstance(old, list) and isinstance(new, list) and len(old) == len(new) == 2
+            and old[0] == new[0] == "list(dict)"):
+        return diff_snapshots(old[1], new[1], f"{path}[]")
+    return [{'change': 'changed', 'path': path or '(root)', 'old': old, 'new': new}]
+
+
+def _brief(shape: Any) -> str:
+    if isinstance(shape, dict):
+        return f"object({len(shape)} keys)"
+    if isinstance(shape, list):
+        return shape[0] if shape and isinstance(shape[0], str) else "list"
+    return str(shape)
+
+
+def format_change(change: Dict[str, Any]) -> str:
+    if change['change'] == 'added':
+        return f"+ {change['path']}: {_brief(change['new'])}"
+    if change['change'] == 'removed':
+        return f"- {change['path']}: {_brief(change['old'])}"
+    return f"~ {change['path']}: {_brief(change['old'])} -> {_brief(change['new'])}"
+
+
+def check_drift(corpus: PhaseCorpus, phases: List[str], names: List[str], snapshots: str = 'data',
+                against: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Compare live inferred schemas with committed snapshots (or with a reference
+    phase). One result per (phase, file): {'phase', 'file', 'status', 'changes'}.
+    """
+    inferred: Dict[Tuple[str, str], Any] = {}
+
+    def live(phase: str, name: str) -> Any:
+        if (phase, name) not in inferred:
+            filename = f"{name}.json"
+            inferred[phase, name] = (infer_snapshot(filename, corpus.load(phase, filename))
+                                     if corpus.has(phase, filename) else None)
+        return inferred[phase, name]
+
+    results = []
+    for phase in phases:
+        for name in names:
+            current = live(phase, name)
+            if current is None:
+                continue
+            if against:
+                reference, source = live(against, name), f"{against}/{name}.json"
+            else:
+                source = SNAPSHOT_DIRS[snapshots].format(phase=phase, name=name)
+                snapshot_path = PROJECT_ROOT / source
+                reference = load_json(snapshot_path, use_cache=False) if snapshot_path.exists() else None
+            if reference is None:
+                results.append({'phase': phase, 'file': name, 'source': source, 'status': 'missing', 'changes': []})
+                continue
+            # Round-trip so the live snapshot compares like a file (defaultdict, shared shapes)
+            changes = diff_snapshots(reference, json.loads(json.dumps(current)))
+            results.append({'phase': phase, 'file': name, 'source': source,
+                            'status': 'drift' if changes else 'match', 'changes': changes})
+    return results
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Schema Inference - Detect structural drift between data and schema snapshots",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  Check data/ snapshots against the live phase files (CI):
+    python scripts/schema_inference.py
+
+  Check exports/schemas/ for one phase:
+    python scripts/schema_inference.py --snapshots exports --phase phase_0
+
+  Compare every phase's manifest and prompts shape with phase_1's:
+    python scripts/schema_inference.py --against phase_1 --file manifest --file prompts
+
+  Diff two snapshot files:
+    python scripts/schema_inference.py --diff old_schema.json new_schema.json
+        """
+    )
+    parser.add_argument('--snapshots', choices=list(SNAPSHOT_DIRS), default='data',
+                        help='Committed snapshots to check (default: data)')
+    parser.add_argument('--against', metavar='PHASE', help='Compare each phase with this phase instead')
+    parser.add_argument('--diff', nargs=2, metavar=('OLD', 'NEW'), help='Diff two snapshot files')
+    parser.add_argument('--phase', help='Only check this phase (default: all)')
+    parser.add_argument('--file', action='append', choices=SNAPSHOT_FILES, help='Files to check (default: all)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='Output format (default: text)')
+    args = parser.parse_args()
+
+    if args.diff:
+        try:
+            old, new = (load_json(Path(path), use_cache=False) for path in args.diff)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        changes = diff_snapshots(old, new)
+        if args.format == 'json':
+            print(json.dumps(changes, indent=2))
+        else:
+            for change in changes:
+                print(format_change(change))
+            print(f"{len(changes)} structural differences" if changes else "[SUCCESS] Snapshots match")
+        sys.exit(1 if changes else 0)
+
+    corpus = PhaseCorpus.for_project()
+    for phase in filter(None, [args.phase, args.against]):
+        if phase not in corpus.phases():
+            print(f"ERROR: Unknown phase: {phase}")
+            sys.exit(1)
+    phases = [args.phase] if args.phase else sorted(corpus.phases())
+
+    try:
+        results = check_drift(corpus, phases, args.file or SNAPSHOT_FILES, args.snapshots, args.against)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    drifted = [result for result in results if result['status'] == 'drift']
+    if args.format == 'json':
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print(f"{result['phase']}/{result['file']}: {result['status'].upper()} ({result['source']})")
+            for change in result['changes']:
+                print(f"  {format_change(change)}")
+        missing = sum(1 for result in results if result['status'] == 'missing')
+        print(f"\n{len(results)} checked: {len(results) - len(drifted) - missing} match, {len(drifted)} drifted, "
+              f"{missing} missing (distinct shapes inferred: {_INFERRER.shape_count})")
+        if not drifted:
+            print("[SUCCESS] No schema drift")
+    sys.exit(1 if drifted else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1060 @@
+# ./scripts/schema_validators.py
+"""
+Compiled Schema Validators - GENERATED, DO NOT EDIT
+====================================================
+
+Generated by scripts/schema_compiler.py from data/schema/*.schema.json.
+Rebuild after editing a schema: python scripts/schema_compiler.py
+
+Each validate_<name>(data) returns a list of (JSON Pointer, message)
+tuples; an empty list means the document is valid.
+
+Validators: validate_questions, validate_manifest, validate_prompts
+"""
+
+import re
+import json
+
+SCHEMA_HASHES = {
+    "manifest": "8f10dc670d0eba72ab22d543edc28899",
+    "prompts": "d9cf2d7d7d79a953345dd11e0cb8fdcf",
+    "questions": "8be70d13369a0afcf48fa5c7d40629d6"
+}
+
+_RE_0 = re.compile('^s[0-9]+$')
+_RE_1 = re.compile('^q[0-9]+[a-z]?$')
+_ENUM_2 = frozenset(['compound', 'free_text', 'multi_select', 'ranked_select', 'single_select'])
+_RE_3 = re.compile('^[a-z0-9][a-z0-9_-]*$')
+_ENUM_4 = frozenset(['dropdown', 'free_text', 'multi_select', 'number', 'ranked_select', 'short_text', 'single_select'])
+_ENUM_5 = frozenset(['dropdown', 'multi_select', 'ranked_select', 'single_select'])
+_RE_6 = re.compile('^[0-9]+\\.[0-9]+\\.[0-9]+$')
+_RE_7 = re.compile('^[a-z]{2}(-[A-Z]{2})?$')
+
+def _type_name(value):
+    if value is None:
+        return 'null'
+    if value is True or value is False:
+        return 'boolean'
+    return _TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+_TYPE_NAMES = {dict: 'object', list: 'array', str: 'string', int: 'integer', float: 'number'}
+
+
+def _esc(key):
+    if '~' in key or '/' in key:
+        return key.replace('~', '~0').replace('/', '~1')
+    return key
+
+
+def _equal(a, b):
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    return a == b
+
+
+def _unique(items):
+    try:
+        return len(set(items)) == len(items)
+    except TypeError:
+        seen = [json.dumps(item, sort_keys=True) for item in items]
+        return len(set(seen)) == len(seen)
+
+
+def _questions_root(data, path, errors):
+    if not isinstance(data, dict):
+        errors.append((path, 'expected object, got ' + _type_name(data)))
+    else:
+        if 'schema_version' in data:
+            v1 = data['schema_version']
+            if not isinstance(v1, str):
+                errors.append((path + '/schema_version', 'expected string, got ' + _type_name(v1)))
+        if 'sections' in data:
+            v2 = data['sections']
+            if not isinstance(v2, list):
+                errors.append((path + '/sections', 'expected array, got ' + _type_name(v2)))
+            else:
+                if len(v2) < 1:
+                    errors.append((path + '/sections', 'must have at least 1 item'))
+                for i3, v4 in enumerate(v2):
+                    if not isinstance(v4, dict):
+                        errors.append((path + '/sections/' + str(i3), 'expected object, got ' + _type_name(v4)))
+                    else:
+                        if 'id' in v4:
+                            v5 = v4['id']
+                            if not isinstance(v5, str):
+                                errors.append((path + '/sections/' + str(i3) + '/id', 'expected string, got ' + _type_name(v5)))
+                            else:
+                                if _RE_0.search(v5) is None:
+                                    errors.append((path + '/sections/' + str(i3) + '/id', 'does not match ^s[0-9]+$'))
+                        else:
+                            errors.append((path + '/sections/' + str(i3), "missing required property 'id'"))
+                        if 'title' in v4:
+                            v6 = v4['title']
+                            if not isinstance(v6, str):
+                                errors.append((path + '/sections/' + str(i3) + '/title', 'expected string, got ' + _type_name(v6)))
+                            else:
+                                if not v6:
+                                    errors.append((path + '/sections/' + str(i3) + '/title', 'must not be empty'))
+                        else:
+                            errors.append((path + '/sections/' + str(i3), "missing required property 'title'"))
+                        if 'question_ids' in v4:
+                            v7 = v4['question_ids']
+                            if not isinstance(v7, list):
+                                errors.append((path + '/sections/' + str(i3) + '/question_ids', 'expected array, got ' + _type_name(v7)))
+                            else:
+                                if not _unique(v7):
+                                    errors.append((path + '/sections/' + str(i3) + '/question_ids', 'items must be unique'))
+                                for i8, v9 in enumerate(v7):
+                                    if not isinstance(v9, str):
+                                        errors.append((path + '/sections/' + str(i3) + '/question_ids/' + str(i8), 'expected string, got ' + _type_name(v9)))
+                                    else:
+                                        if _RE_1.search(v9) is None:
+                                            errors.append((path + '/sections/' + str(i3) + '/question_ids/' + str(i8), 'does not match ^q[0-9]+[a-z]?$'))
+                        else:
+                            errors.append((path + '/sections/' + str(i3), "missing required property 'question_ids'"))
+        else:
+            errors.append((path, "missing required property 'sections'"))
+        if 'questions' in data:
+            v10 = data['questions']
+            if not isinstance(v10, dict):
+                errors.append((path + '/questions', 'expected object, got ' + _type_name(v10)))
+            else:
+                if len(v10) < 1:
+                    errors.append((path + '/questions', 'must have at least 1 properties'))
+                for k11, v12 in v10.items():
+                    if not isinstance(k11, str):
+                        errors.append((path + '/questions/' + _esc(k11), 'expected string, got ' + _type_name(k11)))
+                    else:
+                        if _RE_1.search(k11) is None:
+                            errors.append((path + '/questions/' + _esc(k11), 'does not match ^q[0-9]+[a-z]?$'))
+                    if not isinstance(v12, dict):
+                        errors.append((path + '/questions/' + _esc(k11), 'expected object, got ' + _type_name(v12)))
+                    else:
+                        if 'id' in v12:
+                            v13 = v12['id']
+                            if not isinstance(v13, str):
+                                errors.append((path + '/questions/' + _esc(k11) + '/id', 'expected string, got ' + _type_name(v13)))
+                            else:
+                                if _RE_1.search(v13) is None:
+                                    errors.append((path + '/questions/' + _esc(k11) + '/id', 'does not match ^q[0-9]+[a-z]?$'))
+                        else:
+                            errors.append((path + '/questions/' + _esc(k11), "missing required property 'id'"))
+                        if 'section_id' in v12:
+                            v14 = v12['section_id']
+                            if not isinstance(v14, str):
+                                errors.append((path + '/questions/' + _esc(k11) + '/section_id', 'expected string, got ' + _type_name(v14)))
+                            else:
+                                if _RE_0.search(v14) is None:
+                                    errors.append((path + '/questions/' + _esc(k11) + '/section_id', 'does not match ^s[0-9]+$'))
+                        else:
+                            errors.append((path + '/questions/' + _esc(k11), "missing required property 'section_id'"))
+                        if 'order' in v12:
+                            v15 = v12['order']
+                            if not (type(v15) is int or (type(v15) is float and v15.is_integer())):
+                                errors.append((path + '/questions/' + _esc(k11) + '/order', 'expected integer, got ' + _type_name(v15)))
+                            else:
+                                if v15 < 1:
+                                    errors.append((path + '/questions/' + _esc(k11) + '/order', 'must be at least 1'))
+                        else:
+                            errors.append((path + '/questions/' + _esc(k11), "missing required property 'order'"))
+                        if 'title' in v12:
+                            v16 = v12['title']
+                            if not isinstance(v16, str):
+                                errors.append((path + '/questions/' + _esc(k11) + '/title', 'expected string, got ' + _type_name(v16)))
+                            else:
+                                if not v16:
+                                    errors.append((path + '/questions/' + _esc(k11) + '/title', 'must not be empty'))
+                        else:
+                            errors.append((path + '/questions/' + _esc(k11), "missing required property 'title'"))
+                        if 'prompt' in v12:
+                            v17 = v12['prompt']
+                            if not isinstance(v17, str):
+                                errors.append((path + '/questions/' + _esc(k11) + '/prompt', 'expected string, got ' + _type_name(v17)))
+                            else:
+                                if not v17:
+                                    errors.append((path + '/questions/' + _esc(k11) + '/prompt', 'must not be empty'))
+                        else:
+                            errors.append((path + '/questions/' + _esc(k11), "missing required property 'prompt'"))
+                        if 'type' in v12:
+                            v18 = v12['type']
+                            if not isinstance(v18, str) or v18 not in _ENUM_2:
+                                errors.append((path + '/questions/' + _esc(k11) + '/type', 'must be one of: free_text, single_select, multi_select, ranked_select, compound'))
+                        else:
+                            errors.append((path + '/questions/' + _esc(k11), "missing required property 'type'"))
+                        if 'options' in v12:
+                            v19 = v12['options']
+                            if not isinstance(v19, list):
+                                errors.append((path + '/questions/' + _esc(k11) + '/options', 'expected array, got ' + _type_name(v19)))
+                            else:
+                                if len(v19) < 1:
+                                    errors.append((path + '/questions/' + _esc(k11) + '/options', 'must have at least 1 item'))
+                                for i20, v21 in enumerate(v19):
+                                    if not isinstance(v21, dict):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/options/' + str(i20), 'expected object, got ' + _type_name(v21)))
+                                    else:
+                                        if 'value' in v21:
+                                            v22 = v21['value']
+                                            if not isinstance(v22, str):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/options/' + str(i20) + '/value', 'expected string, got ' + _type_name(v22)))
+                                            else:
+                                                if not v22:
+                                                    errors.append((path + '/questions/' + _esc(k11) + '/options/' + str(i20) + '/value', 'must not be empty'))
+                                        else:
+                                            errors.append((path + '/questions/' + _esc(k11) + '/options/' + str(i20), "missing required property 'value'"))
+                                        if 'label' in v21:
+                                            v23 = v21['label']
+                                            if not isinstance(v23, str):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/options/' + str(i20) + '/label', 'expected string, got ' + _type_name(v23)))
+                                            else:
+                                                if not v23:
+                                                    errors.append((path + '/questions/' + _esc(k11) + '/options/' + str(i20) + '/label', 'must not be empty'))
+                                        else:
+                                            errors.append((path + '/questions/' + _esc(k11) + '/options/' + str(i20), "missing required property 'label'"))
+                        if 'fields' in v12:
+                            v24 = v12['fields']
+                            if not isinstance(v24, list):
+                                errors.append((path + '/questions/' + _esc(k11) + '/fields', 'expected array, got ' + _type_name(v24)))
+                            else:
+                                if len(v24) < 1:
+                                    errors.append((path + '/questions/' + _esc(k11) + '/fields', 'must have at least 1 item'))
+                                for i25, v26 in enumerate(v24):
+                                    if not isinstance(v26, dict):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25), 'expected object, got ' + _type_name(v26)))
+                                    else:
+                                        if 'key' in v26:
+                                            v27 = v26['key']
+                                            if not isinstance(v27, str):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/key', 'expected string, got ' + _type_name(v27)))
+                                            else:
+                                                if _RE_3.search(v27) is None:
+                                                    errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/key', 'does not match ^[a-z0-9][a-z0-9_-]*$'))
+                                        else:
+                                            errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25), "missing required property 'key'"))
+                                        if 'type' in v26:
+                                            v28 = v26['type']
+                                            if not isinstance(v28, str) or v28 not in _ENUM_4:
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/type', 'must be one of: single_select, multi_select, ranked_select, dropdown, short_text, free_text, number'))
+                                        else:
+                                            errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25), "missing required property 'type'"))
+                                        if 'label' in v26:
+                                            v29 = v26['label']
+                                            if not isinstance(v29, str):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/label', 'expected string, got ' + _type_name(v29)))
+                                            else:
+                                                if not v29:
+                                                    errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/label', 'must not be empty'))
+                                        else:
+                                            errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25), "missing required property 'label'"))
+                                        if 'options' in v26:
+                                            v30 = v26['options']
+                                            if not isinstance(v30, list):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/options', 'expected array, got ' + _type_name(v30)))
+                                            else:
+                                                if len(v30) < 1:
+                                                    errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/options', 'must have at least 1 item'))
+                                                for i31, v32 in enumerate(v30):
+                                                    if not isinstance(v32, dict):
+                                                        errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/options/' + str(i31), 'expected object, got ' + _type_name(v32)))
+                                                    else:
+                                                        if 'value' in v32:
+                                                            v33 = v32['value']
+                                                            if not isinstance(v33, str):
+                                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/options/' + str(i31) + '/value', 'expected string, got ' + _type_name(v33)))
+                                                            else:
+                                                                if not v33:
+                                                                    errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/options/' + str(i31) + '/value', 'must not be empty'))
+                                                        else:
+                                                            errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/options/' + str(i31), "missing required property 'value'"))
+                                                        if 'label' in v32:
+                                                            v34 = v32['label']
+                                                            if not isinstance(v34, str):
+                                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/options/' + str(i31) + '/label', 'expected string, got ' + _type_name(v34)))
+                                                            else:
+                                                                if not v34:
+                                                                    errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/options/' + str(i31) + '/label', 'must not be empty'))
+                                                        else:
+                                                            errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/options/' + str(i31), "missing required property 'label'"))
+                                        if 'placeholder' in v26:
+                                            v35 = v26['placeholder']
+                                            if not isinstance(v35, str):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/placeholder', 'expected string, got ' + _type_name(v35)))
+                                        if 'min' in v26:
+                                            v36 = v26['min']
+                                            if not (type(v36) is int or type(v36) is float):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/min', 'expected number, got ' + _type_name(v36)))
+                                        if 'max' in v26:
+                                            v37 = v26['max']
+                                            if not (type(v37) is int or type(v37) is float):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/max', 'expected number, got ' + _type_name(v37)))
+                                        if 'layout' in v26:
+                                            v38 = v26['layout']
+                                            if not isinstance(v38, str):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/layout', 'expected string, got ' + _type_name(v38)))
+                                        if 'validation' in v26:
+                                            v39 = v26['validation']
+                                            if not isinstance(v39, dict):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/validation', 'expected object, got ' + _type_name(v39)))
+                                            else:
+                                                if 'min_selected' in v39:
+                                                    v40 = v39['min_selected']
+                                                    if not (type(v40) is int or (type(v40) is float and v40.is_integer())):
+                                                        errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/validation/min_selected', 'expected integer, got ' + _type_name(v40)))
+                                                    else:
+                                                        if v40 < 0:
+                                                            errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/validation/min_selected', 'must be at least 0'))
+                                                if 'max_selected' in v39:
+                                                    v41 = v39['max_selected']
+                                                    if not (type(v41) is int or (type(v41) is float and v41.is_integer())):
+                                                        errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/validation/max_selected', 'expected integer, got ' + _type_name(v41)))
+                                                    else:
+                                                        if v41 < 1:
+                                                            errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/validation/max_selected', 'must be at least 1'))
+                                        if 'showWhen' in v26:
+                                            v42 = v26['showWhen']
+                                            if not isinstance(v42, dict):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/showWhen', 'expected object, got ' + _type_name(v42)))
+                                            else:
+                                                if 'field' in v42:
+                                                    v43 = v42['field']
+                                                    if not isinstance(v43, str):
+                                                        errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/showWhen/field', 'expected string, got ' + _type_name(v43)))
+                                                    else:
+                                                        if not v43:
+                                                            errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/showWhen/field', 'must not be empty'))
+                                                else:
+                                                    errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/showWhen', "missing required property 'field'"))
+                                                if 'equals' in v42:
+                                                    v44 = v42['equals']
+                                                    if not (isinstance(v44, str) or (type(v44) is int or type(v44) is float) or (v44 is True or v44 is False)):
+                                                        errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/showWhen/equals', 'expected string or number or boolean, got ' + _type_name(v44)))
+                                                if 'in' in v42:
+                                                    v45 = v42['in']
+                                                    if not isinstance(v45, list):
+                                                        errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/showWhen/in', 'expected array, got ' + _type_name(v45)))
+                                                    else:
+                                                        if len(v45) < 1:
+                                                            errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/showWhen/in', 'must have at least 1 item'))
+                                                if 'includes' in v42:
+                                                    v46 = v42['includes']
+                                                    if not isinstance(v46, str):
+                                                        errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25) + '/showWhen/includes', 'expected string, got ' + _type_name(v46)))
+                                    if (not isinstance(v26, dict) or ('type' in v26 and v26['type'] in _ENUM_5)):
+                                        if isinstance(v26, dict):
+                                            if 'options' not in v26:
+                                                errors.append((path + '/questions/' + _esc(k11) + '/fields/' + str(i25), "missing required property 'options'"))
+                        if 'answer_schema' in v12:
+                            v47 = v12['answer_schema']
+                            if not isinstance(v47, dict):
+                                errors.append((path + '/questions/' + _esc(k11) + '/answer_schema', 'expected object, got ' + _type_name(v47)))
+                        else:
+                            errors.append((path + '/questions/' + _esc(k11), "missing required property 'answer_schema'"))
+                        if 'validation' in v12:
+                            v48 = v12['validation']
+                            if not isinstance(v48, dict):
+                                errors.append((path + '/questions/' + _esc(k11) + '/validation', 'expected object, got ' + _type_name(v48)))
+                            else:
+                                if 'min_selected' in v48:
+                                    v49 = v48['min_selected']
+                                    if not (type(v49) is int or (type(v49) is float and v49.is_integer())):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/validation/min_selected', 'expected integer, got ' + _type_name(v49)))
+                                    else:
+                                        if v49 < 0:
+                                            errors.append((path + '/questions/' + _esc(k11) + '/validation/min_selected', 'must be at least 0'))
+                                if 'max_selected' in v48:
+                                    v50 = v48['max_selected']
+                                    if not (type(v50) is int or (type(v50) is float and v50.is_integer())):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/validation/max_selected', 'expected integer, got ' + _type_name(v50)))
+                                    else:
+                                        if v50 < 1:
+                                            errors.append((path + '/questions/' + _esc(k11) + '/validation/max_selected', 'must be at least 1'))
+                                if 'required_if' in v48:
+                                    v51 = v48['required_if']
+                                    if not isinstance(v51, list):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if', 'expected array, got ' + _type_name(v51)))
+                                    else:
+                                        for i52, v53 in enumerate(v51):
+                                            if not isinstance(v53, dict):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52), 'expected object, got ' + _type_name(v53)))
+                                            else:
+                                                if 'if' in v53:
+                                                    v54 = v53['if']
+                                                    if not isinstance(v54, dict):
+                                                        errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/if', 'expected object, got ' + _type_name(v54)))
+                                                    else:
+                                                        if 'field' in v54:
+                                                            v55 = v54['field']
+                                                            if not isinstance(v55, str):
+                                                                errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/if/field', 'expected string, got ' + _type_name(v55)))
+                                                            else:
+                                                                if not v55:
+                                                                    errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/if/field', 'must not be empty'))
+                                                        else:
+                                                            errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/if', "missing required property 'field'"))
+                                                        if 'equals' in v54:
+                                                            v56 = v54['equals']
+                                                            if not (isinstance(v56, str) or (type(v56) is int or type(v56) is float) or (v56 is True or v56 is False)):
+                                                                errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/if/equals', 'expected string or number or boolean, got ' + _type_name(v56)))
+                                                        if 'in' in v54:
+                                                            v57 = v54['in']
+                                                            if not isinstance(v57, list):
+                                                                errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/if/in', 'expected array, got ' + _type_name(v57)))
+                                                            else:
+                                                                if len(v57) < 1:
+                                                                    errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/if/in', 'must have at least 1 item'))
+                                                        if 'includes' in v54:
+                                                            v58 = v54['includes']
+                                                            if not isinstance(v58, str):
+                                                                errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/if/includes', 'expected string, got ' + _type_name(v58)))
+                                                if 'when' in v53:
+                                                    v59 = v53['when']
+                                                    if not isinstance(v59, dict):
+                                                        errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/when', 'expected object, got ' + _type_name(v59)))
+                                                    else:
+                                                        if len(v59) < 1:
+                                                            errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/when', 'must have at least 1 properties'))
+                                                if 'then_require' in v53:
+                                                    v60 = v53['then_require']
+                                                    if not isinstance(v60, list):
+                                                        errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/then_require', 'expected array, got ' + _type_name(v60)))
+                                                    else:
+                                                        if len(v60) < 1:
+                                                            errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/then_require', 'must have at least 1 item'))
+                                                        for i61, v62 in enumerate(v60):
+                                                            if not isinstance(v62, str):
+                                                                errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52) + '/then_require/' + str(i61), 'expected string, got ' + _type_name(v62)))
+                                                else:
+                                                    errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52), "missing required property 'then_require'"))
+                                            if ((not _questions_branch63(v53, path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52), [])) + (not _questions_branch64(v53, path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52), []))) != 1:
+                                                errors.append((path + '/questions/' + _esc(k11) + '/validation/required_if/' + str(i52), 'must match exactly one oneOf alternative'))
+                        if 'placeholder' in v12:
+                            v65 = v12['placeholder']
+                            if not isinstance(v65, str):
+                                errors.append((path + '/questions/' + _esc(k11) + '/placeholder', 'expected string, got ' + _type_name(v65)))
+                        if 'max' in v12:
+                            v66 = v12['max']
+                            if not (type(v66) is int or (type(v66) is float and v66.is_integer())):
+                                errors.append((path + '/questions/' + _esc(k11) + '/max', 'expected integer, got ' + _type_name(v66)))
+                            else:
+                                if v66 < 1:
+                                    errors.append((path + '/questions/' + _esc(k11) + '/max', 'must be at least 1'))
+                        if 'showWhen' in v12:
+                            v67 = v12['showWhen']
+                            if not isinstance(v67, dict):
+                                errors.append((path + '/questions/' + _esc(k11) + '/showWhen', 'expected object, got ' + _type_name(v67)))
+                            else:
+                                if 'field' in v67:
+                                    v68 = v67['field']
+                                    if not isinstance(v68, str):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/showWhen/field', 'expected string, got ' + _type_name(v68)))
+                                    else:
+                                        if not v68:
+                                            errors.append((path + '/questions/' + _esc(k11) + '/showWhen/field', 'must not be empty'))
+                                else:
+                                    errors.append((path + '/questions/' + _esc(k11) + '/showWhen', "missing required property 'field'"))
+                                if 'equals' in v67:
+                                    v69 = v67['equals']
+                                    if not (isinstance(v69, str) or (type(v69) is int or type(v69) is float) or (v69 is True or v69 is False)):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/showWhen/equals', 'expected string or number or boolean, got ' + _type_name(v69)))
+                                if 'in' in v67:
+                                    v70 = v67['in']
+                                    if not isinstance(v70, list):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/showWhen/in', 'expected array, got ' + _type_name(v70)))
+                                    else:
+                                        if len(v70) < 1:
+                                            errors.append((path + '/questions/' + _esc(k11) + '/showWhen/in', 'must have at least 1 item'))
+                                if 'includes' in v67:
+                                    v71 = v67['includes']
+                                    if not isinstance(v71, str):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/showWhen/includes', 'expected string, got ' + _type_name(v71)))
+                        if 'examples' in v12:
+                            v72 = v12['examples']
+                            if not isinstance(v72, list):
+                                errors.append((path + '/questions/' + _esc(k11) + '/examples', 'expected array, got ' + _type_name(v72)))
+                            else:
+                                for i73, v74 in enumerate(v72):
+                                    if not isinstance(v74, str):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/examples/' + str(i73), 'expected string, got ' + _type_name(v74)))
+                        else:
+                            errors.append((path + '/questions/' + _esc(k11), "missing required property 'examples'"))
+                        if 'tags' in v12:
+                            v75 = v12['tags']
+                            if not isinstance(v75, dict):
+                                errors.append((path + '/questions/' + _esc(k11) + '/tags', 'expected object, got ' + _type_name(v75)))
+                            else:
+                                if 'included_in_manifests' in v75:
+                                    v76 = v75['included_in_manifests']
+                                    if not isinstance(v76, list):
+                                        errors.append((path + '/questions/' + _esc(k11) + '/tags/included_in_manifests', 'expected array, got ' + _type_name(v76)))
+                                    else:
+                                        if len(v76) < 1:
+                                            errors.append((path + '/questions/' + _esc(k11) + '/tags/included_in_manifests', 'must have at least 1 item'))
+                                        if not _unique(v76):
+                                            errors.append((path + '/questions/' + _esc(k11) + '/tags/included_in_manifests', 'items must be unique'))
+                                        for i77, v78 in enumerate(v76):
+                                            if not isinstance(v78, str):
+                                                errors.append((path + '/questions/' + _esc(k11) + '/tags/included_in_manifests/' + str(i77), 'expected string, got ' + _type_name(v78)))
+                                else:
+                                    errors.append((path + '/questions/' + _esc(k11) + '/tags', "missing required property 'included_in_manifests'"))
+                        else:
+                            errors.append((path + '/questions/' + _esc(k11), "missing required property 'tags'"))
+                    if (not isinstance(v12, dict) or ('type' in v12 and v12['type'] == 'free_text')):
+                        if isinstance(v12, dict):
+                            if 'answer_schema' in v12:
+                                v79 = v12['answer_schema']
+                                if isinstance(v79, dict):
+                                    if 'text' not in v79:
+                                        errors.append((path + '/questions/' + _esc(k11) + '/answer_schema', "missing required property 'text'"))
+                    if (not isinstance(v12, dict) or ('type' in v12 and v12['type'] == 'single_select')):
+                        if isinstance(v12, dict):
+                            if 'options' not in v12:
+                                errors.append((path + '/questions/' + _esc(k11), "missing required property 'options'"))
+                            if 'answer_schema' in v12:
+                                v80 = v12['answer_schema']
+                                if isinstance(v80, dict):
+                                    if 'selected_value' not in v80:
+                                        errors.append((path + '/questions/' + _esc(k11) + '/answer_schema', "missing required property 'selected_value'"))
+                    if (not isinstance(v12, dict) or ('type' in v12 and v12['type'] == 'multi_select')):
+                        if isinstance(v12, dict):
+                            if 'options' not in v12:
+                                errors.append((path + '/questions/' + _esc(k11), "missing required property 'options'"))
+                            if 'answer_schema' in v12:
+                                v81 = v12['answer_schema']
+                                if isinstance(v81, dict):
+                                    if 'selected_values' not in v81:
+                                        errors.append((path + '/questions/' + _esc(k11) + '/answer_schema', "missing required property 'selected_values'"))
+                    if (not isinstance(v12, dict) or ('type' in v12 and v12['type'] == 'ranked_select')):
+                        if isinstance(v12, dict):
+                            if 'options' not in v12:
+                                errors.append((path + '/questions/' + _esc(k11), "missing required property 'options'"))
+                            if 'answer_schema' in v12:
+                                v82 = v12['answer_schema']
+                                if isinstance(v82, dict):
+                                    if 'ranked_values' not in v82:
+                                        errors.append((path + '/questions/' + _esc(k11) + '/answer_schema', "missing required property 'ranked_values'"))
+                    if (not isinstance(v12, dict) or ('type' in v12 and v12['type'] == 'compound')):
+                        if isinstance(v12, dict):
+                            if 'fields' not in v12:
+                                errors.append((path + '/questions/' + _esc(k11), "missing required property 'fields'"))
+        else:
+            errors.append((path, "missing required property 'questions'"))
+        if 'ui_hints' in data:
+            v83 = data['ui_hints']
+            if not isinstance(v83, dict):
+                errors.append((path + '/ui_hints', 'expected object, got ' + _type_name(v83)))
+        if 'manifests' in data:
+            v84 = data['manifests']
+            if not isinstance(v84, dict):
+                errors.append((path + '/manifests', 'expected object, got ' + _type_name(v84)))
+            else:
+                if len(v84) < 1:
+                    errors.append((path + '/manifests', 'must have at least 1 properties'))
+                for k85, v86 in v84.items():
+                    if not isinstance(v86, dict):
+                        errors.append((path + '/manifests/' + _esc(k85), 'expected object, got ' + _type_name(v86)))
+                    else:
+                        if 'id' in v86:
+                            v87 = v86['id']
+                            if not isinstance(v87, str):
+                                errors.append((path + '/manifests/' + _esc(k85) + '/id', 'expected string, got ' + _type_name(v87)))
+                        if 'title' in v86:
+                            v88 = v86['title']
+                            if not isinstance(v88, str):
+                                errors.append((path + '/manifests/' + _esc(k85) + '/title', 'expected string, got ' + _type_name(v88)))
+                            else:
+                                if not v88:
+                                    errors.append((path + '/manifests/' + _esc(k85) + '/title', 'must not be empty'))
+                        else:
+                            errors.append((path + '/manifests/' + _esc(k85), "missing required property 'title'"))
+                        if 'description' in v86:
+                            v89 = v86['description']
+                            if not isinstance(v89, str):
+                                errors.append((path + '/manifests/' + _esc(k85) + '/description', 'expected string, got ' + _type_name(v89)))
+                        if 'question_ids' in v86:
+                            v90 = v86['question_ids']
+                            if not isinstance(v90, list):
+                                errors.append((path + '/manifests/' + _esc(k85) + '/question_ids', 'expected array, got ' + _type_name(v90)))
+                            else:
+                                if not _unique(v90):
+                                    errors.append((path + '/manifests/' + _esc(k85) + '/question_ids', 'items must be unique'))
+                                for i91, v92 in enumerate(v90):
+                                    if not isinstance(v92, str):
+                                        errors.append((path + '/manifests/' + _esc(k85) + '/question_ids/' + str(i91), 'expected string, got ' + _type_name(v92)))
+                                    else:
+                                        if _RE_1.search(v92) is None:
+                                            errors.append((path + '/manifests/' + _esc(k85) + '/question_ids/' + str(i91), 'does not match ^q[0-9]+[a-z]?$'))
+                        else:
+                            errors.append((path + '/manifests/' + _esc(k85), "missing required property 'question_ids'"))
+                        if 'timebox_minutes' in v86:
+                            v93 = v86['timebox_minutes']
+                            if not ((type(v93) is int or (type(v93) is float and v93.is_integer())) or v93 is None):
+                                errors.append((path + '/manifests/' + _esc(k85) + '/timebox_minutes', 'expected integer or null, got ' + _type_name(v93)))
+                            if (type(v93) is int or type(v93) is float):
+                                if v93 < 0:
+                                    errors.append((path + '/manifests/' + _esc(k85) + '/timebox_minutes', 'must be at least 0'))
+                        if 'post_timebox_activity' in v86:
+                            v94 = v86['post_timebox_activity']
+                            if not isinstance(v94, str):
+                                errors.append((path + '/manifests/' + _esc(k85) + '/post_timebox_activity', 'expected string, got ' + _type_name(v94)))
+        else:
+            errors.append((path, "missing required property 'manifests'"))
+        if 'primary_manifest_id' in data:
+            v95 = data['primary_manifest_id']
+            if not isinstance(v95, str):
+                errors.append((path + '/primary_manifest_id', 'expected string, got ' + _type_name(v95)))
+            else:
+                if not v95:
+                    errors.append((path + '/primary_manifest_id', 'must not be empty'))
+        else:
+            errors.append((path, "missing required property 'primary_manifest_id'"))
+    return errors
+
+
+def _questions_branch63(data, path, errors):
+    if isinstance(data, dict):
+        if 'if' not in data:
+            errors.append((path, "missing required property 'if'"))
+    return errors
+
+
+def _questions_branch64(data, path, errors):
+    if isinstance(data, dict):
+        if 'when' not in data:
+            errors.append((path, "missing required property 'when'"))
+    return errors
+
+
+def validate_questions(data):
+    """Validate a parsed questions document; returns [(json_pointer, message), ...]."""
+    return _questions_root(data, '', [])
+
+
+def _manifest_root(data, path, errors):
+    if not isinstance(data, dict):
+        errors.append((path, 'expected object, got ' + _type_name(data)))
+    else:
+        if 'schema_version' in data:
+            v96 = data['schema_version']
+            if not isinstance(v96, str):
+                errors.append((path + '/schema_version', 'expected string, got ' + _type_name(v96)))
+            else:
+                if _RE_6.search(v96) is None:
+                    errors.append((path + '/schema_version', 'does not match ^[0-9]+\\.[0-9]+\\.[0-9]+$'))
+        else:
+            errors.append((path, "missing required property 'schema_version'"))
+        if 'display' in data:
+            v97 = data['display']
+            if not isinstance(v97, dict):
+                errors.append((path + '/display', 'expected object, got ' + _type_name(v97)))
+            else:
+                if 'id' in v97:
+                    v98 = v97['id']
+                    if not isinstance(v98, str):
+                        errors.append((path + '/display/id', 'expected string, got ' + _type_name(v98)))
+                    else:
+                        if not v98:
+                            errors.append((path + '/display/id', 'must not be empty'))
+                else:
+                    errors.append((path + '/display', "missing required property 'id'"))
+                if 'title' in v97:
+                    v99 = v97['title']
+                    if not isinstance(v99, str):
+                        errors.append((path + '/display/title', 'expected string, got ' + _type_name(v99)))
+                    else:
+                        if not v99:
+                            errors.append((path + '/display/title', 'must not be empty'))
+                else:
+                    errors.append((path + '/display', "missing required property 'title'"))
+                if 'short_title' in v97:
+                    v100 = v97['short_title']
+                    if not isinstance(v100, str):
+                        errors.append((path + '/display/short_title', 'expected string, got ' + _type_name(v100)))
+                    else:
+                        if not v100:
+                            errors.append((path + '/display/short_title', 'must not be empty'))
+                else:
+                    errors.append((path + '/display', "missing required property 'short_title'"))
+                if 'description' in v97:
+                    v101 = v97['description']
+                    if not isinstance(v101, str):
+                        errors.append((path + '/display/description', 'expected string, got ' + _type_name(v101)))
+                else:
+                    errors.append((path + '/display', "missing required property 'description'"))
+                if 'icon' in v97:
+                    v102 = v97['icon']
+                    if not isinstance(v102, str):
+                        errors.append((path + '/display/icon', 'expected string, got ' + _type_name(v102)))
+                else:
+                    errors.append((path + '/display', "missing required property 'icon'"))
+                if 'menu_icon' in v97:
+                    v103 = v97['menu_icon']
+                    if not isinstance(v103, str):
+                        errors.append((path + '/display/menu_icon', 'expected string, got ' + _type_name(v103)))
+                else:
+                    errors.append((path + '/display', "missing required property 'menu_icon'"))
+                if 'order' in v97:
+                    v104 = v97['order']
+                    if not (type(v104) is int or (type(v104) is float and v104.is_integer())):
+                        errors.append((path + '/display/order', 'expected integer, got ' + _type_name(v104)))
+                else:
+                    errors.append((path + '/display', "missing required property 'order'"))
+        else:
+            errors.append((path, "missing required property 'display'"))
+        if 'artifact' in data:
+            v105 = data['artifact']
+            if not isinstance(v105, dict):
+                errors.append((path + '/artifact', 'expected object, got ' + _type_name(v105)))
+            else:
+                if 'id' in v105:
+                    v106 = v105['id']
+                    if not isinstance(v106, str):
+                        errors.append((path + '/artifact/id', 'expected string, got ' + _type_name(v106)))
+                    else:
+                        if not v106:
+                            errors.append((path + '/artifact/id', 'must not be empty'))
+                else:
+                    errors.append((path + '/artifact', "missing required property 'id'"))
+                if 'title' in v105:
+                    v107 = v105['title']
+                    if not isinstance(v107, str):
+                        errors.append((path + '/artifact/title', 'expected string, got ' + _type_name(v107)))
+                    else:
+                        if not v107:
+                            errors.append((path + '/artifact/title', 'must not be empty'))
+                else:
+                    errors.append((path + '/artifact', "missing required property 'title'"))
+                if 'subtitle' in v105:
+                    v108 = v105['subtitle']
+                    if not isinstance(v108, str):
+                        errors.append((path + '/artifact/subtitle', 'expected string, got ' + _type_name(v108)))
+                else:
+                    errors.append((path + '/artifact', "missing required property 'subtitle'"))
+                if 'language' in v105:
+                    v109 = v105['language']
+                    if not isinstance(v109, str):
+                        errors.append((path + '/artifact/language', 'expected string, got ' + _type_name(v109)))
+                    else:
+                        if _RE_7.search(v109) is None:
+                            errors.append((path + '/artifact/language', 'does not match ^[a-z]{2}(-[A-Z]{2})?$'))
+                else:
+                    errors.append((path + '/artifact', "missing required property 'language'"))
+                if 'stage' in v105:
+                    v110 = v105['stage']
+                    if not isinstance(v110, dict):
+                        errors.append((path + '/artifact/stage', 'expected object, got ' + _type_name(v110)))
+                    else:
+                        if 'code' in v110:
+                            v111 = v110['code']
+                            if not isinstance(v111, str):
+                                errors.append((path + '/artifact/stage/code', 'expected string, got ' + _type_name(v111)))
+                            else:
+                                if not v111:
+                                    errors.append((path + '/artifact/stage/code', 'must not be empty'))
+                        else:
+                            errors.append((path + '/artifact/stage', "missing required property 'code'"))
+                        if 'label' in v110:
+                            v112 = v110['label']
+                            if not isinstance(v112, str):
+                                errors.append((path + '/artifact/stage/label', 'expected string, got ' + _type_name(v112)))
+                            else:
+                                if not v112:
+                                    errors.append((path + '/artifact/stage/label', 'must not be empty'))
+                        else:
+                            errors.append((path + '/artifact/stage', "missing required property 'label'"))
+                        if 'eligibility' in v110:
+                            v113 = v110['eligibility']
+                            if not isinstance(v113, list):
+                                errors.append((path + '/artifact/stage/eligibility', 'expected array, got ' + _type_name(v113)))
+                            else:
+                                for i114, v115 in enumerate(v113):
+                                    if not isinstance(v115, str):
+                                        errors.append((path + '/artifact/stage/eligibility/' + str(i114), 'expected string, got ' + _type_name(v115)))
+                        else:
+                            errors.append((path + '/artifact/stage', "missing required property 'eligibility'"))
+                else:
+                    errors.append((path + '/artifact', "missing required property 'stage'"))
+                if 'purpose' in v105:
+                    v116 = v105['purpose']
+                    if not isinstance(v116, list):
+                        errors.append((path + '/artifact/purpose', 'expected array, got ' + _type_name(v116)))
+                    else:
+                        for i117, v118 in enumerate(v116):
+                            if not isinstance(v118, str):
+                                errors.append((path + '/artifact/purpose/' + str(i117), 'expected string, got ' + _type_name(v118)))
+                else:
+                    errors.append((path + '/artifact', "missing required property 'purpose'"))
+        else:
+            errors.append((path, "missing required property 'artifact'"))
+        if 'intro' in data:
+            v119 = data['intro']
+            if not isinstance(v119, dict):
+                errors.append((path + '/intro', 'expected object, got ' + _type_name(v119)))
+            else:
+                if 'instructions' in v119:
+                    v120 = v119['instructions']
+                    if not isinstance(v120, dict):
+                        errors.append((path + '/intro/instructions', 'expected object, got ' + _type_name(v120)))
+                    else:
+                        if 'title' in v120:
+                            v121 = v120['title']
+                            if not isinstance(v121, str):
+                                errors.append((path + '/intro/instructions/title', 'expected string, got ' + _type_name(v121)))
+                        if 'items' in v120:
+                            v122 = v120['items']
+                            if not isinstance(v122, list):
+                                errors.append((path + '/intro/instructions/items', 'expected array, got ' + _type_name(v122)))
+                            else:
+                                for i123, v124 in enumerate(v122):
+                                    if not isinstance(v124, str):
+                                        errors.append((path + '/intro/instructions/items/' + str(i123), 'expected string, got ' + _type_name(v124)))
+                        else:
+                            errors.append((path + '/intro/instructions', "missing required property 'items'"))
+                else:
+                    errors.append((path + '/intro', "missing required property 'instructions'"))
+                if 'keep_in_mind' in v119:
+                    v125 = v119['keep_in_mind']
+                    if not isinstance(v125, dict):
+                        errors.append((path + '/intro/keep_in_mind', 'expected object, got ' + _type_name(v125)))
+                    else:
+                        if 'title' in v125:
+                            v126 = v125['title']
+                            if not isinstance(v126, str):
+                                errors.append((path + '/intro/keep_in_mind/title', 'expected string, got ' + _type_name(v126)))
+                        if 'items' in v125:
+                            v127 = v125['items']
+                            if not isinstance(v127, list):
+                                errors.append((path + '/intro/keep_in_mind/items', 'expected array, got ' + _type_name(v127)))
+                            else:
+                                for i128, v129 in enumerate(v127):
+                                    if not isinstance(v129, str):
+                                        errors.append((path + '/intro/keep_in_mind/items/' + str(i128), 'expected string, got ' + _type_name(v129)))
+                        else:
+                            errors.append((path + '/intro/keep_in_mind', "missing required property 'items'"))
+                else:
+                    errors.append((path + '/intro', "missing required property 'keep_in_mind'"))
+        else:
+            errors.append((path, "missing required property 'intro'"))
+        if 'prompts_artifact' in data:
+            v130 = data['prompts_artifact']
+            if not isinstance(v130, dict):
+                errors.append((path + '/prompts_artifact', 'expected object, got ' + _type_name(v130)))
+            else:
+                if 'id' in v130:
+                    v131 = v130['id']
+                    if not isinstance(v131, str):
+                        errors.append((path + '/prompts_artifact/id', 'expected string, got ' + _type_name(v131)))
+                    else:
+                        if not v131:
+                            errors.append((path + '/prompts_artifact/id', 'must not be empty'))
+                else:
+                    errors.append((path + '/prompts_artifact', "missing required property 'id'"))
+                if 'title' in v130:
+                    v132 = v130['title']
+                    if not isinstance(v132, str):
+                        errors.append((path + '/prompts_artifact/title', 'expected string, got ' + _type_name(v132)))
+                    else:
+                        if not v132:
+                            errors.append((path + '/prompts_artifact/title', 'must not be empty'))
+                else:
+                    errors.append((path + '/prompts_artifact', "missing required property 'title'"))
+                if 'language' in v130:
+                    v133 = v130['language']
+                    if not isinstance(v133, str):
+                        errors.append((path + '/prompts_artifact/language', 'expected string, got ' + _type_name(v133)))
+                    else:
+                        if _RE_7.search(v133) is None:
+                            errors.append((path + '/prompts_artifact/language', 'does not match ^[a-z]{2}(-[A-Z]{2})?$'))
+                else:
+                    errors.append((path + '/prompts_artifact', "missing required property 'language'"))
+                if 'applies_to' in v130:
+                    v134 = v130['applies_to']
+                    if not isinstance(v134, str):
+                        errors.append((path + '/prompts_artifact/applies_to', 'expected string, got ' + _type_name(v134)))
+                    else:
+                        if not v134:
+                            errors.append((path + '/prompts_artifact/applies_to', 'must not be empty'))
+                else:
+                    errors.append((path + '/prompts_artifact', "missing required property 'applies_to'"))
+        else:
+            errors.append((path, "missing required property 'prompts_artifact'"))
+        if 'privacy_preface' in data:
+            v135 = data['privacy_preface']
+            if not isinstance(v135, dict):
+                errors.append((path + '/privacy_preface', 'expected object, got ' + _type_name(v135)))
+            else:
+                if 'title' in v135:
+                    v136 = v135['title']
+                    if not isinstance(v136, str):
+                        errors.append((path + '/privacy_preface/title', 'expected string, got ' + _type_name(v136)))
+                if 'text' in v135:
+                    v137 = v135['text']
+                    if not isinstance(v137, str):
+                        errors.append((path + '/privacy_preface/text', 'expected string, got ' + _type_name(v137)))
+                    else:
+                        if not v137:
+                            errors.append((path + '/privacy_preface/text', 'must not be empty'))
+                else:
+                    errors.append((path + '/privacy_preface', "missing required property 'text'"))
+        else:
+            errors.append((path, "missing required property 'privacy_preface'"))
+    return errors
+
+
+def validate_manifest(data):
+    """Validate a parsed manifest document; returns [(json_pointer, message), ...]."""
+    return _manifest_root(data, '', [])
+
+
+def _prompts_root(data, path, errors):
+    if not isinstance(data, dict):
+        errors.append((path, 'expected object, got ' + _type_name(data)))
+    else:
+        if 'prompts' in data:
+            v138 = data['prompts']
+            if not isinstance(v138, dict):
+                errors.append((path + '/prompts', 'expected object, got ' + _type_name(v138)))
+            else:
+                if 'individual_reflection_lite' not in v138:
+                    errors.append((path + '/prompts', "missing required property 'individual_reflection_lite'"))
+                if 'individual_reflection_full' not in v138:
+                    errors.append((path + '/prompts', "missing required property 'individual_reflection_full'"))
+                if 'couple_reflection_lite' not in v138:
+                    errors.append((path + '/prompts', "missing required property 'couple_reflection_lite'"))
+                if 'couple_reflection_full' not in v138:
+                    errors.append((path + '/prompts', "missing required property 'couple_reflection_full'"))
+                for k139, v140 in v138.items():
+                    if not isinstance(v140, dict):
+                        errors.append((path + '/prompts/' + _esc(k139), 'expected object, got ' + _type_name(v140)))
+                    else:
+                        if 'id' in v140:
+                            v141 = v140['id']
+                            if not isinstance(v141, str):
+                                errors.append((path + '/prompts/' + _esc(k139) + '/id', 'expected string, got ' + _type_name(v141)))
+                            else:
+                                if not v141:
+                                    errors.append((path + '/prompts/' + _esc(k139) + '/id', 'must not be empty'))
+                        else:
+                            errors.append((path + '/prompts/' + _esc(k139), "missing required property 'id'"))
+                        if 'title' in v140:
+                            v142 = v140['title']
+                            if not isinstance(v142, str):
+                                errors.append((path + '/prompts/' + _esc(k139) + '/title', 'expected string, got ' + _type_name(v142)))
+                            else:
+                                if not v142:
+                                    errors.append((path + '/prompts/' + _esc(k139) + '/title', 'must not be empty'))
+                        else:
+                            errors.append((path + '/prompts/' + _esc(k139), "missing required property 'title'"))
+                        if 'description' in v140:
+                            v143 = v140['description']
+                            if not isinstance(v143, str):
+                                errors.append((path + '/prompts/' + _esc(k139) + '/description', 'expected string, got ' + _type_name(v143)))
+                        else:
+                            errors.append((path + '/prompts/' + _esc(k139), "missing required property 'description'"))
+                        if 'role' in v140:
+                            v144 = v140['role']
+                            if not isinstance(v144, str):
+                                errors.append((path + '/prompts/' + _esc(k139) + '/role', 'expected string, got ' + _type_name(v144)))
+                            else:
+                                if not v144:
+                                    errors.append((path + '/prompts/' + _esc(k139) + '/role', 'must not be empty'))
+                        else:
+                            errors.append((path + '/prompts/' + _esc(k139), "missing required property 'role'"))
+                        if 'inputs' in v140:
+                            v145 = v140['inputs']
+                            if not isinstance(v145, list):
+                                errors.append((path + '/prompts/' + _esc(k139) + '/inputs', 'expected array, got ' + _type_name(v145)))
+                            else:
+                                for i146, v147 in enumerate(v145):
+                                    if not isinstance(v147, dict):
+                                        errors.append((path + '/prompts/' + _esc(k139) + '/inputs/' + str(i146), 'expected object, got ' + _type_name(v147)))
+                                    else:
+                                        if 'key' in v147:
+                                            v148 = v147['key']
+                                            if not isinstance(v148, str):
+                                                errors.append((path + '/prompts/' + _esc(k139) + '/inputs/' + str(i146) + '/key', 'expected string, got ' + _type_name(v148)))
+                                            else:
+                                                if not v148:
+                                                    errors.append((path + '/prompts/' + _esc(k139) + '/inputs/' + str(i146) + '/key', 'must not be empty'))
+                                        else:
+                                            errors.append((path + '/prompts/' + _esc(k139) + '/inputs/' + str(i146), "missing required property 'key'"))
+                                        if 'label' in v147:
+                                            v149 = v147['label']
+                                            if not isinstance(v149, str):
+                                                errors.append((path + '/prompts/' + _esc(k139) + '/inputs/' + str(i146) + '/label', 'expected string, got ' + _type_name(v149)))
+                                        else:
+                                            errors.append((path + '/prompts/' + _esc(k139) + '/inputs/' + str(i146), "missing required property 'label'"))
+                                        if 'placeholder' in v147:
+                                            v150 = v147['placeholder']
+                                            if not isinstance(v150, str):
+                                                errors.append((path + '/prompts/' + _esc(k139) + '/inputs/' + str(i146) + '/placeholder', 'expected string, got ' + _type_name(v150)))
+                                        else:
+                                            errors.append((path + '/prompts/' + _esc(k139) + '/inputs/' + str(i146), "missing required property 'placeholder'"))
+                        else:
+                            errors.append((path + '/prompts/' + _esc(k139), "missing required property 'inputs'"))
+                        if 'context' in v140:
+                            v151 = v140['context']
+                            if not isinstance(v151, list):
+                                errors.append((path + '/prompts/' + _esc(k139) + '/context', 'expected array, got ' + _type_name(v151)))
+                            else:
+                                for i152, v153 in enumerate(v151):
+                                    if not isinstance(v153, str):
+                                        errors.append((path + '/prompts/' + _esc(k139) + '/context/' + str(i152), 'expected string, got ' + _type_name(v153)))
+                        else:
+                            errors.append((path + '/prompts/' + _esc(k139), "missing required property 'context'"))
+                        if 'output_format' in v140:
+                            v154 = v140['output_format']
+                            if not isinstance(v154, list):
+                                errors.append((path + '/prompts/' + _esc(k139) + '/output_format', 'expected array, got ' + _type_name(v154)))
+                            else:
+                                if len(v154) < 1:
+                                    errors.append((path + '/prompts/' + _esc(k139) + '/output_format', 'must have at least 1 item'))
+                                for i155, v156 in enumerate(v154):
+                                    if not isinstance(v156, dict):
+                                        errors.append((path + '/prompts/' + _esc(k139) + '/output_format/' + str(i155), 'expected object, got ' + _type_name(v156)))
+                                    else:
+                                        if 'section' in v156:
+                                            v157 = v156['section']
+                                            if not isinstance(v157, str):
+                                                errors.append((path + '/prompts/' + _esc(k139) + '/output_format/' + str(i155) + '/section', 'expected string, got ' + _type_name(v157)))
+                                            else:
+                                                if not v157:
+                                                    errors.append((path + '/prompts/' + _esc(k139) + '/output_format/' + str(i155) + '/section', 'must not be empty'))
+                                        else:
+                                            errors.append((path + '/prompts/' + _esc(k139) + '/output_format/' + str(i155), "missing required property 'section'"))
+                                        if 'requirements' in v156:
+                                            v158 = v156['requirements']
+                                            if not isinstance(v158, list):
+                                                errors.append((path + '/prompts/' + _esc(k139) + '/output_format/' + str(i155) + '/requirements', 'expected array, got ' + _type_name(v158)))
+                                            else:
+                                                for i159, v160 in enumerate(v158):
+                                                    if not isinstance(v160, str):
+                                                        errors.append((path + '/prompts/' + _esc(k139) + '/output_format/' + str(i155) + '/requirements/' + str(i159), 'expected string, got ' + _type_name(v160)))
+                                        else:
+                                            errors.append((path + '/prompts/' + _esc(k139) + '/output_format/' + str(i155), "missing required property 'requirements'"))
+                        else:
+                            errors.append((path + '/prompts/' + _esc(k139), "missing required property 'output_format'"))
+                        if 'constraints' in v140:
+                            v161 = v140['constraints']
+                            if not isinstance(v161, list):
+                                errors.append((path + '/prompts/' + _esc(k139) + '/constraints', 'expected array, got ' + _type_name(v161)))
+                            else:
+                                for i162, v163 in enumerate(v161):
+                                    if not isinstance(v163, str):
+                                        errors.append((path + '/prompts/' + _esc(k139) + '/constraints/' + str(i162), 'expected string, got ' + _type_name(v163)))
+                        else:
+                            errors.append((path + '/prompts/' + _esc(k139), "missing required property 'constraints'"))
+        else:
+            errors.append((path, "missing required property 'prompts'"))
+    return errors
+
+
+def validate_prompts(data):
+    """Validate a parsed prompts document; returns [(json_pointer, message), ...]."""
+    return _prompts_root(data, '', [])
+
+
+VALIDATORS = {
+    'questions': validate_questions,
+    'manifest': validate_manifest,
+    'prompts': validate_prompts,
+}
@@ -0,0 +1,841 @@
+# ./scripts/search_index.py
+"""
+Search Index - Persistent Inverted Full-Text Index for question_search.py
+=========================================================================
+
+Tokenizes every question's title, prompt, option labels, compound field
+labels and examples into a per-phase inverted index (token -> questions and
+positions), plus the small per-question record that search results and
+filters need. question_search.py answers queries from these files without
+parsing questions.json.
+
+Usage:
+    from search_index import SearchIndex
+
+    index = SearchIndex(corpus)
+    records = index.records('phase_0')                      # every question
+    records = index.records('phase_0', 'pac* "hard topic"')  # query matches
+    scores = index.rank(['phase_0', 'phase_1'], 'money habits')  # {(phase, doc): BM25}
+
+    python scripts/search_index.py build [--phase PHASE]
+    python scripts/search_index.py stats [--phase PHASE]
+    python scripts/search_index.py clear
+    python scripts/search_index.py benchmark [--copies 10] [--repeat 20]
+
+Query Syntax (all clauses must match, case-insensitive):
+    word: A whole word (token), e.g. pacing
+    word*: Any word starting with the prefix, e.g. pac* (pace, pacing, ...)
+    "two words": An exact phrase within one title/prompt/label/example
+
+CLI Arguments:
+    build: Build or refresh the index (only phases whose file changed)
+    stats: Questions, distinct tokens and index size per phase
+    clear: Delete every index file
+    benchmark: Index the phases with every question repeated N times (temp dir) and time queries
+    --phase: Optional. Limit build/stats to one phase. Default: all phases
+    --copies: Optional. Copies of each question for benchmark. Default: 10
+    --repeat: Optional. Runs per benchmark query (best is reported). Default: 20
+
+Inputs:
+    - data/{phase}/questions.json
+
+Outputs:
+    - .cache/search/{phase}-{dirhash}.index (one file per phase)
+    - Benchmark table and exit code: 0 (every query within 10 ms), 1 (over)
+
+Operational Notes:
+    - Each file records the (mtime_ns, size) of the questions.json it was
+      built from; a phase is re-tokenized only when its file changed, so an
+      edit to one phase never rebuilds the others
+    - Tokens are lowercase runs of letters/digits ("don't" -> don, t), so
+      queries are tokenized the same way
+    - Positions are field * FIELD_STRIDE + offset, with a one-position gap
+      between separate labels/examples, so phrases never span two of them
+    - rank() is BM25F: term counts and question lengths are weighted per field
+      (title 3, prompt 2, options/field labels 1, examples 0.5) before the
+      usual BM25 saturation (k1 1.2, b 0.75); a prefix word counts every
+      token it expands to as one term
+    - Postings are packed uint32 sections viewed in place through a
+      read-only mmap, and records are decoded one by one, so a query only
+      pages in what it touches (cold queries stay in single-digit ms over
+      thousands of questions; see benchmark)
+    - Index files are a local cache (native byte order); unreadable, stale
+      or truncated files are simply rebuilt, and write errors are ignored
+    - The header stores a digest of this script's source next to
+      INDEX_FORMAT, so an index written by an older tokenizer or layout is
+      rebuilt even when the format number was not bumped
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import os
+import re
+import math
+import sys
+import zlib
+import time
+import hashlib
+import json
+import mmap
+import marshal
+import argparse
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from phase_corpus import PROJECT_ROOT, PhaseCorpus
+
+
+INDEX_FORMAT = 3
+INDEX_MAGIC = b"RFUSRCH\0"
+DEFAULT_INDEX_DIR = PROJECT_ROOT / ".cache" / "search"
+
+# Indexed text, in position order: a token at offset i of field f sits at
+# position f * FIELD_STRIDE + i
+FIELDS = ('title', 'prompt', 'options', 'fields', 'examples')
+FIELD_STRIDE = 1 << 20
+
+# --rank: BM25F, i.e. BM25 over field-weighted term counts and lengths
+FIELD_WEIGHTS = (3.0, 2.0, 1.0, 1.0, 0.5)
+BM25_K1 = 1.2
+BM25_B = 0.75
+SNIPPET_CHARS = 120
+
+# benchmark: every query, index load included, must answer within this
+QUERY_BUDGET_MS = 10.0
+
+# Stored record layout (tuples, so key names are not repeated per question)
+RECORD_KEYS = ('id', 'title', 'type', 'section', 'prompt', 'manifests', 'text', 'missing', 'has')
+
+# Indexed facets: a question is posted under '{field}:{value}' for each of these
+FACET_FIELDS = ('type', 'section', 'manifest', 'missing', 'has')
+
+_TOKEN = re.compile(r'[^\W_]+')
+_QUERY_PART = re.compile(r'"([^"]*)"|(\S+)')
+
+Clause = Tuple[List[str], bool]
+
+_source_digest: Optional[str] = None
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase letter/digit runs of a string."""
+    return _TOKEN.findall(text.lower())
+
+
+def parse_query(query: str) -> List[Clause]:
+    """
+    Split a query into (tokens, last_token_is_prefix) clauses.
+
+    A bare word with punctuation inside ("self-care") becomes a phrase of
+    its tokens. Raises ValueError if nothing searchable is left.
+    """
+    clauses = []
+    for phrase, word in _QUERY_PART.findall(query):
+        tokens = tokenize(phrase or word)
+        if tokens:
+            clauses.append((tokens, word.endswith('*')))
+    if not clauses:
+        raise ValueError(f"Query has no searchable words: {query!r}")
+    return clauses
+
+
+def query_terms(query: str) -> List[Tuple[str, bool]]:
+    """Distinct (token, is_prefix) words of a query; quotes only group words when ranking."""
+    terms: List[Tuple[str, bool]] = []
+    for tokens, prefix in parse_query(query):
+        for i, token in enumerate(tokens):
+            term = (token, prefix and i == len(tokens) - 1)
+            if term not in terms:
+                terms.append(term)
+    return terms
+
+
+def manifest_membership(qid: str, lite_ids: Set[str], full_ids: Set[str]) -> str:
+    """'lite,full', 'lite', 'full' or 'none'."""
+    in_lite = qid in lite_ids
+    in_full = qid in full_ids
+    if in_lite and in_full:
+        return "lite,full"
+    elif in_lite:
+        return "lite"
+    elif in_full:
+        return "full"
+    return "none"
+
+
+def question_record(qid: str, q: Dict, lite_ids: Set[str], full_ids: Set[str]) -> Dict[str, Any]:
+    """
+    The fields question_search filters and prints for one question.
+
+    'text' is the lowercase title/prompt/option-label string --text
+    substring-matches against; 'missing' lists the --missing values the
+    question matches; 'has' lists its top-level keys with a non-empty value
+    plus its validation rules as 'validation.{rule}' (e.g. validation.max_selected).
+    """
+    title = q.get('title', '')
+    prompt = q.get('prompt', '')
+    options_text = ""
+    if 'options' in q:
+        options_text = " ".join([opt.get('label', '').lower() for opt in q['options']])
+
+    missing = []
+    if not (q.get('examples') and len(q['examples']) > 0):
+        missing.append('examples')
+    if not q.get('validation'):
+        missing.append('validation')
+    # Only select types can have options missing; others always pass this filter
+    if q.get('type') not in ['single_select', 'multi_select'] or not (q.get('options') and len(q['options']) > 0):
+        missing.append('options')
+
+    return {
+        'id': qid,
+        'title': title,
+        'type': q.get('type', ''),
+        'section': q.get('section_id', ''),
+        'prompt': prompt,
+        'manifests': manifest_membership(qid, lite_ids, full_ids),
+        'text': f"{title.lower()} {prompt.lower()} {options_text}",
+        'missing': missing,
+        'has': sorted([key for key, value in q.items() if value not in (None, "", [], {})]
+                      + [f"validation.{rule}" for rule in (q.get('validation') or {})]),
+    }
+
+
+def facet_terms(record: Dict[str, Any]) -> List[str]:
+    """The '{field}:{value}' facets (see FACET_FIELDS) a question record is posted under."""
+    terms = [f"type:{record['type']}", f"section:{record['section']}"]
+    terms.extend(f"manifest:{name}" for name in record['manifests'].split(','))
+    terms.extend(f"missing:{name}" for name in record['missing'])
+    terms.extend(f"has:{key}" for key in record['has'])
+    return terms
+
+
+def _labels(items: Any) -> List[str]:
+    if not isinstance(items, list):
+        return []
+    return [item['label'] for item in items if isinstance(item, dict) and isinstance(item.get('label'), str)]
+
+
+def field_texts(q: Dict) -> List[List[str]]:
+    """Indexed strings of a question, one list per entry of FIELDS."""
+    fields = q.get('fields') if isinstance(q.get('fields'), list) else []
+    option_labels = _labels(q.get('options'))
+    for field in fields:
+        if isinstance(field, dict):
+            option_labels.extend(_labels(field.get('options')))
+    examples = q.get('examples') if isinstance(q.get('examples'), list) else []
+    return [
+        [q.get('title', '')] if isinstance(q.get('title'), str) else [],
+        [q.get('prompt', '')] if isinstance(q.get('prompt'), str) else [],
+        option_labels,
+        _labels(fields),
+        [e for e in examples if isinstance(e, str)],
+    ]
+
+
+def snippet(q: Dict, terms: List[Tuple[str, bool]], width: int = SNIPPET_CHARS) -> str:
+    """
+    The question's title/prompt/label/example matching the most distinct
+    query words (ties go to the heavier field), cut to about width chars
+    around the first match, with matched words in **bold**.
+    """
+    def matches(word: str) -> bool:
+        word = word.lower()
+        return any(word == token or (prefix and word.startswith(token)) for token, prefix in terms)
+
+    best = None
+    for field, texts in enumerate(field_texts(q)):
+        for text in texts:
+            spans = [m.span() for m in _TOKEN.finditer(text) if matches(m.group())]
+            if spans:
+                key = (len({text[a:b].lower() for a, b in spans}), FIELD_WEIGHTS[field])
+                if best is None or key > best[0]:
+                    best = (key, text, spans)
+    if best is None:
+        return ""
+
+    _, text, spans = best
+    start = max(0, spans[0][0] - width // 4)
+    if start > 0:
+        start = text.rfind(' ', 0, start) + 1
+    end = min(len(text), start + width)
+    if end < len(text) and text.rfind(' ', spans[0][1], end) > 0:
+        end = text.rfind(' ', spans[0][1], end)
+
+    parts, cursor = [], start
+    for a, b in spans:
+        if a >= cursor and b <= end:
+            parts.extend([text[cursor:a], f"**{text[a:b]}**"])
+            cursor = b
+    parts.append(text[cursor:end])
+    return ("…" if start > 0 else "") + "".join(parts).strip() + ("…" if end < len(text) else "")
+
+
+def source_digest() -> str:
+    """Digest of this script's source, stored in every index header."""
+    global _source_digest
+    if _source_digest is None:
+        _source_digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+    return _source_digest
+
+
+def build_index(data: Dict, stamp: Tuple[int, int]) -> bytes:
+    """
+    Index one parsed questions.json into the bytes of an index file.
+
+    Layout: INDEX_MAGIC, a 4-byte header length, a marshalled header
+    (format, source digest, stamp, question count, tokens per field over all questions,
+    facet spans, section spans), then raw sections
+    padded to 4 bytes so each can be viewed in place as uint32s:
+
+        vocab      sorted tokens, newline-delimited (and -wrapped) UTF-8
+        token_starts  character offset of the newline before token i in vocab
+        offsets    token i's postings are docs[offsets[i]:offsets[i + 1]]
+        docs       question numbers (file order), ascending per token
+        starts     posting j's positions are positions[starts[j]:starts[j + 1]]
+        positions  field * FIELD_STRIDE + token offset within the field
+        lengths    tokens per field, question i at lengths[i * len(FIELDS):]
+        facet_docs questions per facet term, at the header's facet spans
+        records    marshalled RECORD_KEYS tuples, record i at
+                   records[record_offsets[i]:record_offsets[i + 1]]
+    """
+    manifests = data.get('manifests', {})
+    lite_ids = set(manifests.get('lite', {}).get('question_ids', []))
+    full_ids = set(manifests.get('full', {}).get('question_ids', []))
+
+    records = bytearray()
+    record_offsets = array('I', [0])
+    lengths = array('I')
+    facets: Dict[str, List[int]] = {}
+    # token -> {doc: [positions]}
+    occurrences: Dict[str, Dict[int, List[int]]] = {}
+    for doc, (qid, q) in enumerate(data.get('questions', {}).items()):
+        record = question_record(qid, q, lite_ids, full_ids)
+        records += marshal.dumps(tuple(record[key] for key in RECORD_KEYS))
+        record_offsets.append(len(records))
+        for term in facet_terms(record):
+            facets.setdefault(term, []).append(doc)
+        for field, texts in enumerate(field_texts(q)):
+            position = field * FIELD_STRIDE
+            length = 0
+            for text in texts:
+                for token in tokenize(text):
+                    occurrences.setdefault(token, {}).setdefault(doc, []).append(position)
+                    position += 1
+                    length += 1
+                position += 1  # never let a phrase run into the next label/example
+            lengths.append(length)
+
+    vocab = sorted(occurrences)
+    offsets, docs, starts, positions = array('I'), array('I'), array('I'), array('I')
+    for token in vocab:
+        offsets.append(len(docs))
+        for doc, doc_positions in occurrences[token].items():
+            docs.append(doc)
+            starts.append(len(positions))
+            positions.extend(doc_positions)
+    offsets.append(len(docs))
+    starts.append(len(positions))
+
+    token_starts = array('I')
+    cursor = 0
+    for token in vocab:
+        token_starts.append(cursor)
+        cursor += len(token) + 1
+    token_starts.append(cursor)
+
+    facet_docs = array('I')
+    facet_spans = {}
+    for term in sorted(facets):
+        facet_spans[term] = (len(facet_docs), len(facet_docs) + len(facets[term]))
+        facet_docs.extend(facets[term])
+
+    sections = {
+        'vocab': ("\n" + "".join(token + "\n" for token in vocab)).encode('utf-8'),
+        'token_starts': token_starts.tobytes(),
+        'offsets': offsets.tobytes(),
+        'docs': docs.tobytes(),
+        'starts': starts.tobytes(),
+        'positions': positions.tobytes(),
+        'lengths': lengths.tobytes(),
+        'facet_docs': facet_docs.tobytes(),
+        'record_offsets': record_offsets.tobytes(),
+        'records': bytes(records),
+    }
+    spans = {}
+    body = bytearray()
+    for name, blob in sections.items():
+        body += b"\0" * (-len(body) % 4)
+        spans[name] = (len(body), len(body) + len(blob))
+        body += blob
+
+    field_totals = [sum(lengths[field::len(FIELDS)]) for field in range(len(FIELDS))]
+    header = marshal.dumps({'format': INDEX_FORMAT, 'source': source_digest(), 'stamp': stamp, 'count': len(record_offsets) - 1,
+                            'field_totals': field_totals, 'facets': facet_spans, 'sections': spans})
+    padding = b"\0" * (-(len(INDEX_MAGIC) + 4 + len(header)) % 4)
+    return b"".join([INDEX_MAGIC, len(header).to_bytes(4, 'little'), header, padding, bytes(body)])
+
+
+class PhaseIndex:
+    """
+    One phase's index, viewed in place over the file's bytes (usually a
+    read-only mmap): a query only touches the sections and postings it
+    needs, and only result records are decoded.
+    """
+
+    def __init__(self, buffer: Any):
+        """Raises ValueError if buffer is not a current-format index."""
+        view = memoryview(buffer)
+        if bytes(view[:len(INDEX_MAGIC)]) != INDEX_MAGIC:
+            raise ValueError("not a search index")
+        size = int.from_bytes(view[len(INDEX_MAGIC):len(INDEX_MAGIC) + 4], 'little')
+        start = len(INDEX_MAGIC) + 4
+        header = marshal.loads(view[start:start + size])
+        if not isinstance(header, dict) or header.get('format') != INDEX_FORMAT:
+            raise ValueError("index format changed")
+        if header.get('source') != source_digest():
+            raise ValueError("index built by a different search_index.py")
+        body = start + size + (-(start + size) % 4)
+
+        self.stamp = tuple(header['stamp'])
+        self.count = header['count']
+        self.field_totals = tuple(header['field_totals'])
+        self.facets: Dict[str, Tuple[int, int]] = header['facets']
+        self._view = view
+        self._spans = {name: (body + low, body + high) for name, (low, high) in header['sections'].items()}
+        if max(high for _, high in self._spans.values()) > len(view):
+            raise ValueError("index truncated")
+        self._vocab: Optional[str] = None
+        self._arrays: Dict[str, memoryview] = {}
+        self._records: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _section(self, name: str) -> memoryview:
+        low, high = self._spans[name]
+        return self._view[low:high]
+
+    def _array(self, name: str) -> memoryview:
+        if name not in self._arrays:
+            self._arrays[name] = self._section(name).cast('I')
+        return self._arrays[name]
+
+    @property
+    def vocab(self) -> str:
+        if self._vocab is None:
+            self._vocab = str(self._section('vocab'), 'utf-8')
+        return self._vocab
+
+    @property
+    def vocab_size(self) -> int:
+        return max(0, self.vocab.count("\n") - 1)
+
+    def record(self, doc: int) -> Dict[str, Any]:
+        if doc not in self._records:
+            record_offsets = self._array('record_offsets')
+            low = self._spans['records'][0]
+            blob = self._view[low + record_offsets[doc]:low + record_offsets[doc + 1]]
+            self._records[doc] = dict(zip(RECORD_KEYS, marshal.loads(blob)), doc=doc)
+        return self._records[doc]
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        return [self.record(doc) for doc in range(self.count)]
+
+    def expand(self, token: str, prefix: bool) -> List[int]:
+        """Vocabulary numbers a query token stands for (itself, or every token with that prefix)."""
+        # Searching the delimited string directly is faster than splitting it
+        # into a list per load; tokens sharing a prefix are adjacent when sorted
+        vocab, token_starts = self.vocab, self._array('token_starts')
+        needle = "\n" + token if prefix else "\n" + token + "\n"
+        at = vocab.find(needle)
+        if at < 0:
+            return []
+        first = bisect_left(token_starts, at)
+        last = first + 1
+        if prefix:
+            while last < len(token_starts) - 1 and vocab.startswith(needle, token_starts[last]):
+                last += 1
+        return list(range(first, last))
+
+    def docs(self, terms: List[int]) -> Set[int]:
+        """Questions containing any of the terms."""
+        offsets, docs = self._array('offsets'), self._array('docs')
+        found: Set[int] = set()
+        for term in terms:
+            found.update(docs[offsets[term]:offsets[term + 1]])
+        return found
+
+    def positions(self, terms: List[int], wanted: Set[int]) -> Dict[int, Set[int]]:
+        """{question: positions} of any of the terms, for the questions in wanted."""
+        offsets, docs = self._array('offsets'), self._array('docs')
+        starts, positions = self._array('starts'), self._array('positions')
+        found: Dict[int, Set[int]] = {doc: set() for doc in wanted}
+        for term in terms:
+            low, high = offsets[term], offsets[term + 1]
+            for doc in wanted:
+                j = bisect_left(docs, doc, low, high)
+                if j < high and docs[j] == doc:
+                    found[doc].update(positions[starts[j]:starts[j + 1]])
+        return found
+
+    def weighted_length(self, doc: int) -> float:
+        """Question length in tokens, each field counted at its FIELD_WEIGHTS weight."""
+        lengths = self._array('lengths')
+        base = doc * len(FIELDS)
+        return sum(weight * lengths[base + field] for field, weight in enumerate(FIELD_WEIGHTS))
+
+    def frequencies(self, terms: List[int]) -> Dict[int, float]:
+        """{question: occurrences of any of the terms, each weighted by its field}."""
+        offsets, docs = self._array('offsets'), self._array('docs')
+        starts, positions = self._array('starts'), self._array('positions')
+        found: Dict[int, float] = {}
+        for term in terms:
+            for j in range(offsets[term], offsets[term + 1]):
+                weight = 0.0
+                for position in positions[starts[j]:starts[j + 1]]:
+                    weight += FIELD_WEIGHTS[position // FIELD_STRIDE]
+                doc = docs[j]
+                found[doc] = found.get(doc, 0.0) + weight
+        return found
+
+    def facet(self, term: str) -> Set[int]:
+        """Questions posted under a facet term such as 'type:compound' (see facet_terms)."""
+        span = self.facets.get(term)
+        return set(self._array('facet_docs')[span[0]:span[1]]) if span else set()
+
+    def match(self, clauses: List[Clause], field: Optional[int] = None,
+              within: Optional[Set[int]] = None) -> List[int]:
+        """
+        Sorted question numbers (file order) matching every clause, optionally
+        only inside one FIELDS entry and only among the questions in within.
+        """
+        matched = within
+        # Single words before prefixes before phrases: every later clause only narrows the set
+        for tokens, prefix in sorted(clauses, key=lambda clause: (len(clause[0]) > 1, clause[1])):
+            matched = self._clause(tokens, prefix, matched, field)
+            if not matched:
+                return []
+        return sorted(matched or ())
+
+    def _clause(self, tokens: List[str], prefix: bool, within: Optional[Set[int]],
+                field: Optional[int] = None) -> Set[int]:
+        terms = [self.expand(token, prefix and i == len(tokens) - 1) for i, token in enumerate(tokens)]
+        if not all(terms):
+            return set()
+        candidates = set(within) if within is not None else self.docs(terms[0])
+        for alternatives in (terms if within is not None else terms[1:]):
+            candidates &= self.docs(alternatives)
+        if (len(tokens) == 1 and field is None) or not candidates:
+            return candidates
+
+        # Phrase: token i must sit at the first token's position + i
+        # (and, for a field, the first token inside that field)
+        found = [self.positions(alternatives, candidates) for alternatives in terms]
+        return {
+            doc for doc in candidates
+            if any((field is None or start // FIELD_STRIDE == field)
+                   and all(start + i in found[i][doc] for i in range(1, len(tokens)))
+                   for start in found[0][doc])
+        }
+
+
+def _map_file(path: Path) -> Any:
+    """Read-only mmap of a file (pages are only read when touched)."""
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class SearchIndex:
+    """Per-phase inverted indexes, loaded from .cache/search/ and rebuilt when stale."""
+
+    def __init__(self, corpus: PhaseCorpus, index_dir: Optional[Path] = None):
+        self.corpus = corpus
+        self.index_dir = Path(index_dir) if index_dir else DEFAULT_INDEX_DIR
+        self._phases: Dict[str, PhaseIndex] = {}
+        # Keeps indexes of different data directories (e.g. benchmarks) apart
+        self._dir_key = f"{zlib.crc32(str(Path(corpus.data_dir).resolve()).encode('utf-8')):08x}"
+        self.stats = {'loaded': 0, 'built': 0}
+
+    def _file(self, phase: str) -> Path:
+        return self.index_dir / f"{phase}-{self._dir_key}.index"
+
+    def phase(self, phase: str) -> Optional[PhaseIndex]:
+        """The phase's index, refreshed if questions.json changed; None if it has none."""
+        stamp = _stamp(self.corpus.path(phase, "questions.json"))
+        if stamp is None:
+            return None
+        index = self._phases.get(phase)
+        if index is not None and index.stamp == stamp:
+            return index
+
+        # Release the old mapping first (Windows cannot replace a mapped file)
+        self._phases.pop(phase, None)
+        index = self._load(phase)
+        if index is not None and index.stamp == stamp:
+            self.stats['loaded'] += 1
+        else:
+            data = build_index(self.corpus.questions(phase), stamp)
+            self._save(phase, data)
+            index = PhaseIndex(data)
+            self.stats['built'] += 1
+        self._phases[phase] = index
+        return index
+
+    def _load(self, phase: str) -> Optional[PhaseIndex]:
+        try:
+            return PhaseIndex(_map_file(self._file(phase)))
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            return None
+
+    def _save(self, phase: str, data: bytes) -> None:
+        index_file = self._file(phase)
+        try:
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = index_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, index_file)
+        except OSError:
+            pass
+
+    def clear(self) -> int:
+        """Delete every index file. Returns number of files removed."""
+        self._phases.clear()
+        removed = 0
+        if self.index_dir.exists():
+            for index_file in self.index_dir.glob("*.index"):
+                index_file.unlink()
+                removed += 1
+        return removed
+
+    def rank(self, phases: List[str], query: str) -> Dict[Tuple[str, int], float]:
+        """
+        BM25F score of every question in phases containing any query word,
+        keyed by (phase, record['doc']). Document frequencies and average
+        length are taken over all questions of the given phases.
+        """
+        terms = query_terms(query)
+        total_docs, total_length = 0, 0.0
+        doc_counts = [0] * len(terms)
+        found = []
+        for phase in phases:
+            index = self.phase(phase)
+            if index is None:
+                continue
+            total_docs += len(index)
+            total_length += sum(weight * total for weight, total in zip(FIELD_WEIGHTS, index.field_totals))
+            frequencies = [index.frequencies(index.expand(token, prefix)) for token, prefix in terms]
+            for i, term_frequencies in enumerate(frequencies):
+                doc_counts[i] += len(term_frequencies)
+            found.append((phase, index, frequencies))
+        if not total_docs:
+            return {}
+
+        average_length = total_length / total_docs or 1.0
+        idf = [math.log(1 + (total_docs - n + 0.5) / (n + 0.5)) for n in doc_counts]
+        scores: Dict[Tuple[str, int], float] = {}
+        for phase, index, frequencies in found:
+            norms: Dict[int, float] = {}
+            for i, term_frequencies in enumerate(frequencies):
+                for doc, tf in term_frequencies.items():
+                    norm = norms.get(doc)
+                    if norm is None:
+                        norm = norms[doc] = BM25_K1 * (1 - BM25_B + BM25_B * index.weighted_length(doc) / average_length)
+                    scores[(phase, doc)] = scores.get((phase, doc), 0.0) + idf[i] * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+    def select_docs(self, phase: str, predicate: Any = None) -> List[int]:
+        """
+        Question numbers of a phase matching a compiled search_query predicate
+        (all if None), in file order. Evaluated on posting sets; no record is
+        decoded unless the predicate has record checks (id:, contains:).
+        """
+        index = self.phase(phase)
+        if index is None:
+            return []
+        if predicate is None:
+            return list(range(len(index)))
+        return sorted(predicate.filter(index, phase, set(range(len(index)))))
+
+    def select(self, phase: str, predicate: Any = None) -> List[Dict[str, Any]]:
+        """Records of a phase matching a compiled search_query predicate (all if None), in file order."""
+        index = self.phase(phase)
+        if index is None:
+            return []
+        if predicate is None:
+            return index.records
+        return [index.record(doc) for doc in self.select_docs(phase, predicate)]
+
+    def records(self, phase: str, query: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Question records of a phase in file order, optionally only those matching query."""
+        index = self.phase(phase)
+        if index is None:
+            return []
+        if not query:
+            return index.records
+        return [index.record(doc) for doc in index.match(parse_query(query))]
+
+
+def _phase_names(corpus: PhaseCorpus, phase: Optional[str]) -> List[str]:
+    phases = [phase] if phase else sorted(corpus.phases())
+    return [p for p in phases if corpus.has(p, "questions.json")]
+
+
+def benchmark(copies: int, repeat: int) -> int:
+    """Index every phase with each question repeated `copies` times (in a temp dir) and time queries."""
+    # Benchmark-only modules stay out of a plain search's import time
+    import shutil
+    import tempfile
+
+    corpus = PhaseCorpus(PROJECT_ROOT / "data")
+    phases = _phase_names(corpus, None)
+    queries = ['pacing', 'pac*', '"hard topics"', 'conflict repair', 'feel* "how you"']
+    ranked = ['conflict repair', 'money spending habits']
+    filters = ['type:multi_select AND manifest:lite AND NOT has:validation.max* AND text:feel*',
+               '(manifest:full AND NOT manifest:lite) OR missing:examples', 'has:option* AND title:feel*']
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix='rfu-search-'))
+    try:
+        data_dir = tmp_dir / "data"
+        for phase in phases:
+            data = corpus.questions(phase)
+
+            def copied(qids: List[str]) -> List[str]:
+                return [f"{qid}x{copy}" if copy else qid for copy in range(copies) for qid in qids]
+
+            bench_data = dict(data)
+            bench_data['questions'] = {
+                qid: q for qid, q in zip(copied(list(data.get('questions', {}))),
+                                         list(data.get('questions', {}).values()) * copies)
+            }
+            bench_data['manifests'] = {
+                name: dict(manifest, question_ids=copied(manifest.get('question_ids', [])))
+                for name, manifest in data.get('manifests', {}).items()
+            }
+            (data_dir / phase).mkdir(parents=True)
+            with open(data_dir / phase / "questions.json", 'w', encoding='utf-8') as f:
+                json.dump(bench_data, f, ensure_ascii=False)
+        bench_corpus = PhaseCorpus(data_dir)
+        bench_phases = _phase_names(bench_corpus, None)
+
+        start = time.perf_counter()
+        index = SearchIndex(bench_corpus, tmp_dir / "index")
+        questions = sum(len(index.records(p)) for p in bench_phases)
+        build_ms = (time.perf_counter() - start) * 1000
+        print(f"Indexed {questions} questions ({copies}x each) in {len(bench_phases)} phases: {build_ms:.0f} ms\n")
+
+        def best(func) -> float:
+            timings = []
+            for _ in range(max(1, repeat)):
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+            return min(timings) * 1000
+
+        from search_query import compile_query
+
+        def run(search_index: SearchIndex, query: str, mode: str) -> int:
+            if mode == 'rank':
+                return len(search_index.rank(bench_phases, query))
+            if mode == 'where':
+                # As `question_search.py --where ... --count` does: set operations only
+                predicate = compile_query(query)
+                return sum(len(search_index.select_docs(p, predicate)) for p in bench_phases)
+            return sum(len(search_index.records(p, query)) for p in bench_phases)
+
+        print(f"{'Query':<30} {'Hits':>6} {'cold (load+query)':>18} {'warm':>9}")
+        worst = 0.0
+        runs = [(q, 'query') for q in queries] + [(q, 'rank') for q in ranked] + [(q, 'where') for q in filters]
+        for query, mode in runs:
+            hits = run(index, query, mode)
+            cold = best(lambda: run(SearchIndex(bench_corpus, tmp_dir / "index"), query, mode))
+            warm = best(lambda: run(index, query, mode))
+            worst = max(worst, cold)
+            label = query if mode == 'query' else f"--{mode} {query}"
+            print(f"{label[:30]:<30} {hits:>6} {cold:>16.2f}ms {warm:>7.2f}ms")
+        print(f"\n(best of {repeat}; cold = fresh SearchIndex reading every phase file, "
+              f"as one question_search.py call does; --where rows count matches like --count, "
+              f"listing them adds ~8 us per decoded record)")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    if worst > QUERY_BUDGET_MS:
+        print(f"ERROR: Slowest query took {worst:.2f} ms (budget {QUERY_BUDGET_MS:.0f} ms)")
+        return 1
+    print(f"[SUCCESS] Every query answered within {QUERY_BUDGET_MS:.0f} ms")
+    return 0
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Search Index - Persistent inverted index for question_search.py"
+    )
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+
+    build_parser = subparsers.add_parser('build', help='Build or refresh the index')
+    build_parser.add_argument('--phase', help='Phase directory (default: all)')
+
+    stats_parser = subparsers.add_parser('stats', help='Show index size per phase')
+    stats_parser.add_argument('--phase', help='Phase directory (default: all)')
+
+    subparsers.add_parser('clear', help='Delete every index file')
+
+    bench_parser = subparsers.add_parser('benchmark', help='Time queries with every question repeated N times')
+    bench_parser.add_argument('--copies', type=int, default=10, help='Copies of each question (default: 10)')
+    bench_parser.add_argument('--repeat', type=int, default=20, help='Runs per query (default: 20)')
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    if args.command == 'benchmark':
+        sys.exit(benchmark(max(1, args.copies), args.repeat))
+
+    corpus = PhaseCorpus(PROJECT_ROOT / "data")
+    index = SearchIndex(corpus)
+
+    if args.command == 'clear':
+        print(f"[SUCCESS] Removed {index.clear()} index file(s) from {index.index_dir}")
+        sys.exit(0)
+
+    if args.phase and not corpus.has(args.phase, "questions.json"):
+        print(f"ERROR: questions.json not found in data/{args.phase}")
+        sys.exit(1)
+    phases = _phase_names(corpus, args.phase)
+
+    try:
+        if args.command == 'build':
+            questions = sum(len(index.records(p)) for p in phases)
+            print(f"[SUCCESS] Indexed {questions} questions in {len(phases)} phase(s) "
+                  f"({index.stats['built']} rebuilt, {index.stats['loaded']} up to date)")
+        else:
+            print(f"{'Phase':<15} {'Questions':>9} {'Tokens':>7} {'Index KB':>9}")
+            for phase in phases:
+                phase_index = index.phase(phase)
+                index_file = index._file(phase)
+                size = index_file.stat().st_size if index_file.exists() else 0
+                print(f"{phase:<15} {len(phase_index):>9} {phase_index.vocab_size:>7} {size / 1024:>9.1f}")
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+# ./scripts/search_query.py
+"""
+Search Query - Compiled Filter Language for question_search.py
+==============================================================
+
+Parses a filter expression once into a predicate tree, then answers it per
+phase with search index set operations. Facets and full-text words are
+posting lists, and AND/OR/NOT are set intersection/union/difference. Only
+id:, contains: and phase: look at anything besides the index.
+
+Usage:
+    from search_query import compile_query
+
+    predicate = compile_query('type:multi_select AND manifest:lite AND NOT has:validation.max* AND text:"pacing"')
+    records = search_index.select('phase_0', predicate)
+
+    python scripts/question_search.py --where 'type:compound AND NOT missing:examples'
+    python scripts/search_query.py 'type:multi_select AND (manifest:lite OR has:validation.*)'
+
+Syntax:
+    field:value       One condition; quote values with spaces; value* = prefix
+    A AND B, A B      Both (AND is implied between conditions)
+    A OR B            Either (AND binds tighter than OR)
+    NOT A, -A         Negation
+    ( ... )           Grouping
+    word, "a phrase"  Shorthand for text:word / text:"a phrase"
+
+Fields:
+    type:       Question type (free_text, single_select, ...)            index
+    section:    Section ID (s1, s2, ...)                                 index
+    manifest:   lite, full or none                                       index
+    missing:    examples, validation or options (same as --missing)      index
+    has:        Non-empty key (options, fields, validation.max_selected) index
+    text:       Full-text words, prefix*, "phrase" (same as --query)     index
+    title: prompt: options: fields: examples:
+                Full-text inside one part of the question                index
+    contains:   Substring of title/prompt/option labels (same as --text) record
+    id:         Question ID (q05, q1*)                                   record
+    phase:      Phase directory (phase_2, phase_2*)                      phase
+
+CLI Arguments:
+    expression: Required. Filter expression to compile and explain
+
+Inputs:
+    - None (the expression; question_search.py supplies the search index)
+
+Outputs:
+    - The compiled condition tree, one condition per line with how it is
+      answered (index facet, index full-text, record check, phase name)
+    - Exit code: 0 (compiled), 1 (syntax error)
+
+Operational Notes:
+    - AND evaluates index conditions first and passes the surviving set on,
+      so record checks (id:, contains:) only decode questions still in play
+    - Operators are upper case (AND, OR, NOT) so "and"/"or"/"not" can still
+      be searched for as words
+    - A field with no value (type:, section:"") is a syntax error, not a
+      search for the field name
+    - Every question_search.py flag (--type, --manifest/--exclude, --text,
+      --missing, --query, --id) compiles to the same conditions
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import re
+import sys
+import argparse
+from typing import Any, Dict, List, Optional, Set
+
+from phase_corpus import MANIFEST_NAMES, QUESTION_TYPES
+from search_index import FACET_FIELDS, FIELDS, facet_terms, parse_query
+
+
+# Facets whose values are a closed set (others, e.g. section/has, accept anything)
+FACET_VALUES: Dict[str, List[str]] = {
+    'type': list(QUESTION_TYPES),
+    'manifest': list(MANIFEST_NAMES) + ['none'],
+    'missing': ['examples', 'validation', 'options'],
+}
+TEXT_FIELDS: Dict[str, Optional[int]] = {'text': None, **{name: i for i, name in enumerate(FIELDS)}}
+ALL_FIELDS = list(FACET_FIELDS) + list(TEXT_FIELDS) + ['contains', 'id', 'phase']
+
+OPERATORS = ('AND', 'OR', 'NOT')
+
+_TOKEN = re.compile(r'\s*(?:(?P<open>\()|(?P<close>\))|(?P<neg>-)?(?:(?P<field>[A-Za-z_]+):)?'
+                    r'(?P<value>"[^"]*"|[^\s()"]+))')
+
+
+def _unquote(value: str) -> str:
+    return value[1:-1] if len(value) >= 2 and value[0] == value[-1] == '"' else value
+
+
+def _value_matches(pattern: str, value: str) -> bool:
+    """Exact match, or prefix match for a pattern ending in *."""
+    return value.startswith(pattern[:-1]) if pattern.endswith('*') else value == pattern
+
+
+class Node:
+    """A compiled condition. filter() narrows a set of question numbers of one phase."""
+
+    # AND evaluates cheaper children first: 0 phase name, 1 index, 2 record check
+    cost = 2
+    kind = "record check"
+
+    def filter(self, index: Any, phase: str, candidates: Set[int]) -> Set[int]:
+        """The candidates (question numbers of index) that satisfy this condition."""
+        return {doc for doc in candidates if self.test(index.record(doc), phase)}
+
+    def test(self, record: Dict[str, Any], phase: str) -> bool:
+        """Evaluate against one question record (search_index.question_record)."""
+        raise NotImplementedError
+
+    def explain(self, depth: int = 0) -> List[str]:
+        return [f"{'  ' * depth + str(self):<44} {self.kind}"]
+
+
+class And(Node):
+    def __init__(self, children: List[Node]):
+        self.children = sorted(children, key=lambda child: child.cost)
+        self.cost = max(child.cost for child in self.children)
+
+    def filter(self, index: Any, phase: str, candidates: Set[int]) -> Set[int]:
+        for child in self.children:
+            if not candidates:
+                break
+            candidates = child.filter(index, phase, candidates)
+        return candidates
+
+    def test(self, record: Dict[str, Any], phase: str) -> bool:
+        return all(child.test(record, phase) for child in self.children)
+
+    def explain(self, depth: int = 0) -> List[str]:
+        return [f"{'  ' * depth}AND"] + [line for child in self.children for line in child.explain(depth + 1)]
+
+    def __str__(self) -> str:
+        return "(" + " AND ".join(str(child) for child in self.children) + ")"
+
+
+class Or(Node):
+    def __init__(self, children: List[Node]):
+        self.children = children
+        self.cost = max(child.cost for child in children)
+
+    def filter(self, index: Any, phase: str, candidates: Set[int]) -> Set[int]:
+        matched: Set[int] = set()
+        for child in self.children:
+            matched |= child.filter(index, phase, candidates - matched)
+        return matched
+
+    def test(self, record: Dict[str, Any], phase: str) -> bool:
+        return any(child.test(record, phase) for child in self.children)
+
+    def explain(self, depth: int = 0) -> List[str]:
+        return [f"{'  ' * depth}OR"] + [line for child in self.children for line in child.explain(depth + 1)]
+
+    def __str__(self) -> str:
+        return "(" + " OR ".join(str(child) for child in self.children) + ")"
+
+
+class Not(Node):
+    def __init__(self, child: Node):
+        self.child = child
+        self.cost = child.cost
+
+    def filter(self, index: Any, phase: str, candidates: Set[int]) -> Set[int]:
+        return candidates - self.child.filter(index, phase, candidates)
+
+    def test(self, record: Dict[str, Any], phase: str) -> bool:
+        return not self.child.test(record, phase)
+
+    def explain(self, depth: int = 0) -> List[str]:
+        return [f"{'  ' * depth}NOT"] + self.child.explain(depth + 1)
+
+    def __str__(self) -> str:
+        return f"NOT {self.child}"
+
+
+class Facet(Node):
+    """type:, section:, manifest:, missing:, has: - answered from the index's facet postings."""
+
+    cost = 1
+    kind = "index facet"
+
+    def __init__(self, field: str, value: str):
+        allowed = FACET_VALUES.get(field)
+        if allowed and not value.endswith('*') and value not in allowed:
+            raise ValueError(f"Unknown {field} '{value}' (use one of: {', '.join(allowed)})")
+        self.field = field
+        self.value = value
+
+    def filter(self, index: Any, phase: str, candidates: Set[int]) -> Set[int]:
+        if not self.value.endswith('*'):
+            return candidates & index.facet(f"{self.field}:{self.value}")
+        prefix = f"{self.field}:"
+        matched: Set[int] = set()
+        for term in index.facets:
+            if term.startswith(prefix) and _value_matches(self.value, term[len(prefix):]):
+                matched |= index.facet(term)
+        return candidates & matched
+
+    def test(self, record: Dict[str, Any], phase: str) -> bool:
+        prefix = f"{self.field}:"
+        return any(_value_matches(self.value, term[len(prefix):])
+                   for term in facet_terms(record) if term.startswith(prefix))
+
+    def __str__(self) -> str:
+        return f"{self.field}:{self.value}"
+
+
+class FullText(Node):
+    """text: (anywhere) or title:/prompt:/options:/fields:/examples: - answered from postings."""
+
+    cost = 1
+    kind = "index full-text"
+
+    def __init__(self, field: str, query: str):
+        self.field = field
+        self.query = query
+        self.clauses = parse_query(query)
+
+    def filter(self, index: Any, phase: str, candidates: Set[int]) -> Set[int]:
+        return set(index.match(self.clauses, TEXT_FIELDS[self.field], within=candidates))
+
+    def test(self, record: Dict[str, Any], phase: str) -> bool:
+        raise ValueError(f"{self} needs the search index")
+
+    def __str__(self) -> str:
+        return f"{self.field}:{self.query}" if ' ' not in self.query else f'{self.field}:({self.query})'
+
+
+class Contains(Node):
+    """contains: - substring of the lowercase title/prompt/option labels (the --text behaviour)."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def test(self, record: Dict[str, Any], phase: str) -> bool:
+        return self.text.lower() in record['text']
+
+    def __str__(self) -> str:
+        return f'contains:"{self.text}"'
+
+
+class QuestionId(Node):
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+
+    def test(self, record: Dict[str, Any], phase: str) -> bool:
+        return _value_matches(self.pattern, record['id'])
+
+    def __str__(self) -> str:
+        return f"id:{self.pattern}"
+
+
+class PhaseName(Node):
+    cost = 0
+    kind = "phase name"
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+
+    def filter(self, index: Any, phase: str, candidates: Set[int]) -> Set[int]:
+        return candidates if _value_matches(self.pattern, phase) else set()
+
+    def test(self, record: Dict[str, Any], phase: str) -> bool:
+        return _value_matches(self.pattern, phase)
+
+    def __str__(self) -> str:
+        return f"phase:{self.pattern}"
+
+
+def condition(field: str, value: str) -> Node:
+    """One field:value condition (value as written, quotes included)."""
+    if not _unquote(value).strip():
+        raise ValueError(f"Empty value for '{field}:' (write {field}:VALUE)")
+    if field in TEXT_FIELDS:
+        return FullText(field, value)
+    value = _unquote(value)
+    if field in FACET_FIELDS:
+        return Facet(field, value)
+    if field == 'contains':
+        return Contains(value)
+    if field == 'id':
+        return QuestionId(value)
+    if field == 'phase':
+        return PhaseName(value)
+    raise ValueError(f"Unknown filter field '{field}' (use one of: {', '.join(ALL_FIELDS)})")
+
+
+def _tokenize(expression: str) -> List[Dict[str, Any]]:
+    tokens = []
+    position = 0
+    rest = expression.rstrip()
+    while position < len(rest):
+        m = _TOKEN.match(rest, position)
+        if not m:
+            position += len(rest[position:]) - len(rest[position:].lstrip())
+            raise ValueError(f"Cannot parse filter at position {position + 1}: {rest[position:position + 20]!r} "
+                             f"(unbalanced quote?)")
+        token = m.groupdict()
+        # 'type:' with nothing after it would otherwise be searched as the word "type"
+        if token['value'] and not token['field'] and re.fullmatch(r'[A-Za-z_]+:', token['value']):
+            raise ValueError(f"Empty value for '{token['value']}' at position {m.start('value') + 1} "
+                             f"(write {token['value']}VALUE, no space after ':')")
+        tokens.append(token)
+        position = m.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent: or_expr := and_expr (OR and_expr)*; and_expr := unary (AND? unary)*."""
+
+    def __init__(self, tokens: List[Dict[str, Any]]):
+        self.tokens = tokens
+        self.i = 0
+
+    def _peek(self) -> Optional[Dict[str, Any]]:
+        return self.tokens[self.i] if self.i < len(self.tokens) else None
+
+    def _operator(self, token: Optional[Dict[str, Any]]) -> Optional[str]:
+        if token and token['value'] in OPERATORS and not token['field'] and not token['neg']:
+            return token['value']
+        return None
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise ValueError("Empty filter")
+        node = self._or()
+        if self._peek() is not None:
+            raise ValueError("Unexpected ')' in filter")
+        return node
+
+    def _or(self) -> Node:
+        nodes = [self._and()]
+        while self._operator(self._peek()) == 'OR':
+            self.i += 1
+            nodes.append(self._and())
+        return nodes[0] if len(nodes) == 1 else Or(nodes)
+
+    def _and(self) -> Node:
+        nodes = [self._unary()]
+        while True:
+            token = self._peek()
+            if token is None or token['close'] or self._operator(token) == 'OR':
+                break
+            if self._operator(token) == 'AND':
+                self.i += 1
+            nodes.append(self._unary())
+        return nodes[0] if len(nodes) == 1 else And(nodes)
+
+    def _unary(self) -> Node:
+        token = self._peek()
+        if token is None:
+            raise ValueError("Filter ends where a condition was expected")
+        self.i += 1
+        operator = self._operator(token)
+        if operator == 'NOT':
+            return Not(self._unary())
+        if operator:
+            raise ValueError(f"'{operator}' needs a condition before it")
+        if token['open']:
+            node = self._or()
+            closing = self._peek()
+            if closing is None or not closing['close']:
+                raise ValueError("Missing ')' in filter")
+            self.i += 1
+            return node
+        if token['close']:
+            raise ValueError("Unexpected ')' in filter")
+        node = condition(token['field'].lower() if token['field'] else 'text', token['value'])
+        return Not(node) if token['neg'] else node
+
+
+def compile_query(expression: str) -> Node:
+    """Compile a filter expression. Raises ValueError with a readable message on bad syntax."""
+    return _Parser(_tokenize(expression)).parse()
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Search Query - Compile and explain a question_search.py --where filter"
+    )
+    parser.add_argument('expression', help='Filter expression, e.g. \'type:compound AND NOT has:examples\'')
+    args = parser.parse_args()
+
+    try:
+        predicate = compile_query(args.expression)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    print(f"Compiled: {predicate}\n")
+    print("\n".join(predicate.explain()))
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
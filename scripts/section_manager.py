@@ -12,6 +12,7 @@ Usage:
     python scripts/section_manager.py rename --phase PHASE --id SECTION_ID --title NEW_TITLE
     python scripts/section_manager.py reorder --phase PHASE --id SECTION_ID --position POSITION
     python scripts/section_manager.py list --phase PHASE
+    python scripts/section_manager.py batch --phase PHASE --file ops.jsonl
 
 Commands:
     add: Create new section
@@ -19,6 +20,7 @@ Commands:
     rename: Update section title
     reorder: Change section position
     list: Display all sections with question counts
+    batch: Apply JSONL operations in one atomic write (see question_batch.py)
 
 CLI Arguments (add):
     --phase: Required. Phase directory (e.g., phase_0)
@@ -68,10 +70,14 @@ GitHub: https://github.com/imyourboyroy
 import json
 import sys
 import argparse
+import os
 import shutil
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from phase_corpus import load_json
+from question_index import QuestionIndex, refresh_index
+
 
 class SectionManager:
     """Surgical section CRUD operations with minimal file I/O."""
@@ -84,20 +90,32 @@ class SectionManager:
         
         if not self.questions_file.exists():
             raise FileNotFoundError(f"questions.json not found in {self.phase_dir}")
+        
+        # Set by question_batch: operations share one in-memory document
+        self._batch_data: Optional[Dict] = None
     
     def _load_questions(self) -> Dict:
-        """Load questions.json file."""
-        with open(self.questions_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """Load a private (mutable) copy of questions.json (or the batch document)."""
+        if self._batch_data is not None:
+            return self._batch_data
+        return load_json(self.questions_file, use_cache=False)
     
     def _save_questions(self, data: Dict, backup: bool = True) -> None:
-        """Save questions.json with optional backup."""
+        """Save questions.json with optional backup (no-op inside a batch)."""
+        if self._batch_data is not None:
+            return
+        
         if backup:
             backup_path = str(self.questions_file) + ".bak"
             shutil.copy2(self.questions_file, backup_path)
         
-        with open(self.questions_file, 'w', encoding='utf-8') as f:
+        # Write beside the target and swap in, so readers never see a partial file
+        tmp_path = self.questions_file.with_name(self.questions_file.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, self.questions_file)
+        
+        refresh_index(self.questions_file)
     
     def _validate_section_id(self, section_id: str) -> List[str]:
         """Validate section ID format."""
@@ -220,8 +238,8 @@ class SectionManager:
         return f"[SUCCESS] Moved section {args.id} to position {args.position}"
     
     def list_sections(self, args: argparse.Namespace) -> str:
-        """List all sections."""
-        data = self._load_questions()
+        """List all sections (decodes only the sections array)."""
+        data = {'sections': QuestionIndex(self.questions_file).read_top_level('sections') or []}
         
         if args.format == 'json':
             return json.dumps(data['sections'], indent=2, ensure_ascii=False)
@@ -281,6 +299,12 @@ def main():
     list_parser.add_argument('--phase', required=True, help='Phase directory')
     list_parser.add_argument('--format', choices=['text', 'json'], default='text')
     
+    # BATCH command
+    batch_parser = subparsers.add_parser('batch', help='Apply JSONL operations atomically (one write)')
+    batch_parser.add_argument('--phase', required=True, help='Phase directory')
+    batch_parser.add_argument('--file', default='-', help='JSONL operations file (default: stdin)')
+    batch_parser.add_argument('--dry-run', action='store_true', help='Validate operations without writing')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -304,6 +328,9 @@ def main():
             result = manager.reorder_section(args)
         elif args.command == 'list':
             result = manager.list_sections(args)
+        elif args.command == 'batch':
+            from question_batch import run_batch
+            result = run_batch(manager, args.file, dry_run=args.dry_run)
         else:
             result = f"ERROR: Unknown command: {args.command}"
         
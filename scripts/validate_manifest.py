@@ -10,17 +10,21 @@ Usage:
     python scripts/validate_manifest.py [--phase PHASE]
     python scripts/validate_manifest.py --phase phase_0
     python scripts/validate_manifest.py  # validates all phases
+    python scripts/validate_manifest.py --jobs 4
 
 CLI Arguments:
     --phase: Optional. Specific phase to validate. Default: all phases
     --strict: Optional. Fail on warnings (not just errors)
     --format: Optional. Output format (text, json). Default: text
+    --jobs: Optional. Worker processes for multi-phase runs (0 = all CPUs). Default: 1
 
 Inputs:
     - data/{phase}/manifest.json
 
 Outputs:
-    - Validation report with errors/warnings
+    - Validation report with errors/warnings, each prefixed with
+      file:line:column (json: error_locations/warning_locations give file,
+      JSON Pointer, line and column per message)
     - Exit code: 0 (pass), 1 (fail)
 
 Operational Notes:
@@ -28,6 +32,7 @@ Operational Notes:
     - Validates field types and structures
     - Ensures consistency with production manifests
     - Token-efficient: ~10 tokens to run
+    - --jobs output is identical to a sequential run (results merge in phase order)
 
 Author: Roy Dawson IV
 GitHub: https://github.com/imyourboyroy
@@ -39,6 +44,10 @@ import argparse
 from pathlib import Path
 from typing import Dict, List
 
+from json_positions import display_path, pointer, source_map
+from phase_corpus import PhaseCorpus, load_json, map_phases
+from validation_engine import located_messages, location
+
 
 class ManifestValidator:
     """Validates manifest.json files against expected structure."""
@@ -77,106 +86,128 @@ class ManifestValidator:
     def validate_manifest(self, manifest_path: Path) -> Dict:
         """Validate a single manifest.json file."""
         phase_name = manifest_path.parent.name
+        file = display_path(manifest_path)
         
         if not manifest_path.exists():
             return {
                 'phase': phase_name,
                 'status': 'ERROR',
                 'errors': ['manifest.json not found'],
-                'warnings': []
+                'warnings': [],
+                'error_locations': [location(file, '')],
+                'warning_locations': []
             }
         
         # Load manifest
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(manifest_path)
         except json.JSONDecodeError as e:
             return {
                 'phase': phase_name,
                 'status': 'ERROR',
                 'errors': [f'JSON syntax error: {e}'],
-                'warnings': []
+                'warnings': [],
+                'error_locations': [location(file, '', e.lineno, e.colno)],
+                'warning_locations': []
             }
         
         errors = []
         warnings = []
+        # JSON Pointer of each finding, resolved to line:column once at the end
+        error_pointers = []
+        warning_pointers = []
+        
+        def error(message: str, *path) -> None:
+            errors.append(message)
+            error_pointers.append(pointer(*path))
+        
+        def warning(message: str, *path) -> None:
+            warnings.append(message)
+            warning_pointers.append(pointer(*path))
         
         # Check top-level fields
         for field, expected_type in self.REQUIRED_FIELDS.items():
             if field not in data:
-                errors.append(f"Missing required field: {field}")
+                error(f"Missing required field: {field}", field)
             elif not isinstance(data[field], expected_type):
-                errors.append(f"Field '{field}' should be {expected_type.__name__}, got {type(data[field]).__name__}")
+                error(f"Field '{field}' should be {expected_type.__name__}, got {type(data[field]).__name__}", field)
         
         # Check display fields
         if 'display' in data:
             for field, expected_type in self.REQUIRED_DISPLAY_FIELDS.items():
                 if field not in data['display']:
-                    errors.append(f"Missing display.{field}")
+                    error(f"Missing display.{field}", 'display', field)
                 elif not isinstance(data['display'][field], expected_type):
-                    errors.append(f"display.{field} should be {expected_type.__name__}")
+                    error(f"display.{field} should be {expected_type.__name__}", 'display', field)
         
         # Check artifact fields
         if 'artifact' in data:
             for field, expected_type in self.REQUIRED_ARTIFACT_FIELDS.items():
                 if field not in data['artifact']:
-                    errors.append(f"Missing artifact.{field}")
+                    error(f"Missing artifact.{field}", 'artifact', field)
                 elif not isinstance(data['artifact'][field], expected_type):
-                    errors.append(f"artifact.{field} should be {expected_type.__name__}")
+                    error(f"artifact.{field} should be {expected_type.__name__}", 'artifact', field)
             
             # Check stage structure
             if 'stage' in data['artifact']:
                 stage = data['artifact']['stage']
                 if 'code' not in stage:
-                    errors.append("Missing artifact.stage.code")
+                    error("Missing artifact.stage.code", 'artifact', 'stage', 'code')
                 if 'label' not in stage:
-                    errors.append("Missing artifact.stage.label")
+                    error("Missing artifact.stage.label", 'artifact', 'stage', 'label')
                 if 'eligibility' not in stage:
-                    errors.append("Missing artifact.stage.eligibility")
+                    error("Missing artifact.stage.eligibility", 'artifact', 'stage', 'eligibility')
                 elif not isinstance(stage['eligibility'], list):
-                    errors.append("artifact.stage.eligibility should be a list")
+                    error("artifact.stage.eligibility should be a list", 'artifact', 'stage', 'eligibility')
         
         # Check intro structure
         if 'intro' in data:
             intro = data['intro']
             if 'instructions' not in intro:
-                errors.append("Missing intro.instructions")
+                error("Missing intro.instructions", 'intro', 'instructions')
             elif not isinstance(intro['instructions'], dict):
-                errors.append("intro.instructions should be object")
+                error("intro.instructions should be object", 'intro', 'instructions')
             else:
                 if 'title' not in intro['instructions']:
-                    warnings.append("Missing intro.instructions.title")
+                    warning("Missing intro.instructions.title", 'intro', 'instructions', 'title')
                 if 'items' not in intro['instructions']:
-                    errors.append("Missing intro.instructions.items")
+                    error("Missing intro.instructions.items", 'intro', 'instructions', 'items')
                 elif not isinstance(intro['instructions']['items'], list):
-                    errors.append("intro.instructions.items should be array")
+                    error("intro.instructions.items should be array", 'intro', 'instructions', 'items')
             
             if 'keep_in_mind' not in intro:
-                errors.append("Missing intro.keep_in_mind")
+                error("Missing intro.keep_in_mind", 'intro', 'keep_in_mind')
             elif not isinstance(intro['keep_in_mind'], dict):
-                errors.append("intro.keep_in_mind should be object")
+                error("intro.keep_in_mind should be object", 'intro', 'keep_in_mind')
             else:
                 if 'title' not in intro['keep_in_mind']:
-                    warnings.append("Missing intro.keep_in_mind.title")
+                    warning("Missing intro.keep_in_mind.title", 'intro', 'keep_in_mind', 'title')
                 if 'items' not in intro['keep_in_mind']:
-                    errors.append("Missing intro.keep_in_mind.items")
+                    error("Missing intro.keep_in_mind.items", 'intro', 'keep_in_mind', 'items')
                 elif not isinstance(intro['keep_in_mind']['items'], list):
-                    errors.append("intro.keep_in_mind.items should be array")
+                    error("intro.keep_in_mind.items should be array", 'intro', 'keep_in_mind', 'items')
         
         # Check prompts_artifact
         if 'prompts_artifact' in data:
             pa = data['prompts_artifact']
             for field in ['id', 'title', 'language', 'applies_to']:
                 if field not in pa:
-                    errors.append(f"Missing prompts_artifact.{field}")
+                    error(f"Missing prompts_artifact.{field}", 'prompts_artifact', field)
         
         # Check privacy_preface
         if 'privacy_preface' in data:
             pp = data['privacy_preface']
             if 'title' not in pp:
-                warnings.append("Missing privacy_preface.title")
+                warning("Missing privacy_preface.title", 'privacy_preface', 'title')
             if 'text' not in pp:
-                errors.append("Missing privacy_preface.text")
+                error("Missing privacy_preface.text", 'privacy_preface', 'text')
+        
+        # Only manifests with findings pay for the position-tracking parse
+        error_locations, warning_locations = [], []
+        if errors or warnings:
+            positions = source_map(manifest_path)
+            error_locations = [location(file, path, *positions.locate(path)) for path in error_pointers]
+            warning_locations = [location(file, path, *positions.locate(path)) for path in warning_pointers]
         
         # Determine status
         if errors:
@@ -192,7 +223,9 @@ class ManifestValidator:
             'phase': phase_name,
             'status': status,
             'errors': errors,
-            'warnings': warnings
+            'warnings': warnings,
+            'error_locations': error_locations,
+            'warning_locations': warning_locations
         }
     
     def format_text(self, results: List[Dict]) -> str:
@@ -215,12 +248,12 @@ class ManifestValidator:
             
             if result.get('errors'):
                 lines.append(f"  ERRORS ({len(result['errors'])}):")
-                for error in result['errors']:
+                for error in located_messages(result, 'error'):
                     lines.append(f"    - {error}")
             
             if result.get('warnings'):
                 lines.append(f"  WARNINGS ({len(result['warnings'])}):")
-                for warning in result['warnings']:
+                for warning in located_messages(result, 'warning'):
                     lines.append(f"    - {warning}")
             
             lines.append("")
@@ -245,6 +278,7 @@ def main():
     parser.add_argument('--phase', help='Specific phase to validate (default: all)')
     parser.add_argument('--strict', action='store_true', help='Fail on warnings')
     parser.add_argument('--format', choices=['text', 'json'], default='text')
+    parser.add_argument('--jobs', type=int, default=1, help='Validate phases in N worker processes (0 = all CPUs)')
     
     args = parser.parse_args()
     
@@ -258,23 +292,19 @@ def main():
         sys.exit(1)
     
     # Get phases to validate
+    corpus = PhaseCorpus(data_dir)
     if args.phase:
-        phases = [data_dir / args.phase]
+        phases = [corpus.phase_dir(args.phase)]
         if not phases[0].exists():
             print(f"ERROR: Phase directory not found: {args.phase}")
             sys.exit(1)
     else:
-        phases = [p for p in data_dir.iterdir() if p.is_dir() and p.name.startswith('phase')]
-        phases.sort()
+        phases = [corpus.phase_dir(p) for p in sorted(corpus.phases())]
     
     # Run validation
     validator = ManifestValidator(strict=args.strict)
-    results = []
-    
-    for phase_dir in phases:
-        manifest_path = phase_dir / "manifest.json"
-        result = validator.validate_manifest(manifest_path)
-        results.append(result)
+    manifest_paths = [phase_dir / "manifest.json" for phase_dir in phases]
+    results = map_phases(validator.validate_manifest, manifest_paths, args.jobs)
     
     # Format output
     if args.format == 'json':
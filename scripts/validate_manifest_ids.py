@@ -3,13 +3,16 @@
 """
 Validates that all question IDs listed in manifest.json (lite/full/sections)
 actually exist in the corresponding questions.json file.
+Checks are the 'manifest_ids' rule set of validation_engine.py.
+Issues are prefixed with the file:line:column of the offending ID.
 """
 
-import json
-import os
 import sys
 from pathlib import Path
 
+from phase_corpus import PhaseCorpus, load_json
+from validation_engine import ValidationEngine, locate_findings, located_message
+
 def validate_manifest(manifest_path):
     folder = manifest_path.parent
     questions_path = folder / "questions.json"
@@ -18,55 +21,21 @@ def validate_manifest(manifest_path):
         return [f"Missing questions.json in {folder}"]
 
     try:
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest_data = json.load(f)
-        with open(questions_path, 'r', encoding='utf-8') as f:
-            questions_data = json.load(f)
+        manifest_data = load_json(manifest_path)
+        questions_data = load_json(questions_path)
     except Exception as e:
         return [f"JSON Load Error: {e}"]
 
-    defined_q_ids = set(questions_data.get("questions", {}).keys())
-    errors = []
-
-    # Check manifests (lite/full) - assuming structure based on Phase Closure/Phase 0
-    # Note: Structure might vary, so we check various common keys
-    
-    manifests_block = questions_data.get("manifests", {}) # Sometimes in questions.json? 
-    # Wait, in the Phase Closure example earlier, 'manifests' block was in questions.json, NOT manifest.json!
-    # Let's check where the manifest IDs are stored.
-    # In Phase Closure questions.json (Step 13):
-    # "manifests": { "lite": { "question_ids": [...] }, "full": { ... } }
-    # So actually, we should be auditing questions.json internal consistency too.
-    
-    # Let's check the file named 'manifest.json' to see what it contains.
-    # In Step 7, data/phase_closure/manifest.json contained metadata (display, artifact, intro), 
-    # NOT the lists of questions. 
-    
-    # So the "manifest" of questions is actually inside `questions.json`.
-    # I should validate internal referential integrity of `questions.json`.
-    
-    # 1. Check 'manifests' block in questions.json
-    manifests = questions_data.get("manifests", {})
-    for m_name, m_data in manifests.items():
-        q_ids = m_data.get("question_ids", [])
-        for qid in q_ids:
-            if qid not in defined_q_ids:
-                errors.append(f"Manifest '{m_name}' references undefined ID '{qid}'")
-
-    # 2. Check 'sections' block in questions.json
-    sections = questions_data.get("sections", [])
-    for section in sections:
-        s_id = section.get("id")
-        q_ids = section.get("question_ids", [])
-        for qid in q_ids:
-            if qid not in defined_q_ids:
-                errors.append(f"Section '{s_id}' references undefined ID '{qid}'")
-
-    return errors
+    # The question lists live in questions.json ('manifests' and 'sections'
+    # blocks); manifest.json only holds display metadata
+    engine = ValidationEngine(rule_sets=['manifest_ids'])
+    findings = engine.run(folder.name, questions_data)
+    return [located_message(f) for f in locate_findings(folder, findings)]
 
 def main():
     root_dir = Path("./data")
-    questions_files = list(root_dir.rglob("questions.json"))
+    corpus = PhaseCorpus(root_dir)
+    questions_files = [corpus.path(p, "questions.json") for p in corpus.phases() if corpus.has(p, "questions.json")]
     
     total_errors = 0
     print(f"Scanning {len(questions_files)} questions.json files for integrity...")
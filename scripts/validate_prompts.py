@@ -9,6 +9,7 @@ defined in TEMPLATE_prompts.json.
 Usage:
     python scripts/validate_prompts.py --phase PHASE_ID
     python scripts/validate_prompts.py                    # Validate all phases
+    python scripts/validate_prompts.py --watch            # Re-validate on every save
 
 Inputs:
     - data/PHASE_ID/prompts.json
@@ -16,13 +17,17 @@ Inputs:
 Outputs:
     - Exit code 0 if all validations pass
     - Exit code 1 if any validation fails
-    - Validation report to stdout
+    - Validation report to stdout, each finding prefixed with file:line:column
+      (json: error_locations/warning_locations give file, JSON Pointer, line
+      and column per message)
 
 Operational Notes:
     - Reports missing required fields
     - Validates prompt structure (id, title, description, role, inputs, context, output_format, constraints)
     - Checks for all four required prompts: individual_reflection_lite, individual_reflection_full, couple_reflection_lite, couple_reflection_full
     - Token-efficient: ~10 tokens to run
+    - --watch re-validates only the saved phase and prints new (+) and
+      resolved (-) findings (see phase_watch.py); --poll-ms sets the interval
 
 Author: Roy Dawson IV
 GitHub: https://github.com/imyourboyroy
@@ -34,6 +39,10 @@ import argparse
 from pathlib import Path
 from typing import Dict, List
 
+from json_positions import display_path, pointer, source_map
+from phase_corpus import PhaseCorpus, load_json
+from validation_engine import finding_location, located_messages, location
+
 
 class PromptsValidator:
     """Validates prompts.json files against expected structure."""
@@ -77,136 +86,162 @@ class PromptsValidator:
             'phase': prompts_path.parent.name,
             'status': 'PASS',
             'errors': [],
-            'warnings': []
+            'warnings': [],
+            'error_locations': [],
+            'warning_locations': []
         }
+        # JSON Pointer of each finding, resolved to line:column once at the end
+        pointers = {'error': [], 'warning': []}
+        
+        def error(message: str, *path) -> None:
+            result['status'] = 'FAIL'
+            result['errors'].append(message)
+            pointers['error'].append(pointer(*path))
+        
+        def warning(message: str, *path) -> None:
+            result['warnings'].append(message)
+            pointers['warning'].append(pointer(*path))
         
         # Check file exists
         if not prompts_path.exists():
             result['status'] = 'FAIL'
             result['errors'].append('File does not exist')
+            result['error_locations'].append(location(display_path(prompts_path), ''))
             return result
         
         # Load JSON
         try:
-            with open(prompts_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(prompts_path)
         except json.JSONDecodeError as e:
             result['status'] = 'FAIL'
             result['errors'].append(f'Invalid JSON: {e}')
+            result['error_locations'].append(location(display_path(prompts_path), '', e.lineno, e.colno))
             return result
         except Exception as e:
             result['status'] = 'FAIL'
             result['errors'].append(f'Error reading file: {e}')
+            result['error_locations'].append(location(display_path(prompts_path), ''))
             return result
         
+        self._check(data, error, warning)
+        
+        # Only files with findings pay for the position-tracking parse
+        if result['errors'] or result['warnings']:
+            file = display_path(prompts_path)
+            positions = source_map(prompts_path)
+            for kind, paths in pointers.items():
+                result[f'{kind}_locations'] = [location(file, path, *positions.locate(path)) for path in paths]
+        
+        # Treat warnings as errors in strict mode
+        if self.strict and result['warnings']:
+            result['status'] = 'FAIL'
+        
+        return result
+    
+    def _check(self, data: Dict, error, warning) -> None:
+        """Run the structure checks, reporting through error(message, *path)/warning(message, *path)."""
         # Check root structure
         if 'prompts' not in data:
-            result['status'] = 'FAIL'
-            result['errors'].append('Missing root "prompts" object')
-            return result
+            error('Missing root "prompts" object', 'prompts')
+            return
         
         prompts = data['prompts']
         if not isinstance(prompts, dict):
-            result['status'] = 'FAIL'
-            result['errors'].append('"prompts" must be an object/dict')
-            return result
+            error('"prompts" must be an object/dict', 'prompts')
+            return
         
         # Check required prompts exist
         for required_prompt in self.REQUIRED_PROMPTS:
             if required_prompt not in prompts:
-                result['status'] = 'FAIL'
-                result['errors'].append(f'Missing required prompt: {required_prompt}')
+                error(f'Missing required prompt: {required_prompt}', 'prompts', required_prompt)
         
         # Validate each prompt
         for prompt_name, prompt_data in prompts.items():
             # Check prompt is a dict
             if not isinstance(prompt_data, dict):
-                result['status'] = 'FAIL'
-                result['errors'].append(f'{prompt_name}: must be an object')
+                error(f'{prompt_name}: must be an object', 'prompts', prompt_name)
                 continue
             
             # Check required fields
             for field, field_type in self.REQUIRED_PROMPT_FIELDS.items():
                 if field not in prompt_data:
-                    result['status'] = 'FAIL'
-                    result['errors'].append(f'{prompt_name}: missing required field "{field}"')
+                    error(f'{prompt_name}: missing required field "{field}"', 'prompts', prompt_name, field)
                 elif not isinstance(prompt_data[field], field_type):
-                    result['status'] = 'FAIL'
-                    result['errors'].append(
+                    error(
                         f'{prompt_name}.{field}: expected {field_type.__name__}, '
-                        f'got {type(prompt_data[field]).__name__}'
+                        f'got {type(prompt_data[field]).__name__}',
+                        'prompts', prompt_name, field
                     )
             
             # Validate inputs array
             if 'inputs' in prompt_data and isinstance(prompt_data['inputs'], list):
                 for idx, input_field in enumerate(prompt_data['inputs']):
                     if not isinstance(input_field, dict):
-                        result['status'] = 'FAIL'
-                        result['errors'].append(
-                            f'{prompt_name}.inputs[{idx}]: must be an object'
-                        )
+                        error(f'{prompt_name}.inputs[{idx}]: must be an object', 'prompts', prompt_name, 'inputs', idx)
                         continue
                     
                     for req_field, req_type in self.REQUIRED_INPUT_FIELDS.items():
                         if req_field not in input_field:
-                            result['status'] = 'FAIL'
-                            result['errors'].append(
-                                f'{prompt_name}.inputs[{idx}]: missing "{req_field}"'
+                            error(
+                                f'{prompt_name}.inputs[{idx}]: missing "{req_field}"',
+                                'prompts', prompt_name, 'inputs', idx, req_field
                             )
                         elif not isinstance(input_field[req_field], req_type):
-                            result['status'] = 'FAIL'
-                            result['errors'].append(
+                            error(
                                 f'{prompt_name}.inputs[{idx}].{req_field}: expected {req_type.__name__}, '
-                                f'got {type(input_field[req_field]).__name__}'
+                                f'got {type(input_field[req_field]).__name__}',
+                                'prompts', prompt_name, 'inputs', idx, req_field
                             )
             
             # Validate output_format array
             if 'output_format' in prompt_data and isinstance(prompt_data['output_format'], list):
                 for idx, section in enumerate(prompt_data['output_format']):
                     if not isinstance(section, dict):
-                        result['status'] = 'FAIL'
-                        result['errors'].append(
-                            f'{prompt_name}.output_format[{idx}]: must be an object'
+                        error(
+                            f'{prompt_name}.output_format[{idx}]: must be an object',
+                            'prompts', prompt_name, 'output_format', idx
                         )
                         continue
                     
                     for req_field, req_type in self.REQUIRED_OUTPUT_FORMAT_FIELDS.items():
                         if req_field not in section:
-                            result['status'] = 'FAIL'
-                            result['errors'].append(
-                                f'{prompt_name}.output_format[{idx}]: missing "{req_field}"'
+                            error(
+                                f'{prompt_name}.output_format[{idx}]: missing "{req_field}"',
+                                'prompts', prompt_name, 'output_format', idx, req_field
                             )
                         elif not isinstance(section[req_field], req_type):
-                            result['status'] = 'FAIL'
-                            result['errors'].append(
+                            error(
                                 f'{prompt_name}.output_format[{idx}].{req_field}: expected {req_type.__name__}, '
-                                f'got {type(section[req_field]).__name__}'
+                                f'got {type(section[req_field]).__name__}',
+                                'prompts', prompt_name, 'output_format', idx, req_field
                             )
             
             # Validate constraints array
             if 'constraints' in prompt_data and isinstance(prompt_data['constraints'], list):
                 if len(prompt_data['constraints']) == 0:
-                    result['warnings'].append(
-                        f'{prompt_name}.constraints: empty array, consider adding constraints'
+                    warning(
+                        f'{prompt_name}.constraints: empty array, consider adding constraints',
+                        'prompts', prompt_name, 'constraints'
                     )
                 for idx, constraint in enumerate(prompt_data['constraints']):
                     if not isinstance(constraint, str):
-                        result['status'] = 'FAIL'
-                        result['errors'].append(
-                            f'{prompt_name}.constraints[{idx}]: must be a string'
+                        error(
+                            f'{prompt_name}.constraints[{idx}]: must be a string',
+                            'prompts', prompt_name, 'constraints', idx
                         )
             
             # Validate context array
             if 'context' in prompt_data and isinstance(prompt_data['context'], list):
                 if len(prompt_data['context']) == 0:
-                    result['warnings'].append(
-                        f'{prompt_name}.context: empty array, consider adding context'
+                    warning(
+                        f'{prompt_name}.context: empty array, consider adding context',
+                        'prompts', prompt_name, 'context'
                     )
                 for idx, context_item in enumerate(prompt_data['context']):
                     if not isinstance(context_item, str):
-                        result['status'] = 'FAIL'
-                        result['errors'].append(
-                            f'{prompt_name}.context[{idx}]: must be a string'
+                        error(
+                            f'{prompt_name}.context[{idx}]: must be a string',
+                            'prompts', prompt_name, 'context', idx
                         )
             
             # Check for placeholder text that should be replaced
@@ -215,15 +250,10 @@ class PromptsValidator:
                 if field in prompt_data and isinstance(prompt_data[field], str):
                     for pattern in placeholder_patterns:
                         if pattern in prompt_data[field]:
-                            result['warnings'].append(
-                                f'{prompt_name}.{field}: contains placeholder text "{pattern}"'
+                            warning(
+                                f'{prompt_name}.{field}: contains placeholder text "{pattern}"',
+                                'prompts', prompt_name, field
                             )
-        
-        # Treat warnings as errors in strict mode
-        if self.strict and result['warnings']:
-            result['status'] = 'FAIL'
-        
-        return result
     
     def format_text(self, results: List[Dict]) -> str:
         """Format validation results as text."""
@@ -247,11 +277,11 @@ class PromptsValidator:
             lines.append(f"{status_symbol} {r['phase']}: {r['status']}")
             
             if r['errors']:
-                for err in r['errors']:
+                for err in located_messages(r, 'error'):
                     lines.append(f"  ❌ {err}")
                 failed += 1
             elif r['warnings']:
-                for warn in r['warnings']:
+                for warn in located_messages(r, 'warning'):
                     lines.append(f"  ⚠️  {warn}")
                 warnings += 1
             else:
@@ -285,6 +315,17 @@ def main():
         default='text',
         help='Output format'
     )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Re-validate on every save and print finding diffs'
+    )
+    parser.add_argument(
+        '--poll-ms',
+        type=float,
+        default=50,
+        help='--watch polling interval in ms (default: 50)'
+    )
     
     args = parser.parse_args()
     
@@ -297,17 +338,37 @@ def main():
         sys.exit(1)
     
     # Collect phases to validate
+    corpus = PhaseCorpus(data_dir)
     if args.phase:
-        phases = [data_dir / args.phase]
+        phases = [corpus.phase_dir(args.phase)]
         if not phases[0].exists():
             print(f'Error: phase directory not found: {phases[0]}', file=sys.stderr)
             sys.exit(1)
     else:
-        # Find all phase directories
-        phases = sorted([p for p in data_dir.iterdir() if p.is_dir() and p.name.startswith('phase_')])
+        # Registered phases plus any unregistered phase directories
+        phases = [corpus.phase_dir(p) for p in sorted(corpus.phases())]
     
     # Validate each phase
     validator = PromptsValidator(strict=args.strict)
+    
+    if args.watch:
+        from phase_watch import PhaseWatcher, watch_findings
+        
+        def check(phase: str):
+            result = validator.validate_prompts(corpus.path(phase, 'prompts.json'))
+            if result['errors'] and result['errors'][0].startswith(('Invalid JSON', 'Error reading file')):
+                return 'ERROR', result['errors'], [finding_location(where or {}) for where in result['error_locations']]
+            # Diff bare messages; locations are only shown (see watch_findings)
+            findings = [f"ERROR: {e}" for e in result['errors']] + [f"WARNING: {w}" for w in result['warnings']]
+            locations = [finding_location(where or {})
+                         for where in result['error_locations'] + result['warning_locations']]
+            return result['status'], findings, locations
+        
+        watcher = PhaseWatcher(corpus, ['prompts.json'], phases=[args.phase] if args.phase else None,
+                               poll_ms=args.poll_ms)
+        watch_findings(watcher, check)
+        return
+    
     results = []
     
     for phase_dir in phases:
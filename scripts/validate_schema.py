@@ -10,6 +10,10 @@ Usage:
     python scripts/validate_schema.py [--phase PHASE] [--format FORMAT] [--strict]
     python scripts/validate_schema.py --phase phase_0
     python scripts/validate_schema.py --check structure,references --format json
+    python scripts/validate_schema.py --jobs 8
+    python scripts/validate_schema.py --compiled
+    python scripts/validate_schema.py --benchmark [--repeat 50]
+    python scripts/validate_schema.py --watch [--phase phase_0]
 
 CLI Arguments:
     --phase: Optional. Specific phase to validate. Default: all phases
@@ -18,6 +22,15 @@ CLI Arguments:
     --check: Optional. Comma-separated checks to run. Default: all
     --strict: Optional. Fail on warnings (not just errors)
     --verbose: Optional. Show detailed validation info
+    --jobs: Optional. Worker processes for multi-phase runs (0 = all CPUs). Default: 1
+    --no-cache: Optional. Re-check everything instead of replaying cached results
+    --compiled: Optional. Validate questions/manifest/prompts.json against the formal
+        JSON Schemas in data/schema/ using the generated validators
+    --benchmark: Optional. Time the hand-written checks against the compiled validator
+    --repeat: Optional. Runs per benchmark case (best is reported). Default: 20
+    --watch: Optional. Stay running; re-validate a phase on every save and print
+        only new (+) and resolved (-) findings
+    --poll-ms: Optional. How often --watch checks for saves. Default: 50
 
 Available Checks:
     structure: Required fields present (id, title, type, etc.)
@@ -32,12 +45,16 @@ Available Checks:
 
 Inputs:
     - data/{phase}/questions.json
+    - data/{phase}/manifest.json, prompts.json (--compiled only)
+    - data/schema/*.schema.json (--compiled only)
     - data/SCHEMA.md (reference)
 
 Outputs:
     - Validation report to stdout or file
     - Exit code: 0 (pass), 1 (fail)
-    - Concise error/warning messages
+    - Concise error/warning messages, each prefixed with file:line:column
+      (json: error_locations/warning_locations give file, JSON Pointer,
+      line and column for each message, in the same order)
 
 Operational Notes:
     - Read-only operation (no modifications)
@@ -45,6 +62,15 @@ Operational Notes:
     - Can run in CI/CD pipelines
     - Strict mode for pre-commit hooks
     - Token-efficient: ~10 tokens to run vs ~2,000 for manual review
+    - Results are cached in .cache/validation/ keyed by content hash and
+      rule-set version; after an edit only changed questions (and the
+      cross-references, if IDs/sections/manifests changed) are re-checked
+    - --jobs output is identical to a sequential run (results merge in phase order)
+    - Checks are the 'schema' rule set of validation_engine.py (one pass per phase)
+    - --compiled runs scripts/schema_validators.py (built by schema_compiler.py).
+      It covers structure and types only; cross-references (section/manifest
+      membership, duplicate orders, orphans) need the default mode. --check
+      does not apply in this mode
 
 Author: Roy Dawson IV
 GitHub: https://github.com/imyourboyroy
@@ -52,18 +78,28 @@ GitHub: https://github.com/imyourboyroy
 
 import json
 import sys
+import time
 import argparse
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
-from collections import defaultdict
+from typing import Dict, List
+
+from phase_corpus import QUESTION_TYPES, MANIFEST_NAMES, PhaseCorpus, load_json, map_phases
+from validation_engine import ERROR, WARNING, REQUIRED_QUESTION_FIELDS, ValidationCache, ValidationEngine
+from validation_engine import finding_location, located_messages, location
 
 
 class SchemaValidator:
     """Validates questions.json against schema requirements."""
     
-    VALID_TYPES = ['free_text', 'single_select', 'multi_select', 'ranked_select', 'compound']
-    VALID_MANIFESTS = ['lite', 'full']
-    REQUIRED_QUESTION_FIELDS = ['id', 'section_id', 'order', 'title', 'prompt', 'type', 'answer_schema', 'examples', 'tags']
+    VALID_TYPES = QUESTION_TYPES
+    VALID_MANIFESTS = MANIFEST_NAMES
+    REQUIRED_QUESTION_FIELDS = REQUIRED_QUESTION_FIELDS
+    
+    # Files checked by --compiled, each against data/schema/{name}.schema.json
+    COMPILED_FILES = ['questions', 'manifest', 'prompts']
+    
+    # Hand-written checks covering what the formal JSON Schema covers
+    STRUCTURAL_CHECKS = ['structure', 'types', 'options', 'fields']
     
     ALL_CHECKS = [
         'structure',
@@ -79,78 +115,38 @@ class SchemaValidator:
         'manifest_tags'
     ]
     
-    def __init__(self, enabled_checks: List[str] = None, strict: bool = False, verbose: bool = False):
+    def __init__(self, enabled_checks: List[str] = None, strict: bool = False, verbose: bool = False,
+                 use_cache: bool = True, compiled: bool = False):
         self.enabled_checks = set(enabled_checks) if enabled_checks else set(self.ALL_CHECKS)
         self.strict = strict
         self.verbose = verbose
+        self.compiled = compiled
+        self.engine = ValidationEngine(rule_sets=['schema'], checks=list(self.enabled_checks),
+                                       cache=ValidationCache() if use_cache else None)
     
     def validate_phase(self, phase_dir: Path) -> Dict:
         """Validate a single phase. Returns validation results."""
-        questions_file = phase_dir / "questions.json"
+        if self.compiled:
+            return self.validate_phase_compiled(phase_dir)
+        result = self.engine.validate_phase(phase_dir)
         
-        if not questions_file.exists():
+        if result.get('error'):
+            detail = result.get('detail')
             return {
-                'phase': phase_dir.name,
+                'phase': result['phase'],
                 'status': 'ERROR',
-                'message': 'questions.json not found',
-                'errors': [],
+                'message': result['error'],
+                'errors': [detail] if detail else [],
                 'warnings': []
             }
         
-        # Load and validate JSON syntax
-        try:
-            with open(questions_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            return {
-                'phase': phase_dir.name,
-                'status': 'ERROR',
-                'message': f'JSON syntax error: {e}',
-                'errors': [str(e)],
-                'warnings': []
-            }
-        
-        errors = []
-        warnings = []
-        
-        # Run enabled checks
-        if 'structure' in self.enabled_checks:
-            errors.extend(self._check_structure(data))
-        
-        if 'types' in self.enabled_checks:
-            errors.extend(self._check_types(data))
-        
-        if 'references' in self.enabled_checks:
-            errors.extend(self._check_references(data))
-        
-        if 'manifests' in self.enabled_checks:
-            errors.extend(self._check_manifests(data))
-        
-        if 'options' in self.enabled_checks:
-            errors.extend(self._check_options(data))
-        
-        if 'fields' in self.enabled_checks:
-            errors.extend(self._check_fields(data))
-        
-        if 'manifest_tags' in self.enabled_checks:
-            errors.extend(self._check_manifest_tags(data))
-        
-        if 'duplicates' in self.enabled_checks:
-            errors.extend(self._check_duplicates(data))
-        
-        if 'orphans' in self.enabled_checks:
-            warnings_found = self._check_orphans(data)
-            if self.strict:
-                errors.extend(warnings_found)
-            else:
-                warnings.extend(warnings_found)
-        
-        if 'best_practices' in self.enabled_checks:
-            warnings_found = self._check_best_practices(data)
-            if self.strict:
-                errors.extend(warnings_found)
-            else:
-                warnings.extend(warnings_found)
+        error_findings = [f for f in result['findings'] if f['severity'] == ERROR]
+        warning_findings = [f for f in result['findings'] if f['severity'] == WARNING]
+        if self.strict:
+            error_findings.extend(warning_findings)
+            warning_findings = []
+        errors = [f['message'] for f in error_findings]
+        warnings = [f['message'] for f in warning_findings]
         
         # Determine status
         if errors:
@@ -161,192 +157,54 @@ class SchemaValidator:
             status = 'PASS'
         
         return {
-            'phase': phase_dir.name,
+            'phase': result['phase'],
             'status': status,
             'errors': errors,
             'warnings': warnings,
-            'checks_run': list(self.enabled_checks)
+            'error_locations': [location(f.get('file'), f['path'], f.get('line'), f.get('column'))
+                                for f in error_findings],
+            'warning_locations': [location(f.get('file'), f['path'], f.get('line'), f.get('column'))
+                                  for f in warning_findings],
+            'checks_run': [c for c in self.ALL_CHECKS if c in self.enabled_checks]
         }
     
-    def _check_structure(self, data: Dict) -> List[str]:
-        """Check required top-level structure."""
-        errors = []
-        
-        if 'sections' not in data:
-            errors.append("Missing 'sections' array")
-        if 'questions' not in data:
-            errors.append("Missing 'questions' object")
-        if 'manifests' not in data:
-            errors.append("Missing 'manifests' object")
-        
-        # Check questions have required fields
-        for qid, q in data.get('questions', {}).items():
-            missing = [f for f in self.REQUIRED_QUESTION_FIELDS if f not in q]
-            if missing:
-                errors.append(f"{qid}: Missing required fields: {', '.join(missing)}")
-        
-        return errors
-    
-    def _check_types(self, data: Dict) -> List[str]:
-        """Validate question types."""
-        errors = []
-        
-        for qid, q in data.get('questions', {}).items():
-            qtype = q.get('type')
-            if qtype and qtype not in self.VALID_TYPES:
-                errors.append(f"{qid}: Invalid type '{qtype}'. Must be one of {self.VALID_TYPES}")
-        
-        return errors
-    
-    def _check_references(self, data: Dict) -> List[str]:
-        """Check section_id references exist."""
-        errors = []
-        
-        section_ids = {s['id'] for s in data.get('sections', [])}
-        
-        for qid, q in data.get('questions', {}).items():
-            section_id = q.get('section_id')
-            if section_id and section_id not in section_ids:
-                errors.append(f"{qid}: Invalid section_id '{section_id}' (section doesn't exist)")
-        
-        return errors
-    
-    def _check_manifests(self, data: Dict) -> List[str]:
-        """Validate manifest question_id references."""
-        errors = []
-        
-        question_ids = set(data.get('questions', {}).keys())
-        
-        for manifest_name, manifest in data.get('manifests', {}).items():
-            for qid in manifest.get('question_ids', []):
-                if qid not in question_ids:
-                    errors.append(f"Manifest '{manifest_name}': References non-existent question '{qid}'")
-        
-        return errors
-    
-    def _check_manifest_tags(self, data: Dict) -> List[str]:
-        """Validate consistency between manifest lists and question tags."""
-        errors = []
-        questions = data.get('questions', {})
-        manifests = data.get('manifests', {})
-        
-        # Check for each known manifest type
-        for manifest_id in ['lite', 'full']:
-            if manifest_id not in manifests:
+    def validate_phase_compiled(self, phase_dir: Path) -> Dict:
+        """Validate a phase's three files with the compiled JSON Schema validators."""
+        # Imported here so the default mode never loads the compiler
+        from schema_compiler import load_validators
+        from json_positions import display_path, source_map
+        validators = load_validators()
+        
+        errors, error_locations = [], []
+        for name in self.COMPILED_FILES:
+            path = phase_dir / f"{name}.json"
+            if not path.exists():
+                if name == 'questions':
+                    return {'phase': phase_dir.name, 'status': 'ERROR',
+                            'message': 'questions.json not found', 'errors': [], 'warnings': []}
+                errors.append(f"{name}.json not found")
+                error_locations.append(None)
                 continue
-                
-            manifest_q_ids = set(manifests[manifest_id].get('question_ids', []))
-            
-            # 1. Check if questions in manifest have the tag
-            for qid in manifest_q_ids:
-                if qid in questions:
-                    tags = questions[qid].get('tags', {}).get('included_in_manifests', [])
-                    if manifest_id not in tags:
-                        errors.append(f"Question '{qid}' is in '{manifest_id}' manifest but missing '{manifest_id}' tag")
-            
-            # 2. Check if questions with tag are in manifest
-            for qid, q in questions.items():
-                tags = q.get('tags', {}).get('included_in_manifests', [])
-                if manifest_id in tags:
-                    if qid not in manifest_q_ids:
-                        errors.append(f"Question '{qid}' has '{manifest_id}' tag but is missing from '{manifest_id}' manifest")
-        
-        return errors
-    
-    def _check_options(self, data: Dict) -> List[str]:
-        """Validate options for select-type questions."""
-        errors = []
+            try:
+                data = load_json(path)
+            except json.JSONDecodeError as e:
+                return {'phase': phase_dir.name, 'status': 'ERROR',
+                        'message': f'JSON syntax error: {e}', 'errors': [f"{name}.json: {e}"], 'warnings': []}
+            found = validators[name](data)
+            positions = source_map(path) if found else None
+            for pointer, message in found:
+                errors.append(f"{name}.json#{pointer}: {message}")
+                error_locations.append(location(display_path(path), pointer, *positions.locate(pointer)))
         
-        for qid, q in data.get('questions', {}).items():
-            if q.get('type') in ['single_select', 'multi_select']:
-                options = q.get('options', [])
-                
-                if not options:
-                    errors.append(f"{qid}: Select-type question missing options array")
-                
-                for i, opt in enumerate(options):
-                    if 'value' not in opt:
-                        errors.append(f"{qid}: Option {i} missing 'value'")
-                    if 'label' not in opt:
-                        errors.append(f"{qid}: Option {i} missing 'label'")
-        
-        return errors
-    
-    def _check_best_practices(self, data: Dict) -> List[str]:
-        """Check best practices (returns warnings, not errors)."""
-        warnings = []
-        
-        for qid, q in data.get('questions', {}).items():
-            # Warn if multi_select has no max limit (can cause analysis paralysis)
-            if q.get('type') == 'multi_select':
-                if 'max' not in q:
-                    num_options = len(q.get('options', []))
-                    warnings.append(f"{qid}: multi_select has no max limit ({num_options} options). Consider adding max to prevent analysis paralysis.")
-        
-        return warnings
-    
-    def _check_fields(self, data: Dict) -> List[str]:
-        """Validate compound field structures."""
-        errors = []
-        
-        for qid, q in data.get('questions', {}).items():
-            if q.get('type') == 'compound':
-                fields = q.get('fields', [])
-                
-                if not fields:
-                    errors.append(f"{qid}: Compound question missing 'fields' array")
-                
-                for field in fields:
-                    if 'key' not in field:
-                        errors.append(f"{qid}: Compound field missing 'key'")
-                    if 'type' not in field:
-                        errors.append(f"{qid}: Compound field missing 'type'")
-                    if 'label' not in field:
-                        errors.append(f"{qid}: Compound field missing 'label'")
-        
-        return errors
-    
-    def _check_duplicates(self, data: Dict) -> List[str]:
-        """Check for duplicate IDs and order numbers."""
-        errors = []
-        
-        # Check duplicate question IDs (shouldn't happen with dict keys, but check anyway)
-        question_ids = list(data.get('questions', {}).keys())
-        if len(question_ids) != len(set(question_ids)):
-            duplicates = [qid for qid in question_ids if question_ids.count(qid) > 1]
-            errors.append(f"Duplicate question IDs found: {', '.join(set(duplicates))}")
-        
-        # Check duplicate order numbers within sections
-        for section in data.get('sections', []):
-            section_questions = section.get('question_ids', [])
-            orders = {}
-            
-            for qid in section_questions:
-                if qid in data.get('questions', {}):
-                    order = data['questions'][qid].get('order')
-                    if order in orders:
-                        errors.append(f"Section {section['id']}: Duplicate order {order} ({orders[order]} and {qid})")
-                    orders[order] = qid
-        
-        return errors
-    
-    def _check_orphans(self, data: Dict) -> List[str]:
-        """Find questions not in any section."""
-        warnings = []
-        
-        # Get all questions in sections
-        questions_in_sections = set()
-        for section in data.get('sections', []):
-            questions_in_sections.update(section.get('question_ids', []))
-        
-        # Find orphans
-        all_questions = set(data.get('questions', {}).keys())
-        orphans = all_questions - questions_in_sections
-        
-        if orphans:
-            warnings.append(f"Orphan questions (not in any section): {', '.join(sorted(orphans))}")
-        
-        return warnings
+        return {
+            'phase': phase_dir.name,
+            'status': 'FAIL' if errors else 'PASS',
+            'errors': errors,
+            'warnings': [],
+            'error_locations': error_locations,
+            'warning_locations': [],
+            'checks_run': ['compiled']
+        }
     
     def format_text(self, results: List[Dict]) -> str:
         """Format validation results as text."""
@@ -375,14 +233,14 @@ class SchemaValidator:
             
             if result.get('errors'):
                 lines.append(f"  ERRORS ({len(result['errors'])}):")
-                for error in result['errors'][:10]:
+                for error in located_messages(result, 'error')[:10]:
                     lines.append(f"    - {error}")
                 if len(result['errors']) > 10:
                     lines.append(f"    ... and {len(result['errors']) - 10} more")
             
             if result.get('warnings'):
                 lines.append(f"  WARNINGS ({len(result['warnings'])}):")
-                for warning in result['warnings'][:10]:
+                for warning in located_messages(result, 'warning')[:10]:
                     lines.append(f"    - {warning}")
                 if len(result['warnings']) > 10:
                     lines.append(f"    ... and {len(result['warnings']) - 10} more")
@@ -398,6 +256,85 @@ class SchemaValidator:
     def format_json(self, results: List[Dict]) -> str:
         """Format validation results as JSON."""
         return json.dumps(results, indent=2, ensure_ascii=False)
+    
+    def format_markdown(self, results: List[Dict]) -> str:
+        """Format validation results as Markdown."""
+        lines = ["# Schema Validation Report\n"]
+        
+        for result in results:
+            lines.append(f"## {result['phase']}: {result['status']}\n")
+            if result.get('message'):
+                lines.append(f"**Error**: {result['message']}\n")
+            
+            for kind, title in (('error', 'Errors'), ('warning', 'Warnings')):
+                messages = result.get(f'{kind}s') or []
+                if not messages:
+                    continue
+                locations = result.get(f'{kind}_locations') or []
+                lines.append(f"### {title} ({len(messages)})\n")
+                for index, message in enumerate(messages):
+                    where = finding_location((locations[index] if index < len(locations) else None) or {})
+                    lines.append(f"- `{where}` {message}" if where else f"- {message}")
+                lines.append("")
+        
+        total_pass = sum(1 for r in results if r['status'] == 'PASS')
+        total_warn = sum(1 for r in results if r['status'] == 'WARN')
+        total_fail = sum(1 for r in results if r['status'] in ('FAIL', 'ERROR'))
+        lines.append("---\n")
+        lines.append(f"**Summary**: {total_pass} passed, {total_warn} warnings, {total_fail} failed\n")
+        return "\n".join(lines)
+
+
+def benchmark(phase_dirs: List[Path], repeat: int) -> None:
+    """Time hand-written checks vs the compiled validator on already-parsed questions.json."""
+    from schema_compiler import load_validators
+    validate_questions = load_validators()['questions']
+    hand_all = ValidationEngine(rule_sets=['schema'])
+    hand_structural = ValidationEngine(rule_sets=['schema'], checks=SchemaValidator.STRUCTURAL_CHECKS)
+    
+    def best(func) -> float:
+        timings = []
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings) * 1000
+    
+    print(f"{'Phase':<15} {'Questions':>9} {'hand (all)':>11} {'hand (struct)':>14} {'compiled':>10} {'speedup':>8}")
+    totals = [0.0, 0.0, 0.0]
+    for phase_dir in phase_dirs:
+        path = phase_dir / "questions.json"
+        if not path.exists():
+            continue
+        data = load_json(path)
+        row = [
+            best(lambda: hand_all.run(phase_dir.name, data)),
+            best(lambda: hand_structural.run(phase_dir.name, data)),
+            best(lambda: validate_questions(data)),
+        ]
+        totals = [t + r for t, r in zip(totals, row)]
+        print(f"{phase_dir.name:<15} {len(data.get('questions', {})):>9} {row[0]:>9.2f}ms {row[1]:>12.2f}ms "
+              f"{row[2]:>8.2f}ms {row[1] / row[2]:>7.1f}x")
+    print(f"{'TOTAL':<15} {'':>9} {totals[0]:>9.2f}ms {totals[1]:>12.2f}ms {totals[2]:>8.2f}ms "
+          f"{totals[1] / totals[2]:>7.1f}x")
+    print("(speedup = hand-written structure/types/options/fields checks vs compiled full schema; "
+          f"best of {repeat}, parse time excluded)")
+
+
+def watch(validator: SchemaValidator, corpus: PhaseCorpus, phases: List[str] = None, poll_ms: float = 50) -> None:
+    """Re-validate each saved phase; the results cache limits work to changed questions."""
+    from phase_watch import PhaseWatcher, watch_findings
+    
+    filenames = [f"{name}.json" for name in SchemaValidator.COMPILED_FILES] if validator.compiled else ['questions.json']
+    
+    def check(phase: str):
+        result = validator.validate_phase(corpus.phase_dir(phase))
+        if result['status'] == 'ERROR':
+            return 'ERROR', [result['message']]
+        findings = [f"ERROR: {e}" for e in result['errors']] + [f"WARNING: {w}" for w in result['warnings']]
+        return result['status'], findings
+    
+    watch_findings(PhaseWatcher(corpus, filenames, phases=phases, poll_ms=poll_ms), check)
 
 
 def main():
@@ -408,14 +345,26 @@ def main():
     )
     
     parser.add_argument('--phase', help='Specific phase to validate (default: all)')
-    parser.add_argument('--format', choices=['text', 'json'], default='text')
+    parser.add_argument('--format', choices=['text', 'json', 'markdown'], default='text')
     parser.add_argument('--output', help='Save report to file')
     parser.add_argument('--check', help=f'Checks to run (comma-separated). Available: {", ".join(SchemaValidator.ALL_CHECKS)}')
     parser.add_argument('--strict', action='store_true', help='Fail on warnings')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--jobs', type=int, default=1, help='Validate phases in N worker processes (0 = all CPUs)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-check everything; skip the results cache')
+    parser.add_argument('--compiled', action='store_true',
+                        help='Validate against data/schema/*.schema.json with the generated validators')
+    parser.add_argument('--benchmark', action='store_true', help='Time hand-written checks vs the compiled validator')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per benchmark case (default: 20)')
+    parser.add_argument('--watch', action='store_true', help='Re-validate on every save and print finding diffs')
+    parser.add_argument('--poll-ms', type=float, default=50, help='--watch polling interval in ms (default: 50)')
     
     args = parser.parse_args()
     
+    if args.compiled and args.check:
+        print("ERROR: --check does not apply to --compiled (the formal schema runs as a whole)")
+        sys.exit(1)
+    
     # Parse checks
     enabled_checks = None
     if args.check:
@@ -436,26 +385,33 @@ def main():
         sys.exit(1)
     
     # Get phases to validate
+    corpus = PhaseCorpus(data_dir)
     if args.phase:
-        phases = [data_dir / args.phase]
+        phases = [corpus.phase_dir(args.phase)]
         if not phases[0].exists():
             print(f"ERROR: Phase directory not found: {args.phase}")
             sys.exit(1)
     else:
-        phases = [p for p in data_dir.iterdir() if p.is_dir() and p.name.startswith('phase')]
-        phases.sort()
+        phases = [corpus.phase_dir(p) for p in sorted(corpus.phases())]
+    
+    if args.benchmark:
+        benchmark(phases, args.repeat)
+        return
     
     # Run validation
-    validator = SchemaValidator(enabled_checks=enabled_checks, strict=args.strict, verbose=args.verbose)
-    results = []
+    validator = SchemaValidator(enabled_checks=enabled_checks, strict=args.strict, verbose=args.verbose,
+                                use_cache=not args.no_cache, compiled=args.compiled)
+    if args.watch:
+        watch(validator, corpus, [p.name for p in phases] if args.phase else None, args.poll_ms)
+        return
     
-    for phase_dir in phases:
-        result = validator.validate_phase(phase_dir)
-        results.append(result)
+    results = map_phases(validator.validate_phase, phases, args.jobs)
     
     # Format output
     if args.format == 'json':
         output = validator.format_json(results)
+    elif args.format == 'markdown':
+        output = validator.format_markdown(results)
     else:
         output = validator.format_text(results)
     
@@ -0,0 +1,1353 @@
+# ./scripts/validation_engine.py
+"""
+Validation Engine - Single-Pass Rule Registry for Phase Data
+=============================================================
+
+Walks each phase's questions.json (and prompts.json) exactly once and feeds
+every node to the rules subscribed to its kind. The legacy validators
+(validate_schema, review_compliance, audit_questions_schema,
+find_schema_mismatches_generic, validate_manifest_ids,
+audit_questions_other_fields) are thin wrappers that run their own rule set
+and keep their original report formats.
+
+Usage:
+    python scripts/validation_engine.py
+    python scripts/validation_engine.py --phase phase_0
+    python scripts/validation_engine.py --rule-set schema,compliance --format json
+    python scripts/validation_engine.py --list
+    python scripts/validation_engine.py --benchmark
+    python scripts/validation_engine.py --scale [--budget-s 20]
+
+CLI Arguments:
+    --phase: Optional. Specific phase to validate. Default: all phases
+    --rule-set: Optional. Comma-separated rule sets to run. Default: all
+    --format: Optional. Output format (text, json). Default: text
+    --strict: Optional. Fail on warnings (not just errors)
+    --list: Optional. List registered rules and the node kinds they subscribe to
+    --jobs: Optional. Worker processes for multi-phase runs (0 = all CPUs). Default: 1
+    --no-cache: Optional. Re-check everything instead of replaying cached results
+    --clear-cache: Optional. Delete .cache/validation/ entries and exit
+    --benchmark: Optional. Time full vs cache-hit vs one-question-edit runs per phase
+    --repeat: Optional. Runs per benchmark case. Default: 20
+    --scale: Optional. Validate + audit a synthetic N-question phase against a
+        time budget (N defaults to 100000); fails on super-linear growth
+    --budget-s: Optional. Time budget in seconds for --scale. Default: 20
+
+Node Kinds (traversal order):
+    document: The parsed questions.json object
+    section: Each entry of 'sections'
+    question: Each entry of 'questions', followed by its
+        option: Each entry of the question's 'options'
+        field: Each entry of the question's 'fields'
+    manifest: Each entry of 'manifests', followed by its
+        manifest_entry: Each question ID in the manifest's 'question_ids'
+    prompt: Each entry of prompts.json 'prompts' (loaded only if subscribed)
+
+Rule Sets:
+    schema: validate_schema.py checks
+    compliance: review_compliance.py checks
+    audit_schema: audit_questions_schema.py checks
+    mismatches: find_schema_mismatches_generic.py checks
+    manifest_ids: validate_manifest_ids.py checks
+    other_fields: audit_questions_other_fields.py checks
+    prompts: Per-prompt required fields (unified report only)
+
+Inputs:
+    - data/{phase}/questions.json
+    - data/{phase}/prompts.json (prompt rules only)
+
+Outputs:
+    - One report with every finding: rule, severity, JSON Pointer path,
+      file:line:column (via json_positions.py), message
+    - .cache/validation/{phase}-{dirhash}-{ruleversion}.marshal (results cache)
+    - Exit code: 0 (pass), 1 (any errors, or warnings with --strict)
+
+Operational Notes:
+    - Read-only operation (no modifications)
+    - Kinds with no subscribed rule are not walked at all
+    - Rules that need the whole phase (manifest/tag agreement, orphans)
+      collect during the walk and report from end()
+    - Findings are ordered by rule registration order, then traversal order,
+      so each wrapper prints exactly what the old per-script loops printed
+    - New rule: subclass Rule, set name/rule_set/check/kinds, add on_<kind>
+      handlers, decorate with @register. Set local = True only when findings
+      depend on nothing but the visited question/prompt subtree (no
+      begin/end state); otherwise list the question keys it reads in
+      question_keys so cache invalidation sees them
+    - Repeated keys vanish when JSON is parsed, so validate_phase() reads
+      them from the position-tracking parse (json_positions.py) into
+      ctx.duplicate_keys, only when a rule sets reads_duplicate_keys
+      (schema.duplicates: repeated question IDs, top-level keys, manifests)
+    - Results cache: an unchanged questions.json (raw bytes hash) replays the
+      whole phase without parsing; otherwise only question/prompt subtrees
+      whose content hash changed re-run the local rules, and cross-reference
+      rules re-run only when the skeleton (everything but question bodies,
+      plus the question keys those rules declare, and any repeated keys)
+      changed
+    - The rule-set version hashes the source of this file, phase_corpus.py
+      (question types, manifest names) and json_positions.py (stored
+      line:column) plus the selected rules, so editing any of them
+      invalidates the cache entries automatically
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import os
+import sys
+import json
+import marshal
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from phase_corpus import PROJECT_ROOT, QUESTION_TYPES, MANIFEST_NAMES, PhaseCorpus, load_json, map_phases
+from json_positions import display_path, pointer, source_map, split_pointer
+
+
+ERROR = 'error'
+WARNING = 'warning'
+
+NODE_KINDS = ['document', 'section', 'question', 'option', 'field', 'manifest', 'manifest_entry', 'prompt']
+
+RULE_SETS = ['schema', 'compliance', 'audit_schema', 'mismatches', 'manifest_ids', 'other_fields', 'prompts']
+
+# Registration order is report order (see Operational Notes)
+RULES: List[type] = []
+
+CACHE_FORMAT = 1
+# Sources whose code shapes cached findings: the rules themselves, the
+# QUESTION_TYPES/MANIFEST_NAMES they check against, and the line:column locator
+VERSION_SOURCES = ('validation_engine.py', 'phase_corpus.py', 'json_positions.py')
+
+# --scale defaults: 100k questions must validate + audit within the budget,
+# and per-question cost may not grow more than SCALE_MAX_GROWTH x between
+# a tenth-size run and the full run (catches quadratic rules). Measured
+# ~12 s for 100k on a slow CI-class box; enforced by tests/test_scale_budget.py
+SCALE_DEFAULT_COUNT = 100_000
+SCALE_DEFAULT_BUDGET_S = 20.0
+SCALE_MAX_GROWTH = 3.0
+DEFAULT_CACHE_DIR = PROJECT_ROOT / ".cache" / "validation"
+
+
+def register(rule_class: type) -> type:
+    """Class decorator: add a rule to the registry."""
+    RULES.append(rule_class)
+    return rule_class
+
+
+class PhaseContext:
+    """Shared per-phase state: the document, precomputed ID sets, and findings."""
+
+    def __init__(self, phase: str, data: Dict, duplicate_keys: Tuple[str, ...] = ()):
+        self.phase = phase
+        # Pointers of keys the source repeats (see json_positions.SourceMap.duplicate_keys)
+        self.duplicate_keys = duplicate_keys
+        self.data = data if isinstance(data, dict) else {}
+        questions = self.data.get('questions', {})
+        self.questions = questions if isinstance(questions, dict) else {}
+        sections = self.data.get('sections', [])
+        self.sections = sections if isinstance(sections, list) else []
+        manifests = self.data.get('manifests', {})
+        self.manifests = manifests if isinstance(manifests, dict) else {}
+        self.question_ids = set(self.questions)
+        self.section_ids = {s.get('id') for s in self.sections if isinstance(s, dict)}
+        self.findings: List[Dict] = []
+
+    def report(self, rule: 'Rule', message: str, path: Any = '', **extra: Any) -> None:
+        # Hot handlers pass the path as a tuple; the pointer string is only
+        # built when something is actually reported
+        if isinstance(path, tuple):
+            path = pointer(*path)
+        finding = {
+            'rule': rule.name,
+            'rule_set': rule.rule_set,
+            'check': rule.check,
+            'severity': rule.severity,
+            'path': path,
+            'message': message,
+        }
+        if extra:
+            finding['data'] = extra
+        self.findings.append(finding)
+
+
+class Rule:
+    """
+    Base rule. Subclasses declare the node kinds they subscribe to and
+    implement the matching handlers:
+
+        on_document(ctx, data)
+        on_section(ctx, index, section)
+        on_question(ctx, qid, q)
+        on_option(ctx, qid, q, index, option)
+        on_field(ctx, qid, q, index, field)
+        on_manifest(ctx, name, manifest)
+        on_manifest_entry(ctx, name, index, qid)
+        on_prompt(ctx, name, prompt)
+    """
+
+    name = ''
+    rule_set = ''
+    check = ''
+    severity = ERROR
+    kinds: tuple = ()
+    # local: findings depend only on the visited question/prompt subtree, so
+    # they can be cached per node. Other rules read the phase skeleton and
+    # list the question keys they look at in question_keys.
+    local = False
+    question_keys: tuple = ()
+    # True when a handler reads ctx.duplicate_keys (costs a position-tracking parse)
+    reads_duplicate_keys = False
+
+    def begin(self, ctx: PhaseContext) -> None:
+        """Reset per-phase state."""
+
+    def end(self, ctx: PhaseContext) -> None:
+        """Report findings that need the whole phase."""
+
+
+# ============================================================================
+# schema (validate_schema.py)
+# ============================================================================
+
+REQUIRED_QUESTION_FIELDS = ['id', 'section_id', 'order', 'title', 'prompt', 'type', 'answer_schema', 'examples', 'tags']
+SELECT_TYPES = ['single_select', 'multi_select']
+
+
+@register
+class SchemaStructure(Rule):
+    name, rule_set, check = 'schema.structure', 'schema', 'structure'
+    kinds = ('document',)
+
+    def on_document(self, ctx, data):
+        if 'sections' not in data:
+            ctx.report(self, "Missing 'sections' array", pointer('sections'))
+        if 'questions' not in data:
+            ctx.report(self, "Missing 'questions' object", pointer('questions'))
+        if 'manifests' not in data:
+            ctx.report(self, "Missing 'manifests' object", pointer('manifests'))
+
+
+@register
+class SchemaRequiredFields(Rule):
+    name, rule_set, check = 'schema.required_fields', 'schema', 'structure'
+    kinds = ('question',)
+    local = True
+
+    def on_question(self, ctx, qid, q):
+        missing = [f for f in REQUIRED_QUESTION_FIELDS if f not in q]
+        if missing:
+            ctx.report(self, f"{qid}: Missing required fields: {', '.join(missing)}", pointer('questions', qid))
+
+
+@register
+class SchemaTypes(Rule):
+    name, rule_set, check = 'schema.types', 'schema', 'types'
+    kinds = ('question',)
+    local = True
+
+    def on_question(self, ctx, qid, q):
+        qtype = q.get('type')
+        if qtype and qtype not in QUESTION_TYPES:
+            ctx.report(self, f"{qid}: Invalid type '{qtype}'. Must be one of {QUESTION_TYPES}",
+                       pointer('questions', qid, 'type'))
+
+
+@register
+class SchemaReferences(Rule):
+    name, rule_set, check = 'schema.references', 'schema', 'references'
+    kinds = ('question',)
+    question_keys = ('section_id',)
+
+    def on_question(self, ctx, qid, q):
+        section_id = q.get('section_id')
+        if section_id and section_id not in ctx.section_ids:
+            ctx.report(self, f"{qid}: Invalid section_id '{section_id}' (section doesn't exist)",
+                       pointer('questions', qid, 'section_id'))
+
+
+@register
+class SchemaManifests(Rule):
+    name, rule_set, check = 'schema.manifests', 'schema', 'manifests'
+    kinds = ('manifest_entry',)
+
+    def on_manifest_entry(self, ctx, name, index, qid):
+        if qid not in ctx.question_ids:
+            ctx.report(self, f"Manifest '{name}': References non-existent question '{qid}'",
+                       pointer('manifests', name, 'question_ids', index))
+
+
+@register
+class SchemaOptions(Rule):
+    name, rule_set, check = 'schema.options', 'schema', 'options'
+    kinds = ('question', 'option')
+    local = True
+
+    def on_question(self, ctx, qid, q):
+        if q.get('type') in SELECT_TYPES and not q.get('options', []):
+            ctx.report(self, f"{qid}: Select-type question missing options array", pointer('questions', qid))
+
+    def on_option(self, ctx, qid, q, index, option):
+        if q.get('type') not in SELECT_TYPES:
+            return
+        for key in ('value', 'label'):
+            if key not in option:
+                ctx.report(self, f"{qid}: Option {index} missing '{key}'",
+                           pointer('questions', qid, 'options', index))
+
+
+@register
+class SchemaFields(Rule):
+    name, rule_set, check = 'schema.fields', 'schema', 'fields'
+    kinds = ('question', 'field')
+    local = True
+
+    def on_question(self, ctx, qid, q):
+        if q.get('type') == 'compound' and not q.get('fields', []):
+            ctx.report(self, f"{qid}: Compound question missing 'fields' array", pointer('questions', qid))
+
+    def on_field(self, ctx, qid, q, index, field):
+        if q.get('type') != 'compound':
+            return
+        for key in ('key', 'type', 'label'):
+            if key not in field:
+                ctx.report(self, f"{qid}: Compound field missing '{key}'",
+                           pointer('questions', qid, 'fields', index))
+
+
+@register
+class SchemaManifestTags(Rule):
+    name, rule_set, check = 'schema.manifest_tags', 'schema', 'manifest_tags'
+    kinds = ('question',)
+    question_keys = ('tags',)
+
+    def begin(self, ctx):
+        self.tagged = {m: [] for m in MANIFEST_NAMES}
+
+    def on_question(self, ctx, qid, q):
+        tags = q.get('tags', {}).get('included_in_manifests', [])
+        for manifest_id in MANIFEST_NAMES:
+            if manifest_id in tags:
+                self.tagged[manifest_id].append(qid)
+
+    def end(self, ctx):
+        for manifest_id in MANIFEST_NAMES:
+            if manifest_id not in ctx.manifests:
+                continue
+            # List order (duplicates dropped) keeps findings stable between runs
+            listed = list(dict.fromkeys(ctx.manifests[manifest_id].get('question_ids', [])))
+            manifest_q_ids = set(listed)
+            tagged = set(self.tagged[manifest_id])
+
+            for qid in listed:
+                if qid in ctx.questions and qid not in tagged:
+                    ctx.report(self, f"Question '{qid}' is in '{manifest_id}' manifest but missing '{manifest_id}' tag",
+                               pointer('questions', qid, 'tags', 'included_in_manifests'))
+
+            for qid in self.tagged[manifest_id]:
+                if qid not in manifest_q_ids:
+                    ctx.report(self, f"Question '{qid}' has '{manifest_id}' tag but is missing from '{manifest_id}' manifest",
+                               pointer('manifests', manifest_id, 'question_ids'))
+
+
+@register
+class SchemaDuplicates(Rule):
+    name, rule_set, check = 'schema.duplicates', 'schema', 'duplicates'
+    kinds = ('document', 'section')
+    question_keys = ('order',)
+    reads_duplicate_keys = True
+
+    def on_document(self, ctx, data):
+        repeated = [split_pointer(path) for path in ctx.duplicate_keys]
+        duplicates = [tokens[1] for tokens in repeated if len(tokens) == 2 and tokens[0] == 'questions']
+        if duplicates:
+            ctx.report(self, f"Duplicate question IDs found: {', '.join(duplicates)} (only the last of each is kept)",
+                       pointer('questions'))
+        for path, tokens in zip(ctx.duplicate_keys, repeated):
+            if len(tokens) != 2 or tokens[0] != 'questions':
+                ctx.report(self, f"Duplicate key '{tokens[-1]}' (only the last value is kept)", path)
+
+    def on_section(self, ctx, index, section):
+        orders = {}
+        for qid in section.get('question_ids', []):
+            if qid in ctx.questions:
+                order = ctx.questions[qid].get('order')
+                if order in orders:
+                    ctx.report(self, f"Section {section['id']}: Duplicate order {order} ({orders[order]} and {qid})",
+                               pointer('sections', index))
+                orders[order] = qid
+
+
+@register
+class SchemaOrphans(Rule):
+    name, rule_set, check = 'schema.orphans', 'schema', 'orphans'
+    severity = WARNING
+    kinds = ('section',)
+
+    def begin(self, ctx):
+        self.in_sections = set()
+
+    def on_section(self, ctx, index, section):
+        self.in_sections.update(section.get('question_ids', []))
+
+    def end(self, ctx):
+        orphans = ctx.question_ids - self.in_sections
+        if orphans:
+            ctx.report(self, f"Orphan questions (not in any section): {', '.join(sorted(orphans))}",
+                       pointer('sections'))
+
+
+@register
+class SchemaBestPractices(Rule):
+    name, rule_set, check = 'schema.best_practices', 'schema', 'best_practices'
+    severity = WARNING
+    kinds = ('question',)
+    local = True
+
+    def on_question(self, ctx, qid, q):
+        # multi_select without a max invites analysis paralysis
+        if q.get('type') == 'multi_select' and 'max' not in q:
+            num_options = len(q.get('options', []))
+            ctx.report(self, f"{qid}: multi_select has no max limit ({num_options} options). "
+                             f"Consider adding max to prevent analysis paralysis.", pointer('questions', qid))
+
+
+# ============================================================================
+# compliance (review_compliance.py)
+# ============================================================================
+
+def _has_other_option(options: Any) -> bool:
+    return any(opt.get('value') == 'other' for opt in options)
+
+
+@register
+class ComplianceStructure(Rule):
+    name, rule_set, check = 'compliance.structure', 'compliance', 'structure'
+    kinds = ('document',)
+
+    def on_document(self, ctx, data):
+        for root in ['sections', 'questions', 'manifests', 'primary_manifest_id']:
+            if root not in data:
+                ctx.report(self, f"Missing root key: '{root}'", pointer(root))
+
+
+@register
+class ComplianceSections(Rule):
+    name, rule_set, check = 'compliance.sections', 'compliance', 'references'
+    kinds = ('section',)
+
+    def on_section(self, ctx, index, section):
+        for qid in section.get('question_ids', []):
+            if qid not in ctx.question_ids:
+                ctx.report(self, f"Section '{section['id']}' references missing question: '{qid}'",
+                           pointer('sections', index, 'question_ids'))
+
+
+@register
+class ComplianceSectionIds(Rule):
+    name, rule_set, check = 'compliance.section_ids', 'compliance', 'references'
+    kinds = ('question',)
+    question_keys = ('section_id',)
+
+    def on_question(self, ctx, qid, q):
+        sid = q.get('section_id')
+        if sid not in ctx.section_ids:
+            ctx.report(self, f"Question '{qid}' references invalid section_id: '{sid}'",
+                       pointer('questions', qid, 'section_id'))
+
+
+@register
+class ComplianceManifests(Rule):
+    name, rule_set, check = 'compliance.manifests', 'compliance', 'references'
+    kinds = ('manifest_entry',)
+
+    def on_manifest_entry(self, ctx, name, index, qid):
+        if qid not in ctx.question_ids:
+            ctx.report(self, f"Manifest '{name}' references missing question: '{qid}'",
+                       pointer('manifests', name, 'question_ids', index))
+
+
+@register
+class ComplianceAnswerSchema(Rule):
+    name, rule_set, check = 'compliance.answer_schema', 'compliance', 'answer_schema'
+    kinds = ('question',)
+    local = True
+
+    def on_question(self, ctx, qid, q):
+        q_type = q.get('type')
+        schema = q.get('answer_schema', {})
+        path = ('questions', qid, 'answer_schema')
+
+        if not isinstance(schema, dict):
+            ctx.report(self, f"[{qid}] answer_schema must be a dictionary.", path)
+            return
+
+        schema_keys = set(schema.keys())
+
+        if q_type == 'free_text':
+            if 'text' not in schema_keys:
+                ctx.report(self, f"[{qid}] free_text schema missing 'text' key.", path)
+
+        elif q_type in SELECT_TYPES:
+            required = {'selected_value'} if q_type == 'single_select' else {'selected_values'}
+            if not required.issubset(schema_keys):
+                ctx.report(self, f"[{qid}] {q_type} schema missing required keys: {required - schema_keys}", path)
+            if _has_other_option(q.get('options', [])) and 'other_text' not in schema_keys:
+                ctx.report(self, f"[{qid}] Has 'other' option but missing 'other_text' in schema.", path)
+
+        elif q_type == 'compound':
+            field_keys = {f.get('key') for f in q.get('fields', [])}
+            missing_in_schema = field_keys - schema_keys
+            extra_in_schema = schema_keys - field_keys
+            if missing_in_schema:
+                ctx.report(self, f"[{qid}] Compound schema missing keys defined in fields: {missing_in_schema}", path)
+            if extra_in_schema:
+                ctx.report(self, f"[{qid}] Compound schema has extra keys not in fields: {extra_in_schema}", path)
+
+
+# ============================================================================
+# audit_schema (audit_questions_schema.py)
+# ============================================================================
+
+@register
+class AuditSchemaTopLevel(Rule):
+    name, rule_set, check = 'audit_schema.top_level', 'audit_schema', 'structure'
+    kinds = ('document',)
+
+    def on_document(self, ctx, data):
+        for key in ['sections', 'questions', 'manifests', 'primary_manifest_id']:
+            if key not in data:
+                ctx.report(self, f"Missing top-level key: '{key}'", pointer(key))
+        if 'questions' not in data:
+            ctx.report(self, "root: Missing 'questions' object", pointer('questions'))
+
+
+@register
+class AuditSchemaSections(Rule):
+    name, rule_set, check = 'audit_schema.sections', 'audit_schema', 'references'
+    kinds = ('section',)
+
+    def on_section(self, ctx, index, section):
+        if 'questions' not in ctx.data:
+            return
+        sid = section.get('id', 'unknown')
+        if 'question_ids' not in section:
+            ctx.report(self, f"root.sections[{sid}]: Missing 'question_ids'", pointer('sections', index))
+            return
+        for qid in section['question_ids']:
+            if qid not in ctx.question_ids:
+                ctx.report(self, f"root.sections[{sid}]: References unknown question ID '{qid}'",
+                           pointer('sections', index, 'question_ids'))
+
+
+@register
+class AuditSchemaManifests(Rule):
+    name, rule_set, check = 'audit_schema.manifests', 'audit_schema', 'references'
+    kinds = ('manifest', 'manifest_entry')
+
+    def on_manifest(self, ctx, name, manifest):
+        if 'questions' in ctx.data and 'question_ids' not in manifest:
+            ctx.report(self, f"root.manifests[{name}]: Missing 'question_ids'", pointer('manifests', name))
+
+    def on_manifest_entry(self, ctx, name, index, qid):
+        if 'questions' in ctx.data and qid not in ctx.question_ids:
+            ctx.report(self, f"root.manifests[{name}]: References unknown question ID '{qid}'",
+                       pointer('manifests', name, 'question_ids', index))
+
+
+@register
+class AuditSchemaQuestions(Rule):
+    name, rule_set, check = 'audit_schema.questions', 'audit_schema', 'answer_schema'
+    kinds = ('question',)
+    local = True
+
+    def on_question(self, ctx, qid, q):
+        prefix = f"root.questions[{qid}]"
+        path = ('questions', qid)
+
+        for field in ['id', 'type', 'title', 'prompt', 'answer_schema']:
+            if field not in q:
+                ctx.report(self, f"{prefix}: Missing required field '{field}'", path)
+        if 'type' not in q:
+            return
+
+        qtype = q['type']
+        schema = q.get('answer_schema', {})
+        schema_path = ('questions', qid, 'answer_schema')
+
+        if qtype in SELECT_TYPES:
+            key = 'selected_value' if qtype == 'single_select' else 'selected_values'
+            if 'options' not in q:
+                ctx.report(self, f"{prefix}: Missing 'options' for {qtype}", path)
+            if key not in schema:
+                ctx.report(self, f"{prefix}.answer_schema: Missing '{key}'", schema_path)
+
+        elif qtype == 'compound':
+            if 'fields' not in q:
+                ctx.report(self, f"{prefix}: Missing 'fields' for compound question", path)
+            else:
+                field_keys = {f['key'] for f in q['fields'] if 'key' in f}
+                missing_schema_keys = field_keys - set(schema.keys())
+                if missing_schema_keys:
+                    ctx.report(self, f"{prefix}.answer_schema: Missing keys for fields: {missing_schema_keys}",
+                               schema_path)
+
+        elif qtype == 'free_text':
+            if 'text' not in schema:
+                ctx.report(self, f"{prefix}.answer_schema: Missing 'text'", schema_path)
+
+
+# ============================================================================
+# mismatches (find_schema_mismatches_generic.py)
+# ============================================================================
+
+@register
+class SchemaKeyMismatch(Rule):
+    name, rule_set, check = 'mismatches.answer_schema', 'mismatches', 'answer_schema'
+    severity = WARNING
+    kinds = ('question',)
+    local = True
+
+    def on_question(self, ctx, qid, q):
+        q_type = q.get('type')
+        if q_type == 'compound':
+            expected_keys = {field.get('key') for field in q.get('fields', [])}
+        elif q_type in SELECT_TYPES:
+            expected_keys = {'selected_value' if q_type == 'single_select' else 'selected_values'}
+            if _has_other_option(q.get('options', [])):
+                expected_keys.add('other_text')
+        else:
+            return
+
+        schema_keys = set(q.get('answer_schema', {}).keys())
+        missing = expected_keys - schema_keys
+        extra = schema_keys - expected_keys
+        if missing or extra:
+            parts = [f"{label} {', '.join(sorted(map(str, keys)))}"
+                     for label, keys in (('missing', missing), ('extra', extra)) if keys]
+            ctx.report(self, f"{qid}: answer_schema keys mismatch ({'; '.join(parts)})",
+                       pointer('questions', qid, 'answer_schema'),
+                       qid=qid, title=q.get('title'), type=q_type, missing=missing, extra=extra)
+
+
+# ============================================================================
+# manifest_ids (validate_manifest_ids.py)
+# ============================================================================
+
+@register
+class ManifestIdsManifests(Rule):
+    name, rule_set, check = 'manifest_ids.manifests', 'manifest_ids', 'references'
+    kinds = ('manifest_entry',)
+
+    def on_manifest_entry(self, ctx, name, index, qid):
+        if qid not in ctx.question_ids:
+            ctx.report(self, f"Manifest '{name}' references undefined ID '{qid}'",
+                       pointer('manifests', name, 'question_ids', index))
+
+
+@register
+class ManifestIdsSections(Rule):
+    name, rule_set, check = 'manifest_ids.sections', 'manifest_ids', 'references'
+    kinds = ('section',)
+
+    def on_section(self, ctx, index, section):
+        for qid in section.get('question_ids', []):
+            if qid not in ctx.question_ids:
+                ctx.report(self, f"Section '{section.get('id')}' references undefined ID '{qid}'",
+                           pointer('sections', index, 'question_ids'))
+
+
+# ============================================================================
+# other_fields (audit_questions_other_fields.py)
+# ============================================================================
+
+@register
+class OtherFields(Rule):
+    name, rule_set, check = 'other_fields.other_text', 'other_fields', 'other_fields'
+    kinds = ('question',)
+    local = True
+
+    def on_question(self, ctx, qid, q):
+        q_type = q.get('type')
+
+        if q_type in SELECT_TYPES:
+            if _has_other_option(q.get('options', [])) and 'other_text' not in q.get('answer_schema', {}):
+                ctx.report(self, f"[{qid}] 'other' option exists, but 'other_text' missing from answer_schema",
+                           pointer('questions', qid, 'answer_schema'))
+
+        elif q_type == 'compound':
+            fields = q.get('fields', [])
+            # A field offering 'other' needs a sibling shown when it includes 'other'
+            catchers = {
+                field.get('showWhen', {}).get('field') for field in fields
+                if field.get('showWhen', {}).get('includes') == 'other'
+            }
+            for index, field in enumerate(fields):
+                if (field.get('type') in ['single_select', 'multi_select', 'ranked_select']
+                        and _has_other_option(field.get('options', []))
+                        and field.get('key') not in catchers):
+                    ctx.report(self, f"[{qid}] Field '{field.get('key')}' has 'other' option "
+                                     f"but no conditional text input field found.",
+                               pointer('questions', qid, 'fields', index))
+
+
+# ============================================================================
+# prompts (unified report only; validate_prompts.py owns the full check)
+# ============================================================================
+
+REQUIRED_PROMPT_FIELDS = {
+    'id': str,
+    'title': str,
+    'description': str,
+    'role': str,
+    'inputs': list,
+    'context': list,
+    'output_format': list,
+    'constraints': list,
+}
+
+
+@register
+class PromptFields(Rule):
+    name, rule_set, check = 'prompts.fields', 'prompts', 'structure'
+    kinds = ('prompt',)
+    local = True
+
+    def on_prompt(self, ctx, name, prompt):
+        path = ('prompts', name)
+        if not isinstance(prompt, dict):
+            ctx.report(self, f"{name}: must be an object", path)
+            return
+        for field, field_type in REQUIRED_PROMPT_FIELDS.items():
+            if field not in prompt:
+                ctx.report(self, f'{name}: missing required field "{field}"', path)
+            elif not isinstance(prompt[field], field_type):
+                ctx.report(self, f"{name}.{field}: expected {field_type.__name__}, "
+                                 f"got {type(prompt[field]).__name__}", pointer('prompts', name, field))
+
+
+# ============================================================================
+# Engine
+# ============================================================================
+
+def select_rules(rule_sets: Optional[List[str]] = None, checks: Optional[List[str]] = None) -> List[type]:
+    """Registered rule classes filtered by rule set and check name."""
+    return [
+        rule for rule in RULES
+        if (rule_sets is None or rule.rule_set in rule_sets)
+        and (checks is None or rule.check in checks)
+    ]
+
+
+class ValidationCache:
+    """
+    Persisted phase results, one marshal file per (phase dir, rule-set version).
+
+    An entry holds the phase's findings keyed by the raw file hash, the
+    findings of each question/prompt subtree for local rules keyed by the
+    subtree's content hash, and the cross-reference findings keyed by the
+    phase skeleton hash. Cache I/O problems are never fatal.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+
+    def _file(self, phase_dir: Path, version: str) -> Path:
+        dir_hash = _digest(str(Path(phase_dir).resolve()).encode('utf-8'))[:8]
+        return self.cache_dir / f"{Path(phase_dir).name}-{dir_hash}-{version[:12]}.marshal"
+
+    def load(self, phase_dir: Path, version: str) -> Optional[Dict]:
+        try:
+            with open(self._file(phase_dir, version), 'rb') as f:
+                entry = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return entry if isinstance(entry, dict) and entry.get('version') == version else None
+
+    def save(self, phase_dir: Path, version: str, entry: Dict) -> None:
+        cache_file = self._file(phase_dir, version)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                marshal.dump(entry, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, ValueError):
+            pass
+
+    def clear(self) -> int:
+        """Delete every cached entry. Returns number of files removed."""
+        removed = 0
+        if self.cache_dir.exists():
+            for cache_file in self.cache_dir.glob("*.marshal"):
+                cache_file.unlink()
+                removed += 1
+        return removed
+
+
+def _digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _node_hash(node: Any) -> str:
+    # marshal format 2 has no back-references, so equal JSON values always
+    # serialize to the same bytes (and ~3x faster than json.dumps)
+    return _digest(marshal.dumps(node, 2))
+
+
+class ValidationEngine:
+    """Runs a set of rules over each phase in one traversal."""
+
+    def __init__(self, rule_sets: Optional[List[str]] = None, checks: Optional[List[str]] = None,
+                 cache: Optional[ValidationCache] = None):
+        self.rules = [rule_class() for rule_class in select_rules(rule_sets, checks)]
+        self.cache = cache
+        self._rank = {rule.name: i for i, rule in enumerate(self.rules)}
+        self._local_rules = {rule.name for rule in self.rules if rule.local}
+        self._handlers = {
+            kind: [getattr(rule, f"on_{kind}") for rule in self.rules if kind in rule.kinds]
+            for kind in NODE_KINDS
+        }
+        self._global_handlers = {
+            kind: [getattr(rule, f"on_{kind}") for rule in self.rules if kind in rule.kinds and not rule.local]
+            for kind in NODE_KINDS
+        }
+        self._local_handlers = {
+            kind: [getattr(rule, f"on_{kind}") for rule in self.rules if kind in rule.kinds and rule.local]
+            for kind in NODE_KINDS
+        }
+        self._question_keys = sorted({key for rule in self.rules if not rule.local for key in rule.question_keys})
+        self._version = None
+
+    @property
+    def version(self) -> str:
+        """Rule-set version: VERSION_SOURCES, selected rules, cache format and Python version."""
+        if self._version is None:
+            stamp = f"{CACHE_FORMAT}|{sys.version_info[0]}.{sys.version_info[1]}|{','.join(self._rank)}"
+            scripts_dir = Path(__file__).parent
+            sources = b''.join(_digest((scripts_dir / name).read_bytes()).encode('ascii') for name in VERSION_SOURCES)
+            self._version = _digest(sources + stamp.encode('utf-8'))
+        return self._version
+
+    @property
+    def wants_prompts(self) -> bool:
+        return bool(self._handlers['prompt'])
+
+    @property
+    def wants_duplicate_keys(self) -> bool:
+        return any(rule.reads_duplicate_keys for rule in self.rules)
+
+    def run(self, phase: str, data: Dict, prompts: Optional[Dict] = None) -> List[Dict]:
+        """Walk one parsed phase and return its findings in report order."""
+        return self._walk(phase, data, prompts)[0]
+
+    def _skeleton_hash(self, ctx: PhaseContext) -> str:
+        """Hash of everything the cross-reference rules read."""
+        keys = self._question_keys
+        return _node_hash([
+            list(ctx.data.keys()),
+            list(ctx.duplicate_keys),
+            {k: v for k, v in ctx.data.items() if k != 'questions'},
+            [[qid, {k: q[k] for k in keys if k in q} if isinstance(q, dict) else q]
+             for qid, q in ctx.questions.items()],
+        ])
+
+    @staticmethod
+    def _visit_question(ctx: PhaseContext, qid: str, q: Dict, handlers: Dict) -> None:
+        for handler in handlers['question']:
+            handler(ctx, qid, q)
+        if handlers['option']:
+            for index, option in enumerate(q.get('options') or []):
+                for handler in handlers['option']:
+                    handler(ctx, qid, q, index, option)
+        if handlers['field']:
+            for index, field in enumerate(q.get('fields') or []):
+                for handler in handlers['field']:
+                    handler(ctx, qid, q, index, field)
+
+    def _walk(self, phase: str, data: Dict, prompts: Optional[Dict] = None, previous: Optional[Dict] = None,
+              duplicate_keys: Tuple[str, ...] = ()) -> Tuple[List[Dict], Optional[Dict], int]:
+        """
+        One traversal of a phase.
+
+        With previous (a cache entry, or {} for a cold cache) every
+        question/prompt subtree is hashed: unchanged subtrees replay their
+        local findings, and an unchanged skeleton replays the cross-reference
+        findings instead of running those rules.
+
+        Returns (findings, new cache entry or None, subtrees re-checked).
+        """
+        ctx = PhaseContext(phase, data, duplicate_keys)
+        tracking = previous is not None
+        old_nodes = previous.get('nodes', {}) if tracking else {}
+        nodes: Dict[str, Tuple[str, List[Dict]]] = {}
+        rechecked = 0
+
+        skeleton = self._skeleton_hash(ctx) if tracking else None
+        replay_global = previous['global'] if tracking and previous.get('skeleton') == skeleton else None
+        rules = self.rules if replay_global is None else [rule for rule in self.rules if rule.local]
+        global_handlers = self._global_handlers if replay_global is None else {kind: [] for kind in NODE_KINDS}
+        local_handlers = self._local_handlers
+
+        def run_local(key: str, node: Any, visit) -> None:
+            nonlocal rechecked
+            if tracking:
+                node_hash = _node_hash(node)
+                cached = old_nodes.get(key)
+                if cached is not None and cached[0] == node_hash:
+                    ctx.findings.extend(cached[1])
+                    nodes[key] = cached
+                    return
+            start = len(ctx.findings)
+            visit()
+            rechecked += 1
+            if tracking:
+                nodes[key] = (node_hash, ctx.findings[start:])
+
+        for rule in rules:
+            rule.begin(ctx)
+
+        for handler in global_handlers['document']:
+            handler(ctx, ctx.data)
+
+        if global_handlers['section']:
+            for index, section in enumerate(ctx.sections):
+                for handler in global_handlers['section']:
+                    handler(ctx, index, section)
+
+        has_global = any(global_handlers[kind] for kind in ('question', 'option', 'field'))
+        has_local = any(local_handlers[kind] for kind in ('question', 'option', 'field'))
+        if has_global or has_local:
+            for qid, q in ctx.questions.items():
+                if not isinstance(q, dict):
+                    continue
+                if has_global:
+                    self._visit_question(ctx, qid, q, global_handlers)
+                if has_local:
+                    run_local(f"q:{qid}", q, lambda: self._visit_question(ctx, qid, q, local_handlers))
+
+        if global_handlers['manifest'] or global_handlers['manifest_entry']:
+            for name, manifest in ctx.manifests.items():
+                for handler in global_handlers['manifest']:
+                    handler(ctx, name, manifest)
+                if global_handlers['manifest_entry']:
+                    for index, qid in enumerate(manifest.get('question_ids', [])):
+                        for handler in global_handlers['manifest_entry']:
+                            handler(ctx, name, index, qid)
+
+        if self._handlers['prompt'] and isinstance(prompts, dict):
+            for name, prompt in (prompts.get('prompts') or {}).items():
+                for handler in global_handlers['prompt']:
+                    handler(ctx, name, prompt)
+                if local_handlers['prompt']:
+                    run_local(f"p:{name}", prompt,
+                              lambda: [handler(ctx, name, prompt) for handler in local_handlers['prompt']])
+
+        for rule in rules:
+            rule.end(ctx)
+
+        entry = None
+        if tracking:
+            if replay_global is None:
+                replay_global = [f for f in ctx.findings if f['rule'] not in self._local_rules]
+            else:
+                ctx.findings.extend(replay_global)
+            entry = {'version': self.version, 'skeleton': skeleton, 'global': replay_global, 'nodes': nodes}
+
+        ctx.findings.sort(key=lambda finding: self._rank[finding['rule']])
+        if entry is not None:
+            entry['findings'] = ctx.findings
+        return ctx.findings, entry, rechecked
+
+    def validate_phase(self, phase_dir: Path) -> Dict:
+        """
+        Load and validate one phase directory.
+
+        Returns {'phase', 'findings'} plus 'error'/'detail' when
+        questions.json is missing or unreadable (callers word that message
+        themselves). With a cache, also 'cache': {'status': hit|partial|miss,
+        'rechecked': subtrees re-run}.
+        """
+        phase_dir = Path(phase_dir)
+        result = {'phase': phase_dir.name, 'findings': []}
+        questions_file = phase_dir / "questions.json"
+        prompts_file = phase_dir / "prompts.json"
+
+        if not questions_file.exists():
+            result['error'] = 'questions.json not found'
+            return result
+
+        previous, file_hash = None, None
+        if self.cache is not None:
+            try:
+                raw = questions_file.read_bytes()
+                if self.wants_prompts and prompts_file.exists():
+                    raw += b'\0' + prompts_file.read_bytes()
+            except OSError:
+                raw = None
+            if raw is not None:
+                file_hash = _digest(raw)
+                previous = self.cache.load(phase_dir, self.version) or {}
+                if previous.get('file_hash') == file_hash:
+                    result['findings'] = previous['findings']
+                    result['cache'] = {'status': 'hit', 'rechecked': 0}
+                    return result
+
+        try:
+            data = load_json(questions_file)
+        except (json.JSONDecodeError, OSError) as e:
+            result['error'] = f'JSON syntax error: {e}'
+            result['detail'] = str(e)
+            return result
+
+        prompts = None
+        if self.wants_prompts and prompts_file.exists():
+            try:
+                prompts = load_json(prompts_file)
+            except (json.JSONDecodeError, OSError) as e:
+                file_hash = None  # don't cache a phase whose prompts didn't parse
+                result['findings'].append({
+                    'rule': 'prompts.syntax', 'rule_set': 'prompts', 'check': 'syntax', 'severity': ERROR,
+                    'path': '', 'message': f'prompts.json: Invalid JSON: {e}',
+                })
+
+        duplicate_keys: Tuple[str, ...] = ()
+        if self.wants_duplicate_keys:
+            try:
+                duplicate_keys = tuple(source_map(questions_file).duplicate_keys())
+            except (OSError, UnicodeDecodeError):
+                pass
+
+        findings, entry, rechecked = self._walk(phase_dir.name, data, prompts, previous, duplicate_keys)
+        result['findings'].extend(findings)
+        # Located before caching, so a cache hit replays the positions too
+        locate_findings(phase_dir, result['findings'])
+
+        if entry is not None:
+            result['cache'] = {'status': 'partial' if previous.get('nodes') else 'miss', 'rechecked': rechecked}
+            if file_hash is not None:
+                entry['file_hash'] = file_hash
+                self.cache.save(phase_dir, self.version, entry)
+        return result
+
+
+def locate_findings(phase_dir: Path, findings: List[Dict]) -> List[Dict]:
+    """
+    Attach 'file', 'line' and 'column' to findings (in place) by resolving
+    each JSON Pointer in questions.json, or prompts.json for prompt rules.
+    line/column are None when the file cannot be read.
+    """
+    if not findings:
+        return findings
+    # Only phases with findings pay for the position-tracking parse
+    maps: Dict[str, Tuple[str, Any]] = {}
+    for finding in findings:
+        name = 'prompts.json' if finding['rule_set'] == 'prompts' else 'questions.json'
+        if name not in maps:
+            path = Path(phase_dir) / name
+            try:
+                maps[name] = (display_path(path), source_map(path))
+            except (OSError, UnicodeDecodeError):
+                maps[name] = (display_path(path), None)
+        finding['file'], positions = maps[name]
+        finding['line'], finding['column'] = positions.locate(finding['path']) if positions else (None, None)
+    return findings
+
+
+def finding_location(finding: Dict) -> str:
+    """'data/phase_0/questions.json:859:9' for a located finding ('' if never located)."""
+    if not finding.get('line'):
+        return finding.get('file', '')
+    return f"{finding['file']}:{finding['line']}:{finding['column']}"
+
+
+def located_message(finding: Dict) -> str:
+    """The finding's message, prefixed with file:line:column when it has been located."""
+    location = finding_location(finding)
+    return f"{location}: {finding['message']}" if location else finding['message']
+
+
+def location(file: str, path: str, line: Optional[int] = None, column: Optional[int] = None) -> Dict:
+    """Where a standalone validator's finding is: file, JSON Pointer, 1-based line/column (None if unknown)."""
+    return {'file': file, 'pointer': path, 'line': line, 'column': column}
+
+
+def located_messages(result: Dict, kind: str) -> List[str]:
+    """
+    A validator result's 'error' or 'warning' messages, each prefixed with
+    file:line:column from the parallel '{kind}_locations' list when known.
+    """
+    locations = result.get(f'{kind}_locations') or []
+    return [located_message(dict((locations[index] if index < len(locations) else None) or {}, message=message))
+            for index, message in enumerate(result.get(f'{kind}s') or [])]
+
+
+def status_for(findings: List[Dict], strict: bool = False) -> str:
+    """PASS/WARN/FAIL for a phase's findings."""
+    severities = {f['severity'] for f in findings}
+    if ERROR in severities or (strict and WARNING in severities):
+        return 'FAIL'
+    return 'WARN' if WARNING in severities else 'PASS'
+
+
+def format_text(results: List[Dict], strict: bool = False) -> str:
+    """Unified text report: every finding, tagged with rule and path."""
+    lines = ["=" * 70, " UNIFIED VALIDATION REPORT", "=" * 70, ""]
+    counts = {'PASS': 0, 'WARN': 0, 'FAIL': 0, 'ERROR': 0}
+
+    for result in results:
+        status = 'ERROR' if result.get('error') else status_for(result['findings'], strict)
+        counts[status] += 1
+        lines.append(f"[{status}] {result['phase']}: {len(result['findings'])} finding(s)")
+        if result.get('error'):
+            lines.append(f"  {result['error']}")
+        for finding in result['findings']:
+            location = finding_location(finding)
+            lines.append(f"  {finding['severity'].upper():<7} {finding['rule']:<26} {finding['path']}"
+                         + (f"  ({location})" if location else ''))
+            lines.append(f"          {finding['message']}")
+        lines.append("")
+
+    lines.append("=" * 70)
+    lines.append(f" SUMMARY: {counts['PASS']} passed, {counts['WARN']} warnings, "
+                 f"{counts['FAIL'] + counts['ERROR']} failed")
+    lines.append("=" * 70)
+    return "\n".join(lines)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def format_json(results: List[Dict]) -> str:
+    return json.dumps(results, indent=2, ensure_ascii=False, default=_json_default)
+
+
+def list_rules() -> str:
+    width = max(len(rule.name) for rule in RULES)
+    lines = [f"{'Rule':<{width}}  {'Severity':<8}  Node kinds"]
+    for rule in RULES:
+        lines.append(f"{rule.name:<{width}}  {rule.severity:<8}  {', '.join(rule.kinds)}")
+    return "\n".join(lines)
+
+
+def synthetic_phase(count: int, section_size: int = 100) -> Dict:
+    """
+    A schema-valid phase with count questions cycling through every type.
+
+    Used by --scale; sections, manifests and tags are consistent, so the
+    rules do their full work without drowning the run in findings.
+    """
+    options = [{'value': f"opt{i}", 'label': f"Option {i}"} for i in range(1, 6)] + [{'value': 'other', 'label': 'Other'}]
+    questions, sections, lite_ids, full_ids = {}, [], [], []
+
+    for i in range(count):
+        qid = f"q{i + 1:06d}"
+        if i % section_size == 0:
+            sections.append({'id': f"s{len(sections) + 1}", 'title': f"Section {len(sections) + 1}", 'question_ids': []})
+        section = sections[-1]
+        section['question_ids'].append(qid)
+
+        qtype = QUESTION_TYPES[i % len(QUESTION_TYPES)]
+        manifests = ['lite', 'full'] if i % 3 == 0 else ['full']
+        q = {
+            'id': qid,
+            'section_id': section['id'],
+            'order': len(section['question_ids']),
+            'title': f"Question {i + 1}",
+            'prompt': f"Describe how you would approach situation {i + 1}.",
+            'type': qtype,
+            'examples': [f"Example answer {i + 1}"],
+            'tags': {'included_in_manifests': manifests},
+        }
+        if qtype == 'free_text':
+            q['answer_schema'] = {'text': ''}
+        elif qtype == 'single_select':
+            q['options'] = options
+            q['answer_schema'] = {'selected_value': '', 'other_text': ''}
+        elif qtype == 'multi_select':
+            q['options'] = options
+            q['max'] = 3
+            q['answer_schema'] = {'selected_values': [], 'other_text': ''}
+        elif qtype == 'ranked_select':
+            q['options'] = options
+            q['answer_schema'] = {'ranking': []}
+        else:
+            q['fields'] = [
+                {'key': 'choice', 'type': 'single_select', 'label': 'Choice', 'options': options},
+                {'key': 'choice_other', 'type': 'short_text', 'label': 'Other',
+                 'showWhen': {'field': 'choice', 'includes': 'other'}},
+            ]
+            q['answer_schema'] = {'choice': '', 'choice_other': ''}
+
+        questions[qid] = q
+        full_ids.append(qid)
+        if 'lite' in manifests:
+            lite_ids.append(qid)
+
+    return {
+        'sections': sections,
+        'questions': questions,
+        'manifests': {'lite': {'question_ids': lite_ids}, 'full': {'question_ids': full_ids}},
+        'primary_manifest_id': 'lite',
+    }
+
+
+def scale_check(count: int, budget_s: float, max_growth: float = SCALE_MAX_GROWTH) -> int:
+    """
+    Validate and audit a synthetic phase of count questions, plus one a tenth
+    the size. Fails when the large run exceeds budget_s (parse + every rule
+    set + QuestionAuditor) or its per-question cost grows more than
+    max_growth times over the small run (a superlinear rule).
+    """
+    import time
+    import tempfile
+    from audit_questions import QuestionAuditor
+
+    engine = ValidationEngine()
+    timings = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        auditor = QuestionAuditor(Path(data_dir))
+        for size in (max(1, count // 10), count):
+            phase_dir = Path(data_dir) / f"phase_synthetic_{size}"
+            phase_dir.mkdir()
+            with open(phase_dir / "questions.json", 'w', encoding='utf-8') as f:
+                json.dump(synthetic_phase(size), f)
+
+            start = time.perf_counter()
+            result = engine.validate_phase(phase_dir)
+            validated = time.perf_counter()
+            auditor.audit_phase(phase_dir.name)
+            audited = time.perf_counter()
+            timings.append((size, validated - start, audited - validated, len(result['findings'])))
+
+    lines = [f"{'Questions':>9} {'validate':>10} {'audit':>10} {'total':>10} {'us/question':>12} {'findings':>9}"]
+    for size, validate_s, audit_s, findings in timings:
+        total = validate_s + audit_s
+        lines.append(f"{size:>9} {validate_s:>9.3f}s {audit_s:>9.3f}s {total:>9.3f}s "
+                     f"{total / size * 1e6:>12.1f} {findings:>9}")
+    print("\n".join(lines))
+
+    (small, *small_t, _), (large, *large_t, _) = timings
+    total_large = sum(large_t)
+    growth = (total_large / large) / max(sum(small_t) / small, 1e-9)
+    failures = []
+    if total_large > budget_s:
+        failures.append(f"{large} questions took {total_large:.2f}s (budget {budget_s:.2f}s)")
+    if growth > max_growth:
+        failures.append(f"per-question cost grew {growth:.1f}x from {small} to {large} questions "
+                        f"(limit {max_growth:.1f}x); a rule is superlinear")
+    if failures:
+        for failure in failures:
+            print(f"ERROR: {failure}")
+        return 1
+    print(f"[SUCCESS] {large} questions in {total_large:.2f}s (budget {budget_s:.2f}s), "
+          f"per-question growth {growth:.2f}x")
+    return 0
+
+
+def benchmark(rule_sets: Optional[List[str]], phase_dirs: List[Path], repeat: int) -> str:
+    """Per phase: full walk vs cache hit vs a rerun after a one-question edit."""
+    import copy
+    import time
+    import tempfile
+
+    def best_of(func) -> float:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+        return min(samples) * 1000
+
+    lines = [f"{'Phase':<16} {'Questions':>9} {'full':>9} {'hit':>9} {'1 edit':>9}  (ms, best of {repeat})"]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        engine = ValidationEngine(rule_sets=rule_sets, cache=ValidationCache(Path(cache_dir)))
+        for phase_dir in phase_dirs:
+            if not (phase_dir / "questions.json").exists():
+                continue
+            data = load_json(phase_dir / "questions.json")
+            prompts = load_json(phase_dir / "prompts.json") if (phase_dir / "prompts.json").exists() else None
+            engine.validate_phase(phase_dir)
+            _, entry, _ = engine._walk(phase_dir.name, data, prompts, {})
+
+            edited = copy.deepcopy(data)
+            qid = next(iter(edited.get('questions', {})), None)
+            if qid is not None:
+                edited['questions'][qid]['title'] = f"{edited['questions'][qid].get('title', '')} (edited)"
+
+            full = best_of(lambda: engine.run(phase_dir.name, data, prompts))
+            hit = best_of(lambda: engine.validate_phase(phase_dir))
+            edit = best_of(lambda: engine._walk(phase_dir.name, edited, prompts, entry))
+            count = len(data.get('questions', {}))
+            lines.append(f"{phase_dir.name:<16} {count:>9} {full:>9.2f} {hit:>9.2f} {edit:>9.2f}")
+    return "\n".join(lines)
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(description="Validation Engine - single-pass rule registry for phase data")
+    parser.add_argument('--phase', help='Specific phase to validate (default: all)')
+    parser.add_argument('--rule-set', help=f'Rule sets to run (comma-separated). Available: {", ".join(RULE_SETS)}')
+    parser.add_argument('--format', choices=['text', 'json'], default='text')
+    parser.add_argument('--strict', action='store_true', help='Fail on warnings')
+    parser.add_argument('--list', action='store_true', help='List registered rules')
+    parser.add_argument('--jobs', type=int, default=1, help='Validate phases in N worker processes (0 = all CPUs)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-check everything; skip the results cache')
+    parser.add_argument('--clear-cache', action='store_true', help='Delete cached results and exit')
+    parser.add_argument('--benchmark', action='store_true', help='Time full vs cached vs one-edit validation')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per benchmark case (default: 20)')
+    parser.add_argument('--scale', type=int, nargs='?', const=SCALE_DEFAULT_COUNT, metavar='N',
+                        help=f'Validate a synthetic N-question phase against a time budget (default N: {SCALE_DEFAULT_COUNT})')
+    parser.add_argument('--budget-s', type=float, default=SCALE_DEFAULT_BUDGET_S,
+                        help=f'Time budget for --scale in seconds (default: {SCALE_DEFAULT_BUDGET_S})')
+    args = parser.parse_args()
+
+    if args.list:
+        print(list_rules())
+        sys.exit(0)
+
+    if args.clear_cache:
+        print(f"[SUCCESS] Removed {ValidationCache().clear()} cached phase result(s)")
+        sys.exit(0)
+
+    if args.scale:
+        sys.exit(scale_check(args.scale, args.budget_s))
+
+    rule_sets = None
+    if args.rule_set:
+        rule_sets = [s.strip() for s in args.rule_set.split(',')]
+        invalid = [s for s in rule_sets if s not in RULE_SETS]
+        if invalid:
+            print(f"ERROR: Invalid rule set(s): {', '.join(invalid)}")
+            print(f"Available: {', '.join(RULE_SETS)}")
+            sys.exit(1)
+
+    corpus = PhaseCorpus.for_project()
+    if args.phase:
+        phase_dirs = [corpus.phase_dir(args.phase)]
+        if not phase_dirs[0].exists():
+            print(f"ERROR: Phase directory not found: {args.phase}")
+            sys.exit(1)
+    else:
+        phase_dirs = [corpus.phase_dir(p) for p in sorted(corpus.phases())]
+
+    if args.benchmark:
+        print(benchmark(rule_sets, phase_dirs, max(1, args.repeat)))
+        sys.exit(0)
+
+    engine = ValidationEngine(rule_sets=rule_sets, cache=None if args.no_cache else ValidationCache())
+    results = map_phases(engine.validate_phase, phase_dirs, args.jobs)
+
+    print(format_json(results) if args.format == 'json' else format_text(results, args.strict))
+
+    failed = any(r.get('error') or status_for(r['findings'], args.strict) == 'FAIL' for r in results)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+# ./tests/conftest.py
+"""
+Pytest setup: scripts/ modules import each other by bare name (as they do
+when run as `python scripts/x.py`), so put scripts/ on sys.path.
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import sys
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
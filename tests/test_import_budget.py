@@ -0,0 +1,45 @@
+# ./tests/test_import_budget.py
+"""
+Import Budget - rfu Dispatcher Import Time Stays Within Budget
+==============================================================
+
+Runs the same gate as `python -m scripts.rfu importtime`: the dispatched
+subcommand's imports, above a bare interpreter, must fit DEFAULT_BUDGET_MS,
+and no other subcommand's module may be imported eagerly.
+
+Usage:
+    python -m pytest -q tests/test_import_budget.py
+
+Operational Notes:
+    - scripts/ is byte-compiled first, so a cold checkout (or
+      PYTHONDONTWRITEBYTECODE) does not measure compilation
+    - One discarded warm-up run fills the OS file cache; the gate then takes
+      the best of 5 runs, so a single slow run cannot fail it
+    - The budget itself sits well above the measured cost (see rfu.py)
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import compileall
+
+import pytest
+
+import rfu
+
+
+@pytest.fixture(scope="module", autouse=True)
+def compiled_scripts():
+    compileall.compile_dir(rfu.SCRIPTS_DIR, quiet=1)
+    rfu._import_times(['-m', 'scripts.rfu', 'search', '--count'])
+
+
+@pytest.mark.parametrize("command", [
+    ['search', '--count'],
+    ['search', '--where', 'type:compound AND manifest:lite', '--count'],
+    ['validate-manifest', '--phase', 'phase_0'],
+])
+def test_import_budget(command, capsys):
+    code = rfu.check_importtime(['--repeat', '5'] + command)
+    report = capsys.readouterr().out
+    assert code == 0, report
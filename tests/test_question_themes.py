@@ -0,0 +1,42 @@
+# ./tests/test_question_themes.py
+"""
+Question Themes - Backend Parity
+================================
+
+Pins that the NumPy and pure-Python similarity backends of
+question_themes.py produce the same report on the project's phases, so a
+report cached by one backend is valid for the other.
+
+Usage:
+    python -m pytest -q tests/test_question_themes.py
+
+Operational Notes:
+    - Skipped when NumPy is not installed
+    - Read-only on data/; no report is cached
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import pytest
+
+from phase_corpus import PhaseCorpus
+from question_themes import DEFAULT_NEIGHBORS, DEFAULT_OVERLAP, DEFAULT_THIN, ThemeMapper
+
+
+pytest.importorskip('numpy')
+
+
+@pytest.mark.parametrize("clusters", [None, 7])
+def test_numpy_and_python_backends_give_the_same_report(clusters):
+    corpus = PhaseCorpus.for_project()
+    phases = [phase for phase in sorted(corpus.phases()) if corpus.has(phase, "questions.json")]
+    mapper = ThemeMapper(corpus, phases)
+
+    reports = {}
+    for backend in ('numpy', 'python'):
+        report = mapper.report(clusters, DEFAULT_NEIGHBORS, DEFAULT_OVERLAP, DEFAULT_THIN, backend)
+        assert report.pop('backend') == backend
+        reports[backend] = report
+
+    assert reports['numpy'] == reports['python']
@@ -0,0 +1,159 @@
+# ./tests/test_questions_manager.py
+"""
+Questions Manager - Merge Verdicts and Export Safety
+====================================================
+
+Pins the per-file merge verdicts (unchanged, added, updated, stale,
+conflict, invalid) of QuestionsManager._classify and merge_phase, and that
+export never overwrites or deletes unmerged work.
+
+Usage:
+    python -m pytest -q tests/test_questions_manager.py
+
+Operational Notes:
+    - Every test works on a synthetic phase (validation_engine.synthetic_phase)
+      in a temp directory; data/ is never touched
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import json
+
+import pytest
+
+from questions_manager import QuestionsManager, question_hash
+from validation_engine import synthetic_phase
+
+
+PHASE = "phase_test"
+
+
+@pytest.fixture
+def manager(tmp_path):
+    phase_dir = tmp_path / "data" / PHASE
+    phase_dir.mkdir(parents=True)
+    write_json(phase_dir / "questions.json", synthetic_phase(10))
+    manager = QuestionsManager(str(tmp_path))
+    assert manager.export_phase(PHASE, export_txt=False)
+    return manager
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def master(manager):
+    return read_json(manager.data_dir / PHASE / "questions.json")
+
+
+def shard_path(manager, qid):
+    return manager.data_dir / PHASE / "questions" / f"{qid}.json"
+
+
+def edit_shard(manager, qid, **changes):
+    question = read_json(shard_path(manager, qid))
+    question.update(changes)
+    write_json(shard_path(manager, qid), question)
+    return question
+
+
+def edit_master(manager, qid, **changes):
+    data = master(manager)
+    data['questions'][qid].update(changes)
+    write_json(manager.data_dir / PHASE / "questions.json", data)
+
+
+def new_question(manager, qid):
+    """A copy of q000002 under a new id, in no manifest (so the phase stays valid)."""
+    return dict(read_json(shard_path(manager, 'q000002')), id=qid, tags={'included_in_manifests': []})
+
+
+def verdict(shard, master_question=None, base_question=None, qid="q1"):
+    questions = {qid: master_question} if master_question is not None else {}
+    base = {qid: question_hash(base_question)} if base_question is not None else {}
+    return QuestionsManager._classify(qid, question_hash(shard), questions, base)
+
+
+@pytest.mark.parametrize("shard, master_question, base_question, expected", [
+    ({'t': 'a'}, {'t': 'a'}, {'t': 'a'}, 'unchanged'),
+    ({'t': 'a'}, {'t': 'a'}, {'t': 'old'}, 'unchanged'),
+    ({'t': 'new'}, None, None, 'added'),
+    ({'t': 'new'}, {'t': 'a'}, None, 'updated'),
+    ({'t': 'new'}, {'t': 'a'}, {'t': 'a'}, 'updated'),
+    ({'t': 'a'}, {'t': 'master'}, {'t': 'a'}, 'stale'),
+    ({'t': 'file'}, {'t': 'master'}, {'t': 'a'}, 'conflict'),
+    ({'t': 'file'}, None, {'t': 'a'}, 'conflict'),
+])
+def test_classify(shard, master_question, base_question, expected):
+    assert verdict(shard, master_question, base_question) == expected
+
+
+def test_merge_applies_updates_and_additions_but_not_stale_files(manager):
+    updated = edit_shard(manager, 'q000001', title="Edited in the file")
+    added = new_question(manager, 'q000099')
+    write_json(shard_path(manager, 'q000099'), added)
+    edit_master(manager, 'q000003', title="Edited in the master")
+
+    assert manager.merge_phase(PHASE)
+    questions = master(manager)['questions']
+    assert questions['q000001'] == updated
+    assert questions['q000099'] == added
+    assert questions['q000003']['title'] == "Edited in the master"
+
+
+def test_nothing_to_merge_leaves_master_unwritten(manager):
+    main_file = manager.data_dir / PHASE / "questions.json"
+    before = main_file.stat().st_mtime_ns
+    assert manager.merge_phase(PHASE)
+    assert main_file.stat().st_mtime_ns == before
+    assert not main_file.with_name("questions.json.bak").exists()
+
+
+@pytest.mark.parametrize("break_phase", [
+    lambda m: (edit_shard(m, 'q000001', title="File"), edit_master(m, 'q000001', title="Master")),
+    lambda m: edit_shard(m, 'q000001', type="not_a_type"),
+    lambda m: shard_path(m, 'q000001').write_text("{broken", encoding='utf-8'),
+], ids=['conflict', 'invalid', 'unreadable'])
+def test_merge_aborts_without_writing(manager, break_phase):
+    break_phase(manager)
+    edit_shard(manager, 'q000002', title="A good edit in the same phase")
+    before = master(manager)
+
+    assert not manager.merge_phase(PHASE)
+    assert master(manager) == before
+
+
+def test_export_keeps_unmerged_edits_and_new_files(manager):
+    edited = edit_shard(manager, 'q000001', title="Not merged yet")
+    new = new_question(manager, 'q000099')
+    write_json(shard_path(manager, 'q000099'), new)
+
+    assert manager.export_phase(PHASE, export_txt=False)
+    assert read_json(shard_path(manager, 'q000001')) == edited
+    assert read_json(shard_path(manager, 'q000099')) == new
+
+    # ... and merge still sees them as edits
+    assert manager.merge_phase(PHASE)
+    questions = master(manager)['questions']
+    assert questions['q000001'] == edited
+    assert questions['q000099'] == new
+
+
+def test_export_removes_only_unedited_files_of_deleted_questions(manager):
+    data = master(manager)
+    del data['questions']['q000009'], data['questions']['q000010']
+    write_json(manager.data_dir / PHASE / "questions.json", data)
+    edit_shard(manager, 'q000010', title="Edited after export")
+
+    assert manager.export_phase(PHASE, export_txt=False)
+    assert not shard_path(manager, 'q000009').exists()
+    assert shard_path(manager, 'q000010').exists()
+    # Edited here, deleted in the master: merge must not silently re-add it
+    assert not manager.merge_phase(PHASE)
@@ -0,0 +1,35 @@
+# ./tests/test_scale_budget.py
+"""
+Scale Budget - Validation and Audit Stay Linear at 100k Questions
+=================================================================
+
+Runs the same gate as `python scripts/validation_engine.py --scale`: a
+synthetic 100,000-question phase must validate (every rule set) and audit
+within SCALE_DEFAULT_BUDGET_S, and the per-question cost may not grow more
+than SCALE_MAX_GROWTH times over the 10,000-question run.
+
+Usage:
+    python -m pytest -q tests/test_scale_budget.py
+
+Operational Notes:
+    - Takes ~25 s (two synthetic phases are generated, validated and audited)
+    - A 1,000-question warm-up run loads the rule and audit modules and
+      fills the caches before anything is timed
+    - The budget sits well above the measured cost (~12 s), and the growth
+      check compares per-question cost rather than wall time, so a slow or
+      busy machine does not fail it
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+from validation_engine import SCALE_DEFAULT_BUDGET_S, SCALE_DEFAULT_COUNT, SCALE_MAX_GROWTH, scale_check
+
+
+def test_scale_budget(capsys):
+    scale_check(1_000, SCALE_DEFAULT_BUDGET_S)
+    capsys.readouterr()
+
+    code = scale_check(SCALE_DEFAULT_COUNT, SCALE_DEFAULT_BUDGET_S, SCALE_MAX_GROWTH)
+    report = capsys.readouterr().out
+    assert code == 0, report
@@ -0,0 +1,63 @@
+# ./tests/test_validation_engine.py
+"""
+Validation Engine - Repeated Keys
+=================================
+
+Pins that schema.duplicates reports keys the source repeats (which
+json.loads collapses to the last value), with and without the results
+cache, and that fixing the file clears the finding.
+
+Usage:
+    python -m pytest -q tests/test_validation_engine.py
+
+Operational Notes:
+    - Every test works on a synthetic phase (validation_engine.synthetic_phase)
+      in a temp directory; data/ is never touched
+
+Author: Roy Dawson IV
+GitHub: https://github.com/imyourboyroy
+"""
+
+import json
+
+import pytest
+
+from json_positions import SourceMap
+from validation_engine import ValidationCache, ValidationEngine, synthetic_phase
+
+
+def test_source_map_lists_repeated_keys_in_the_eager_levels():
+    positions = SourceMap('{"a": 1, "questions": {"q1": {"x": 1, "x": 2}, "q1": {}}, "a/b": 2, "a/b": 3}')
+    assert positions.parse() == {'a': 1, 'questions': {'q1': {}}, 'a/b': 3}
+    # "x" repeats inside a question body, below EAGER_DEPTH
+    assert positions.duplicate_keys() == ['/questions/q1', '/a~1b']
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_repeated_question_ids_and_keys_are_reported(tmp_path, cached):
+    phase_dir = tmp_path / "phase_test"
+    phase_dir.mkdir()
+    questions_file = phase_dir / "questions.json"
+    clean = json.dumps(synthetic_phase(10), indent=2)
+    questions_file.write_text(clean, encoding='utf-8')
+    cache = ValidationCache(tmp_path / "cache") if cached else None
+    engine = ValidationEngine(checks=['duplicates'], cache=cache)
+
+    def messages():
+        return [f"{f['path']} {f['message']}" for f in engine.validate_phase(phase_dir)['findings']]
+
+    assert messages() == []
+
+    # Repeat q000003's body (identical content, so only the raw text differs) and a top-level key
+    start = clean.index('"q000003": {')
+    end = clean.index('"q000004": {')
+    repeated = clean[:end] + clean[start:end] + clean[end:]
+    repeated = repeated.replace('{\n', '{\n  "sections": [],\n', 1)
+    questions_file.write_text(repeated, encoding='utf-8')
+    assert messages() == [
+        "/questions Duplicate question IDs found: q000003 (only the last of each is kept)",
+        "/sections Duplicate key 'sections' (only the last value is kept)",
+    ]
+
+    questions_file.write_text(clean, encoding='utf-8')
+    assert messages() == []